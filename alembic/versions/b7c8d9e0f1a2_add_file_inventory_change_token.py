@@ -0,0 +1,31 @@
+"""Add change_token to file_inventory
+
+Revision ID: b7c8d9e0f1a2
+Revises: a1c2d3e4f5a6
+Create Date: 2026-10-16
+
+Stores the adapter-native content version (S3/Azure ETag, GCS generation,
+Graph cTag/eTag) seen at the last scan so delta scans can skip unchanged
+files from listing metadata alone, without downloading and hashing them.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, Sequence[str]] = 'a1c2d3e4f5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'file_inventory',
+        sa.Column('change_token', sa.String(255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('file_inventory', 'change_token')
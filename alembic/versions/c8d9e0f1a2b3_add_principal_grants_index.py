@@ -0,0 +1,57 @@
+"""Add principal_grants inverted index
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-16
+
+Materializes principal -> sd_hash grants so principal access lookups are
+an index range scan instead of a JSONB key scan over every security
+descriptor. ``security_descriptors.principals_indexed`` tracks which
+descriptors have been expanded; existing descriptors start unindexed and
+are backfilled by the next SD collection run.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d9e0f1a2b3'
+down_revision: Union[str, Sequence[str]] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'security_descriptors',
+        sa.Column('principals_indexed', sa.Boolean(), server_default='false', nullable=True),
+    )
+    op.create_index(
+        'ix_security_descriptors_unindexed',
+        'security_descriptors',
+        ['tenant_id', 'sd_hash'],
+        postgresql_where=sa.text('principals_indexed IS NOT TRUE'),
+    )
+
+    op.create_table(
+        'principal_grants',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('principal', sa.String(255), nullable=False),
+        sa.Column('sd_hash', sa.LargeBinary(32), nullable=False),
+        sa.Column('permissions', postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(
+            ['sd_hash'], ['security_descriptors.sd_hash'], ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('tenant_id', 'principal', 'sd_hash'),
+    )
+    op.create_index('ix_principal_grants_sd', 'principal_grants', ['sd_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_principal_grants_sd', table_name='principal_grants')
+    op.drop_table('principal_grants')
+    op.drop_index('ix_security_descriptors_unindexed', table_name='security_descriptors')
+    op.drop_column('security_descriptors', 'principals_indexed')
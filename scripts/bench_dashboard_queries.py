@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmark: dashboard query latency vs concurrent viewers.
+
+Writes a synthetic scan_results catalog, then simulates N viewers each
+loading the dashboard (file stats, trends, entity trends) at once and
+reports p50/p95 page-load latency with the result cache off and on.
+
+Usage: python scripts/bench_dashboard_queries.py [--rows 200000] [--viewers 1,4,16,32]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pyarrow as pa
+
+from openlabels.analytics.engine import DuckDBEngine
+from openlabels.analytics.schemas import SCAN_RESULTS_SCHEMA
+from openlabels.analytics.service import AnalyticsService, DuckDBDashboardService
+from openlabels.analytics.storage import LocalStorage
+
+TENANT = uuid4()
+TIERS = ("MINIMAL", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+ENTITIES = ("SSN", "EMAIL", "NAME", "PHONE", "CREDIT_CARD", "ADDRESS", "DOB", "IBAN")
+
+
+def write_catalog(storage: LocalStorage, rows: int, days: int = 30, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    per_day = rows // days
+    for day in range(days):
+        date = start + timedelta(days=day)
+        cols: dict[str, list] = {f.name: [] for f in SCAN_RESULTS_SCHEMA}
+        for i in range(per_day):
+            counts = [(e, rng.randint(1, 20)) for e in rng.sample(ENTITIES, 3)]
+            row = {
+                "id": uuid4().bytes,
+                "file_path": f"/share/{day}/{i}.docx",
+                "file_name": f"{i}.docx",
+                "risk_score": rng.randint(0, 100),
+                "risk_tier": rng.choice(TIERS),
+                "entity_counts": counts,
+                "total_entities": sum(c for _, c in counts),
+                "label_applied": rng.random() < 0.4,
+                "scanned_at": date,
+            }
+            for k in cols:
+                cols[k].append(row.get(k))
+        storage.write_parquet(
+            f"scan_results/tenant={TENANT}/target={TENANT}/scan_date={date:%Y-%m-%d}/part-0.parquet",
+            pa.table(cols, schema=SCAN_RESULTS_SCHEMA),
+        )
+
+
+async def page_load(dashboard: DuckDBDashboardService) -> float:
+    end = datetime(2026, 1, 31, tzinfo=timezone.utc)
+    begin = end - timedelta(days=30)
+    started = time.perf_counter()
+    await asyncio.gather(
+        dashboard.get_file_stats(TENANT),
+        dashboard.get_trends(TENANT, begin, end),
+        dashboard.get_entity_trends(TENANT, begin, end),
+    )
+    return time.perf_counter() - started
+
+
+async def run(engine: DuckDBEngine, viewers: int, cache_entries: int, rounds: int) -> list[float]:
+    svc = AnalyticsService(engine, max_workers=4, cache_entries=cache_entries)
+    dashboard = DuckDBDashboardService(svc)
+    latencies: list[float] = []
+    try:
+        for _ in range(rounds):
+            latencies += await asyncio.gather(*[page_load(dashboard) for _ in range(viewers)])
+    finally:
+        svc._executor.shutdown(wait=True)
+    return latencies
+
+
+def _pct(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--viewers", default="1,4,16,32")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        storage = LocalStorage(root)
+        write_catalog(storage, args.rows)
+        engine = DuckDBEngine(root, memory_limit="2GB", threads=4)
+
+        print(f"{'viewers':>7} {'nocache p50':>12} {'p95':>8} {'cache p50':>10} {'p95':>8}")
+        for viewers in [int(v) for v in args.viewers.split(",")]:
+            cold = asyncio.run(run(engine, viewers, 0, args.rounds))
+            warm = asyncio.run(run(engine, viewers, 256, args.rounds))
+            print(
+                f"{viewers:>7} {_pct(cold, 50) * 1e3:>10.1f}ms {_pct(cold, 95) * 1e3:>6.1f}ms"
+                f" {_pct(warm, 50) * 1e3:>8.1f}ms {_pct(warm, 95) * 1e3:>6.1f}ms"
+            )
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Benchmark: per-event ORM inserts vs COPY + aggregated UPDATE for access events.
+
+Reports sustained events/second for each flush size against a real
+PostgreSQL database (the migrated OpenLabels schema, with a
+``file_access_events`` partition covering the current date). Each run
+executes in a transaction that is rolled back, so nothing is kept.
+
+Usage: python scripts/bench_event_ingest.py --database-url URL
+       [--events 20000] [--files 500] [--flush-sizes 500,5000,20000] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from openlabels.monitoring.ingest import persist_access_events, resolve_monitored_files
+from openlabels.monitoring.providers.base import RawAccessEvent
+from openlabels.server.models import FileAccessEvent, MonitoredFile, Tenant, generate_uuid
+
+ACTIONS = ("read", "write", "delete", "rename", "execute")
+
+
+def make_events(count: int, paths: list[str], seed: int = 0) -> list[RawAccessEvent]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    return [
+        RawAccessEvent(
+            file_path=rng.choice(paths),
+            event_time=now - timedelta(milliseconds=rng.randint(0, 60_000)),
+            action=rng.choice(ACTIONS),
+            event_source="bench",
+            user_sid="S-1-5-21-1-2-3-1001",
+            user_name="bench",
+            process_id=rng.randint(100, 9999),
+        )
+        for _ in range(count)
+    ]
+
+
+async def orm_flush(session, events: list[RawAccessEvent]) -> None:
+    """The previous path: one ORM object and one file mutation per event."""
+    result = await session.execute(
+        select(MonitoredFile).where(MonitoredFile.file_path.in_({e.file_path for e in events}))
+    )
+    by_path = {mf.file_path: mf for mf in result.scalars()}
+    for event in events:
+        mf = by_path[event.file_path]
+        session.add(FileAccessEvent(
+            tenant_id=mf.tenant_id,
+            monitored_file_id=mf.id,
+            file_path=event.file_path,
+            action=event.action,
+            success=event.success,
+            user_sid=event.user_sid,
+            user_name=event.user_name,
+            process_id=event.process_id,
+            event_source=event.event_source,
+            event_time=event.event_time,
+        ))
+        mf.access_count = (mf.access_count or 0) + 1
+        if mf.last_event_at is None or event.event_time > mf.last_event_at:
+            mf.last_event_at = event.event_time
+    await session.flush()
+
+
+async def bulk_flush(session, events: list[RawAccessEvent]) -> None:
+    mapping = await resolve_monitored_files(session, {e.file_path for e in events})
+    await persist_access_events(session, events, mapping)
+
+
+async def run_once(engine, flush, events, flush_size, n_files) -> float:
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        try:
+            tenant_id = generate_uuid()
+            await session.execute(insert(Tenant.__table__), [{"id": tenant_id, "name": "bench"}])
+            await session.execute(insert(MonitoredFile.__table__), [
+                {
+                    "id": generate_uuid(), "tenant_id": tenant_id,
+                    "file_path": f"/bench/file-{i}.docx", "risk_tier": "HIGH",
+                    "access_count": 0,
+                }
+                for i in range(n_files)
+            ])
+
+            start = time.perf_counter()
+            for offset in range(0, len(events), flush_size):
+                await flush(session, events[offset:offset + flush_size])
+            return time.perf_counter() - start
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+async def main_async(args) -> None:
+    engine = create_async_engine(args.database_url)
+    paths = [f"/bench/file-{i}.docx" for i in range(args.files)]
+    events = make_events(args.events, paths)
+    flush_sizes = [int(s) for s in args.flush_sizes.split(",")]
+
+    print(f"{'flush':>7} {'orm ev/s':>10} {'copy ev/s':>10} {'speedup':>8}")
+    try:
+        for size in flush_sizes:
+            orm_s = min([
+                await run_once(engine, orm_flush, events, size, args.files)
+                for _ in range(args.repeat)
+            ])
+            bulk_s = min([
+                await run_once(engine, bulk_flush, events, size, args.files)
+                for _ in range(args.repeat)
+            ])
+            n = len(events)
+            print(f"{size:>7} {n / orm_s:>10.0f} {n / bulk_s:>10.0f} {orm_s / bulk_s:>7.1f}x")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default=os.getenv("TEST_DATABASE_URL"))
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--flush-sizes", default="500,5000,20000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("--database-url (or TEST_DATABASE_URL) is required")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Benchmark: object-based span deduplication vs the columnar SpanTable sweep.
+
+Generates dense synthetic detections (phone/date/IP hits as in log files
+and CSV exports, with duplicate detectors, contained matches and
+partial overlaps) and times resolve_spans against the previous
+object-based implementation, checking both produce identical spans.
+
+Usage: python scripts/bench_span_resolve.py [--spans 100000 1000000] [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+
+from openlabels.core.pipeline.span_resolver import (
+    OverlapStrategy,
+    drop_contained_spans,
+    resolve_spans,
+)
+from openlabels.core.types import Span, Tier, normalize_entity_type
+
+TYPES = ["PHONE", "DATE", "IP_ADDRESS", "phone", "EMAIL"]
+TIERS = [Tier.PATTERN, Tier.CHECKSUM, Tier.ML, Tier.STRUCTURED]
+
+
+def make_spans(count: int, seed: int = 0) -> list[Span]:
+    rng = random.Random(seed)
+    spans: list[Span] = []
+    pos = 0
+    while len(spans) < count:
+        pos += rng.randint(1, 12)
+        length = rng.randint(4, 16)
+        kind = rng.random()
+        if kind < 0.2:
+            # Same hit from a second detector
+            starts = [(pos, length), (pos, length)]
+        elif kind < 0.3:
+            # Contained sub-match
+            starts = [(pos, length), (pos + 1, max(1, length - 2))]
+        elif kind < 0.45:
+            # Partial overlap
+            starts = [(pos, length), (pos + length // 2, length)]
+        else:
+            starts = [(pos, length)]
+        for start, size in starts:
+            spans.append(Span(
+                start=start,
+                end=start + size,
+                text="x" * size,
+                entity_type=rng.choice(TYPES),
+                confidence=round(rng.uniform(0.5, 1.0), 2),
+                detector="bench",
+                tier=rng.choice(TIERS),
+            ))
+        pos += length
+    return spans[:count]
+
+
+def legacy_deduplicate(spans, strategy=OverlapStrategy.HIGHER_CONFIDENCE):
+    """The object-based resolver the SpanTable sweep replaced."""
+    result: list[Span] = []
+    for span in sorted(spans, key=lambda s: (s.start, -s.tier.value, -s.confidence)):
+        absorbed = False
+        i = len(result) - 1
+        while i >= 0:
+            accepted = result[i]
+            if accepted.end <= span.start:
+                break
+            if not accepted.overlaps(span):
+                i -= 1
+                continue
+            better = (span.tier.value > accepted.tier.value
+                      or (span.tier.value == accepted.tier.value
+                          and span.confidence > accepted.confidence))
+            if span.start == accepted.start and span.end == accepted.end:
+                if better:
+                    result[i] = span
+                absorbed = True
+                break
+            if accepted.contains(span):
+                absorbed = True
+                break
+            if span.contains(accepted):
+                result.pop(i)
+                i -= 1
+                continue
+            if normalize_entity_type(accepted.entity_type) == normalize_entity_type(span.entity_type):
+                left, right = (accepted, span) if accepted.start <= span.start else (span, accepted)
+                base = span if better else accepted
+                span = Span(
+                    start=min(accepted.start, span.start),
+                    end=max(accepted.end, span.end),
+                    text=left.text + right.text[left.end - right.start:],
+                    entity_type=base.entity_type,
+                    confidence=max(accepted.confidence, span.confidence),
+                    detector=base.detector,
+                    tier=base.tier,
+                )
+                result.pop(i)
+                i -= 1
+                continue
+            if (span.confidence > accepted.confidence
+                    or (span.confidence == accepted.confidence
+                        and span.tier.value > accepted.tier.value)):
+                result.pop(i)
+                i -= 1
+                continue
+            absorbed = True
+            break
+        if not absorbed:
+            result.append(span)
+    result.sort(key=lambda s: (s.start, -s.end))
+    return result
+
+
+def legacy_drop_contained(spans):
+    """The tiered pipeline's previous pairwise containment filter."""
+    result: list[Span] = []
+    for span in sorted(spans, key=lambda s: (s.start, -s.tier.value, -s.confidence)):
+        if not any(span.overlaps(a) and a.contains(span) for a in result):
+            result.append(span)
+    return result
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _key(spans):
+    return [(s.start, s.end, s.text, s.entity_type, s.confidence, s.tier) for s in spans]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--spans", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'spans':>9} {'legacy s':>9} {'sweep s':>9} {'speedup':>8} {'kept':>9}")
+    for count in args.spans:
+        spans = make_spans(count)
+        expected = legacy_deduplicate(spans)
+        actual = resolve_spans(spans)
+        if _key(expected) != _key(actual):
+            raise SystemExit(f"{count}: sweep output differs from legacy resolver")
+
+        legacy_s = _best(lambda spans=spans: legacy_deduplicate(spans), args.repeat)
+        sweep_s = _best(lambda spans=spans: resolve_spans(spans), args.repeat)
+        print(f"{count:>9} {legacy_s:>9.3f} {sweep_s:>9.3f} "
+              f"{legacy_s / sweep_s:>7.1f}x {len(actual):>9}")
+
+    # The containment filter was pairwise (quadratic); keep its input small
+    small = make_spans(min(args.spans[0], 20_000))
+    if _key(legacy_drop_contained(small)) != _key(drop_contained_spans(small)):
+        raise SystemExit("drop_contained_spans output differs from legacy filter")
+    legacy_s = _best(lambda: legacy_drop_contained(small), 1)
+    sweep_s = _best(lambda: drop_contained_spans(small), args.repeat)
+    print(f"\ncontainment filter, {len(small)} spans: legacy {legacy_s:.3f}s, "
+          f"sweep {sweep_s:.3f}s ({legacy_s / sweep_s:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone
 from types import TracebackType
 
@@ -23,7 +24,9 @@ from openlabels.adapters.base import (
     FileInfo,
     FilterConfig,
     PartitionSpec,
+    chunked,
     is_label_compatible,
+    iter_pages_in_thread,
     resolve_prefix,
     validate_content_size,
     validate_file_size,
@@ -39,6 +42,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Blobs per thread hop when streaming item iterators (matches the API page size)
+_LIST_CHUNK_SIZE = 1000
+
 
 class AzureBlobAdapter:
     """Azure Blob Storage adapter — scans blobs in Azure containers.
@@ -140,56 +146,58 @@ class AzureBlobAdapter:
             blob_iter_factory = lambda: container.list_blobs(**kwargs)
 
         # Stream page-by-page: Azure SDK returns a lazy ItemPaged iterator.
-        # We use by_page() to iterate one page at a time, fetching each
-        # page in a thread to avoid blocking the event loop.
+        # by_page() yields one page per request; each is fetched in a
+        # worker thread, the next one in the background while this one
+        # is consumed.
         paged_iter = await asyncio.to_thread(lambda: blob_iter_factory().by_page())
-        pages = await asyncio.to_thread(lambda: list(paged_iter))
 
         start_after = partition.start_after if partition else None
         end_before = partition.end_before if partition else None
 
-        for page in pages:
-            hit_boundary = False
-            for blob in page:
-                blob_name: str = blob.name
-                # Skip "directory" markers
-                if blob_name.endswith("/"):
-                    continue
-                # walk_blobs returns BlobPrefix objects for directories — skip them
-                if not hasattr(blob, "size"):
-                    continue
-
-                # Apply partition boundaries
-                if start_after and blob_name <= start_after:
-                    continue
-                if end_before and blob_name >= end_before:
-                    hit_boundary = True
+        async with aclosing(iter_pages_in_thread(paged_iter)) as pages:
+            async for page in pages:
+                hit_boundary = False
+                for blob in page:
+                    blob_name: str = blob.name
+                    # Skip "directory" markers
+                    if blob_name.endswith("/"):
+                        continue
+                    # walk_blobs returns BlobPrefix objects for directories — skip them
+                    if not hasattr(blob, "size"):
+                        continue
+
+                    # Apply partition boundaries
+                    if start_after and blob_name <= start_after:
+                        continue
+                    if end_before and blob_name >= end_before:
+                        hit_boundary = True
+                        break
+
+                    short_name = blob_name.rsplit("/", 1)[-1]
+                    modified = blob.last_modified or datetime.now(timezone.utc)
+                    size = blob.size or 0
+                    etag = (blob.etag or "").strip('"')
+
+                    file_info = FileInfo(
+                        path=f"https://{self._storage_account}.blob.core.windows.net/{self._container_name}/{blob_name}",
+                        name=short_name,
+                        size=size,
+                        modified=modified,
+                        adapter="azure_blob",
+                        item_id=blob_name,  # full blob name for read/get_metadata
+                        exposure=ExposureLevel.PRIVATE,
+                        permissions={"etag": etag},
+                        change_token=etag or None,
+                    )
+
+                    if filter_config and not filter_config.should_include(file_info):
+                        continue
+
+                    yield file_info
+
+                if hit_boundary:
                     break
 
-                short_name = blob_name.rsplit("/", 1)[-1]
-                modified = blob.last_modified or datetime.now(timezone.utc)
-                size = blob.size or 0
-                etag = (blob.etag or "").strip('"')
-
-                file_info = FileInfo(
-                    path=f"https://{self._storage_account}.blob.core.windows.net/{self._container_name}/{blob_name}",
-                    name=short_name,
-                    size=size,
-                    modified=modified,
-                    adapter="azure_blob",
-                    item_id=blob_name,  # full blob name for read/get_metadata
-                    exposure=ExposureLevel.PRIVATE,
-                    permissions={"etag": etag},
-                )
-
-                if filter_config and not filter_config.should_include(file_info):
-                    continue
-
-                yield file_info
-
-            if hit_boundary:
-                break
-
     async def list_top_level_prefixes(
         self,
         target: str = "",
@@ -213,10 +221,21 @@ class AzureBlobAdapter:
         prefix = self._resolve_prefix(target)
 
         blob_iter = await asyncio.to_thread(
-            lambda: container.list_blobs(name_starts_with=prefix, results_per_page=1000)
+            lambda: container.list_blobs(name_starts_with=prefix, results_per_page=_LIST_CHUNK_SIZE)
         )
-        blobs = await asyncio.to_thread(lambda: list(blob_iter))
-        keys = [b.name for b in blobs[:sample_limit] if not b.name.endswith("/") and hasattr(b, "size")]
+        # Stop listing once the sample is full instead of walking the container
+        keys: list[str] = []
+        seen = 0
+        async with aclosing(
+            iter_pages_in_thread(chunked(blob_iter, _LIST_CHUNK_SIZE))
+        ) as chunks:
+            async for blobs in chunks:
+                for b in blobs[:sample_limit - seen]:
+                    if not b.name.endswith("/") and hasattr(b, "size"):
+                        keys.append(b.name)
+                seen += len(blobs)
+                if seen >= sample_limit:
+                    break
         return len(keys), keys
 
     async def list_folders(
@@ -309,6 +328,7 @@ class AzureBlobAdapter:
                 "etag": etag,
                 "metadata": dict(props.metadata or {}),
             },
+            change_token=etag or None,
         )
 
 
@@ -416,12 +436,12 @@ class AzureBlobAdapter:
         blob_iter = await asyncio.to_thread(
             lambda: container.list_blobs(name_starts_with=resolved)
         )
-        blobs = await asyncio.to_thread(lambda: list(blob_iter))
-        return {
-            b.name: (b.etag or "").strip('"')
-            for b in blobs
-            if not b.name.endswith("/")
-        }
+        result: dict[str, str] = {}
+        async for blobs in iter_pages_in_thread(chunked(blob_iter, _LIST_CHUNK_SIZE)):
+            for b in blobs:
+                if not b.name.endswith("/"):
+                    result[b.name] = (b.etag or "").strip('"')
+        return result
 
 
     def _build_client(self):
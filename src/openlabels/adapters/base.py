@@ -11,19 +11,23 @@ Provides:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import fnmatch
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from types import TracebackType
-from typing import Protocol, runtime_checkable
+from typing import Protocol, TypeVar, runtime_checkable
 
 from openlabels.core.constants import DEFAULT_MAX_READ_BYTES
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Rust file filter acceleration
 _USE_RUST_FILTER = False
 _RustFileFilter = None
@@ -201,9 +205,10 @@ class PartitionSpec:
     Used by the coordinator to tell each worker which slice of the
     keyspace to enumerate.  Adapter-specific interpretation:
     - S3/GCS/Azure Blob: lexicographic key range within the bucket
-    - Filesystem: a specific subdirectory path
-    - SharePoint: a specific site ID
-    - OneDrive: a specific user ID
+    - Filesystem: directory subtrees (``directory``/``directories``),
+      pruning subtrees owned by other partitions (``exclude_directories``)
+    - SharePoint: a batch of site IDs
+    - OneDrive: a batch of user IDs
     """
 
     # Lexicographic key boundaries (inclusive start, exclusive end)
@@ -218,6 +223,12 @@ class PartitionSpec:
     site_id: str | None = None
     user_id: str | None = None
 
+    # Batches for filesystem subtree and SharePoint/OneDrive partitioning
+    directories: list[str] | None = None
+    exclude_directories: list[str] | None = None
+    site_ids: list[str] | None = None
+    user_ids: list[str] | None = None
+
     def to_dict(self) -> dict:
         """Serialize for JSONB storage."""
         return {k: v for k, v in {
@@ -227,6 +238,10 @@ class PartitionSpec:
             "directory": self.directory,
             "site_id": self.site_id,
             "user_id": self.user_id,
+            "directories": self.directories,
+            "exclude_directories": self.exclude_directories,
+            "site_ids": self.site_ids,
+            "user_ids": self.user_ids,
         }.items() if v is not None}
 
     @classmethod
@@ -239,8 +254,29 @@ class PartitionSpec:
             directory=data.get("directory"),
             site_id=data.get("site_id"),
             user_id=data.get("user_id"),
+            directories=data.get("directories"),
+            exclude_directories=data.get("exclude_directories"),
+            site_ids=data.get("site_ids"),
+            user_ids=data.get("user_ids"),
         )
 
+    def listing_roots(self) -> list[str]:
+        """
+        Directories, sites or users this partition enumerates.
+
+        Empty for key-range partitions of object stores.
+        """
+        roots: list[str] = []
+        for single, batch in (
+            (self.directory, self.directories),
+            (self.site_id, self.site_ids),
+            (self.user_id, self.user_ids),
+        ):
+            if single:
+                roots.append(single)
+            roots.extend(batch or [])
+        return roots
+
 
 @dataclass
 class FileInfo:
@@ -262,6 +298,7 @@ class FileInfo:
 
     # Delta tracking
     change_type: str | None = None  # 'created', 'modified', 'deleted' for delta queries
+    change_token: str | None = None  # Adapter-native content version (ETag, cTag, generation)
 
     @classmethod
     def from_scan_result(
@@ -511,3 +548,74 @@ def validate_content_size(
             f"File content exceeds limit: {len(content)} bytes "
             f"(max: {max_size_bytes} bytes). File: {file_path}"
         )
+
+
+# Sentinel marking exhaustion of a blocking page iterator
+_PAGES_DONE = object()
+
+
+class _PageError:
+    """Carries an exception from the page-fetch task to the consumer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def iter_pages_in_thread(
+    pages: Iterable[T],
+    prefetch: int = 1,
+) -> AsyncIterator[T]:
+    """Stream a blocking (SDK) page iterator without blocking the event loop.
+
+    Each ``next()`` call runs in a worker thread. A background task keeps
+    fetching while the caller consumes the current page, but stays at most
+    *prefetch* pages ahead, so memory is bounded by a few pages no matter
+    how large the listing is. Breaking out early stops the fetcher.
+
+    Exceptions raised by the SDK surface from the ``async for`` at the
+    point in the stream where they occurred.
+    """
+    iterator = iter(pages)
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+
+    async def _fetch() -> None:
+        try:
+            while True:
+                page = await asyncio.to_thread(next, iterator, _PAGES_DONE)
+                await buffer.put(page)
+                if page is _PAGES_DONE:
+                    return
+        except Exception as e:  # noqa: BLE001 — re-raised in the consumer
+            await buffer.put(_PageError(e))
+
+    fetcher = asyncio.create_task(_fetch())
+    try:
+        while True:
+            page = await buffer.get()
+            if page is _PAGES_DONE:
+                return
+            if isinstance(page, _PageError):
+                raise page.error
+            yield page
+    finally:
+        fetcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await fetcher
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Group a lazy item iterator into lists of *size* items.
+
+    Lets SDK iterators that only expose items (not pages) be streamed
+    through :func:`iter_pages_in_thread` one chunk per thread hop.
+    """
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
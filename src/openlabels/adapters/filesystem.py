@@ -24,13 +24,25 @@ from types import TracebackType
 import aiofiles
 import aiofiles.os
 
-from openlabels.adapters.base import DEFAULT_FILTER, ExposureLevel, FileInfo, FilterConfig, FolderInfo
+from openlabels.adapters.base import (
+    DEFAULT_FILTER,
+    ExposureLevel,
+    FileInfo,
+    FilterConfig,
+    FolderInfo,
+    PartitionSpec,
+)
 from openlabels.core.constants import DEFAULT_MAX_READ_BYTES
 from openlabels.exceptions import FilesystemError
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_dir(path: str) -> str:
+    """Normalize a directory path for comparison (no trailing separator)."""
+    return path.rstrip("/\\") or path
+
+
 class FilesystemAdapter:
     """
     Adapter for local and network filesystem scanning.
@@ -73,6 +85,7 @@ class FilesystemAdapter:
         target: str,
         recursive: bool = True,
         filter_config: FilterConfig | None = None,
+        partition: PartitionSpec | None = None,
     ) -> AsyncIterator[FileInfo]:
         """
         List files in a directory.
@@ -81,6 +94,9 @@ class FilesystemAdapter:
             target: Directory path to scan
             recursive: Whether to scan subdirectories
             filter_config: Optional filter for file/account exclusions
+            partition: Optional partition spec. Its directories are walked
+                instead of ``target`` (which stays the symlink boundary),
+                skipping its ``exclude_directories`` subtrees.
 
         Yields:
             FileInfo objects for each file (after filtering)
@@ -88,6 +104,23 @@ class FilesystemAdapter:
         filter_config = filter_config or DEFAULT_FILTER
         target_path = Path(target)
 
+        roots = partition.listing_roots() if partition is not None else []
+        if roots:
+            exclude = frozenset(_normalize_dir(d) for d in partition.exclude_directories or [])
+            for root in roots:
+                root_path = Path(root)
+                is_dir = await asyncio.to_thread(root_path.is_dir)
+                if not is_dir:
+                    # Removed since the directory tree was indexed
+                    logger.warning(f"Skipping missing partition directory: {root}")
+                    continue
+                async for file_info in self._walk_directory(
+                    root_path, recursive, filter_config,
+                    _scan_root=target_path, _exclude=exclude,
+                ):
+                    yield file_info
+            return
+
         exists, is_dir = await asyncio.to_thread(
             lambda: (target_path.exists(), target_path.is_dir()),
         )
@@ -270,12 +303,14 @@ class FilesystemAdapter:
         recursive: bool,
         filter_config: FilterConfig,
         _scan_root: Path | None = None,
+        _exclude: frozenset[str] = frozenset(),
     ) -> AsyncIterator[FileInfo]:
         """Recursively walk a directory with filtering.
 
         All blocking I/O for each directory level is batched into a
         single ``asyncio.to_thread(_collect_entries, ...)`` call to
-        minimise thread-pool overhead.
+        minimise thread-pool overhead. Subdirectories in ``_exclude``
+        (normalized paths) are not descended into.
 
         Security: Symlinks are resolved and validated against the scan
         root to prevent path traversal attacks where a symlink inside
@@ -315,9 +350,13 @@ class FilesystemAdapter:
                         skip_dir = True
                         break
 
+                if _exclude and _normalize_dir(str(subdir)) in _exclude:
+                    skip_dir = True
+
                 if not skip_dir:
                     async for file_info in self._walk_directory(
-                        subdir, recursive, filter_config, _scan_root=scan_root
+                        subdir, recursive, filter_config,
+                        _scan_root=scan_root, _exclude=_exclude,
                     ):
                         yield file_info
 
@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone
 from types import TracebackType
 
@@ -23,7 +24,9 @@ from openlabels.adapters.base import (
     FileInfo,
     FilterConfig,
     PartitionSpec,
+    chunked,
     is_label_compatible,
+    iter_pages_in_thread,
     resolve_prefix,
     validate_content_size,
     validate_file_size,
@@ -37,6 +40,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Blobs per thread hop when streaming item iterators (matches the API page size)
+_LIST_CHUNK_SIZE = 1000
+
 
 class GCSAdapter:
     """Google Cloud Storage adapter — scans objects in GCS buckets.
@@ -134,8 +140,9 @@ class GCSAdapter:
             kwargs["end_offset"] = partition.end_before
 
         # Stream page-by-page: GCS list_blobs returns a lazy HTTPIterator.
-        # We pull one page at a time via to_thread to avoid blocking the
-        # event loop while keeping memory bounded to ~one page of blobs.
+        # Each page is fetched in a worker thread, the next one in the
+        # background while this one is consumed, so memory stays bounded
+        # to a couple of pages of blobs.
         blob_iterator = await asyncio.to_thread(
             lambda: bucket.list_blobs(**kwargs)
         )
@@ -143,44 +150,45 @@ class GCSAdapter:
         end_before = partition.end_before if partition else None
 
         # Iterate pages — each page is a list of blob objects
-        pages = await asyncio.to_thread(lambda: list(blob_iterator.pages))
-        for page in pages:
-            hit_boundary = False
-            for blob in page:
-                name_str: str = blob.name
-                # Skip "directory" markers
-                if name_str.endswith("/"):
-                    continue
-
-                # Extra boundary check in case SDK doesn't respect end_offset
-                if end_before and name_str >= end_before:
-                    hit_boundary = True
+        async with aclosing(iter_pages_in_thread(blob_iterator.pages)) as pages:
+            async for page in pages:
+                hit_boundary = False
+                for blob in page:
+                    name_str: str = blob.name
+                    # Skip "directory" markers
+                    if name_str.endswith("/"):
+                        continue
+
+                    # Extra boundary check in case SDK doesn't respect end_offset
+                    if end_before and name_str >= end_before:
+                        hit_boundary = True
+                        break
+
+                    short_name = name_str.rsplit("/", 1)[-1]
+                    modified = blob.updated or datetime.now(timezone.utc)
+                    size = blob.size or 0
+                    generation = blob.generation
+
+                    file_info = FileInfo(
+                        path=f"gs://{self._bucket_name}/{name_str}",
+                        name=short_name,
+                        size=size,
+                        modified=modified,
+                        adapter="gcs",
+                        item_id=name_str,  # full blob name for read/get_metadata
+                        exposure=ExposureLevel.PRIVATE,
+                        permissions={"generation": generation},
+                        change_token=str(generation) if generation else None,
+                    )
+
+                    if filter_config and not filter_config.should_include(file_info):
+                        continue
+
+                    yield file_info
+
+                if hit_boundary:
                     break
 
-                short_name = name_str.rsplit("/", 1)[-1]
-                modified = blob.updated or datetime.now(timezone.utc)
-                size = blob.size or 0
-                generation = blob.generation
-
-                file_info = FileInfo(
-                    path=f"gs://{self._bucket_name}/{name_str}",
-                    name=short_name,
-                    size=size,
-                    modified=modified,
-                    adapter="gcs",
-                    item_id=name_str,  # full blob name for read/get_metadata
-                    exposure=ExposureLevel.PRIVATE,
-                    permissions={"generation": generation},
-                )
-
-                if filter_config and not filter_config.should_include(file_info):
-                    continue
-
-                yield file_info
-
-            if hit_boundary:
-                break
-
     async def list_top_level_prefixes(
         self,
         target: str = "",
@@ -210,8 +218,9 @@ class GCSAdapter:
         blob_iter = await asyncio.to_thread(
             lambda: bucket.list_blobs(prefix=prefix, max_results=sample_limit)
         )
-        blobs = await asyncio.to_thread(lambda: list(blob_iter))
-        keys = [b.name for b in blobs if not b.name.endswith("/")]
+        keys: list[str] = []
+        async for blobs in iter_pages_in_thread(chunked(blob_iter, _LIST_CHUNK_SIZE)):
+            keys.extend(b.name for b in blobs if not b.name.endswith("/"))
         return len(keys), keys
 
     async def list_folders(
@@ -305,6 +314,7 @@ class GCSAdapter:
                 "generation": blob.generation,
                 "metadata": blob.metadata or {},
             },
+            change_token=str(blob.generation) if blob.generation else None,
         )
 
 
@@ -422,8 +432,12 @@ class GCSAdapter:
         blob_iter = await asyncio.to_thread(
             lambda: bucket.list_blobs(prefix=resolved)
         )
-        blobs = await asyncio.to_thread(lambda: list(blob_iter))
-        return {b.name: b.generation for b in blobs if not b.name.endswith("/")}
+        result: dict[str, int] = {}
+        async for blobs in iter_pages_in_thread(chunked(blob_iter, _LIST_CHUNK_SIZE)):
+            for b in blobs:
+                if not b.name.endswith("/"):
+                    result[b.name] = b.generation
+        return result
 
 
     def _build_client(self):
@@ -141,6 +141,8 @@ class BaseGraphAdapter:
             "exposure": self._determine_exposure(item),
             "adapter": self.adapter_type,
             "item_id": item["id"],
+            # cTag only changes with content; eTag also changes on metadata edits
+            "change_token": item.get("cTag") or item.get("eTag"),
         }
 
     def _folder_from_item(self, item: dict, **extra) -> FolderInfo:
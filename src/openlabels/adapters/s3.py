@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone
 from types import TracebackType
 
@@ -24,6 +25,7 @@ from openlabels.adapters.base import (
     FilterConfig,
     PartitionSpec,
     is_label_compatible,
+    iter_pages_in_thread,
     resolve_prefix,
     validate_content_size,
     validate_file_size,
@@ -40,22 +42,20 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-async def _iter_s3_pages(paginator_result) -> list[dict]:
-    """Fetch all pages from a boto3 paginator via a thread.
+# Pages fetched ahead of the consumer (each ListObjectsV2 page is <= 1000 keys)
+_LIST_PREFETCH_PAGES = 1
 
-    boto3 paginators are synchronous lazy iterators. We run the iteration
-    in a thread to avoid blocking the event loop. For true one-page-at-a-time
-    streaming, the caller iterates the returned list; memory is bounded
-    by one full page (~1000 keys per page ≈ few hundred KB) rather than
-    the entire listing.
 
-    Note: boto3 paginators don't support partial iteration across threads
-    cleanly, so we still materialize all pages. However, the key difference
-    from the previous approach is that list_files now *yields* FileInfo per
-    page rather than waiting for all pages before yielding anything.
-    For truly large buckets, use the fan-out coordinator to split work.
+def _iter_s3_pages(paginator_result) -> AsyncIterator[dict]:
+    """Stream pages from a boto3 paginator without blocking the event loop.
+
+    boto3 paginators are synchronous lazy iterators. Each page request runs
+    in a worker thread, and the next page is fetched in the background while
+    the caller processes the current one. Only a bounded number of pages is
+    held at a time, so time-to-first-key and memory do not grow with the
+    bucket size.
     """
-    return await asyncio.to_thread(list, paginator_result)
+    return iter_pages_in_thread(paginator_result, prefetch=_LIST_PREFETCH_PAGES)
 
 
 class S3Adapter:
@@ -163,51 +163,52 @@ class S3Adapter:
 
         end_before = partition.end_before if partition else None
 
-        # Stream page-by-page to avoid materializing millions of keys.
-        # boto3 paginators are synchronous iterators so we fetch one page
-        # at a time via to_thread to avoid blocking the event loop.
+        # Stream page-by-page to avoid materializing millions of keys;
+        # the next page is fetched in the background while this one is
+        # being yielded.
         page_iter = paginator.paginate(**page_kwargs)
 
-        # Use a queue-based approach: fetch pages one at a time in a thread
-        for page in await _iter_s3_pages(page_iter):
-            hit_boundary = False
-            for obj in page.get("Contents", []):
-                key: str = obj["Key"]
-
-                # Stop early if past the partition boundary
-                if end_before and key >= end_before:
-                    hit_boundary = True
+        async with aclosing(_iter_s3_pages(page_iter)) as pages:
+            async for page in pages:
+                hit_boundary = False
+                for obj in page.get("Contents", []):
+                    key: str = obj["Key"]
+
+                    # Stop early if past the partition boundary
+                    if end_before and key >= end_before:
+                        hit_boundary = True
+                        break
+
+                    # Skip "directory" markers
+                    if key.endswith("/"):
+                        continue
+
+                    name = key.rsplit("/", 1)[-1]
+                    modified = obj.get("LastModified", datetime.now(timezone.utc))
+                    size = obj.get("Size", 0)
+                    etag = obj.get("ETag", "").strip('"')
+
+                    file_info = FileInfo(
+                        path=f"s3://{self._bucket}/{key}",
+                        name=name,
+                        size=size,
+                        modified=modified,
+                        adapter="s3",
+                        item_id=key,  # store full key for read_file / get_metadata
+                        exposure=ExposureLevel.PRIVATE,
+                        permissions={"etag": etag},
+                        change_token=etag or None,
+                    )
+
+                    if filter_config and not filter_config.should_include(file_info):
+                        continue
+
+                    yield file_info
+
+                # If we hit the partition boundary, stop fetching more pages
+                if hit_boundary:
                     break
 
-                # Skip "directory" markers
-                if key.endswith("/"):
-                    continue
-
-                name = key.rsplit("/", 1)[-1]
-                modified = obj.get("LastModified", datetime.now(timezone.utc))
-                size = obj.get("Size", 0)
-                etag = obj.get("ETag", "").strip('"')
-
-                file_info = FileInfo(
-                    path=f"s3://{self._bucket}/{key}",
-                    name=name,
-                    size=size,
-                    modified=modified,
-                    adapter="s3",
-                    item_id=key,  # store full key for read_file / get_metadata
-                    exposure=ExposureLevel.PRIVATE,
-                    permissions={"etag": etag},
-                )
-
-                if filter_config and not filter_config.should_include(file_info):
-                    continue
-
-                yield file_info
-
-            # If we hit the partition boundary, stop fetching more pages
-            if hit_boundary:
-                break
-
     async def list_top_level_prefixes(
         self,
         target: str = "",
@@ -232,7 +233,7 @@ class S3Adapter:
 
         prefixes: list[str] = []
         page_iter = paginator.paginate(**page_kwargs)
-        for page in await _iter_s3_pages(page_iter):
+        async for page in _iter_s3_pages(page_iter):
             for cp in page.get("CommonPrefixes", []):
                 prefixes.append(cp["Prefix"])
 
@@ -264,7 +265,7 @@ class S3Adapter:
 
         keys: list[str] = []
         page_iter = paginator.paginate(**page_kwargs)
-        for page in await _iter_s3_pages(page_iter):
+        async for page in _iter_s3_pages(page_iter):
             for obj in page.get("Contents", []):
                 key = obj["Key"]
                 if not key.endswith("/"):
@@ -312,6 +313,7 @@ class S3Adapter:
             item_id=key,
             exposure=file_info.exposure,
             permissions={"etag": etag, "metadata": head.get("Metadata", {})},
+            change_token=etag or None,
         )
 
 
@@ -421,22 +423,12 @@ class S3Adapter:
         result: dict[str, str] = {}
 
         page_iter = paginator.paginate(Bucket=self._bucket, Prefix=resolved)
-        for page in await _iter_s3_pages(page_iter):
+        async for page in _iter_s3_pages(page_iter):
             for obj in page.get("Contents", []):
                 result[obj["Key"]] = obj.get("ETag", "").strip('"')
 
         return result
 
-
-    @staticmethod
-    def _iter_pages_sync(paginator_result):
-        """Collect pages from a synchronous boto3 paginator into a list.
-
-        Called inside asyncio.to_thread so the main loop isn't blocked.
-        Returns one page at a time to the caller for streaming consumption.
-        """
-        return list(paginator_result)
-
     def _build_client(self):
         try:
             import boto3
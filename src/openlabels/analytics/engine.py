@@ -1,18 +1,24 @@
 """
 Embedded DuckDB query engine for analytical workloads.
 
-DuckDB runs **in-process** — no separate server.  A single connection is
+DuckDB runs **in-process** — no separate server.  A single database is
 created at startup and all queries are executed against Parquet-backed
 views registered with ``hive_partitioning=true``.
 
 Because DuckDB is not async-native, queries are dispatched to a
 :class:`~concurrent.futures.ThreadPoolExecutor` by
-:class:`~openlabels.analytics.service.AnalyticsService`.
+:class:`~openlabels.analytics.service.AnalyticsService`.  A DuckDB
+connection must not be used from several threads at once, so each
+executor thread queries through its own cursor (a connection to the
+same in-memory database, created on first use); the root connection is
+only used for setup and view registration.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Iterator
 from typing import Any
 
 import duckdb
@@ -33,6 +39,12 @@ class DuckDBEngine:
     ) -> None:
         self._catalog_root = catalog_root.rstrip("/")
         self._db = duckdb.connect(":memory:")
+        # Per-thread cursors; all share the database (and its views)
+        self._local = threading.local()
+        self._cursors: list[duckdb.DuckDBPyConnection] = []
+        self._cursors_lock = threading.Lock()
+        # Views still backed by stub tables (no Parquet files yet)
+        self.stub_views: set[str] = set()
 
         # Validate config values before interpolating into SQL.
         # memory_limit must be a DuckDB-recognised size string.
@@ -126,53 +138,98 @@ class DuckDBEngine:
         # Escape single quotes in path to prevent SQL injection via
         # user-configured catalog_root (e.g. paths containing apostrophes).
         root = self._catalog_root.replace("'", "''")
+        stub_views: set[str] = set()
 
         for view_name, pattern in self._VIEW_DEFS:
             # Validate view_name is a safe SQL identifier (alphanumeric + underscore only)
             if not view_name.isidentifier():
                 raise ValueError(f"Invalid view name: {view_name!r}")
-            # Drop any previous object (table first, then view) to
-            # avoid DuckDB type-mismatch errors on DROP.
-            self._db.execute(f"DROP TABLE IF EXISTS {view_name};")
-            self._db.execute(f"DROP VIEW IF EXISTS {view_name};")
-
-            try:
-                self._db.execute(f"""
-                    CREATE VIEW {view_name} AS
-                    SELECT * FROM read_parquet(
-                        '{root}/{pattern}',
-                        hive_partitioning = true,
-                        union_by_name = true
-                    );
-                """)
-            except Exception as exc:  # noqa: BLE001
-                # No Parquet files exist yet for this view.  Create an
-                # empty stub table so that ``SELECT ... FROM <view>``
-                # returns zero rows instead of crashing.  The stub is
-                # replaced by a real glob-backed view on the next
-                # ``refresh_views()`` call once data is flushed.
-                self._db.execute(
-                    f"CREATE TABLE {view_name} (placeholder BOOLEAN);"
+            select_sql = f"""
+                SELECT * FROM read_parquet(
+                    '{root}/{pattern}',
+                    hive_partitioning = true,
+                    union_by_name = true
                 )
-                logger.debug(
-                    "No Parquet files for %s yet (stub created): %s",
-                    view_name,
-                    exc,
+            """
+
+            if view_name not in self.stub_views:
+                # Swapped in one statement, so a concurrent query on
+                # another cursor sees either the old view or the new one.
+                try:
+                    self._db.execute(f"CREATE OR REPLACE VIEW {view_name} AS {select_sql};")
+                    continue
+                except Exception as exc:  # noqa: BLE001
+                    # No Parquet files exist yet for this view.  Create an
+                    # empty stub table so that ``SELECT ... FROM <view>``
+                    # returns zero rows instead of crashing.  The stub is
+                    # replaced by a real glob-backed view on the next
+                    # ``refresh_views()`` call once data is flushed.
+                    logger.debug(
+                        "No Parquet files for %s yet (stub created): %s", view_name, exc,
+                    )
+                self._swap(
+                    f"DROP VIEW IF EXISTS {view_name};",
+                    f"CREATE TABLE {view_name} (placeholder BOOLEAN);",
                 )
+                stub_views.add(view_name)
+            else:
+                # A view cannot replace a table, so the stub is dropped and
+                # the view created in one transaction.  If there are still
+                # no files the rollback leaves the stub in place.
+                try:
+                    self._swap(
+                        f"DROP TABLE IF EXISTS {view_name};",
+                        f"CREATE VIEW {view_name} AS {select_sql};",
+                    )
+                except Exception:  # noqa: BLE001
+                    stub_views.add(view_name)
+
+        self.stub_views = stub_views
+
+    def _swap(self, drop_sql: str, create_sql: str) -> None:
+        """Drop and recreate an object atomically on the root connection."""
+        self._db.begin()
+        try:
+            self._db.execute(drop_sql)
+            self._db.execute(create_sql)
+        except Exception:
+            self._db.rollback()
+            raise
+        self._db.commit()
 
     def refresh_views(self) -> None:
         """Re-register views to pick up newly flushed Parquet files."""
         self._register_views()
 
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """Return the calling thread's cursor, creating it on first use."""
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            cur = self._db.cursor()
+            self._local.cursor = cur
+            with self._cursors_lock:
+                self._cursors.append(cur)
+        return cur
+
+    @property
+    def cursor_count(self) -> int:
+        """Number of per-thread cursors opened so far."""
+        return len(self._cursors)
+
     def execute(
         self,
         sql: str,
         params: dict[str, Any] | list[Any] | None = None,
-    ) -> duckdb.DuckDBPyRelation:
-        """Execute a SQL query and return a DuckDB relation."""
+    ) -> duckdb.DuckDBPyConnection:
+        """Execute a SQL query on this thread's cursor.
+
+        The result must be fetched on the same thread before its next
+        query.
+        """
+        cur = self.cursor()
         if params:
-            return self._db.execute(sql, params)
-        return self._db.execute(sql)
+            return cur.execute(sql, params)
+        return cur.execute(sql)
 
     def fetch_all(
         self,
@@ -192,7 +249,41 @@ class DuckDBEngine:
         """Execute SQL and return a PyArrow Table (zero-copy from DuckDB)."""
         return self.execute(sql, params).fetch_arrow_table()
 
+    def iter_record_batches(
+        self,
+        sql: str,
+        params: dict[str, Any] | list[Any] | None = None,
+        *,
+        batch_size: int = 10_000,
+    ) -> Iterator:
+        """Execute SQL and yield PyArrow RecordBatches of up to *batch_size* rows.
+
+        Runs on a dedicated cursor so a long-running stream does not
+        invalidate results of other queries on the shared connection.
+        DuckDB produces batches lazily, so memory stays bounded by one
+        batch regardless of the result size.  The cursor is closed when
+        the generator is exhausted or closed.
+        """
+        cursor = self._db.cursor()
+        try:
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            # DuckDB >= 1.4 renamed fetch_record_batch to to_arrow_reader
+            to_reader = getattr(cursor, "to_arrow_reader", None) or cursor.fetch_record_batch
+            yield from to_reader(batch_size)
+        finally:
+            cursor.close()
+
     def close(self) -> None:
-        """Close the DuckDB connection."""
+        """Close all cursors and the DuckDB connection."""
+        with self._cursors_lock:
+            cursors, self._cursors = self._cursors, []
+        for cur in cursors:
+            try:
+                cur.close()
+            except duckdb.Error:
+                pass
         self._db.close()
         logger.info("DuckDB engine closed")
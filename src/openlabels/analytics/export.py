@@ -0,0 +1,223 @@
+"""
+Per-batch encoders for streaming exports.
+
+Each encoder turns Arrow record batches into response bytes one batch at
+a time, so an export of any size holds at most one batch in memory::
+
+    encoder = create_encoder("parquet", SCAN_RESULTS_EXPORT_COLUMNS)
+    yield encoder.begin()
+    for batch in reader:
+        yield encoder.encode(batch)
+    yield encoder.finish()
+
+CSV and JSON keep the column order of *columns* and fill missing columns
+with empty values; Parquet and Arrow IPC write the batches' own schema
+(or *schema* when the export is empty).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columns and types of a scan results export (shared by the DuckDB and
+# PostgreSQL export paths so every format has the same shape).
+SCAN_RESULTS_EXPORT_SCHEMA = pa.schema(
+    [
+        pa.field("file_path", pa.utf8()),
+        pa.field("file_name", pa.utf8()),
+        pa.field("risk_score", pa.int32()),
+        pa.field("risk_tier", pa.utf8()),
+        pa.field("total_entities", pa.int32()),
+        pa.field("exposure_level", pa.utf8()),
+        pa.field("owner", pa.utf8()),
+        pa.field("current_label_name", pa.utf8()),
+        pa.field("recommended_label_name", pa.utf8()),
+        pa.field("label_applied", pa.bool_()),
+    ]
+)
+SCAN_RESULTS_EXPORT_COLUMNS = SCAN_RESULTS_EXPORT_SCHEMA.names
+
+# Rows per Arrow batch for streaming exports
+EXPORT_BATCH_SIZE = 10_000
+
+
+class BatchEncoder(ABC):
+    """Encode a stream of record batches into one downloadable file."""
+
+    format: str = ""
+    media_type: str = "application/octet-stream"
+    extension: str = ""
+
+    def __init__(self, columns: list[str], schema: pa.Schema | None = None) -> None:
+        self.columns = list(columns)
+        self.schema = schema
+
+    def begin(self) -> bytes:
+        """Bytes written before the first batch."""
+        return b""
+
+    @abstractmethod
+    def encode(self, batch: pa.RecordBatch) -> bytes:
+        """Bytes for one batch."""
+
+    def finish(self) -> bytes:
+        """Bytes written after the last batch."""
+        return b""
+
+    def _rows(self, batch: pa.RecordBatch):
+        """Yield row tuples in ``self.columns`` order."""
+        data = batch.to_pydict()
+        missing = [None] * batch.num_rows
+        return zip(*(data.get(c, missing) for c in self.columns), strict=True)
+
+
+class CsvBatchEncoder(BatchEncoder):
+    format = "csv"
+    media_type = "text/csv"
+    extension = "csv"
+
+    def _write(self, rows) -> bytes:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        return buf.getvalue().encode("utf-8")
+
+    def begin(self) -> bytes:
+        return self._write([self.columns])
+
+    def encode(self, batch: pa.RecordBatch) -> bytes:
+        return self._write(self._rows(batch))
+
+
+class JsonBatchEncoder(BatchEncoder):
+    """JSON array with one compact object per line."""
+
+    format = "json"
+    media_type = "application/json"
+    extension = "json"
+
+    def __init__(self, columns: list[str], schema: pa.Schema | None = None) -> None:
+        super().__init__(columns, schema)
+        self._first = True
+
+    def begin(self) -> bytes:
+        return b"[\n"
+
+    def encode(self, batch: pa.RecordBatch) -> bytes:
+        if batch.num_rows == 0:
+            return b""
+        body = ",\n".join(
+            json.dumps(dict(zip(self.columns, row, strict=True)), default=str)
+            for row in self._rows(batch)
+        )
+        prefix = "" if self._first else ",\n"
+        self._first = False
+        return (prefix + body).encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b"\n]\n"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose contents are drained after each batch."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _ArrowFileEncoder(BatchEncoder):
+    """Shared lifecycle for binary formats backed by a pyarrow writer."""
+
+    def __init__(self, columns: list[str], schema: pa.Schema | None = None) -> None:
+        super().__init__(columns, schema)
+        self._sink = _ChunkSink()
+        self._writer: Any = None
+
+    @abstractmethod
+    def _open(self, schema: pa.Schema) -> Any:
+        """Create the pyarrow writer over ``self._sink``."""
+
+    def _select(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        if batch.schema.names == self.columns:
+            return batch
+        present = [c for c in self.columns if c in batch.schema.names]
+        return batch.select(present)
+
+    def encode(self, batch: pa.RecordBatch) -> bytes:
+        batch = self._select(batch)
+        if self._writer is None:
+            self._writer = self._open(batch.schema)
+        if batch.num_rows:
+            self._writer.write_batch(batch)
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        if self._writer is None:
+            schema = self.schema or pa.schema([(c, pa.null()) for c in self.columns])
+            self._writer = self._open(schema)
+        self._writer.close()
+        return self._sink.drain()
+
+
+class ParquetBatchEncoder(_ArrowFileEncoder):
+    """Parquet file with one row group per batch."""
+
+    format = "parquet"
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def _open(self, schema: pa.Schema) -> Any:
+        return pq.ParquetWriter(self._sink, schema, compression="zstd")
+
+
+class ArrowStreamBatchEncoder(_ArrowFileEncoder):
+    """Arrow IPC stream (readable with ``pyarrow.ipc.open_stream``)."""
+
+    format = "arrow"
+    media_type = "application/vnd.apache.arrow.stream"
+    extension = "arrows"
+
+    def _open(self, schema: pa.Schema) -> Any:
+        return pa.ipc.new_stream(self._sink, schema)
+
+
+ENCODERS: dict[str, type[BatchEncoder]] = {
+    cls.format: cls
+    for cls in (CsvBatchEncoder, JsonBatchEncoder, ParquetBatchEncoder, ArrowStreamBatchEncoder)
+}
+
+
+def create_encoder(
+    format: str,
+    columns: list[str],
+    schema: pa.Schema | None = None,
+) -> BatchEncoder:
+    """Return a fresh encoder for *format* (``csv``, ``json``, ``parquet``, ``arrow``)."""
+    try:
+        return ENCODERS[format](columns, schema)
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {format!r}") from None
@@ -17,7 +17,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pyarrow as pa
 from sqlalchemy import select
@@ -50,6 +50,7 @@ logger = logging.getLogger(__name__)
 
 _METADATA_DIR = "_metadata"
 _FLUSH_STATE_FILE = "flush_state.json"
+_DATA_VERSION_FILE = "data_version"
 
 
 def _flush_state_path(storage: CatalogStorage) -> str:
@@ -77,6 +78,25 @@ def save_flush_state(storage: CatalogStorage, state: dict) -> None:
     storage.write_bytes(path, data)
 
 
+def bump_data_version(storage: CatalogStorage) -> str:
+    """Mark the catalog as changed so query caches are invalidated.
+
+    Writes a fresh token to ``_metadata/data_version``; readers such as
+    :class:`~openlabels.analytics.service.AnalyticsService` compare it
+    with the token they last saw.
+    """
+    token = f"{datetime.now(timezone.utc).isoformat()}-{uuid4().hex[:8]}"
+    storage.write_bytes(f"{_METADATA_DIR}/{_DATA_VERSION_FILE}", token.encode())
+    return token
+
+
+def read_data_version(storage: CatalogStorage) -> str | None:
+    """Return the current catalog data version token (``None`` if never flushed)."""
+    path = f"{_METADATA_DIR}/{_DATA_VERSION_FILE}"
+    if not storage.exists(path):
+        return None
+    return storage.read_bytes(path).decode()
+
 
 async def flush_scan_to_catalog(
     session: AsyncSession,
@@ -123,6 +143,8 @@ async def flush_scan_to_catalog(
         inv_path = file_inventory_path(job.tenant_id, job.target_id)
         storage.write_parquet(inv_path, inv_table)
 
+    bump_data_version(storage)
+
     logger.info(
         "Flushed %d scan results + %d inventory rows for job %s",
         len(rows),
@@ -197,6 +219,8 @@ async def flush_events_to_catalog(
         counts["remediation_actions"] = len(ra_rows)
 
     save_flush_state(storage, state)
+    if any(counts.values()):
+        bump_data_version(storage)
     return counts
 
 
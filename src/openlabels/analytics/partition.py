@@ -69,8 +69,14 @@ def part_filename(sequence: int = 0) -> str:
     return f"part-{sequence:05d}.parquet"
 
 
-def timestamped_part_filename() -> str:
-    """Generate a part file name with a microsecond timestamp to avoid collisions."""
+def timestamped_part_filename(sequence: int | None = None) -> str:
+    """Generate a part file name with a microsecond timestamp to avoid collisions.
+
+    Concurrent writers that may share a microsecond pass a *sequence*
+    number, which is appended to the timestamp.
+    """
     import time
     ts = int(time.time() * 1_000_000)
+    if sequence is not None:
+        return f"part-{ts}-{sequence:05d}.parquet"
     return f"part-{ts}.parquet"
@@ -0,0 +1,509 @@
+"""
+Full re-export of PostgreSQL to the Parquet catalog (``catalog rebuild``).
+
+Each table is read in work units that run concurrently on separate
+database sessions:
+
+- Append-only tables (scan results, access events, audit log,
+  remediation actions) are split into ``workers`` ranges of the UUID
+  primary key, cut at the key quantiles (``percentile_disc``) so each
+  range holds about the same number of rows. Keys are UUIDv7, whose
+  leading bits are a timestamp, so an even split of the UUID space would
+  put every row in the first range. Each range is paged with keyset
+  pagination (``WHERE id > :last ORDER BY id LIMIT n``), so every page
+  costs the same no matter how deep into the table it is.
+- Inventory snapshot tables are read one ``(tenant, target)`` at a
+  time, paged by path through the unique ``(tenant_id, target_id,
+  path)`` index, and written as one ``snapshot.parquet`` per target.
+
+Pages select raw columns, with no ORM objects, and are converted to
+Arrow column by column. Conversion and the Parquet write for one page
+run on a worker thread while the next page is fetched.
+
+Usage:
+    report = await rebuild_catalog(storage, batch_size=10_000, workers=4)
+    print(f"{report.rows} rows at {report.rows_per_second:.0f} rows/s")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pyarrow as pa
+
+from openlabels.analytics.arrow_convert import _entity_counts_to_map, _ts, _uuid_bytes
+from openlabels.analytics.flush import bump_data_version, save_flush_state
+from openlabels.analytics.partition import (
+    access_event_partition,
+    audit_log_partition,
+    file_inventory_path,
+    folder_inventory_path,
+    remediation_action_partition,
+    scan_result_partition,
+    timestamped_part_filename,
+)
+from openlabels.analytics.schemas import (
+    ACCESS_EVENTS_SCHEMA,
+    AUDIT_LOG_SCHEMA,
+    FILE_INVENTORY_SCHEMA,
+    FOLDER_INVENTORY_SCHEMA,
+    REMEDIATION_ACTIONS_SCHEMA,
+    SCAN_RESULTS_SCHEMA,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import InstrumentedAttribute
+
+    from openlabels.analytics.storage import CatalogStorage
+
+logger = logging.getLogger(__name__)
+
+# (lower bound, upper bound) of a primary-key range; None = unbounded
+KeyRange = tuple[UUID | None, UUID | None]
+# (tenant_id, target_id) of one inventory snapshot
+SnapshotUnit = tuple[UUID, UUID]
+
+
+def _str_or_none(val: Any) -> str | None:
+    return str(val) if val else None
+
+
+def _float_or_none(val: Any) -> float | None:
+    return float(val) if val is not None else None
+
+
+def _json_or_none(val: Any) -> str | None:
+    return json.dumps(val) if val is not None else None
+
+
+def _json_if_set(val: Any) -> str | None:
+    return json.dumps(val) if val else None
+
+
+def _default_converter(arrow_type: pa.DataType) -> Callable[[Any], Any] | None:
+    """Value converter for a schema field, matching ``arrow_convert``."""
+    if arrow_type == pa.binary(16):
+        return _uuid_bytes
+    if pa.types.is_timestamp(arrow_type):
+        return _ts
+    if pa.types.is_dictionary(arrow_type):
+        return _str_or_none
+    if pa.types.is_map(arrow_type):
+        return _entity_counts_to_map
+    if pa.types.is_floating(arrow_type):
+        return _float_or_none
+    return None
+
+
+@dataclass(frozen=True)
+class RebuildTable:
+    """How one catalog table is exported.
+
+    Every schema field is read from the model attribute of the same
+    name. ``extra_columns`` are selected only for partitioning (e.g.
+    the scan job's ``target_id``).
+    """
+
+    name: str
+    schema: pa.Schema
+    model: str
+    partition_by: tuple[str, ...]
+    partition_path: Callable[..., str]
+    snapshot: bool = False
+    keyset: str = "id"
+    extra_columns: tuple[str, ...] = ()
+    converters: dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+    # Flush-state key and the column whose maximum it records
+    cursor: tuple[str, str] | None = None
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Names of the selected columns, in row order."""
+        return tuple(self.schema.names) + tuple(
+            c for c in self.extra_columns if c not in self.schema.names
+        )
+
+
+TABLES: tuple[RebuildTable, ...] = (
+    RebuildTable(
+        name="scan_results",
+        schema=SCAN_RESULTS_SCHEMA,
+        model="ScanResult",
+        partition_by=("tenant_id", "target_id", "scanned_at"),
+        partition_path=scan_result_partition,
+        extra_columns=("target_id",),
+        converters={"policy_violations": _json_if_set},
+    ),
+    RebuildTable(
+        name="file_inventory",
+        schema=FILE_INVENTORY_SCHEMA,
+        model="FileInventory",
+        partition_by=("tenant_id", "target_id"),
+        partition_path=file_inventory_path,
+        snapshot=True,
+        keyset="file_path",
+    ),
+    RebuildTable(
+        name="folder_inventory",
+        schema=FOLDER_INVENTORY_SCHEMA,
+        model="FolderInventory",
+        partition_by=("tenant_id", "target_id"),
+        partition_path=folder_inventory_path,
+        snapshot=True,
+        keyset="folder_path",
+    ),
+    RebuildTable(
+        name="access_events",
+        schema=ACCESS_EVENTS_SCHEMA,
+        model="FileAccessEvent",
+        partition_by=("tenant_id", "event_time"),
+        partition_path=access_event_partition,
+        cursor=("last_access_event_flush", "collected_at"),
+    ),
+    RebuildTable(
+        name="audit_log",
+        schema=AUDIT_LOG_SCHEMA,
+        model="AuditLog",
+        partition_by=("tenant_id", "created_at"),
+        partition_path=audit_log_partition,
+        converters={"details": _json_or_none},
+        cursor=("last_audit_log_flush", "created_at"),
+    ),
+    RebuildTable(
+        name="remediation_actions",
+        schema=REMEDIATION_ACTIONS_SCHEMA,
+        model="RemediationAction",
+        partition_by=("tenant_id", "created_at"),
+        partition_path=remediation_action_partition,
+        cursor=("last_remediation_action_flush", "created_at"),
+    ),
+)
+
+
+def rows_to_arrow(spec: RebuildTable, rows: Sequence[Sequence[Any]]) -> pa.Table:
+    """Convert raw rows (values in ``spec.columns`` order) to an Arrow table."""
+    columns = list(zip(*rows, strict=True)) if rows else [()] * len(spec.columns)
+    arrays = []
+    for arrow_field, values in zip(spec.schema, columns, strict=False):
+        convert = spec.converters.get(arrow_field.name) or _default_converter(arrow_field.type)
+        converted = values if convert is None else [convert(v) for v in values]
+        arrays.append(pa.array(converted, type=arrow_field.type))
+    return pa.Table.from_arrays(arrays, schema=spec.schema)
+
+
+def partition_groups(
+    spec: RebuildTable,
+    rows: Sequence[Sequence[Any]],
+) -> dict[tuple[Any, ...], list[int]]:
+    """Row indices per partition key; timestamps partition by date."""
+    positions = [spec.columns.index(c) for c in spec.partition_by]
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for idx, row in enumerate(rows):
+        key = tuple(row[p].date() if isinstance(row[p], datetime) else row[p] for p in positions)
+        groups.setdefault(key, []).append(idx)
+    return groups
+
+
+def key_ranges(bounds: Sequence[UUID]) -> list[KeyRange]:
+    """Contiguous ranges covering the key space, split at *bounds*.
+
+    *bounds* are split points such as key quantiles; duplicates (from
+    tables smaller than the number of shards) are dropped.
+    """
+    points = sorted(set(bounds))
+    lows: list[UUID | None] = [None, *points]
+    highs: list[UUID | None] = [*points, None]
+    return list(zip(lows, highs, strict=True))
+
+
+# key_bounds(spec, shards) -> up to shards - 1 ascending keys of spec's
+# table that split it into ranges of about equal row counts.
+KeyBounds = Callable[[RebuildTable, int], Awaitable[list[UUID]]]
+
+
+# fetch_page(spec, unit, after, limit, until) -> rows in spec.columns order,
+# ordered by spec.keyset and strictly after *after* (None = from the start).
+# *unit* is a KeyRange for append tables and (tenant_id, target_id) for
+# snapshot tables. *until* is the inclusive upper bound on the column of
+# spec.cursor (None = unbounded).
+FetchPage = Callable[
+    [RebuildTable, Any, Any, int, datetime | None], Awaitable[Sequence[Sequence[Any]]]
+]
+
+
+@dataclass
+class TableReport:
+    """Rows written and time spent for one table."""
+
+    rows: int = 0
+    files: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class RebuildReport:
+    """Per-table and overall rebuild throughput."""
+
+    tables: dict[str, TableReport] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return sum(t.rows for t in self.tables.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class CatalogRebuilder:
+    """Exports tables to the catalog with concurrent keyset-paged readers."""
+
+    def __init__(
+        self,
+        fetch_page: FetchPage,
+        storage: CatalogStorage,
+        *,
+        list_snapshot_units: Callable[[RebuildTable], Awaitable[list[SnapshotUnit]]],
+        key_bounds: KeyBounds,
+        batch_size: int = 10_000,
+        workers: int = 4,
+        cursors: Mapping[str, datetime | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            fetch_page: Coroutine returning one page of raw rows (see ``FetchPage``)
+            storage: Catalog storage backend
+            list_snapshot_units: Coroutine returning the distinct
+                ``(tenant_id, target_id)`` pairs of a snapshot table
+            key_bounds: Coroutine returning the split points of an
+                append-only table (see ``KeyBounds``)
+            batch_size: Rows per page
+            workers: Work units (database sessions) running at once; also
+                the number of key ranges per append-only table
+            cursors: Flush-state cursors read before the export. Rows of a
+                table with a ``cursor`` past its value are left to the next
+                periodic flush, which would otherwise write them again; a
+                None value means the table was empty and nothing is exported.
+        """
+        self._fetch_page = fetch_page
+        self._list_snapshot_units = list_snapshot_units
+        self._key_bounds = key_bounds
+        self._storage = storage
+        self._batch_size = max(1, batch_size)
+        self._workers = max(1, workers)
+        self._slots = asyncio.Semaphore(self._workers)
+        self._cursors = dict(cursors or {})
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self.report = RebuildReport()
+
+    async def run(
+        self,
+        tables: Sequence[RebuildTable] = TABLES,
+        on_table_done: Callable[[str, TableReport], None] | None = None,
+    ) -> RebuildReport:
+        """Clear and re-export *tables*; returns the throughput report."""
+        started = time.perf_counter()
+
+        async def run_table(spec: RebuildTable) -> None:
+            table_started = time.perf_counter()
+            report = self.report.tables.setdefault(spec.name, TableReport())
+            # Old files would otherwise be read alongside the new ones
+            await asyncio.to_thread(self._storage.delete, spec.name)
+            units: Sequence[SnapshotUnit | KeyRange]
+            if self._exports_nothing(spec):
+                units = []
+            elif spec.snapshot:
+                units = await self._list_snapshot_units(spec)
+            else:
+                units = key_ranges(await self._key_bounds(spec, self._workers))
+            await asyncio.gather(*(self._run_unit(spec, unit, report) for unit in units))
+            report.seconds = time.perf_counter() - table_started
+            if on_table_done is not None:
+                on_table_done(spec.name, report)
+
+        await asyncio.gather(*(run_table(spec) for spec in tables))
+        self.report.seconds = time.perf_counter() - started
+        return self.report
+
+    async def _run_unit(self, spec: RebuildTable, unit: Any, report: TableReport) -> None:
+        keyset = spec.columns.index(spec.keyset)
+        snapshot: list[pa.Table] = []
+        after = None
+        pending: asyncio.Future[None] | None = None
+
+        until = self._cursors.get(spec.cursor[0]) if spec.cursor is not None else None
+
+        async with self._slots:
+            while True:
+                rows = await self._fetch_page(spec, unit, after, self._batch_size, until)
+                # The previous page was converted and written while this one was fetched
+                if pending is not None:
+                    await pending
+                    pending = None
+                if not rows:
+                    break
+                after = rows[-1][keyset]
+                report.rows += len(rows)
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(self._write_page, spec, rows, report, snapshot)
+                )
+                if len(rows) < self._batch_size:
+                    await pending
+                    break
+
+            if snapshot:
+                await asyncio.to_thread(self._write_snapshot, spec, unit, snapshot, report)
+
+    def _write_page(
+        self,
+        spec: RebuildTable,
+        rows: Sequence[Sequence[Any]],
+        report: TableReport,
+        snapshot: list[pa.Table],
+    ) -> None:
+        table = rows_to_arrow(spec, rows)
+        if spec.snapshot:
+            snapshot.append(table)
+            return
+        for key, indices in partition_groups(spec, rows).items():
+            partition = spec.partition_path(*key)
+            self._storage.write_parquet(
+                f"{partition}/{timestamped_part_filename(next(self._sequence))}",
+                table.take(indices),
+            )
+            with self._lock:
+                report.files += 1
+
+    def _exports_nothing(self, spec: RebuildTable) -> bool:
+        """Whether *spec* had no rows when the flush cursors were read."""
+        if spec.cursor is None or spec.cursor[0] not in self._cursors:
+            return False
+        return self._cursors[spec.cursor[0]] is None
+
+    def _write_snapshot(
+        self,
+        spec: RebuildTable,
+        unit: SnapshotUnit,
+        tables: list[pa.Table],
+        report: TableReport,
+    ) -> None:
+        self._storage.write_parquet(spec.partition_path(*unit), pa.concat_tables(tables))
+        with self._lock:
+            report.files += 1
+
+
+def finish_rebuild(storage: CatalogStorage, cursors: dict[str, datetime | None]) -> None:
+    """Reset the flush state to *cursors* and invalidate query caches."""
+    state: dict[str, Any] = {key: val.isoformat() if val else None for key, val in cursors.items()}
+    state["schema_version"] = 1
+    save_flush_state(storage, state)
+    bump_data_version(storage)
+
+
+async def rebuild_catalog(
+    storage: CatalogStorage,
+    *,
+    batch_size: int = 10_000,
+    workers: int = 4,
+    tables: Sequence[RebuildTable] = TABLES,
+    on_table_done: Callable[[str, TableReport], None] | None = None,
+) -> RebuildReport:
+    """Rebuild *tables* from the database configured by ``init_db``.
+
+    Flush-state cursors are read before the export starts and bound what
+    the export reads, so rows that arrive during the rebuild are written
+    once, by the next periodic flush.
+    """
+    from sqlalchemy import func, select
+
+    from openlabels.server import models
+    from openlabels.server.db import get_session_context
+
+    def column(spec: RebuildTable, name: str) -> InstrumentedAttribute[Any]:
+        if spec.model == "ScanResult" and name == "target_id":
+            return models.ScanJob.target_id
+        attribute: InstrumentedAttribute[Any] = getattr(getattr(models, spec.model), name)
+        return attribute
+
+    async def fetch_page(
+        spec: RebuildTable,
+        unit: Any,
+        after: Any,
+        limit: int,
+        until: datetime | None,
+    ) -> Sequence[Sequence[Any]]:
+        model = getattr(models, spec.model)
+        key = column(spec, spec.keyset)
+        query = select(*(column(spec, c) for c in spec.columns))
+        if spec.model == "ScanResult":
+            query = query.join(models.ScanJob, models.ScanJob.id == models.ScanResult.job_id)
+        if spec.snapshot:
+            tenant_id, target_id = unit
+            query = query.where(model.tenant_id == tenant_id, model.target_id == target_id)
+        else:
+            low, high = unit
+            if low is not None:
+                query = query.where(key >= low)
+            if high is not None:
+                query = query.where(key < high)
+        if after is not None:
+            query = query.where(key > after)
+        if spec.cursor is not None and until is not None:
+            query = query.where(column(spec, spec.cursor[1]) <= until)
+        async with get_session_context() as session:
+            result = await session.execute(query.order_by(key).limit(limit))
+            return result.all()
+
+    async def list_snapshot_units(spec: RebuildTable) -> list[SnapshotUnit]:
+        model = getattr(models, spec.model)
+        async with get_session_context() as session:
+            result = await session.execute(select(model.tenant_id, model.target_id).distinct())
+            return [(row.tenant_id, row.target_id) for row in result.all()]
+
+    async def key_bounds(spec: RebuildTable, shards: int) -> list[UUID]:
+        if shards < 2:
+            return []
+        key = column(spec, spec.keyset)
+        # One sort of the key column serves every quantile
+        quantiles = [func.percentile_disc(i / shards).within_group(key) for i in range(1, shards)]
+        async with get_session_context() as session:
+            result = await session.execute(select(*quantiles))
+            row = result.one()
+        return [bound for bound in row if bound is not None]
+
+    cursors: dict[str, datetime | None] = {}
+    async with get_session_context() as session:
+        for spec in tables:
+            if spec.cursor is not None:
+                key, name = spec.cursor
+                result = await session.execute(select(func.max(column(spec, name))))
+                cursors[key] = result.scalar()
+
+    rebuilder = CatalogRebuilder(
+        fetch_page,
+        storage,
+        list_snapshot_units=list_snapshot_units,
+        key_bounds=key_bounds,
+        batch_size=batch_size,
+        workers=workers,
+        cursors=cursors,
+    )
+    report = await rebuilder.run(tables, on_table_done=on_table_done)
+    await asyncio.to_thread(finish_rebuild, storage, cursors)
+    return report
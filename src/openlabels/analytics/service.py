@@ -4,6 +4,11 @@ Async analytics service — wraps :class:`DuckDBEngine` for FastAPI.
 DuckDB is not async-native, so every query is dispatched to a small
 :class:`~concurrent.futures.ThreadPoolExecutor`.
 
+Results of :meth:`AnalyticsService.query` are cached per normalized SQL
+and parameters until the catalog's data version changes (see
+:func:`~openlabels.analytics.flush.bump_data_version`), and concurrent
+identical queries share a single execution.
+
 This module also defines the :class:`DashboardQueryService` protocol
 used by route handlers, implemented by :class:`DuckDBDashboardService`.
 """
@@ -12,13 +17,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID
 
 from openlabels.analytics.engine import DuckDBEngine
+from openlabels.analytics.export import EXPORT_BATCH_SIZE, BatchEncoder
+from openlabels.analytics.flush import read_data_version
+
+if TYPE_CHECKING:
+    from openlabels.analytics.storage import CatalogStorage
 
 logger = logging.getLogger(__name__)
 
@@ -125,28 +139,206 @@ class DashboardQueryService(Protocol):
 
 
 
-class AnalyticsService:
-    """Async wrapper around :class:`DuckDBEngine`."""
+class QueryResultCache:
+    """LRU cache of query rows keyed by normalized SQL and parameters.
+
+    Every key carries the cache *generation*; :meth:`invalidate` bumps it,
+    so results computed against older data are never served or stored.
+    Entries also expire after *ttl_seconds*, and results larger than
+    *max_rows* are not cached at all.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 60.0,
+        max_rows: int = 10_000,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _freeze(value: Any) -> Hashable:
+        if isinstance(value, dict):
+            return tuple(sorted((k, QueryResultCache._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set)):
+            return tuple(QueryResultCache._freeze(v) for v in value)
+        return value
+
+    def key(self, sql: str, params: dict[str, Any] | list[Any] | None) -> Hashable:
+        """Cache key for *sql*/*params* in the current generation."""
+        return (self.generation, " ".join(sql.split()), self._freeze(params or ()))
+
+    def get(self, key: Hashable) -> list[dict[str, Any]] | None:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, rows: list[dict[str, Any]]) -> None:
+        if key[0] != self.generation or len(rows) > self.max_rows:  # type: ignore[index]
+            return
+        self._entries[key] = (time.monotonic(), rows)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
-    def __init__(self, engine: DuckDBEngine, max_workers: int = 4) -> None:
+class AnalyticsService:
+    """Async wrapper around :class:`DuckDBEngine`.
+
+    Parameters
+    ----------
+    engine:
+        The DuckDB engine; each executor thread queries through its own
+        cursor.
+    max_workers:
+        Executor threads, i.e. the number of concurrent DuckDB queries.
+    storage:
+        Catalog storage whose data version is polled (at most every
+        *version_check_seconds*) to invalidate cached results after a
+        flush from any process.  Without it only :meth:`refresh_views`
+        invalidates.
+    cache_entries, cache_ttl_seconds:
+        Result cache size and maximum age; ``cache_entries=0`` disables
+        caching.
+    """
+
+    def __init__(
+        self,
+        engine: DuckDBEngine,
+        max_workers: int = 4,
+        *,
+        storage: CatalogStorage | None = None,
+        cache_entries: int = 256,
+        cache_ttl_seconds: float = 60.0,
+        version_check_seconds: float = 5.0,
+    ) -> None:
         self._engine = engine
         self._executor = ThreadPoolExecutor(
             max_workers=max_workers,
             thread_name_prefix="duckdb",
         )
-
-    async def query(
+        self._cache = (
+            QueryResultCache(cache_entries, cache_ttl_seconds) if cache_entries > 0 else None
+        )
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.coalesced_queries = 0
+        self._storage = storage
+        self._version_check_seconds = version_check_seconds
+        self._version_checked_at: float | None = None
+        self._data_version: str | None = None
+
+    async def _run_query(
         self,
         sql: str,
-        params: dict[str, Any] | list[Any] | None = None,
+        params: dict[str, Any] | list[Any] | None,
     ) -> list[dict[str, Any]]:
-        """Run an analytical query in a background thread."""
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self._executor,
             lambda: self._engine.fetch_all(sql, params),
         )
 
+    async def query(
+        self,
+        sql: str,
+        params: dict[str, Any] | list[Any] | None = None,
+        *,
+        cache: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Run an analytical query in a background thread.
+
+        Results are served from the result cache when possible; identical
+        queries already running are awaited instead of re-executed.
+        Pass ``cache=False`` for large or one-off result sets.
+        """
+        if not cache or self._cache is None:
+            return await self._run_query(sql, params)
+
+        await self._check_data_version()
+        key = self._cache.key(sql, params)
+        rows = self._cache.get(key)
+        if rows is None:
+            future = self._inflight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(self._run_query(sql, params))
+                self._inflight[key] = future
+                future.add_done_callback(lambda f: self._query_done(key, f))
+            else:
+                self.coalesced_queries += 1
+            # Shielded so one cancelled caller doesn't cancel the others
+            rows = await asyncio.shield(future)
+        # Callers own their rows; cached dicts are never handed out
+        return [dict(r) for r in rows]
+
+    def _query_done(self, key: Hashable, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if future.cancelled():
+            return
+        if future.exception() is None and self._cache is not None:
+            self._cache.put(key, future.result())
+
+    async def _check_data_version(self) -> None:
+        """Invalidate the cache if a catalog flush bumped the data version."""
+        if self._storage is None:
+            return
+        now = time.monotonic()
+        if (
+            self._version_checked_at is not None
+            and now - self._version_checked_at < self._version_check_seconds
+        ):
+            return
+        self._version_checked_at = now
+
+        loop = asyncio.get_running_loop()
+        try:
+            version = await loop.run_in_executor(
+                self._executor, read_data_version, self._storage,
+            )
+        except Exception as exc:  # noqa: BLE001 — keep serving on storage errors
+            logger.debug("Catalog data version check failed: %s", exc)
+            return
+        if version == self._data_version:
+            return
+        self._data_version = version
+        if self._engine.stub_views:
+            # Views created before any Parquet existed are empty stubs
+            await loop.run_in_executor(self._executor, self._engine.refresh_views)
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Result cache counters for health/metrics endpoints."""
+        cache = self._cache
+        return {
+            "enabled": cache is not None,
+            "entries": len(cache) if cache else 0,
+            "hits": cache.hits if cache else 0,
+            "misses": cache.misses if cache else 0,
+            "coalesced": self.coalesced_queries,
+            "generation": cache.generation if cache else 0,
+            "data_version": self._data_version,
+            "cursors": self._engine.cursor_count,
+        }
+
     async def query_arrow(self, sql: str, params=None):
         """Run a query and return a PyArrow Table (zero-copy)."""
         loop = asyncio.get_running_loop()
@@ -155,19 +347,56 @@ class AnalyticsService:
             lambda: self._engine.fetch_arrow(sql, params),
         )
 
-    async def export_scan_results(
+    async def stream_export(
         self,
+        sql: str,
+        params: dict[str, Any] | list[Any] | None,
+        encoder: BatchEncoder,
+        *,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a query as encoded file chunks.
+
+        Each step fetches one Arrow record batch from DuckDB and encodes
+        it in the same executor call, so neither the result set nor the
+        encoded file is ever held in memory as a whole.
+        """
+        batches = self._engine.iter_record_batches(sql, params, batch_size=batch_size)
+        # Serialises the final close() with a step that may still be
+        # running if the consumer goes away mid-fetch.
+        lock = threading.Lock()
+
+        def _step() -> bytes | None:
+            with lock:
+                batch = next(batches, None)
+                return None if batch is None else encoder.encode(batch)
+
+        def _close() -> None:
+            with lock:
+                batches.close()
+
+        loop = asyncio.get_running_loop()
+        try:
+            yield encoder.begin()
+            while True:
+                chunk = await loop.run_in_executor(self._executor, _step)
+                if chunk is None:
+                    break
+                if chunk:
+                    yield chunk
+            yield encoder.finish()
+        finally:
+            self._executor.submit(_close)
+
+    @staticmethod
+    def _scan_results_export_query(
         tenant_id: UUID,
         *,
         job_id: UUID | None = None,
         risk_tier: str | None = None,
         has_label: bool | None = None,
-    ) -> list[dict[str, Any]]:
-        """Export scan results from Parquet with filter pushdown.
-
-        All filters are applied in the DuckDB query so only matching
-        rows are returned — much cheaper than post-filtering in Python.
-        """
+    ) -> tuple[str, list[Any]]:
+        """Build the filtered scan results export query."""
         conditions = ["tenant = ?"]
         params: list[Any] = [str(tenant_id)]
 
@@ -186,22 +415,77 @@ class AnalyticsService:
             SELECT
                 file_path, file_name, risk_score, risk_tier,
                 total_entities, exposure_level, owner,
-                current_label_name, label_applied
+                current_label_name, recommended_label_name, label_applied
             FROM scan_results
             WHERE {where}
             ORDER BY risk_score DESC
         """
+        return sql, params
+
+    @staticmethod
+    def _is_stub_table_error(exc: Exception) -> bool:
+        # Stub tables (no Parquet files) only have a placeholder column
+        return "not found in FROM clause" in str(exc) or "placeholder" in str(exc)
+
+    async def export_scan_results(
+        self,
+        tenant_id: UUID,
+        *,
+        job_id: UUID | None = None,
+        risk_tier: str | None = None,
+        has_label: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """Export scan results from Parquet with filter pushdown.
+
+        All filters are applied in the DuckDB query so only matching
+        rows are returned — much cheaper than post-filtering in Python.
+        Materializes every row; downloads use :meth:`stream_scan_results`.
+        """
+        sql, params = self._scan_results_export_query(
+            tenant_id, job_id=job_id, risk_tier=risk_tier, has_label=has_label,
+        )
         try:
-            return await self.query(sql, params)
+            return await self.query(sql, params, cache=False)
         except Exception as exc:
-            # Stub tables (no Parquet files) only have a placeholder column
-            if "not found in FROM clause" in str(exc) or "placeholder" in str(exc):
+            if self._is_stub_table_error(exc):
                 return []
             raise
 
+    async def stream_scan_results(
+        self,
+        tenant_id: UUID,
+        encoder: BatchEncoder,
+        *,
+        job_id: UUID | None = None,
+        risk_tier: str | None = None,
+        has_label: bool | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a filtered scan results export encoded by *encoder*.
+
+        Same filters as :meth:`export_scan_results`, but memory use is
+        bounded by *batch_size* rows however large the export is.
+        """
+        sql, params = self._scan_results_export_query(
+            tenant_id, job_id=job_id, risk_tier=risk_tier, has_label=has_label,
+        )
+        try:
+            async for chunk in self.stream_export(sql, params, encoder, batch_size=batch_size):
+                yield chunk
+        except Exception as exc:
+            # Binder errors surface on the first fetch, before any rows
+            if not self._is_stub_table_error(exc):
+                raise
+            yield encoder.finish()
+
     def refresh_views(self) -> None:
-        """Re-register DuckDB views after new Parquet files are written."""
+        """Re-register DuckDB views after new Parquet files are written.
+
+        Also invalidates every cached query result.
+        """
         self._engine.refresh_views()
+        if self._cache is not None:
+            self._cache.invalidate()
 
     def close(self) -> None:
         self._executor.shutdown(wait=False)
@@ -443,7 +727,8 @@ class DuckDBDashboardService:
         return result, total
 
     async def get_access_stats(self, tenant_id: UUID) -> AccessStats:
-        now_iso = datetime.now(tz=timezone.utc).isoformat()
+        # Minute resolution keeps the query (and its cache key) stable
+        now_iso = datetime.now(tz=timezone.utc).replace(second=0, microsecond=0).isoformat()
         rows = await self._safe_query(
             """
             SELECT
@@ -11,6 +11,7 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
 
 import httpx
 from msal import ConfidentialClientApplication
@@ -26,6 +27,15 @@ GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
 # Scopes for client credentials flow (no user context)
 GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
 
+# Maximum requests per JSON $batch call (Graph service limit)
+GRAPH_BATCH_LIMIT = 20
+
+_USER_SELECT = (
+    "id,displayName,userPrincipalName,mail,givenName,surname,"
+    "jobTitle,department,officeLocation,"
+    "onPremisesSamAccountName,onPremisesSecurityIdentifier"
+)
+
 # Pattern to detect OData injection: only match operator-like patterns that
 # are NOT likely to be legitimate names.  Keyword-only matching (\bor\b etc.)
 # causes false positives for names like "Anderson", "Norton", "Martin Lee".
@@ -238,9 +248,7 @@ class GraphClient:
                 "GET",
                 f"/users/{user_id}",
                 params={
-                    "$select": "id,displayName,userPrincipalName,mail,givenName,surname,"
-                    "jobTitle,department,officeLocation,"
-                    "onPremisesSamAccountName,onPremisesSecurityIdentifier"
+                    "$select": _USER_SELECT,
                 },
             )
 
@@ -270,9 +278,7 @@ class GraphClient:
                 "GET",
                 f"/users/{upn}",
                 params={
-                    "$select": "id,displayName,userPrincipalName,mail,givenName,surname,"
-                    "jobTitle,department,officeLocation,"
-                    "onPremisesSamAccountName,onPremisesSecurityIdentifier"
+                    "$select": _USER_SELECT,
                 },
             )
 
@@ -310,9 +316,7 @@ class GraphClient:
                 "/users",
                 params={
                     "$filter": f"onPremisesSecurityIdentifier eq '{safe_sid}'",
-                    "$select": "id,displayName,userPrincipalName,mail,givenName,surname,"
-                    "jobTitle,department,officeLocation,"
-                    "onPremisesSamAccountName,onPremisesSecurityIdentifier",
+                    "$select": _USER_SELECT,
                 },
             )
 
@@ -326,6 +330,58 @@ class GraphClient:
             logger.error(f"Failed to get user by SID {sid}: {e}")
             raise
 
+    async def get_users_by_on_prem_sids(
+        self, sids: list[str],
+    ) -> dict[str, GraphUser | None]:
+        """
+        Look up several on-premises SIDs with one JSON ``$batch`` call.
+
+        At most ``GRAPH_BATCH_LIMIT`` SIDs are sent; callers chunk larger
+        inputs. A SID maps to ``None`` when Graph answered and found no
+        user. SIDs whose sub-request failed (throttling, server errors)
+        are left out so the caller can retry them rather than caching a
+        miss.
+
+        Args:
+            sids: Up to ``GRAPH_BATCH_LIMIT`` Windows SIDs
+
+        Returns:
+            Dict mapping SID -> GraphUser or None
+        """
+        if len(sids) > GRAPH_BATCH_LIMIT:
+            raise ValueError(f"At most {GRAPH_BATCH_LIMIT} SIDs per batch")
+        if not sids:
+            return {}
+
+        requests = []
+        for i, sid in enumerate(sids):
+            # Escape user input to prevent OData injection
+            odata_filter = f"onPremisesSecurityIdentifier eq '{escape_odata_string(sid)}'"
+            requests.append({
+                "id": str(i),
+                "method": "GET",
+                "url": f"/users?$filter={quote(odata_filter)}&$select={_USER_SELECT}",
+            })
+
+        try:
+            data = await self._request("POST", "/$batch", json={"requests": requests})
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Graph batch SID lookup failed for {len(sids)} SIDs: {e}")
+            raise
+
+        results: dict[str, GraphUser | None] = {}
+        for response in data.get("responses", []):
+            try:
+                sid = sids[int(response["id"])]
+            except (KeyError, ValueError, IndexError):
+                continue
+            if response.get("status") != 200:
+                logger.debug(f"Graph batch lookup for {sid} returned {response.get('status')}")
+                continue
+            users = (response.get("body") or {}).get("value", [])
+            results[sid] = self._parse_user(users[0]) if users else None
+        return results
+
     async def get_user_by_sam_account_name(self, sam_account_name: str) -> GraphUser | None:
         """
         Get user by on-premises SAM account name.
@@ -349,9 +405,7 @@ class GraphClient:
                 "/users",
                 params={
                     "$filter": f"onPremisesSamAccountName eq '{safe_sam_account_name}'",
-                    "$select": "id,displayName,userPrincipalName,mail,givenName,surname,"
-                    "jobTitle,department,officeLocation,"
-                    "onPremisesSamAccountName,onPremisesSecurityIdentifier",
+                    "$select": _USER_SELECT,
                 },
             )
 
@@ -365,6 +419,45 @@ class GraphClient:
             logger.error(f"Failed to get user by SAM account name {sam_account_name}: {e}")
             raise
 
+    async def get_transitive_group_sids(self, user_id: str) -> list[str]:
+        """
+        Get on-premises SIDs of every group a user is a transitive member of.
+
+        Cloud-only groups have no on-prem SID and cannot appear in NTFS
+        ACLs, so they are skipped.
+
+        Args:
+            user_id: Entra object ID (GUID)
+
+        Returns:
+            Group SIDs (may be empty)
+        """
+        sids: list[str] = []
+        endpoint: str | None = f"/users/{user_id}/transitiveMemberOf/microsoft.graph.group"
+        params: dict | None = {
+            "$select": "id,onPremisesSecurityIdentifier",
+            "$top": "999",
+        }
+
+        try:
+            while endpoint:
+                data = await self._request("GET", endpoint, params=params)
+                for group in data.get("value", []):
+                    sid = group.get("onPremisesSecurityIdentifier")
+                    if sid:
+                        sids.append(sid)
+
+                # nextLink is absolute and already carries the query string
+                next_link = data.get("@odata.nextLink")
+                endpoint = next_link.removeprefix(GRAPH_API_BASE) if next_link else None
+                params = None
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to get group memberships for user {user_id}: {e}")
+            raise
+
+        return sids
+
     async def search_users(self, query: str, limit: int = 10) -> list[GraphUser]:
         """
         Search for users by display name or email.
@@ -6,19 +6,46 @@ Supports both cloud-only and hybrid (on-prem synced) Entra ID environments.
 
 Features:
 - In-memory LRU cache for performance
-- Optional database persistence for resolved SIDs
+- Optional shared cache tier (Redis via ``CacheManager``) that survives
+  restarts and is shared between workers, with negative caching
+- Batch resolution through Graph JSON ``$batch`` with bounded concurrency
+- Cache warm-up from stored security descriptors
 - Well-known SID handling (SYSTEM, LOCAL SERVICE, etc.)
+- Cached transitive group expansion for effective-access lookups
 - Graceful fallback when Graph API unavailable
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+    class RedisError(Exception):  # type: ignore[no-redef]
+        """Placeholder when redis is not installed."""
+        pass
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from openlabels.auth.graph import GraphUser
+    from openlabels.server.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+_SHARED_KEY_PREFIX = "sid"
+
+# Errors from a Graph lookup that mean "try again later", not "no such user"
+_GRAPH_ERRORS = (OSError, RuntimeError, ValueError, KeyError, AttributeError, httpx.HTTPError)
+
 
 @dataclass
 class ResolvedUser:
@@ -104,6 +131,29 @@ SYSTEM_ACCOUNT_RID_SUFFIXES = {
 }
 
 
+# Groups every non-well-known principal implicitly belongs to
+# (Everyone, Authenticated Users).
+IMPLICIT_GROUP_SIDS = ("S-1-1-0", "S-1-5-11")
+
+
+def _posix_groups(name: str) -> set[str]:
+    """Local group names for a POSIX user (best-effort, empty if unknown)."""
+    try:
+        import grp
+        import pwd
+        gids = os.getgrouplist(name, pwd.getpwnam(name).pw_gid)
+    except (ImportError, KeyError, OSError):
+        return set()
+
+    groups = set()
+    for gid in gids:
+        try:
+            groups.add(grp.getgrgid(gid).gr_name)
+        except KeyError:
+            groups.add(str(gid))
+    return groups
+
+
 class SIDResolver:
     """
     Resolve Windows SIDs to user information.
@@ -116,6 +166,10 @@ class SIDResolver:
         cache_ttl_hours: int = 24,
         max_cache_size: int = 10000,
         enable_graph: bool = True,
+        negative_cache_ttl_minutes: int = 60,
+        max_concurrency: int = 4,
+        use_shared: bool = False,
+        cache_manager: Optional[CacheManager] = None,
     ):
         """
         Initialize SID resolver.
@@ -124,14 +178,33 @@ class SIDResolver:
             cache_ttl_hours: How long to cache resolved SIDs
             max_cache_size: Maximum cache entries
             enable_graph: Whether to use Graph API for resolution
+            negative_cache_ttl_minutes: How long to remember SIDs Graph
+                could not resolve
+            max_concurrency: Maximum concurrent Graph ``$batch`` calls
+            use_shared: Whether to use the shared (Redis) cache tier
+            cache_manager: Cache manager for the shared tier (defaults to
+                the global one)
         """
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self.negative_cache_ttl = timedelta(minutes=negative_cache_ttl_minutes)
         self.max_cache_size = max_cache_size
         self.enable_graph = enable_graph
+        self.max_concurrency = max(1, max_concurrency)
 
         # In-memory cache: SID -> (ResolvedUser, timestamp)
         self._cache: dict[str, tuple[ResolvedUser, datetime]] = {}
 
+        # Negative cache: SID -> time it failed to resolve
+        self._negative: dict[str, datetime] = {}
+
+        # Shared tier (attached by initialize())
+        self._use_shared = use_shared
+        self._cache_manager = cache_manager
+        self._initialized = False
+
+        # Group expansion cache: principal -> (principal + groups, timestamp)
+        self._group_cache: dict[str, tuple[frozenset[str], datetime]] = {}
+
         # Graph client (lazy initialized)
         self._graph_client = None
 
@@ -148,6 +221,34 @@ class SIDResolver:
                 return None
         return self._graph_client
 
+    async def initialize(self) -> None:
+        """Attach the shared tier if Redis is configured and reachable."""
+        if self._initialized:
+            return
+        self._initialized = True
+
+        if not self._use_shared:
+            return
+        try:
+            if self._cache_manager is None:
+                from openlabels.server.cache import get_cache_manager
+                self._cache_manager = await get_cache_manager()
+        except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+            logger.warning(f"SID cache shared tier unavailable: {type(e).__name__}: {e}")
+            self._cache_manager = None
+
+    @property
+    def shared_enabled(self) -> bool:
+        """Whether local misses are looked up in Redis before Graph."""
+        return self._shared_tier() is not None
+
+    def _shared_tier(self) -> CacheManager | None:
+        """The cache manager if the shared tier is enabled and connected."""
+        manager = self._cache_manager
+        if not self._use_shared or manager is None or not manager.is_redis_connected:
+            return None
+        return manager
+
     def _check_well_known(self, sid: str) -> ResolvedUser | None:
         """Check if SID is a well-known SID."""
         if sid in WELL_KNOWN_SIDS:
@@ -196,15 +297,99 @@ class SIDResolver:
 
         self._cache[user.sid] = (user, datetime.now(timezone.utc))
 
+    def _check_negative(self, sid: str) -> bool:
+        """Whether *sid* recently failed to resolve."""
+        failed_at = self._negative.get(sid)
+        if failed_at is None:
+            return False
+        if datetime.now(timezone.utc) - failed_at < self.negative_cache_ttl:
+            return True
+        del self._negative[sid]
+        return False
+
+    def _add_negative(self, sid: str) -> None:
+        """Remember that *sid* failed to resolve."""
+        if len(self._negative) >= self.max_cache_size:
+            entries = sorted(self._negative.items(), key=lambda x: x[1])
+            for key, _ in entries[: self.max_cache_size // 10]:
+                del self._negative[key]
+        self._negative[sid] = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _fallback(sid: str) -> ResolvedUser:
+        """Unresolved SID: the SID itself is the display name."""
+        return ResolvedUser(sid=sid, display_name=sid, resolution_source="fallback")
+
+    @staticmethod
+    def _from_graph_user(sid: str, graph_user: GraphUser) -> ResolvedUser:
+        return ResolvedUser(
+            sid=sid,
+            display_name=graph_user.display_name,
+            user_principal_name=graph_user.user_principal_name,
+            domain_username=graph_user.on_premises_sam_account_name,
+            entra_object_id=graph_user.id,
+            department=graph_user.department,
+            job_title=graph_user.job_title,
+            is_system_account=False,
+            resolution_source="graph_api",
+        )
+
+    async def _shared_get_many(self, sids: list[str]) -> dict[str, ResolvedUser | None]:
+        """Look SIDs up in the shared tier; None marks a cached miss."""
+        manager = self._shared_tier()
+        if manager is None:
+            return {}
+        keys = {f"{_SHARED_KEY_PREFIX}:{sid}": sid for sid in sids}
+        try:
+            found = await manager.get_many(list(keys))
+        except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+            logger.debug(f"SID cache shared get failed: {e}")
+            return {}
+
+        results: dict[str, ResolvedUser | None] = {}
+        for key, data in found.items():
+            if not isinstance(data, dict):
+                continue
+            sid = keys[key]
+            if data.get("not_found"):
+                results[sid] = None
+                continue
+            try:
+                data["resolved_at"] = datetime.fromisoformat(data["resolved_at"])
+                results[sid] = ResolvedUser(**data)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return results
+
+    async def _shared_put(self, sid: str, user: ResolvedUser | None) -> None:
+        """Store a resolved user, or a miss (``None``), in the shared tier."""
+        manager = self._shared_tier()
+        if manager is None:
+            return
+        if user is None:
+            value: dict[str, Any] = {"not_found": True}
+            ttl = self.negative_cache_ttl
+        else:
+            value = asdict(user)
+            value["resolved_at"] = user.resolved_at.isoformat()
+            ttl = self.cache_ttl
+        try:
+            await manager.set(
+                f"{_SHARED_KEY_PREFIX}:{sid}", value, ttl=int(ttl.total_seconds()),
+            )
+        except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+            logger.debug(f"SID cache shared set failed: {e}")
+
     async def resolve(self, sid: str) -> ResolvedUser:
         """
         Resolve a SID to user information.
 
         Resolution order:
         1. Well-known SIDs (SYSTEM, LOCAL SERVICE, etc.)
-        2. In-memory cache
-        3. Microsoft Graph API (for hybrid/cloud users)
-        4. Fallback (returns SID as display name)
+        2. In-memory cache (including recent misses)
+        3. Shared cache tier, if enabled
+        4. Microsoft Graph API (for hybrid/cloud users)
+        5. Fallback (returns SID as display name)
 
         Args:
             sid: Windows Security Identifier
@@ -231,55 +416,244 @@ class SIDResolver:
         cached = self._check_cache(sid)
         if cached:
             return cached
+        if self._check_negative(sid):
+            return self._fallback(sid)
+
+        # 3. Check shared tier
+        await self.initialize()
+        shared = await self._shared_get_many([sid])
+        if sid in shared:
+            return self._accept_shared(sid, shared[sid])
 
-        # 3. Try Graph API
+        # 4. Try Graph API
         if self.enable_graph:
             try:
                 graph = self._get_graph_client()
                 if graph:
                     graph_user = await graph.get_user_by_on_prem_sid(sid)
-                    if graph_user:
-                        resolved = ResolvedUser(
-                            sid=sid,
-                            display_name=graph_user.display_name,
-                            user_principal_name=graph_user.user_principal_name,
-                            domain_username=graph_user.on_premises_sam_account_name,
-                            entra_object_id=graph_user.id,
-                            department=graph_user.department,
-                            job_title=graph_user.job_title,
-                            is_system_account=False,
-                            resolution_source="graph_api",
-                        )
+                    resolved = self._from_graph_user(sid, graph_user) if graph_user else None
+                    await self._shared_put(sid, resolved)
+                    if resolved:
                         self._add_to_cache(resolved)
                         return resolved
-            except (OSError, RuntimeError, ValueError, KeyError, AttributeError) as e:
+            except _GRAPH_ERRORS as e:
                 logger.warning(f"Graph API resolution failed for SID {sid}: {e}")
 
-        # 4. Fallback - return SID as name
-        fallback = ResolvedUser(
-            sid=sid,
-            display_name=sid,
-            resolution_source="fallback",
-        )
-        # Cache fallback briefly (1 hour) to avoid repeated failed lookups
-        self._cache[sid] = (fallback, datetime.now(timezone.utc))
-        return fallback
+        # 5. Fallback - return SID as name, remembered briefly to avoid
+        # repeated failed lookups
+        self._add_negative(sid)
+        return self._fallback(sid)
+
+    def _accept_shared(self, sid: str, user: ResolvedUser | None) -> ResolvedUser:
+        """Adopt a shared-tier entry into the local tier."""
+        if user is None:
+            self._add_negative(sid)
+            return self._fallback(sid)
+        self._add_to_cache(user)
+        user.resolution_source = "cache"
+        return user
 
     async def resolve_batch(self, sids: list[str]) -> dict[str, ResolvedUser]:
         """
         Resolve multiple SIDs.
 
+        Duplicates are resolved once. Well-known SIDs and local cache hits
+        are answered immediately; the remaining SIDs are fetched from the
+        shared tier in one round trip, and whatever is still missing goes
+        to Graph in ``$batch`` calls of up to 20 SIDs, at most
+        ``max_concurrency`` in flight.
+
         Args:
             sids: List of SIDs to resolve
 
         Returns:
-            Dict mapping SID -> ResolvedUser
+            Dict mapping each input SID -> ResolvedUser
         """
-        results = {}
-        for sid in sids:
-            results[sid] = await self.resolve(sid)
+        results: dict[str, ResolvedUser] = {}
+        pending: dict[str, list[str]] = {}  # normalized SID -> input spellings
+
+        for original in sids:
+            if original in results:
+                continue
+            sid = original.strip().upper()
+            if not sid.startswith("S-1-"):
+                results[original] = ResolvedUser(
+                    sid=sid, display_name=sid, resolution_source="invalid",
+                )
+                continue
+            known = self._check_well_known(sid) or self._check_cache(sid)
+            if known is None and self._check_negative(sid):
+                known = self._fallback(sid)
+            if known is not None:
+                results[original] = known
+            else:
+                pending.setdefault(sid, []).append(original)
+
+        if pending:
+            resolved = await self._resolve_misses(list(pending))
+            for sid, originals in pending.items():
+                for original in originals:
+                    results[original] = resolved[sid]
         return results
 
+    async def _resolve_misses(self, sids: list[str]) -> dict[str, ResolvedUser]:
+        """Resolve SIDs missing from the local tier (shared tier, then Graph)."""
+        await self.initialize()
+        resolved = {
+            sid: self._accept_shared(sid, user)
+            for sid, user in (await self._shared_get_many(sids)).items()
+        }
+
+        remaining = [sid for sid in sids if sid not in resolved]
+        graph = self._get_graph_client() if remaining and self.enable_graph else None
+        if graph:
+            from openlabels.auth.graph import GRAPH_BATCH_LIMIT
+
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def lookup(chunk: list[str]) -> None:
+                async with semaphore:
+                    try:
+                        found = await graph.get_users_by_on_prem_sids(chunk)
+                    except _GRAPH_ERRORS as e:
+                        logger.warning(f"Graph batch resolution failed for {len(chunk)} SIDs: {e}")
+                        return
+                    for sid, graph_user in found.items():
+                        user = self._from_graph_user(sid, graph_user) if graph_user else None
+                        await self._shared_put(sid, user)
+                        if user is None:
+                            self._add_negative(sid)
+                            resolved[sid] = self._fallback(sid)
+                        else:
+                            self._add_to_cache(user)
+                            resolved[sid] = user
+
+            await asyncio.gather(*(
+                lookup(remaining[i:i + GRAPH_BATCH_LIMIT])
+                for i in range(0, len(remaining), GRAPH_BATCH_LIMIT)
+            ))
+
+        # Graph unavailable or the lookup failed: remember locally only
+        for sid in sids:
+            if sid not in resolved:
+                self._add_negative(sid)
+                resolved[sid] = self._fallback(sid)
+        return resolved
+
+    async def warm_up(self, session: AsyncSession, limit: int | None = None) -> int:
+        """
+        Pre-resolve SIDs referenced by stored security descriptors.
+
+        Collects distinct owner, group and granted SIDs from
+        ``security_descriptors`` and ``principal_grants`` (up to *limit*,
+        default ``max_cache_size``) and resolves them in one batch.
+
+        Args:
+            session: Active async database session
+            limit: Maximum number of SIDs to resolve
+
+        Returns:
+            Number of SIDs resolved
+        """
+        from sqlalchemy import select, union
+
+        from openlabels.server.models import PrincipalGrant, SecurityDescriptor
+
+        sid_sources = union(
+            select(SecurityDescriptor.owner_sid.label("sid"))
+            .where(SecurityDescriptor.owner_sid.like("S-1-%")),
+            select(SecurityDescriptor.group_sid)
+            .where(SecurityDescriptor.group_sid.like("S-1-%")),
+            select(PrincipalGrant.principal).where(PrincipalGrant.principal.like("S-1-%")),
+        ).subquery()
+        result = await session.execute(
+            select(sid_sources.c.sid).limit(limit or self.max_cache_size)
+        )
+        sids = [row.sid for row in result]
+        if not sids:
+            return 0
+
+        resolved = await self.resolve_batch(sids)
+        found = sum(1 for user in resolved.values() if user.resolution_source != "fallback")
+        logger.info(f"SID cache warm-up: {found} of {len(sids)} SIDs resolved")
+        return len(sids)
+
+    async def expand_principal(self, principal: str) -> frozenset[str]:
+        """
+        Expand a principal into itself plus every group it belongs to.
+
+        - SIDs: transitive group SIDs from Graph (via the resolved user)
+        - UPNs: the user's on-prem SID and its transitive group SIDs
+        - Other names: local POSIX groups
+
+        Every non-well-known principal also gets ``IMPLICIT_GROUP_SIDS``.
+        Expansions are cached for ``cache_ttl``; failed Graph lookups
+        are not cached so they are retried on the next call.
+
+        Args:
+            principal: SID, UPN, or POSIX user name
+
+        Returns:
+            Frozen set of principals whose grants apply to *principal*
+        """
+        principal = principal.strip()
+        if principal[:4].upper() == "S-1-":
+            principal = principal.upper()
+
+        if principal in self._group_cache:
+            members, cached_at = self._group_cache[principal]
+            if datetime.now(timezone.utc) - cached_at < self.cache_ttl:
+                return members
+            del self._group_cache[principal]
+
+        if self._check_well_known(principal):
+            return frozenset({principal})
+
+        expanded = {principal, *IMPLICIT_GROUP_SIDS}
+        complete = True
+
+        if principal.startswith("S-1-"):
+            user = await self.resolve(principal)
+            if user.entra_object_id:
+                complete = await self._add_graph_groups(expanded, user.entra_object_id)
+        elif "@" in principal:
+            complete = False
+            graph = self._get_graph_client()
+            if graph:
+                try:
+                    graph_user = await graph.get_user_by_upn(principal)
+                    complete = True
+                    if graph_user:
+                        if graph_user.on_premises_security_identifier:
+                            expanded.add(graph_user.on_premises_security_identifier.upper())
+                        complete = await self._add_graph_groups(expanded, graph_user.id)
+                except _GRAPH_ERRORS as e:
+                    logger.warning(f"Graph API lookup failed for {principal}: {e}")
+        else:
+            expanded |= _posix_groups(principal)
+
+        members = frozenset(expanded)
+        if complete:
+            if len(self._group_cache) >= self.max_cache_size:
+                entries = sorted(self._group_cache.items(), key=lambda x: x[1][1])
+                for key, _ in entries[: self.max_cache_size // 10]:
+                    del self._group_cache[key]
+            self._group_cache[principal] = (members, datetime.now(timezone.utc))
+        return members
+
+    async def _add_graph_groups(self, expanded: set[str], user_id: str) -> bool:
+        """Add a user's transitive group SIDs; False if Graph was unavailable."""
+        graph = self._get_graph_client()
+        if not graph:
+            return False
+        try:
+            group_sids = await graph.get_transitive_group_sids(user_id)
+        except _GRAPH_ERRORS as e:
+            logger.warning(f"Graph API group lookup failed for {user_id}: {e}")
+            return False
+        expanded.update(sid.upper() for sid in group_sids)
+        return True
+
     def resolve_sync(self, sid: str) -> ResolvedUser:
         """
         Synchronous version of resolve (no Graph API lookup).
@@ -307,8 +681,10 @@ class SIDResolver:
         )
 
     def clear_cache(self):
-        """Clear the resolution cache."""
+        """Clear the local resolution, miss and group expansion caches."""
         self._cache.clear()
+        self._negative.clear()
+        self._group_cache.clear()
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics."""
@@ -318,6 +694,9 @@ class SIDResolver:
             "total_entries": len(self._cache),
             "valid_entries": valid,
             "expired_entries": len(self._cache) - valid,
+            "negative_entries": len(self._negative),
+            "group_entries": len(self._group_cache),
+            "shared_enabled": self.shared_enabled,
             "max_size": self.max_cache_size,
         }
 
@@ -330,7 +709,7 @@ def get_sid_resolver() -> SIDResolver:
     """Get or create singleton SID resolver."""
     global _resolver
     if _resolver is None:
-        _resolver = SIDResolver()
+        _resolver = SIDResolver(use_shared=True)
     return _resolver
 
 
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 import click
 
+if TYPE_CHECKING:
+    from openlabels.analytics.rebuild import TableReport
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,21 +22,26 @@ def catalog():
 
 @catalog.command()
 @click.option("--batch-size", default=10_000, show_default=True, help="Rows per batch")
+@click.option(
+    "--workers", default=4, show_default=True,
+    help="Concurrent readers (database sessions) across tables",
+)
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
-def rebuild(batch_size: int, yes: bool) -> None:
+def rebuild(batch_size: int, workers: int, yes: bool) -> None:
     """Full re-export of PostgreSQL to Parquet.
 
     Streams all scan results, file inventory, access events, audit logs,
     and remediation actions from PostgreSQL to the Parquet catalog in
-    batches.  Resets the flush state cursor so periodic flush picks up
-    from the latest row.
+    keyset-paginated batches, several tables and key ranges at a time.
+    Resets the flush state cursor so periodic flush picks up from the
+    latest row.
 
     Use this for initial setup or disaster recovery.
 
     \b
     Examples:
         openlabels catalog rebuild
-        openlabels catalog rebuild --batch-size 5000
+        openlabels catalog rebuild --batch-size 5000 --workers 8
     """
     if not yes:
         click.confirm(
@@ -42,266 +51,36 @@ def rebuild(batch_size: int, yes: bool) -> None:
         )
 
     click.echo("Rebuilding Parquet catalog from PostgreSQL...")
-    asyncio.run(_run_rebuild(batch_size))
+    asyncio.run(_run_rebuild(batch_size, workers))
     click.echo("Catalog rebuild complete.")
 
 
-async def _run_rebuild(batch_size: int) -> None:
+async def _run_rebuild(batch_size: int, workers: int = 4) -> None:
     """Async implementation of the catalog rebuild."""
-    from sqlalchemy import func, select
-
-    from openlabels.analytics.arrow_convert import (
-        access_events_to_arrow,
-        audit_log_to_arrow,
-        file_inventory_to_arrow,
-        folder_inventory_to_arrow,
-        remediation_actions_to_arrow,
-        scan_results_to_arrow,
-    )
-    from openlabels.analytics.flush import save_flush_state
-    from openlabels.analytics.partition import (
-        access_event_partition,
-        audit_log_partition,
-        file_inventory_path,
-        folder_inventory_path,
-        remediation_action_partition,
-        scan_result_partition,
-        timestamped_part_filename,
-    )
+    from openlabels.analytics.rebuild import rebuild_catalog
     from openlabels.analytics.storage import create_storage
     from openlabels.server.config import get_settings
-    from openlabels.server.db import close_db, get_session_context, init_db
-    from openlabels.server.models import (
-        AuditLog,
-        FileAccessEvent,
-        FileInventory,
-        FolderInventory,
-        RemediationAction,
-        ScanResult,
-    )
+    from openlabels.server.db import close_db, init_db
 
     settings = get_settings()
     storage = create_storage(settings.catalog)
     await init_db(settings.database.url)
 
-    try:
-        async with get_session_context() as session:
-            total = (await session.execute(select(func.count()).select_from(ScanResult))).scalar() or 0
-            click.echo(f"  Scan results: {total} rows")
-            offset = 0
-            last_scanned_at = None
-            while offset < total:
-                q = (
-                    select(ScanResult)
-                    .order_by(ScanResult.scanned_at)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = scan_results_to_arrow(rows)
-
-                # Group by tenant + target + scan_date
-                groups: dict[tuple, list[int]] = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), str(r.target_id), r.scanned_at.date())
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, tgt, sd), indices in groups.items():
-                    from uuid import UUID
-                    part = scan_result_partition(UUID(tid), UUID(tgt), sd)
-                    subset = table.take(indices)
-                    storage.write_parquet(
-                        f"{part}/{timestamped_part_filename()}",
-                        subset,
-                    )
-
-                last_scanned_at = rows[-1].scanned_at
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
-
-            total = (await session.execute(select(func.count()).select_from(FileInventory))).scalar() or 0
-            click.echo(f"  File inventory: {total} rows")
-            offset = 0
-            while offset < total:
-                q = (
-                    select(FileInventory)
-                    .order_by(FileInventory.id)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = file_inventory_to_arrow(rows)
-
-                groups = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), str(r.target_id))
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, tgt), indices in groups.items():
-                    from uuid import UUID
-                    part = file_inventory_path(UUID(tid), UUID(tgt))
-                    subset = table.take(indices)
-                    storage.write_parquet(part, subset)
-
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
-
-            total = (await session.execute(select(func.count()).select_from(FolderInventory))).scalar() or 0
-            click.echo(f"  Folder inventory: {total} rows")
-            offset = 0
-            while offset < total:
-                q = (
-                    select(FolderInventory)
-                    .order_by(FolderInventory.id)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = folder_inventory_to_arrow(rows)
-
-                groups = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), str(r.target_id))
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, tgt), indices in groups.items():
-                    from uuid import UUID
-                    part = folder_inventory_path(UUID(tid), UUID(tgt))
-                    subset = table.take(indices)
-                    storage.write_parquet(part, subset)
-
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
-
-            total = (await session.execute(select(func.count()).select_from(FileAccessEvent))).scalar() or 0
-            click.echo(f"  Access events: {total} rows")
-            offset = 0
-            last_ae_at = None
-            while offset < total:
-                q = (
-                    select(FileAccessEvent)
-                    .order_by(FileAccessEvent.collected_at)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = access_events_to_arrow(rows)
-
-                groups = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), r.event_time.date())
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, ed), indices in groups.items():
-                    from uuid import UUID
-                    part = access_event_partition(UUID(tid), ed)
-                    subset = table.take(indices)
-                    storage.write_parquet(
-                        f"{part}/{timestamped_part_filename()}",
-                        subset,
-                    )
-
-                last_ae_at = rows[-1].collected_at
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
-
-            total = (await session.execute(select(func.count()).select_from(AuditLog))).scalar() or 0
-            click.echo(f"  Audit logs: {total} rows")
-            offset = 0
-            last_al_at = None
-            while offset < total:
-                q = (
-                    select(AuditLog)
-                    .order_by(AuditLog.created_at)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = audit_log_to_arrow(rows)
-
-                groups = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), r.created_at.date())
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, ld), indices in groups.items():
-                    from uuid import UUID
-                    part = audit_log_partition(UUID(tid), ld)
-                    subset = table.take(indices)
-                    storage.write_parquet(
-                        f"{part}/{timestamped_part_filename()}",
-                        subset,
-                    )
-
-                last_al_at = rows[-1].created_at
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
-
-            total = (await session.execute(select(func.count()).select_from(RemediationAction))).scalar() or 0
-            click.echo(f"  Remediation actions: {total} rows")
-            offset = 0
-            last_ra_at = None
-            while offset < total:
-                q = (
-                    select(RemediationAction)
-                    .order_by(RemediationAction.created_at)
-                    .offset(offset)
-                    .limit(batch_size)
-                )
-                result = await session.execute(q)
-                rows = list(result.scalars())
-                if not rows:
-                    break
-
-                table = remediation_actions_to_arrow(rows)
-
-                groups = {}
-                for idx, r in enumerate(rows):
-                    key = (str(r.tenant_id), r.created_at.date())
-                    groups.setdefault(key, []).append(idx)
-
-                for (tid, ad), indices in groups.items():
-                    from uuid import UUID
-                    part = remediation_action_partition(UUID(tid), ad)
-                    subset = table.take(indices)
-                    storage.write_parquet(
-                        f"{part}/{timestamped_part_filename()}",
-                        subset,
-                    )
-
-                last_ra_at = rows[-1].created_at
-                offset += len(rows)
-                click.echo(f"    Flushed {offset}/{total}")
+    def table_done(name: str, report: TableReport) -> None:
+        click.echo(
+            f"  {name}: {report.rows} rows, {report.files} files "
+            f"in {report.seconds:.1f}s ({report.rows_per_second:,.0f} rows/s)"
+        )
 
-        state = {
-            "last_access_event_flush": last_ae_at.isoformat() if last_ae_at else None,
-            "last_audit_log_flush": last_al_at.isoformat() if last_al_at else None,
-            "last_remediation_action_flush": last_ra_at.isoformat() if last_ra_at else None,
-            "schema_version": 1,
-        }
-        save_flush_state(storage, state)
+    try:
+        report = await rebuild_catalog(
+            storage, batch_size=batch_size, workers=workers, on_table_done=table_done,
+        )
         click.echo("  Flush state reset.")
-
+        click.echo(
+            f"  Total: {report.rows} rows in {report.seconds:.1f}s "
+            f"({report.rows_per_second:,.0f} rows/s)"
+        )
     finally:
         await close_db()
 
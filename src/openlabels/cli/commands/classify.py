@@ -14,6 +14,7 @@ import click
 from openlabels.cli.utils import collect_files
 from openlabels.core.constants import MAX_DECOMPRESSED_SIZE
 from openlabels.core.path_validation import PathValidationError, validate_output_path
+from openlabels.core.profiling import StageProfiler, profile_stage, profile_trace, use_profiler
 from openlabels.core.types import ExposureLevel
 
 
@@ -24,7 +25,23 @@ from openlabels.core.types import ExposureLevel
 @click.option("--recursive", "-r", is_flag=True, help="Scan directories recursively")
 @click.option("--output", "-o", help="Output file for results (JSON)")
 @click.option("--min-score", default=0, type=int, help="Minimum risk score to report")
-def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output: str | None, min_score: int):
+@click.option("--profile", "profile", is_flag=True, help="Print per-stage and per-detector timings")
+@click.option("--profile-output", help="Write the stage profile and file traces (JSON)")
+@click.option(
+    "--trace-sample-rate", default=0.0, type=click.FloatRange(0.0, 1.0),
+    help="Fraction of files traced stage by stage (with --profile/--profile-output)",
+)
+def classify(
+    path: str,
+    exposure: str,
+    enable_ml: bool,
+    recursive: bool,
+    output: str | None,
+    min_score: int,
+    profile: bool,
+    profile_output: str | None,
+    trace_sample_rate: float,
+):
     """Classify files locally (no server required).
 
     Can classify a single file or a directory of files.
@@ -33,6 +50,7 @@ def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output:
         openlabels classify ./document.docx
         openlabels classify ./data/ --recursive --output results.json
         openlabels classify ./folder/ -r --min-score 50
+        openlabels classify ./corpus/ -r --profile --trace-sample-rate 0.05
     """
     files = collect_files(path, recursive)
     if Path(path).is_dir():
@@ -46,6 +64,10 @@ def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output:
 
         processor = FileProcessor(config=DetectionConfig(enable_ml=enable_ml))
         results = []
+        profiler = (
+            StageProfiler(trace_sample_rate=trace_sample_rate)
+            if profile or profile_output else None
+        )
 
         async def process_all():
             all_results = []
@@ -53,14 +75,16 @@ def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output:
                 try:
                     if os.path.getsize(file_path) > MAX_DECOMPRESSED_SIZE:
                         continue
-                    with open(file_path, "rb") as f:
-                        content = f.read()
-
-                    result = await processor.process_file(
-                        file_path=str(file_path),
-                        content=content,
-                        exposure_level=exposure,
-                    )
+                    with profile_trace(str(file_path)), profile_stage("file"):
+                        with profile_stage("read"):
+                            with open(file_path, "rb") as f:
+                                content = f.read()
+
+                        result = await processor.process_file(
+                            file_path=str(file_path),
+                            content=content,
+                            exposure_level=exposure,
+                        )
                     all_results.append(result)
                 except PermissionError:
                     click.echo(f"Error: Permission denied: {file_path}", err=True)
@@ -72,7 +96,11 @@ def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output:
                     click.echo(f"Error processing {file_path}: {e}", err=True)
             return all_results
 
-        results = asyncio.run(process_all())
+        async def run():
+            with use_profiler(profiler):
+                return await process_all()
+
+        results = asyncio.run(run())
 
         # Filter by min_score
         results = [r for r in results if r.risk_score >= min_score]
@@ -126,7 +154,29 @@ def classify(path: str, exposure: str, enable_ml: bool, recursive: bool, output:
                 if high_risk:
                     click.echo(f"High/Critical risk: {len(high_risk)} files")
 
+        if profiler is not None:
+            _report_profile(profiler, profile, profile_output)
+
     except ImportError as e:
         click.echo(f"Error: Required module not installed: {e}", err=True)
     except OSError as e:
         click.echo(f"Error: File system error: {e}", err=True)
+
+
+def _report_profile(profiler: StageProfiler, show: bool, profile_output: str | None) -> None:
+    """Print the stage breakdown and/or write it as JSON."""
+    if show:
+        click.echo(f"\n{'=' * 50}")
+        click.echo("Stage profile")
+        click.echo("-" * 50)
+        click.echo(profiler.format_report())
+
+    if profile_output:
+        try:
+            validated = validate_output_path(profile_output, create_parent=True)
+        except PathValidationError as e:
+            click.echo(f"Error: Invalid profile output path: {e}", err=True)
+            return
+        with open(validated, "w") as f:
+            json.dump(profiler.summary(), f, indent=2)
+        click.echo(f"\nProfile written to: {validated}")
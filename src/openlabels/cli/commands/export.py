@@ -18,7 +18,9 @@ def export() -> None:
 
 @export.command("results")
 @click.option("--job", required=True, help="Job ID to export")
-@click.option("--format", "fmt", default="csv", type=click.Choice(["csv", "json"]))
+@click.option(
+    "--format", "fmt", default="csv", type=click.Choice(["csv", "json", "parquet", "arrow"]),
+)
 @click.option("--output", required=True, help="Output file path")
 @server_options
 def export_results(job: str, fmt: str, output: str, server: str, token: str | None) -> None:
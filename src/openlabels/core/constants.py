@@ -5,6 +5,9 @@ All magic numbers, timeouts, and limits defined here.
 Import from this module rather than hardcoding values.
 """
 
+import os
+import sys
+
 __all__ = [
     # Detection
     "BERT_MAX_LENGTH",
@@ -24,6 +27,12 @@ __all__ = [
     "MAX_DECOMPRESSED_SIZE",
     "MAX_EXTRACTION_RATIO",
     "DEFAULT_MAX_READ_BYTES",
+    # Streaming extraction
+    "STREAMING_THRESHOLD_BYTES",
+    "STREAM_WINDOW_CHARS",
+    "STREAM_OVERLAP_CHARS",
+    "STREAM_SEGMENT_ROWS",
+    "STREAM_DECODE_CHUNK_BYTES",
     # Subprocess & query limits
     "SUBPROCESS_TIMEOUT",
     "DEFAULT_QUERY_LIMIT",
@@ -35,6 +44,7 @@ __all__ = [
     "DATA_DIR",
     "DEFAULT_MODELS_DIR",
     "DEFAULT_DICTIONARIES_DIR",
+    "DEFAULT_CACHE_DIR",
     # Risk tier ordering & priority
     "RISK_TIER_PRIORITY",
     "RISK_TIER_ORDER",
@@ -115,6 +125,14 @@ MAX_EXTRACTION_RATIO = 100  # Max ratio of decompressed:compressed size
 # Adapter read_file default limit (prevents memory exhaustion)
 DEFAULT_MAX_READ_BYTES = 100 * 1024 * 1024  # 100MB
 
+# Streaming extraction: large files are extracted and detected segment by
+# segment so peak memory follows the window size, not the document size
+STREAMING_THRESHOLD_BYTES = 8 * 1024 * 1024  # 8MB - smaller files use one pass
+STREAM_WINDOW_CHARS = 1024 * 1024  # Text handed to the detectors per call
+STREAM_OVERLAP_CHARS = 2048  # Context re-scanned across window boundaries
+STREAM_SEGMENT_ROWS = 5000  # Spreadsheet/CSV rows per extracted segment
+STREAM_DECODE_CHUNK_BYTES = 1024 * 1024  # Plain-text decode step
+
 # SUBPROCESS & QUERY LIMITS
 SUBPROCESS_TIMEOUT = 30  # seconds - timeout for icacls/setfacl/getfacl calls
 DEFAULT_QUERY_LIMIT = 500  # Safety limit for unbounded SELECT queries
@@ -162,3 +180,22 @@ PROJECT_ROOT = _find_project_root()
 DATA_DIR = PROJECT_ROOT / ".openlabels"
 DEFAULT_MODELS_DIR = DATA_DIR / "models"
 DEFAULT_DICTIONARIES_DIR = DATA_DIR / "dictionaries"
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (OPENLABELS_CACHE_DIR overrides)."""
+    override = os.environ.get("OPENLABELS_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "openlabels" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "openlabels"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "openlabels"
+
+
+# Derived, rebuildable data (e.g. dictionary matcher indexes); kept out of
+# the installed package so read-only installs work
+DEFAULT_CACHE_DIR = _user_cache_dir()
@@ -15,9 +15,10 @@ from __future__ import annotations
 
 import re
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .pattern_registry import PatternDefinition, _p
+from .pattern_scanner import PatternScanner
 from .registry import register_detector
 
 # Pattern definitions: frozen tuple of PatternDefinition objects
@@ -144,6 +145,9 @@ ADDITIONAL_PATTERNS: tuple[PatternDefinition, ...] = (
     ),
 )
 
+# Literal-prefiltered scanner over the table above (see pattern_scanner)
+_SCANNER = PatternScanner(ADDITIONAL_PATTERNS)
+
 
 # Detector Class
 @register_detector
@@ -166,54 +170,48 @@ class AdditionalPatternDetector(BaseDetector):
 
     def detect(self, text: str) -> list[Span]:
         """Detect additional entity types in text."""
-        spans = []
-
-        for pdef in ADDITIONAL_PATTERNS:
-            for match in pdef.pattern.finditer(text):
-                try:
-                    if pdef.group > 0 and pdef.group <= len(match.groups()):
-                        # Use specific capture group
-                        value = match.group(pdef.group)
-                        if value:
-                            start = match.start(pdef.group)
-                            end = match.end(pdef.group)
-                        else:
-                            continue
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
+
+        for pdef, match in _SCANNER.scan(text):
+            try:
+                if pdef.group > 0 and pdef.group <= len(match.groups()):
+                    # Use specific capture group
+                    value = match.group(pdef.group)
+                    if value:
+                        start = match.start(pdef.group)
+                        end = match.end(pdef.group)
                     else:
-                        # Use whole match
-                        value = match.group(0)
-                        start = match.start()
-                        end = match.end()
+                        continue
+                else:
+                    # Use whole match
+                    value = match.group(0)
+                    start = match.start()
+                    end = match.end()
+
+                # Skip empty or too short matches
+                if not value or len(value.strip()) < 2:
+                    continue
 
-                    # Skip empty or too short matches
-                    if not value or len(value.strip()) < 2:
+                # Validate AGE is reasonable (0-120)
+                if pdef.entity_type == "AGE":
+                    try:
+                        # Extract just the number
+                        age_num = re.search(r'\d+', value)
+                        if age_num:
+                            age = int(age_num.group())
+                            if age < 0 or age > 120:
+                                continue
+                    except ValueError:
+                        # Non-numeric age - skip this match
                         continue
 
-                    # Validate AGE is reasonable (0-120)
-                    if pdef.entity_type == "AGE":
-                        try:
-                            # Extract just the number
-                            age_num = re.search(r'\d+', value)
-                            if age_num:
-                                age = int(age_num.group())
-                                if age < 0 or age > 120:
-                                    continue
-                        except ValueError:
-                            # Non-numeric age - skip this match
-                            continue
-
-                    spans.append(Span(
-                        start=start,
-                        end=end,
-                        text=text[start:end],
-                        entity_type=pdef.entity_type,
-                        confidence=pdef.confidence,
-                        detector=self.name,
-                        tier=self.tier,
-                    ))
-
-                except (IndexError, AttributeError, ValueError):
-                    # Skip problematic matches (bad regex group, None match, etc.)
-                    continue
+                batch.append(start, end, pdef.entity_type, pdef.confidence, self.name, self.tier)
+
+            except (IndexError, AttributeError, ValueError):
+                # Skip problematic matches (bad regex group, None match, etc.)
+                continue
 
-        return spans
+        return batch
@@ -6,7 +6,7 @@ All detectors must inherit from BaseDetector and implement the detect() method.
 
 from abc import ABC, abstractmethod
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 
 
 class BaseDetector(ABC):
@@ -16,7 +16,7 @@ class BaseDetector(ABC):
     Each detector:
     - Has a name and tier
     - Takes normalized text
-    - Returns list of Span
+    - Returns list of Span (or a SpanBatch, via detect_batch)
     - Is independent (no shared state between detect() calls)
 
     Attributes:
@@ -40,6 +40,22 @@ class BaseDetector(ABC):
         """
         pass
 
+    def detect_batch(self, text: str) -> SpanBatch:
+        """
+        Detect entities in text as a columnar ``SpanBatch``.
+
+        The orchestrator calls this instead of ``detect``. Detectors that
+        produce many matches override it to append rows directly and
+        implement ``detect`` as ``self.detect_batch(text).to_spans()``.
+
+        Args:
+            text: Normalized UTF-8 text to scan
+
+        Returns:
+            SpanBatch over *text*
+        """
+        return SpanBatch.from_spans(text, self.detect(text))
+
     def is_available(self) -> bool:
         """
         Check if detector is ready to use.
@@ -32,7 +32,7 @@ from .._rust.validators_py import (
 from .._rust.validators_py import (
     validate_ssn as _validate_ssn_bool,
 )
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .registry import register_detector
 
@@ -499,7 +499,10 @@ class ChecksumDetector(BaseDetector):
     tier = Tier.CHECKSUM
 
     def detect(self, text: str) -> list[Span]:
-        spans = []
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
         seen = set()  # (start, end, text) to avoid duplicates
 
         for pattern, entity_type, validator in CHECKSUM_PATTERNS:
@@ -513,15 +516,9 @@ class ChecksumDetector(BaseDetector):
                         continue
                     seen.add(key)
 
-                    span = Span(
-                        start=match.start(1),
-                        end=match.end(1),
-                        text=value,
-                        entity_type=entity_type,
-                        confidence=confidence,
-                        detector=self.name,
-                        tier=self.tier,
+                    batch.append(
+                        match.start(1), match.end(1), entity_type,
+                        confidence, self.name, self.tier,
                     )
-                    spans.append(span)
 
-        return spans
+        return batch
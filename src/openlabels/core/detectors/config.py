@@ -30,6 +30,16 @@ class DetectionConfig:
     enable_ml: bool = False
     ml_model_dir: Path | None = None
     use_onnx: bool = True
+    ml_batch_size: int = 16  # Max chunks per ONNX inference batch (1 = no batching)
+    ml_batch_wait_ms: float = 5.0  # Max wait for a batch to fill
+
+    # ML scope: "full" runs ML detectors over the whole text; "tiered" runs
+    # the other detectors first and sends ML only the windows around
+    # low-confidence or ML-beneficial spans and medical-context terms
+    # (documents with none skip ML entirely)
+    ml_mode: str = "full"
+    ml_escalation_threshold: float = 0.70
+    ml_window_chars: int = 256
 
     # Post-processing
     enable_coref: bool = False
@@ -40,6 +50,13 @@ class DetectionConfig:
     confidence_threshold: float = 0.70
     max_workers: int = 4
 
+    # Execution backend: "thread" runs detectors on a thread pool in this
+    # process; "process" runs the whole detection path in a pool of worker
+    # processes so pure-Python regex/checksum work is not serialized by the GIL.
+    execution_mode: str = "thread"
+    process_workers: int = 0  # 0 = one per CPU core
+    process_batch_size: int = 8  # Max texts per worker round trip
+
     @classmethod
     def full(cls) -> DetectionConfig:
         """All detectors and post-processing enabled."""
@@ -28,9 +28,10 @@ from .._rust.validators_py import (
 from .._rust.validators_py import (
     validate_isin as _validate_isin,
 )
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .pattern_registry import PatternDefinition, _p
+from .pattern_scanner import PatternScanner
 from .registry import register_detector
 
 
@@ -361,6 +362,9 @@ FINANCIAL_PATTERNS: tuple[PatternDefinition, ...] = (
        'CRYPTO_SEED_PHRASE', 0.95, 1, _validate_seed_phrase, flags=re.I),
 )
 
+# Literal-prefiltered scanner over the table above (see pattern_scanner)
+_SCANNER = PatternScanner(FINANCIAL_PATTERNS)
+
 
 @register_detector
 class FinancialDetector(BaseDetector):
@@ -374,44 +378,38 @@ class FinancialDetector(BaseDetector):
     tier = Tier.CHECKSUM
 
     def detect(self, text: str) -> list[Span]:
-        spans: list[Span] = []
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
         seen: set[tuple[int, int]] = set()
 
-        for pdef in FINANCIAL_PATTERNS:
-            for match in pdef.pattern.finditer(text):
-                if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
-                    value = match.group(pdef.group)
-                    start = match.start(pdef.group)
-                    end = match.end(pdef.group)
-                else:
-                    value = match.group(0)
-                    start = match.start()
-                    end = match.end()
-
-                if not value or not value.strip():
-                    continue
-
-                key = (start, end)
-                if key in seen:
-                    continue
-
-                if pdef.validator and not pdef.validator(value):
-                    continue
-
-                seen.add(key)
-
-                final_confidence = pdef.confidence
-                if pdef.validator:
-                    final_confidence = min(0.99, pdef.confidence + 0.02)
-
-                spans.append(Span(
-                    start=start,
-                    end=end,
-                    text=value,
-                    entity_type=pdef.entity_type,
-                    confidence=final_confidence,
-                    detector=self.name,
-                    tier=self.tier,
-                ))
-
-        return spans
+        for pdef, match in _SCANNER.scan(text):
+            if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
+                value = match.group(pdef.group)
+                start = match.start(pdef.group)
+                end = match.end(pdef.group)
+            else:
+                value = match.group(0)
+                start = match.start()
+                end = match.end()
+
+            if not value or not value.strip():
+                continue
+
+            key = (start, end)
+            if key in seen:
+                continue
+
+            if pdef.validator and not pdef.validator(value):
+                continue
+
+            seen.add(key)
+
+            final_confidence = pdef.confidence
+            if pdef.validator:
+                final_confidence = min(0.99, pdef.confidence + 0.02)
+
+            batch.append(start, end, pdef.entity_type, final_confidence, self.name, self.tier)
+
+        return batch
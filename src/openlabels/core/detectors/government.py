@@ -23,9 +23,10 @@ from __future__ import annotations
 
 import re
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .pattern_registry import PatternDefinition, _p
+from .pattern_scanner import PatternScanner
 from .registry import register_detector
 
 _DOD_PREFIX = (
@@ -128,6 +129,9 @@ GOVERNMENT_PATTERNS: tuple[PatternDefinition, ...] = (
     _p(r'\b(OFFICIAL\s+USE\s+ONLY)\b', 'CLASSIFICATION_LEVEL', 0.95, 1, flags=re.I),
 )
 
+# Literal-prefiltered scanner over the table above (see pattern_scanner)
+_SCANNER = PatternScanner(GOVERNMENT_PATTERNS)
+
 
 @register_detector
 class GovernmentDetector(BaseDetector):
@@ -142,43 +146,37 @@ class GovernmentDetector(BaseDetector):
     tier = Tier.PATTERN
 
     def detect(self, text: str) -> list[Span]:
-        spans: list[Span] = []
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
         seen: set[tuple[int, int]] = set()
 
-        for pdef in GOVERNMENT_PATTERNS:
-            for match in pdef.pattern.finditer(text):
-                if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
-                    value = match.group(pdef.group)
-                    start = match.start(pdef.group)
-                    end = match.end(pdef.group)
-                else:
-                    value = match.group(0)
-                    start = match.start()
-                    end = match.end()
-
-                if not value or not value.strip():
+        for pdef, match in _SCANNER.scan(text):
+            if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
+                value = match.group(pdef.group)
+                start = match.start(pdef.group)
+                end = match.end(pdef.group)
+            else:
+                value = match.group(0)
+                start = match.start()
+                end = match.end()
+
+            if not value or not value.strip():
+                continue
+
+            key = (start, end)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if pdef.entity_type == 'CLASSIFICATION_LEVEL':
+                if self._is_false_positive_classification(value, text, start):
                     continue
 
-                key = (start, end)
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                if pdef.entity_type == 'CLASSIFICATION_LEVEL':
-                    if self._is_false_positive_classification(value, text, start):
-                        continue
-
-                spans.append(Span(
-                    start=start,
-                    end=end,
-                    text=value,
-                    entity_type=pdef.entity_type,
-                    confidence=pdef.confidence,
-                    detector=self.name,
-                    tier=self.tier,
-                ))
-
-        return spans
+            batch.append(start, end, pdef.entity_type, pdef.confidence, self.name, self.tier)
+
+        return batch
 
     def _is_false_positive_classification(self, value: str, text: str, start: int) -> bool:
         """Filter false positives for classification words."""
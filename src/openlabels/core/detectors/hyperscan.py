@@ -26,7 +26,7 @@ from ..agents.hyperscan_matcher import (
     Pattern,
     PatternFlags,
 )
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .registry import register_detector
 
@@ -106,24 +106,21 @@ class HyperscanDetector(BaseDetector):
         Returns:
             List of Span objects for detected entities
         """
-        if not text or not text.strip():
-            return []
+        return self.detect_batch(text).to_spans()
 
-        matches = self._matcher.scan(text)
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
+        if not text or not text.strip():
+            return batch
 
-        spans = []
-        for match in matches:
-            spans.append(Span(
-                start=match.start,
-                end=match.end,
+        for match in self._matcher.scan(text):
+            batch.append(
+                match.start, match.end, match.entity_type,
+                match.confidence, self.name, self.tier,
                 text=match.matched_text,
-                entity_type=match.entity_type,
-                confidence=match.confidence,
-                detector=self.name,
-                tier=self.tier,
-            ))
+            )
 
-        return spans
+        return batch
 
     def is_available(self) -> bool:
         """Check if detector is ready (always True due to fallback)."""
@@ -7,7 +7,7 @@ Features:
 - INT8 quantized model support
 - Optimized ONNX graph caching
 - Chunking for long documents with overlap
-- Parallel chunk processing
+- Dynamic cross-file batching via a shared InferenceBatcher
 """
 
 from __future__ import annotations
@@ -16,7 +16,7 @@ import bisect
 import json
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future
 from pathlib import Path
 
 import numpy as np
@@ -24,8 +24,10 @@ import numpy as np
 from openlabels.exceptions import DetectionError
 
 from ..constants import BERT_MAX_LENGTH, NAME_CONNECTORS, NON_NAME_WORDS, PRODUCT_CODE_PREFIXES
+from ..pipeline.span_resolver import merge_chunk_spans
 from ..types import Span, Tier
 from .base import BaseDetector
+from .inference_batcher import InferenceBatcher
 from .labels import PHI_BERT_LABELS, PII_BERT_LABELS
 from .registry import register_detector
 
@@ -107,6 +109,8 @@ class ONNXDetector(BaseDetector):
     Falls back to HuggingFace tokenizer directory if .tokenizer.json not found.
 
     Handles long documents via chunking with overlap to catch entities at boundaries.
+    All chunks (from this document and any other concurrent ``detect()`` call)
+    go through one InferenceBatcher, which pads them into shared tensor batches.
     """
 
     name = "onnx"
@@ -119,12 +123,24 @@ class ONNXDetector(BaseDetector):
     CHUNK_MAX_CHARS = 1500      # ~375 tokens, leaves room for special tokens
     CHUNK_STRIDE = 1200         # 300 char overlap to catch boundary entities
     CHUNK_MIN_OVERLAP = 200     # Minimum overlap to ensure entity capture
-    CHUNK_PARALLEL_WORKERS = 4  # Max parallel chunk processing threads
 
-    def __init__(self, model_dir: Path | None = None, model_name: str = "model"):
+    # Dynamic batching defaults
+    BATCH_MAX_SIZE = 16         # Max chunks per InferenceSession.run call
+    BATCH_MAX_WAIT_MS = 5.0     # Max time a chunk waits for batch-mates
+
+    def __init__(
+        self,
+        model_dir: Path | None = None,
+        model_name: str = "model",
+        batch_size: int | None = None,
+        batch_wait_ms: float | None = None,
+    ):
         self.model_dir = model_dir
         self.model_name = model_name
+        self.batch_size = self.BATCH_MAX_SIZE if batch_size is None else batch_size
+        self.batch_wait_ms = self.BATCH_MAX_WAIT_MS if batch_wait_ms is None else batch_wait_ms
         self._session = None
+        self._batcher: InferenceBatcher | None = None
         self._tokenizer = None
         self._use_fast_tokenizer = False  # True if using tokenizers lib directly
         self._id2label: dict[int, str] = {}
@@ -240,6 +256,14 @@ class ONNXDetector(BaseDetector):
             else:
                 logger.info(f"{self.name}: ONNX model loaded and optimized (cached for next time)")
 
+            if self.batch_size > 1:
+                self._batcher = InferenceBatcher(
+                    self._session,
+                    max_batch_size=self.batch_size,
+                    max_wait_ms=self.batch_wait_ms,
+                    name=self.name,
+                )
+
             self._loaded = True
             return True
 
@@ -366,62 +390,27 @@ class ONNXDetector(BaseDetector):
 
     def _dedupe_spans(self, spans: list[Span], full_text: str = "") -> list[Span]:
         """Remove duplicate/overlapping spans from chunk boundaries."""
-        if not spans:
-            return []
-
-        # Sort by start position, then by confidence (descending)
-        spans = sorted(spans, key=lambda s: (s.start, -s.confidence))
-
-        result = []
-        for span in spans:
-            if not result:
-                result.append(span)
-                continue
-
-            last = result[-1]
-
-            # Check for overlap
-            if span.start < last.end:
-                if span.entity_type == last.entity_type:
-                    # Same type - merge or keep higher confidence
-                    if span.end > last.end:
-                        # Span extends further - merge
-                        merged_start = last.start
-                        merged_end = span.end
-                        if full_text and merged_end <= len(full_text):
-                            merged_text = full_text[merged_start:merged_end]
-                        else:
-                            merged_text = span.text if span.confidence > last.confidence else last.text
-                        merged = Span(
-                            start=merged_start,
-                            end=merged_end,
-                            text=merged_text,
-                            entity_type=last.entity_type,
-                            confidence=max(last.confidence, span.confidence),
-                            detector=last.detector,
-                            tier=last.tier,
-                        )
-                        result[-1] = merged
-                    elif span.confidence > last.confidence:
-                        result[-1] = span
-                else:
-                    # Different types - keep higher confidence
-                    if span.confidence > last.confidence:
-                        result[-1] = span
-            else:
-                result.append(span)
-
-        return result
+        return merge_chunk_spans(spans, full_text)
 
     def _process_chunk(
         self,
         chunk_start: int,
         chunk_text: str,
         full_text: str,
-        full_text_len: int
+        full_text_len: int,
     ) -> list[Span]:
-        """Process a single chunk and return spans with adjusted offsets."""
+        """Run inference on one chunk and shift its spans to full-text offsets."""
         chunk_spans = self._detect_single(chunk_text)
+        return self._adjust_chunk_spans(chunk_start, chunk_spans, full_text[:full_text_len])
+
+    def _adjust_chunk_spans(
+        self,
+        chunk_start: int,
+        chunk_spans: list[Span],
+        full_text: str,
+    ) -> list[Span]:
+        """Shift chunk-relative spans to full-text offsets."""
+        full_text_len = len(full_text)
         adjusted_spans = []
 
         for span in chunk_spans:
@@ -452,8 +441,9 @@ class ONNXDetector(BaseDetector):
     def detect(self, text: str) -> list[Span]:
         """Run NER inference using ONNX runtime.
 
-        Handles long documents via chunking with overlap.
-        Uses parallel processing for multiple chunks.
+        Handles long documents via chunking with overlap. Every chunk is
+        submitted to the batcher up front so chunks of this document share
+        tensor batches with each other and with concurrent files.
         """
         if not self._loaded or not self._session:
             return []
@@ -467,44 +457,45 @@ class ONNXDetector(BaseDetector):
             if len(text) <= self.CHUNK_MAX_CHARS:
                 return self._detect_single(text)
 
-            # Long text: chunk and process in parallel
             chunks = self._chunk_text(text)
-            full_text_len = len(text)
 
-            num_workers = min(
-                self.CHUNK_PARALLEL_WORKERS,
-                len(chunks),
-                os.cpu_count() or 4
-            )
-
-            all_spans = []
-
-            if num_workers > 1 and len(chunks) > 1:
-                with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                    futures = {
-                        executor.submit(
-                            self._process_chunk,
-                            chunk_start, chunk_text, text, full_text_len
-                        ): chunk_start
-                        for chunk_start, chunk_text in chunks
-                    }
-
-                    for future in as_completed(futures):
-                        try:
-                            chunk_spans = future.result()
-                            all_spans.extend(chunk_spans)
-                        except (RuntimeError, ValueError, OSError) as e:
-                            chunk_start = futures[future]
-                            logger.warning(f"{self.name}: Chunk at {chunk_start} failed: {e}")
-            else:
+            # Without a batcher there is nothing to gain from queueing
+            # chunks up front; run them one at a time.
+            if self._batcher is None:
+                all_spans = []
                 for chunk_start, chunk_text in chunks:
                     try:
-                        chunk_spans = self._process_chunk(
-                            chunk_start, chunk_text, text, full_text_len
+                        all_spans.extend(
+                            self._process_chunk(chunk_start, chunk_text, text, len(text))
                         )
-                        all_spans.extend(chunk_spans)
                     except (RuntimeError, ValueError, OSError) as e:
                         logger.warning(f"{self.name}: Chunk at {chunk_start} failed: {e}")
+                return self._dedupe_spans(all_spans, full_text=text)
+
+            # Long text: tokenize every chunk and queue them all before waiting
+            pending: list[tuple[int, str, list[tuple[int, int]], Future[np.ndarray]]] = []
+            for chunk_start, chunk_text in chunks:
+                if not chunk_text.strip():
+                    continue
+                input_ids, attention_mask, offset_mapping = self._tokenize(chunk_text)
+                pending.append((
+                    chunk_start,
+                    chunk_text,
+                    offset_mapping,
+                    self._submit_inference(input_ids, attention_mask),
+                ))
+
+            all_spans = []
+            for chunk_start, chunk_text, offset_mapping, future in pending:
+                try:
+                    chunk_spans = self._logits_to_spans(
+                        chunk_text, future.result(), offset_mapping
+                    )
+                    all_spans.extend(
+                        self._adjust_chunk_spans(chunk_start, chunk_spans, text)
+                    )
+                except (RuntimeError, ValueError, OSError) as e:
+                    logger.warning(f"{self.name}: Chunk at {chunk_start} failed: {e}")
 
             return self._dedupe_spans(all_spans, full_text=text)
 
@@ -513,15 +504,17 @@ class ONNXDetector(BaseDetector):
                 f"{self.name}: Inference failed: {e}",
             ) from e
 
-    def _detect_single(self, text: str) -> list[Span]:
-        """Run inference on a single chunk of text."""
-        if not text.strip():
-            return []
-
-        # Tokenize
-        input_ids, attention_mask, offset_mapping = self._tokenize(text)
-
-        # Run inference
+    def _submit_inference(
+        self,
+        input_ids: np.ndarray,
+        attention_mask: np.ndarray,
+    ) -> Future[np.ndarray]:
+        """Queue one chunk for inference; resolves to its [seq_len, num_labels] logits."""
+        if self._batcher is not None:
+            return self._batcher.submit(input_ids, attention_mask)
+
+        # Batching disabled: run inline with batch size 1
+        future: Future[np.ndarray] = Future()
         outputs = self._session.run(
             None,
             {
@@ -529,17 +522,36 @@ class ONNXDetector(BaseDetector):
                 'attention_mask': attention_mask,
             }
         )
+        future.set_result(outputs[0][0])
+        return future
+
+    def _detect_single(self, text: str) -> list[Span]:
+        """Run inference on a single chunk of text."""
+        if not text.strip():
+            return []
 
-        logits = outputs[0][0]  # [sequence_length, num_labels]
+        input_ids, attention_mask, offset_mapping = self._tokenize(text)
+        logits = self._submit_inference(input_ids, attention_mask).result()
+        return self._logits_to_spans(text, logits, offset_mapping)
+
+    def _logits_to_spans(
+        self,
+        text: str,
+        logits: np.ndarray,
+        offset_mapping: list[tuple[int, int]],
+    ) -> list[Span]:
+        """Decode one chunk's [seq_len, num_labels] logits into spans."""
         predictions = np.argmax(logits, axis=-1)
         confidences = np.max(self._softmax(logits), axis=-1)
-
-        # Convert predictions to spans
-        spans = self._predictions_to_spans(
+        return self._predictions_to_spans(
             text, predictions, confidences, offset_mapping
         )
 
-        return spans
+    def close(self) -> None:
+        """Stop the inference batcher thread."""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
 
     def _softmax(self, x: np.ndarray) -> np.ndarray:
         """Compute softmax values."""
@@ -775,8 +787,16 @@ class PHIBertONNXDetector(ONNXDetector):
     name = "phi_bert_onnx"
     label_map = PHI_BERT_LABELS
 
-    def __init__(self, model_dir: Path | None = None):
-        super().__init__(model_dir, model_name="phi_bert")
+    def __init__(
+        self,
+        model_dir: Path | None = None,
+        batch_size: int | None = None,
+        batch_wait_ms: float | None = None,
+    ):
+        super().__init__(
+            model_dir, model_name="phi_bert",
+            batch_size=batch_size, batch_wait_ms=batch_wait_ms,
+        )
         if model_dir:
             self.load()
 
@@ -788,7 +808,15 @@ class PIIBertONNXDetector(ONNXDetector):
     name = "pii_bert_onnx"
     label_map = PII_BERT_LABELS
 
-    def __init__(self, model_dir: Path | None = None):
-        super().__init__(model_dir, model_name="pii_bert")
+    def __init__(
+        self,
+        model_dir: Path | None = None,
+        batch_size: int | None = None,
+        batch_wait_ms: float | None = None,
+    ):
+        super().__init__(
+            model_dir, model_name="pii_bert",
+            batch_size=batch_size, batch_wait_ms=batch_wait_ms,
+        )
         if model_dir:
             self.load()
@@ -8,48 +8,109 @@ import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from openlabels.core.constants import DETECTOR_TIMEOUT
 from openlabels.exceptions import DetectionError
 
-from ..pipeline.confidence import calibrate_spans
-from ..pipeline.span_resolver import resolve_spans
+from ..pipeline.confidence import calibrate_batch
+from ..pipeline.escalation import plan_escalation
+from ..pipeline.span_resolver import resolve_batch
 from ..policies.engine import get_policy_engine
 from ..policies.schema import EntityMatch
-from ..types import DetectionResult, Span, normalize_entity_type
+from ..profiling import in_context, profile_stage
+from ..types import DetectionResult, Span, SpanBatch, Tier
 from .base import BaseDetector
 from .config import DetectionConfig
-from .registry import create_detector
+from .registry import create_detector, get_registered_detectors
+
+if TYPE_CHECKING:
+    from openlabels.dictionaries import DictionaryLoader
+
+    from .process_pool import ProcessPoolDetectionBackend
 
 logger = logging.getLogger(__name__)
 
 # Default confidence threshold for filtering
 DEFAULT_CONFIDENCE_THRESHOLD = 0.70
 
+# Supported DetectionConfig.execution_mode values
+EXECUTION_MODES = frozenset({"thread", "process"})
+
+# Supported DetectionConfig.ml_mode values
+ML_MODES = frozenset({"full", "tiered"})
+
+# DetectionConfig flag -> registered detectors it enables
+_CONFIG_TO_DETECTORS: list[tuple[str, list[str]]] = [
+    ("enable_checksum", ["checksum"]),
+    ("enable_secrets", ["secrets"]),
+    ("enable_financial", ["financial"]),
+    ("enable_government", ["government"]),
+    ("enable_patterns", ["pattern", "additional_patterns"]),
+]
+
 
 class DetectorOrchestrator:
     """Runs detectors in parallel, deduplicates results, and applies post-processing."""
 
     def __init__(self, config: DetectionConfig | None = None):
         self.config = config or DetectionConfig()
+        if self.config.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution_mode {self.config.execution_mode!r}; "
+                f"expected one of {sorted(EXECUTION_MODES)}"
+            )
+        if self.config.ml_mode not in ML_MODES:
+            raise ValueError(
+                f"Invalid ml_mode {self.config.ml_mode!r}; "
+                f"expected one of {sorted(ML_MODES)}"
+            )
         self.confidence_threshold = self.config.confidence_threshold
         self.max_workers = self.config.max_workers
         self.detectors: list[BaseDetector] = []
         self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
         self._using_hyperscan = False
+        self._medical_dictionaries: DictionaryLoader | None = None
+        self._coref_resolver: Callable[..., list[Span]] | None = None
+        self._context_enhancer: Any = None
+        self._detectors_loaded = False
+        # add_detector/remove_detector changes, for configured_detector_names()
+        self._custom_detector_names: set[str] = set()
+        self._removed_detector_names: set[str] = set()
+
+        # In process mode the workers build their own detectors; the parent
+        # only loads them if detect_sync() is called on it directly.
+        if self.config.execution_mode == "thread":
+            self._load_detectors()
+
+        self._process_backend: ProcessPoolDetectionBackend | None = None
+        if self.config.execution_mode == "process":
+            from .process_pool import ProcessPoolDetectionBackend
+            self._process_backend = ProcessPoolDetectionBackend(
+                self.config,
+                num_workers=self.config.process_workers,
+                batch_size=self.config.process_batch_size,
+            )
+
+        if self._process_backend is not None:
+            logger.info(
+                f"DetectorOrchestrator initialized in process mode with "
+                f"{self._process_backend.num_workers} workers (detectors load per worker)"
+            )
+        else:
+            logger.info(
+                f"DetectorOrchestrator initialized with {len(self.detectors)} detectors: "
+                f"{[d.name for d in self.detectors]}"
+                f"{' (Hyperscan accelerated)' if self._using_hyperscan else ''}"
+            )
+
+    def _load_detectors(self) -> None:
+        """Build the detectors, ML models and pipeline stages from the config."""
+        self._detectors_loaded = True
 
         if self.config.enable_hyperscan:
             self._init_hyperscan_detector()
 
-        _CONFIG_TO_DETECTORS: list[tuple[str, list[str]]] = [
-            ("enable_checksum", ["checksum"]),
-            ("enable_secrets", ["secrets"]),
-            ("enable_financial", ["financial"]),
-            ("enable_government", ["government"]),
-            ("enable_patterns", ["pattern", "additional_patterns"]),
-        ]
-
         for flag, names in _CONFIG_TO_DETECTORS:
             if getattr(self.config, flag):
                 for name in names:
@@ -60,21 +121,15 @@ class DetectorOrchestrator:
 
         if self.config.enable_ml:
             self._init_ml_detectors(self.config.ml_model_dir, self.config.use_onnx)
+        if self.config.ml_mode == "tiered":
+            self._init_medical_dictionaries()
 
-        self._coref_resolver: Callable[..., list[Span]] | None = None
-        self._context_enhancer: Any = None
         if self.config.enable_coref or self.config.enable_context_enhancement:
             self._init_pipeline(
                 self.config.enable_coref,
                 self.config.enable_context_enhancement,
             )
 
-        logger.info(
-            f"DetectorOrchestrator initialized with {len(self.detectors)} detectors: "
-            f"{[d.name for d in self.detectors]}"
-            f"{' (Hyperscan accelerated)' if self._using_hyperscan else ''}"
-        )
-
     def _init_hyperscan_detector(self) -> None:
         """Initialize Hyperscan-accelerated detector."""
         try:
@@ -117,12 +172,20 @@ class DetectorOrchestrator:
             try:
                 from .ml_onnx import PHIBertONNXDetector, PIIBertONNXDetector
 
-                phi_bert = PHIBertONNXDetector(model_dir=model_dir)
+                phi_bert = PHIBertONNXDetector(
+                    model_dir=model_dir,
+                    batch_size=self.config.ml_batch_size,
+                    batch_wait_ms=self.config.ml_batch_wait_ms,
+                )
                 if phi_bert.is_available():
                     self.detectors.append(phi_bert)
                     logger.info("PHI-BERT ONNX detector loaded")
 
-                pii_bert = PIIBertONNXDetector(model_dir=model_dir)
+                pii_bert = PIIBertONNXDetector(
+                    model_dir=model_dir,
+                    batch_size=self.config.ml_batch_size,
+                    batch_wait_ms=self.config.ml_batch_wait_ms,
+                )
                 if pii_bert.is_available():
                     self.detectors.append(pii_bert)
                     logger.info("PII-BERT ONNX detector loaded")
@@ -153,6 +216,14 @@ class DetectorOrchestrator:
             except ImportError as e:
                 logger.warning(f"HuggingFace detectors not available: {e}")
 
+    def _init_medical_dictionaries(self) -> None:
+        """Load the dictionaries that mark medical-context regions."""
+        try:
+            from openlabels.dictionaries import get_dictionary_loader
+            self._medical_dictionaries = get_dictionary_loader()
+        except ImportError as e:
+            logger.warning(f"Dictionary loader not available: {e}")
+
     def _init_pipeline(
         self,
         enable_coref: bool,
@@ -176,12 +247,26 @@ class DetectorOrchestrator:
                 logger.warning(f"Context enhancement not available: {e}")
 
     async def detect(self, text: str) -> DetectionResult:
-        """Async wrapper around detect_sync via run_in_executor."""
+        """Async wrapper around detect_sync via run_in_executor.
+
+        In ``execution_mode="process"`` the text is dispatched to the
+        worker-process pool instead, so concurrent callers use all cores.
+        """
+        if self._process_backend is not None and text and text.strip():
+            return await self._process_backend.detect(text)
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.detect_sync, text)
+        return await loop.run_in_executor(None, in_context(self.detect_sync), text)
 
     def detect_sync(self, text: str) -> DetectionResult:
-        """Run all detectors on the input text (synchronous entry point)."""
+        """Run all detectors on the input text (synchronous entry point).
+
+        Detectors emit ``SpanBatch`` columns that are calibrated, resolved
+        and enhanced in place; ``Span`` objects are only built for the
+        returned result.
+
+        With ``ml_mode="tiered"`` the ML detectors run after the others,
+        and only on the regions chosen by ``plan_escalation``.
+        """
         start_time = time.time()
 
         if not text or not text.strip():
@@ -193,106 +278,158 @@ class DetectorOrchestrator:
                 text_length=0,
             )
 
-        all_spans: list[Span] = []
-        detectors_used: list[str] = []
+        if not self._detectors_loaded:
+            self._load_detectors()
 
-        future_to_detector = {
-            self._executor.submit(self._run_detector, detector, text): detector
-            for detector in self.detectors
-        }
+        batch = SpanBatch(text)
+        detectors_used: list[str] = []
+        ml_detectors = [
+            d for d in self.detectors if d.tier == Tier.ML and d.is_available()
+        ]
+        ml_chars = 0
 
-        try:
-            for future in as_completed(future_to_detector, timeout=DETECTOR_TIMEOUT):
-                detector = future_to_detector[future]
-                try:
-                    spans = future.result()
-                    all_spans.extend(spans)
-                    if spans:
-                        detectors_used.append(detector.name)
-                except (DetectionError, RuntimeError, ValueError, OSError) as e:
-                    logger.error(f"Detector {detector.name} failed: {e}")
-        except TimeoutError:
-            timed_out = [
-                future_to_detector[f].name
-                for f in future_to_detector
-                if not f.done()
-            ]
-            logger.error(f"Detector timeout ({DETECTOR_TIMEOUT}s): {timed_out}")
+        if self.config.ml_mode == "tiered" and ml_detectors:
+            self._run_detectors(
+                batch,
+                [(d, 0, len(text)) for d in self.detectors if d.tier != Tier.ML],
+                detectors_used,
+            )
+            with profile_stage("escalation"):
+                plan = plan_escalation(
+                    text,
+                    batch,
+                    threshold=self.config.ml_escalation_threshold,
+                    window=self.config.ml_window_chars,
+                    medical_dictionaries=self._medical_dictionaries,
+                )
+            if plan.regions:
+                logger.debug(
+                    f"ML escalation ({plan.reason}): {len(plan.regions)} regions, "
+                    f"{plan.ml_chars}/{len(text)} chars"
+                )
+                self._run_detectors(
+                    batch,
+                    [(d, start, end) for d in ml_detectors for start, end in plan.regions],
+                    detectors_used,
+                )
+                ml_chars = plan.ml_chars
+        else:
+            self._run_detectors(
+                batch, [(d, 0, len(text)) for d in self.detectors], detectors_used,
+            )
+            if ml_detectors:
+                ml_chars = len(text)
 
-        processed_spans = self._post_process(all_spans)
+        with profile_stage("post_process"):
+            self._post_process(batch)
 
-        if self._coref_resolver and processed_spans:
+        if self._coref_resolver and len(batch):
             try:
-                processed_spans = self._coref_resolver(text, processed_spans)
+                with profile_stage("coref"):
+                    # Coreference works on Span objects and may add spans
+                    batch = SpanBatch.from_spans(
+                        text, self._coref_resolver(text, batch.to_spans()),
+                    )
             except (RuntimeError, ValueError, IndexError) as e:
                 logger.error(f"Coreference resolution failed: {e}")
 
-        if self._context_enhancer and processed_spans:
+        if self._context_enhancer and len(batch):
             try:
-                processed_spans = self._context_enhancer.enhance(text, processed_spans)
+                with profile_stage("context"):
+                    self._context_enhancer.enhance_batch(text, batch)
             except (RuntimeError, ValueError, IndexError) as e:
                 logger.error(f"Context enhancement failed: {e}")
 
         policy_result = None
-        if self.config.enable_policy and processed_spans:
+        if self.config.enable_policy and len(batch):
             try:
-                entity_matches = [
-                    EntityMatch(
-                        entity_type=span.entity_type,
-                        value=span.text,
-                        confidence=span.confidence,
-                        start=span.start,
-                        end=span.end,
-                        source=span.detector,
-                    )
-                    for span in processed_spans
-                ]
-                policy_result = get_policy_engine().evaluate(entity_matches)
+                with profile_stage("policy"):
+                    policy_result = get_policy_engine().evaluate(entity_matches(batch))
             except (ValueError, KeyError, RuntimeError) as e:
                 logger.error(f"Policy evaluation failed: {e}")
 
-        entity_counts: dict[str, int] = {}
-        for span in processed_spans:
-            normalized = normalize_entity_type(span.entity_type)
-            entity_counts[normalized] = entity_counts.get(normalized, 0) + 1
-
+        processed_spans = batch.to_spans()
         processing_time_ms = (time.time() - start_time) * 1000
 
         return DetectionResult(
             spans=processed_spans,
-            entity_counts=entity_counts,
+            entity_counts=batch.entity_counts(),
             processing_time_ms=processing_time_ms,
             detectors_used=detectors_used,
             text_length=len(text),
             policy_result=policy_result,
+            ml_chars=ml_chars,
         )
 
-    def _run_detector(self, detector: BaseDetector, text: str) -> list[Span]:
+    def _run_detectors(
+        self,
+        batch: SpanBatch,
+        jobs: list[tuple[BaseDetector, int, int]],
+        detectors_used: list[str],
+    ) -> None:
+        """Run ``(detector, start, end)`` jobs in parallel and merge into *batch*.
+
+        Each detector sees ``batch.text[start:end]``; its spans are shifted
+        back to document offsets.
+        """
+        text = batch.text
+        future_to_job = {
+            self._executor.submit(
+                in_context(self._run_detector), detector, text[start:end],
+            ): (detector, start)
+            for detector, start, end in jobs
+        }
+
+        try:
+            for future in as_completed(future_to_job, timeout=DETECTOR_TIMEOUT):
+                detector, start = future_to_job[future]
+                try:
+                    detector_batch = future.result()
+                    batch.extend(detector_batch, offset=start)
+                    if len(detector_batch) and detector.name not in detectors_used:
+                        detectors_used.append(detector.name)
+                except (DetectionError, RuntimeError, ValueError, OSError) as e:
+                    logger.error(f"Detector {detector.name} failed: {e}")
+        except TimeoutError:
+            timed_out = sorted({
+                future_to_job[f][0].name
+                for f in future_to_job
+                if not f.done()
+            })
+            logger.error(f"Detector timeout ({DETECTOR_TIMEOUT}s): {timed_out}")
+
+    def _run_detector(self, detector: BaseDetector, text: str) -> SpanBatch:
         """Run a single detector with error handling."""
         try:
             if not detector.is_available():
                 logger.warning(f"Detector {detector.name} not available")
-                return []
-            return detector.detect(text)
+                return SpanBatch(text)
+            with profile_stage(f"detector:{detector.name}"):
+                return detector.detect_batch(text)
         except (DetectionError, RuntimeError, ValueError, OSError) as e:
             logger.error(f"Error in detector {detector.name}: {e}")
-            return []
+            return SpanBatch(text)
 
     def shutdown(self) -> None:
-        """Shut down the persistent thread pool."""
+        """Shut down the persistent thread pool and any worker processes."""
         self._executor.shutdown(wait=False)
-
-    def _post_process(self, spans: list[Span]) -> list[Span]:
-        """Post-process: calibrate confidence, filter, deduplicate, sort."""
-        calibrated = calibrate_spans(spans)
-        return resolve_spans(
-            calibrated,
-            confidence_threshold=self.confidence_threshold,
-        )
+        if self._process_backend is not None:
+            self._process_backend.shutdown()
+        for detector in self.detectors:
+            close = getattr(detector, "close", None)
+            if callable(close):
+                close()
+
+    def _post_process(self, batch: SpanBatch) -> None:
+        """Post-process in place: calibrate confidence, filter, deduplicate, sort."""
+        calibrate_batch(batch)
+        resolve_batch(batch, confidence_threshold=self.confidence_threshold)
 
     def add_detector(self, detector: BaseDetector) -> None:
         """Add a custom detector to the orchestrator."""
         self.detectors.append(detector)
+        self._custom_detector_names.add(detector.name)
+        self._removed_detector_names.discard(detector.name)
         logger.info(f"Added detector: {detector.name}")
 
     def remove_detector(self, name: str) -> bool:
@@ -300,6 +437,8 @@ class DetectorOrchestrator:
         for i, detector in enumerate(self.detectors):
             if detector.name == name:
                 self.detectors.pop(i)
+                self._custom_detector_names.discard(name)
+                self._removed_detector_names.add(name)
                 logger.info(f"Removed detector: {name}")
                 return True
         return False
@@ -309,6 +448,42 @@ class DetectorOrchestrator:
         """Get list of active detector names."""
         return [d.name for d in self.detectors]
 
+    def configured_detector_names(self) -> list[str]:
+        """
+        Names of the detectors this config enables, whether loaded or not.
+
+        In process mode the parent never builds detectors, so
+        ``detector_names`` is empty there; this is derived from the config
+        (plus ``add_detector``/``remove_detector`` changes) and is the same
+        in both modes. ML detectors are named by backend, as which models
+        load depends on the model directory.
+        """
+        names: set[str] = set()
+        if self.config.enable_hyperscan:
+            names.add("hyperscan")
+        registered = get_registered_detectors()
+        for flag, detector_names in _CONFIG_TO_DETECTORS:
+            if getattr(self.config, flag):
+                names.update(n for n in detector_names if n in registered)
+        if self.config.enable_ml:
+            names.add("ml:onnx" if self.config.use_onnx else "ml:hf")
+        return sorted((names - self._removed_detector_names) | self._custom_detector_names)
+
+
+def entity_matches(batch: SpanBatch) -> list[EntityMatch]:
+    """Policy engine input for every row of *batch*."""
+    return [
+        EntityMatch(
+            entity_type=batch.entity_type(row),
+            value=batch.span_text(row),
+            confidence=batch.confidences[row],
+            start=batch.starts[row],
+            end=batch.ends[row],
+            source=batch.detector(row),
+        )
+        for row in range(len(batch))
+    ]
+
 
 def detect(
     text: str,
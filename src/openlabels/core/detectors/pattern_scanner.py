@@ -0,0 +1,355 @@
+"""
+Literal-prefiltered scanning for pattern tables.
+
+The pattern detectors used to call ``finditer`` on the whole document once
+per ``PatternDefinition``, so a 1 MB document was walked by the regex
+engine hundreds of times even though most patterns cannot possibly match
+(no "AKIA" anywhere means no AWS key). ``PatternScanner`` analyses each
+compiled pattern once, at construction time, and derives the literals
+every match must contain:
+
+- anchored patterns: every match *starts* with one of a few literals
+  (``ghp_``, ``-----BEGIN``, ``SSN``). They are only tried, with
+  ``pattern.match``, at the positions where those literals occur.
+- gated patterns: every match contains one of a few literals somewhere.
+  They run ``finditer`` only if one of those literals is in the document.
+- everything else (``\\b\\d{3}-\\d{2}-\\d{4}\\b``) runs ``finditer`` as before.
+
+Literal offsets come from ``str.find`` (on a lower-cased copy for
+case-insensitive literals in ASCII text; a lookahead regex otherwise) and
+are memoised per document, so patterns sharing a literal share the search.
+Results are identical to the per-pattern ``finditer`` loop, in the same
+order, so detectors keep their validators and deduplication unchanged.
+
+Pure Python (stdlib ``re``); no Hyperscan or Rust extension required.
+
+Usage:
+    scanner = PatternScanner(SECRETS_PATTERNS)
+    for pdef, match in scanner.scan(text):
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+try:  # Python 3.11+
+    from re import _constants as _sre
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as _sre  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+from .pattern_registry import PatternDefinition
+
+logger = logging.getLogger(__name__)
+
+# Start literals shorter than this are too common to be useful as anchors;
+# such patterns fall back to a whole-document presence check.
+MIN_ANCHOR_LENGTH = 3
+
+# Scan strategies
+ANCHORED = "anchored"
+GATED = "gated"
+FULL = "full"
+
+# A literal is (text, case_insensitive)
+_Literal = tuple[str, bool]
+
+_ZERO_WIDTH = {_sre.AT, _sre.ASSERT, _sre.ASSERT_NOT}
+_REPEATS = {_sre.MAX_REPEAT, _sre.MIN_REPEAT}
+if hasattr(_sre, "POSSESSIVE_REPEAT"):
+    _REPEATS.add(_sre.POSSESSIVE_REPEAT)
+_ATOMIC = getattr(_sre, "ATOMIC_GROUP", None)
+
+
+# PATTERN ANALYSIS
+
+# Cap on alternatives tracked for one literal position (e.g. xox[baprs]-)
+_MAX_ALTERNATIVES = 32
+_MAX_CLASS_CHARS = 8
+
+
+def _score(literals: frozenset[_Literal] | None) -> int:
+    """Selectivity of a literal set: its shortest member's length."""
+    if not literals:
+        return 0
+    return min(len(text) for text, _ in literals)
+
+
+def _finite(op, av, ci: bool) -> frozenset[str] | None:
+    """The exact set of strings a parsed item matches, if small and finite."""
+    if op is _sre.LITERAL:
+        return frozenset({chr(av)})
+    if op is _sre.IN:
+        chars: set[str] = set()
+        for sub_op, sub_av in av:
+            if sub_op is _sre.LITERAL:
+                chars.add(chr(sub_av))
+            elif sub_op is _sre.RANGE and sub_av[1] - sub_av[0] < _MAX_CLASS_CHARS:
+                chars.update(chr(c) for c in range(sub_av[0], sub_av[1] + 1))
+            else:
+                return None
+        return frozenset(chars) if 0 < len(chars) <= _MAX_CLASS_CHARS else None
+    if op is _sre.SUBPATTERN:
+        _group, add_flags, del_flags, sub = av
+        if add_flags & re.IGNORECASE and not ci:
+            return None  # Literal case would be wrong; let _analyze handle it
+        return _finite_sequence(sub, ci)
+    if op is _sre.BRANCH:
+        result: set[str] = set()
+        for branch in av[1]:
+            strings = _finite_sequence(branch, ci)
+            if strings is None:
+                return None
+            result |= strings
+        return frozenset(result) if len(result) <= _MAX_ALTERNATIVES else None
+    if op in _REPEATS:
+        min_count, max_count, sub = av
+        if min_count != max_count or min_count > 4:
+            return None
+        strings = _finite_sequence(sub, ci)
+        product: frozenset[str] | None = frozenset({""})
+        for _ in range(min_count):
+            product = _cross(product, strings)
+        return product
+    return None
+
+
+def _finite_sequence(items, ci: bool) -> frozenset[str] | None:
+    product: frozenset[str] | None = frozenset({""})
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+        product = _cross(product, _finite(op, av, ci))
+        if product is None:
+            return None
+    return product
+
+
+def _cross(left: frozenset[str] | None, right: frozenset[str] | None) -> frozenset[str] | None:
+    if left is None or right is None or len(left) * len(right) > _MAX_ALTERNATIVES:
+        return None
+    return frozenset(a + b for a in left for b in right)
+
+
+def _analyze(items, ci: bool) -> tuple[frozenset[_Literal] | None, frozenset[_Literal] | None]:
+    """Derive literal requirements for a parsed regex sequence.
+
+    Returns:
+        (required, prefix): ``required`` is a set of literals of which every
+        match contains at least one; ``prefix`` is a set of literals of which
+        every match starts with one. Either is None if nothing can be said.
+    """
+    candidates: list[frozenset[_Literal]] = []
+    prefix: frozenset[_Literal] | None = None
+    at_start = True  # No consuming item seen yet
+    run: frozenset[str] | None = None  # Contiguous literal strings being built
+
+    def flush() -> None:
+        nonlocal prefix, at_start, run
+        if run is not None:
+            literals = frozenset((text, ci) for text in run)
+            if all(text for text, _ in literals):
+                candidates.append(literals)
+                if at_start:
+                    prefix = literals
+            at_start = False
+            run = None
+
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+
+        strings = _finite(op, av, ci)
+        if strings is not None:
+            extended = _cross(run if run is not None else frozenset({""}), strings)
+            if extended is None:
+                flush()
+                extended = strings
+            run = extended
+            continue
+        flush()
+
+        sub_required = sub_prefix = None
+        if op is _sre.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            sub_ci = (ci or bool(add_flags & re.IGNORECASE)) and not (del_flags & re.IGNORECASE)
+            sub_required, sub_prefix = _analyze(sub, sub_ci)
+        elif _ATOMIC is not None and op is _ATOMIC:
+            sub_required, sub_prefix = _analyze(av, ci)
+        elif op is _sre.BRANCH:
+            branches = [_analyze(branch, ci) for branch in av[1]]
+            if all(req for req, _ in branches):
+                sub_required = frozenset().union(*(req for req, _ in branches))
+            if all(pre for _, pre in branches):
+                sub_prefix = frozenset().union(*(pre for _, pre in branches))
+        elif op in _REPEATS:
+            min_count, _max_count, sub = av
+            if min_count >= 1:
+                sub_required, sub_prefix = _analyze(sub, ci)
+
+        if sub_required:
+            candidates.append(sub_required)
+        if at_start and sub_prefix:
+            prefix = sub_prefix
+        at_start = False
+
+    flush()
+
+    required = max(candidates, key=_score, default=None)
+    return required, prefix
+
+
+@dataclass(frozen=True)
+class ScanPlan:
+    """How one pattern is scanned."""
+
+    index: int
+    pdef: PatternDefinition
+    strategy: str
+    literals: frozenset[_Literal] = frozenset()
+
+
+def plan_pattern(index: int, pdef: PatternDefinition) -> ScanPlan:
+    """Pick the cheapest exact scan strategy for a compiled pattern."""
+    try:
+        parsed = _sre_parse.parse(pdef.pattern.pattern, pdef.pattern.flags)
+    except (re.error, TypeError, ValueError) as e:
+        logger.debug(f"Pattern analysis failed for {pdef.entity_type}: {e}")
+        return ScanPlan(index, pdef, FULL)
+
+    ci = bool(pdef.pattern.flags & re.IGNORECASE)
+    required, prefix = _analyze(list(parsed), ci)
+
+    if prefix and _score(prefix) >= MIN_ANCHOR_LENGTH:
+        return ScanPlan(index, pdef, ANCHORED, prefix)
+    if required:
+        return ScanPlan(index, pdef, GATED, required)
+    return ScanPlan(index, pdef, FULL)
+
+
+# SCANNER
+
+
+class _ScanState:
+    """Per-document memo of literal offsets shared by all plans."""
+
+    __slots__ = ("text", "folded", "offsets", "present")
+
+    def __init__(self, text: str):
+        self.text = text
+        # For ASCII text, str.lower() is exactly the case folding the regex
+        # engine applies, so case-insensitive literals can use str.find too.
+        self.folded = text.lower() if text.isascii() else None
+        self.offsets: dict[_Literal, list[int]] = {}
+        self.present: dict[_Literal, bool] = {}
+
+
+class PatternScanner:
+    """Scans a document for a fixed table of patterns with literal prefilters.
+
+    Thread-safe: all state is built in ``__init__`` and read-only afterwards.
+    """
+
+    def __init__(self, patterns: Sequence[PatternDefinition]):
+        self.plans: tuple[ScanPlan, ...] = tuple(
+            plan_pattern(i, pdef) for i, pdef in enumerate(patterns)
+        )
+
+        # Fallback matchers for case-insensitive literals in non-ASCII text
+        self._fallback: dict[_Literal, re.Pattern[str]] = {}
+        for plan in self.plans:
+            for literal in plan.literals:
+                if literal[1] and literal not in self._fallback:
+                    self._fallback[literal] = re.compile(f"(?=(?i:{re.escape(literal[0])}))")
+
+        counts = {ANCHORED: 0, GATED: 0, FULL: 0}
+        for plan in self.plans:
+            counts[plan.strategy] += 1
+        self.strategy_counts = counts
+
+    def scan(self, text: str) -> Iterator[tuple[PatternDefinition, re.Match[str]]]:
+        """Yield ``(pattern, match)`` exactly as the per-pattern finditer loop would.
+
+        Matches are produced pattern by pattern, in table order, and within
+        a pattern in document order.
+        """
+        state = _ScanState(text)
+
+        for plan in self.plans:
+            pattern = plan.pdef.pattern
+
+            if plan.strategy == ANCHORED:
+                match_at = pattern.match
+                end = 0
+                for pos in self._candidates(plan, state):
+                    if pos < end:
+                        continue
+                    match = match_at(text, pos)
+                    if match is not None:
+                        yield plan.pdef, match
+                        end = match.end() if match.end() > pos else pos + 1
+                continue
+
+            if plan.strategy == GATED and not any(
+                self._is_present(literal, state) for literal in plan.literals
+            ):
+                continue
+
+            for match in pattern.finditer(text):
+                yield plan.pdef, match
+
+    def _candidates(self, plan: ScanPlan, state: _ScanState) -> list[int]:
+        """Sorted offsets at which any of the plan's start literals occurs."""
+        if len(plan.literals) == 1:
+            (literal,) = plan.literals
+            return self._offsets(literal, state)
+        positions: set[int] = set()
+        for literal in plan.literals:
+            positions.update(self._offsets(literal, state))
+        return sorted(positions)
+
+    def _offsets(self, literal: _Literal, state: _ScanState) -> list[int]:
+        """Every (possibly overlapping) start offset of *literal*."""
+        offsets = state.offsets.get(literal)
+        if offsets is not None:
+            return offsets
+
+        text, ci = literal
+        if not ci:
+            haystack, needle = state.text, text
+        elif state.folded is not None and text.isascii():
+            haystack, needle = state.folded, text.lower()
+        else:
+            offsets = [m.start() for m in self._fallback[literal].finditer(state.text)]
+            state.offsets[literal] = offsets
+            return offsets
+
+        offsets = []
+        find = haystack.find
+        pos = find(needle)
+        while pos != -1:
+            offsets.append(pos)
+            pos = find(needle, pos + 1)
+        state.offsets[literal] = offsets
+        return offsets
+
+    def _is_present(self, literal: _Literal, state: _ScanState) -> bool:
+        """Whether *literal* occurs anywhere in the document."""
+        if literal in state.offsets:
+            return bool(state.offsets[literal])
+        found = state.present.get(literal)
+        if found is None:
+            text, ci = literal
+            if not ci:
+                found = text in state.text
+            elif state.folded is not None and text.isascii():
+                found = text.lower() in state.folded
+            else:
+                found = self._fallback[literal].search(state.text) is not None
+            state.present[literal] = found
+        return found
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 import re
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .pattern_registry import PatternDefinition, _p
+from .pattern_scanner import PatternScanner
 from .registry import register_detector
 
 logger = logging.getLogger(__name__)
@@ -1225,6 +1226,9 @@ _p(r'(?:Sozialversicherungsnummer|SVNR|SV-Nummer)[:\s#]+(\d{2}\s?\d{6}\s?[A-Z]\s
 
 )
 
+# Literal-prefiltered scanner over the table above (see pattern_scanner)
+_SCANNER = PatternScanner(PATTERNS)
+
 
 # VALIDATORS
 
@@ -1453,101 +1457,87 @@ class PatternDetector(BaseDetector):
     tier = Tier.PATTERN
 
     def detect(self, text: str) -> list[Span]:
-        spans: list[Span] = []
-        seen: dict[tuple[int, int, str], int] = {}  # (start, end, entity_type) -> index in spans
-
-        for idx, pdef in enumerate(PATTERNS):
-            for match in pdef.pattern.finditer(text):
-                if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
-                    value = match.group(pdef.group)
-                    start = match.start(pdef.group)
-                    end = match.end(pdef.group)
-                else:
-                    value = match.group(0)
-                    start = match.start()
-                    end = match.end()
-
-                if not value or not value.strip():
-                    continue
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
+        confidences = batch.confidences
+        seen: dict[tuple[int, int, str], int] = {}  # (start, end, entity_type) -> row in batch
+
+        for pdef, match in _SCANNER.scan(text):
+            if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
+                value = match.group(pdef.group)
+                start = match.start(pdef.group)
+                end = match.end(pdef.group)
+            else:
+                value = match.group(0)
+                start = match.start()
+                end = match.end()
 
-                # Post-validation for specific types
-                if pdef.entity_type == 'IP_ADDRESS' and not _validate_ip(value):
-                    continue
+            if not value or not value.strip():
+                continue
 
-                # Phone validation - reject invalid area codes and test numbers
-                if pdef.entity_type in ('PHONE', 'PHONE_MOBILE', 'PHONE_HOME', 'PHONE_WORK', 'FAX'):
-                    if not _validate_phone(value):
-                        continue
-
-                # Date validation - check if pattern captured numeric groups
-                # Uses _validate_date for proper month/day checking (e.g., rejects Feb 31)
-                if pdef.entity_type in ('DATE', 'DATE_DOB') and match.lastindex and match.lastindex >= 3:
-                    try:
-                        g1, g2, g3 = match.group(1), match.group(2), match.group(3)
-                        if g1.isdigit() and g2.isdigit() and g3.isdigit():
-                            if len(g1) == 4:  # YYYY-MM-DD
-                                y, m, d = int(g1), int(g2), int(g3)
-                            else:  # MM/DD/YYYY or DD/MM/YYYY
-                                m, d, y = int(g1), int(g2), int(g3)
-                            if not _validate_date(m, d, y):
-                                continue
-                    except (ValueError, IndexError) as e:
-                        # Date parsing failed - accept match without validation
-                        # This handles edge cases where regex groups don't match expected format
-                        logger.debug(
-                            f"Date validation skipped for '{value}': {type(e).__name__}: {e}"
-                        )
-
-                # Age validation - reject impossible ages
-                if pdef.entity_type == 'AGE' and not _validate_age(value):
-                    continue
+            # Post-validation for specific types
+            if pdef.entity_type == 'IP_ADDRESS' and not _validate_ip(value):
+                continue
 
-                # SSN context validation
-                if pdef.entity_type == 'SSN' and not _validate_ssn_context(text, start, pdef.confidence):
+            # Phone validation - reject invalid area codes and test numbers
+            if pdef.entity_type in ('PHONE', 'PHONE_MOBILE', 'PHONE_HOME', 'PHONE_WORK', 'FAX'):
+                if not _validate_phone(value):
                     continue
 
-                # Credit card Luhn validation
-                if pdef.entity_type == 'CREDIT_CARD' and not _validate_luhn(value):
+            # Date validation - check if pattern captured numeric groups
+            # Uses _validate_date for proper month/day checking (e.g., rejects Feb 31)
+            if pdef.entity_type in ('DATE', 'DATE_DOB') and match.lastindex and match.lastindex >= 3:
+                try:
+                    g1, g2, g3 = match.group(1), match.group(2), match.group(3)
+                    if g1.isdigit() and g2.isdigit() and g3.isdigit():
+                        if len(g1) == 4:  # YYYY-MM-DD
+                            y, m, d = int(g1), int(g2), int(g3)
+                        else:  # MM/DD/YYYY or DD/MM/YYYY
+                            m, d, y = int(g1), int(g2), int(g3)
+                        if not _validate_date(m, d, y):
+                            continue
+                except (ValueError, IndexError) as e:
+                    # Date parsing failed - accept match without validation
+                    # This handles edge cases where regex groups don't match expected format
+                    logger.debug(
+                        f"Date validation skipped for '{value}': {type(e).__name__}: {e}"
+                    )
+
+            # Age validation - reject impossible ages
+            if pdef.entity_type == 'AGE' and not _validate_age(value):
+                continue
+
+            # SSN context validation
+            if pdef.entity_type == 'SSN' and not _validate_ssn_context(text, start, pdef.confidence):
+                continue
+
+            # Credit card Luhn validation
+            if pdef.entity_type == 'CREDIT_CARD' and not _validate_luhn(value):
+                continue
+
+            # VIN validation (for low-confidence bare VIN matches)
+            if pdef.entity_type == 'VIN' and pdef.confidence < 0.90:
+                if not _validate_vin(value):
                     continue
 
-                # VIN validation (for low-confidence bare VIN matches)
-                if pdef.entity_type == 'VIN' and pdef.confidence < 0.90:
-                    if not _validate_vin(value):
-                        continue
-
-                # Name false positive filter
-                if pdef.entity_type in ('NAME', 'NAME_PROVIDER', 'NAME_PATIENT', 'NAME_RELATIVE'):
-                    if _is_false_positive_name(value):
-                        continue
-
-                # Deduplication: skip if same span already seen with equal or higher confidence
-                key = (start, end, pdef.entity_type)
-                if key in seen:
-                    existing_idx = seen[key]
-                    if pdef.confidence <= spans[existing_idx].confidence:
-                        continue
-                    # Replace existing span with higher-confidence match
-                    spans[existing_idx] = Span(
-                        start=start,
-                        end=end,
-                        text=value,
-                        entity_type=pdef.entity_type,
-                        confidence=pdef.confidence,
-                        detector=self.name,
-                        tier=self.tier,
-                    )
+            # Name false positive filter
+            if pdef.entity_type in ('NAME', 'NAME_PROVIDER', 'NAME_PATIENT', 'NAME_RELATIVE'):
+                if _is_false_positive_name(value):
                     continue
 
-                span = Span(
-                    start=start,
-                    end=end,
-                    text=value,
-                    entity_type=pdef.entity_type,
-                    confidence=pdef.confidence,
-                    detector=self.name,
-                    tier=self.tier,
-                )
-                seen[key] = len(spans)
-                spans.append(span)
-
-        return spans
+            # Deduplication: skip if same span already seen with equal or higher confidence
+            key = (start, end, pdef.entity_type)
+            if key in seen:
+                existing_row = seen[key]
+                # Same position and type: keep the higher-confidence match
+                if pdef.confidence > confidences[existing_row]:
+                    confidences[existing_row] = pdef.confidence
+                continue
+
+            seen[key] = batch.append(
+                start, end, pdef.entity_type, pdef.confidence, self.name, self.tier,
+            )
+
+        return batch
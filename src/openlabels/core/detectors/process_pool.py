@@ -0,0 +1,306 @@
+"""
+Process-pool execution backend for DetectorOrchestrator.
+
+Regex, checksum and post-processing work is pure Python and holds the GIL,
+so the thread-pool orchestrator tops out near a single core regardless of
+how many files the scan pipeline keeps in flight. This backend runs the
+full ``detect_sync`` path in worker processes instead:
+
+- Each worker builds its own thread-mode orchestrator once (initializer),
+  so detectors and ML models are loaded once per process, not per file.
+- Texts are dispatched in batches. While a worker is idle a text is sent
+  immediately; when every worker is busy, texts accumulate (up to
+  ``batch_size``) and ship together, amortizing IPC overhead.
+- Results come back as compact span tuples rather than pickled ``Span``
+  objects; the parent rebuilds spans by slicing the text it already holds.
+
+Usage:
+    backend = ProcessPoolDetectionBackend(config, num_workers=8)
+    result = await backend.detect(text)
+    backend.shutdown()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+from ..types import DetectionResult, Span, SpanContext, Tier
+from .config import DetectionConfig
+
+if TYPE_CHECKING:
+    from .orchestrator import DetectorOrchestrator
+
+logger = logging.getLogger(__name__)
+
+# (start, end, entity_type, confidence, detector, tier,
+#  needs_review, review_reason, coref_anchor_value, context)
+SpanTuple = tuple[
+    int,
+    int,
+    str,
+    float,
+    str,
+    int,
+    bool,
+    str | None,
+    str | None,
+    SpanContext | None,
+]
+
+# (spans, entity_counts, detectors_used, processing_time_ms, policy_result, ml_chars)
+PackedResult = tuple[list[SpanTuple], dict[str, int], list[str], float, Any, int]
+
+
+# WORKER PROCESS SIDE
+
+# Per-process orchestrator, built once by _init_worker()
+_worker_orchestrator: DetectorOrchestrator | None = None
+
+
+def _init_worker(config: DetectionConfig) -> None:
+    """Build the per-process orchestrator (runs once in each worker)."""
+    global _worker_orchestrator
+    from .orchestrator import DetectorOrchestrator
+
+    _worker_orchestrator = DetectorOrchestrator(
+        config=replace(config, execution_mode="thread"),
+    )
+
+
+def pack_spans(spans: list[Span]) -> list[SpanTuple]:
+    """Convert spans to compact tuples (text is dropped; rebuilt from offsets)."""
+    return [
+        (
+            s.start,
+            s.end,
+            s.entity_type,
+            s.confidence,
+            s.detector,
+            int(s.tier),
+            s.needs_review,
+            s.review_reason,
+            s.coref_anchor_value,
+            s.context,
+        )
+        for s in spans
+    ]
+
+
+def unpack_spans(text: str, packed: list[SpanTuple]) -> list[Span]:
+    """Rebuild Span objects from compact tuples and the source text."""
+    return [
+        Span(
+            start=start,
+            end=end,
+            text=text[start:end],
+            entity_type=entity_type,
+            confidence=confidence,
+            detector=detector,
+            tier=Tier(tier),
+            context=context,
+            needs_review=needs_review,
+            review_reason=review_reason,
+            coref_anchor_value=coref_anchor_value,
+        )
+        for (
+            start,
+            end,
+            entity_type,
+            confidence,
+            detector,
+            tier,
+            needs_review,
+            review_reason,
+            coref_anchor_value,
+            context,
+        ) in packed
+    ]
+
+
+def _detect_batch(texts: list[str]) -> list[PackedResult | BaseException]:
+    """Run detection over a batch of texts inside a worker process.
+
+    Per-text failures are returned in place of the result so one bad
+    document does not fail the rest of the batch.
+    """
+    if _worker_orchestrator is None:
+        raise RuntimeError("Detection worker was not initialized")
+
+    results: list[PackedResult | BaseException] = []
+    for text in texts:
+        try:
+            result = _worker_orchestrator.detect_sync(text)
+            results.append(
+                (
+                    pack_spans(result.spans),
+                    result.entity_counts,
+                    result.detectors_used,
+                    result.processing_time_ms,
+                    result.policy_result,
+                    result.ml_chars,
+                )
+            )
+        except Exception as e:  # noqa: BLE001 — re-raised in the caller's future
+            results.append(e)
+    return results
+
+
+# PARENT PROCESS SIDE
+
+
+class ProcessPoolDetectionBackend:
+    """Dispatches detection to a pool of worker processes.
+
+    The pool is started lazily on the first ``detect()`` call so that
+    constructing an orchestrator stays cheap.
+    """
+
+    def __init__(
+        self,
+        config: DetectionConfig,
+        num_workers: int = 0,
+        batch_size: int = 8,
+    ):
+        """
+        Args:
+            config: Detection configuration each worker builds its orchestrator from
+            num_workers: Worker process count (0 = one per CPU core)
+            batch_size: Maximum texts sent to a worker in one round trip
+        """
+        self.config = config
+        self.num_workers = num_workers if num_workers > 0 else (os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size)
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[str, asyncio.Future[DetectionResult]]] = []
+        self._in_flight = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: workers must not inherit the parent's event loop,
+            # DB connections or thread-pool state.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config,),
+            )
+            logger.info(
+                f"Started detection process pool with {self.num_workers} workers "
+                f"(batch_size={self.batch_size})"
+            )
+        return self._executor
+
+    async def detect(self, text: str) -> DetectionResult:
+        """Detect entities in *text* on a worker process."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[DetectionResult] = loop.create_future()
+        self._pending.append((text, future))
+
+        # Send right away while a worker is idle; otherwise let texts
+        # accumulate until a batch completes or the batch fills up.
+        if self._in_flight < self.num_workers or len(self._pending) >= self.batch_size:
+            self._flush(loop)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Submit everything pending (up to batch_size) as one batch."""
+        batch = self._pending[: self.batch_size]
+        self._pending = self._pending[self.batch_size :]
+        if not batch:
+            return
+
+        try:
+            cf = self._get_executor().submit(_detect_batch, [text for text, _ in batch])
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._reset_executor()
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        self._in_flight += 1
+        cf.add_done_callback(
+            lambda done: loop.call_soon_threadsafe(self._deliver, loop, batch, done)
+        )
+
+    def _deliver(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: list[tuple[str, asyncio.Future[DetectionResult]]],
+        done: Future[list[PackedResult | BaseException]],
+    ) -> None:
+        """Resolve each caller's future from a completed batch."""
+        self._in_flight -= 1
+
+        exc = None if done.cancelled() else done.exception()
+        if done.cancelled() or exc is not None:
+            if isinstance(exc, BrokenProcessPool):
+                logger.error(f"Detection worker process died: {exc}")
+                self._reset_executor()
+            for _, fut in batch:
+                if not fut.done():
+                    if exc is None:
+                        fut.cancel()
+                    else:
+                        fut.set_exception(exc)
+        else:
+            for (text, fut), packed in zip(batch, done.result(), strict=True):
+                if fut.done():
+                    continue
+                if isinstance(packed, BaseException):
+                    fut.set_exception(packed)
+                else:
+                    fut.set_result(_unpack_result(text, packed))
+
+        # A worker just freed up — ship whatever queued up behind it
+        if self._pending:
+            self._flush(loop)
+
+    def _reset_executor(self) -> None:
+        """Drop a broken pool so the next call starts a fresh one.
+
+        ``_in_flight`` is left alone: every batch submitted to the old pool
+        still completes (failed or cancelled) and decrements it in
+        ``_deliver``.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        """Stop worker processes and fail any texts still waiting."""
+        for _, fut in self._pending:
+            if not fut.done():
+                fut.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _unpack_result(text: str, packed: PackedResult) -> DetectionResult:
+    (
+        span_tuples,
+        entity_counts,
+        detectors_used,
+        processing_time_ms,
+        policy_result,
+        ml_chars,
+    ) = packed
+    return DetectionResult(
+        spans=unpack_spans(text, span_tuples),
+        entity_counts=entity_counts,
+        processing_time_ms=processing_time_ms,
+        detectors_used=detectors_used,
+        text_length=len(text),
+        policy_result=policy_result,
+        ml_chars=ml_chars,
+    )
@@ -26,9 +26,10 @@ import base64
 import binascii
 import re
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 from .base import BaseDetector
 from .pattern_registry import PatternDefinition, _p
+from .pattern_scanner import PatternScanner
 from .registry import register_detector
 
 # Pattern definitions: immutable frozen dataclass tuples
@@ -147,6 +148,9 @@ SECRETS_PATTERNS: tuple[PatternDefinition, ...] = (
     _p(r'(?:private[_\s]?key|priv[_\s]?key)["\s:=]+["\']([a-zA-Z0-9+/=\-_]{20,})["\']', 'PRIVATE_KEY', 0.85, 1, flags=re.I),
 )
 
+# Literal-prefiltered scanner over the table above (see pattern_scanner)
+_SCANNER = PatternScanner(SECRETS_PATTERNS)
+
 
 @register_detector
 class SecretsDetector(BaseDetector):
@@ -161,45 +165,38 @@ class SecretsDetector(BaseDetector):
     tier = Tier.PATTERN
 
     def detect(self, text: str) -> list[Span]:
-        spans = []
+        return self.detect_batch(text).to_spans()
+
+    def detect_batch(self, text: str) -> SpanBatch:
+        batch = SpanBatch(text)
         seen = set()
 
-        for pdef in SECRETS_PATTERNS:
-            for match in pdef.pattern.finditer(text):
-                if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
-                    value = match.group(pdef.group)
-                    start = match.start(pdef.group)
-                    end = match.end(pdef.group)
-                else:
-                    value = match.group(0)
-                    start = match.start()
-                    end = match.end()
-
-                if not value or not value.strip():
+        for pdef, match in _SCANNER.scan(text):
+            if pdef.group > 0 and match.lastindex and pdef.group <= match.lastindex:
+                value = match.group(pdef.group)
+                start = match.start(pdef.group)
+                end = match.end(pdef.group)
+            else:
+                value = match.group(0)
+                start = match.start()
+                end = match.end()
+
+            if not value or not value.strip():
+                continue
+
+            key = (start, end, value)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            # Additional validation for JWTs
+            if pdef.entity_type == 'JWT':
+                if not self._validate_jwt(value):
                     continue
 
-                key = (start, end, value)
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                # Additional validation for JWTs
-                if pdef.entity_type == 'JWT':
-                    if not self._validate_jwt(value):
-                        continue
-
-                span = Span(
-                    start=start,
-                    end=end,
-                    text=value,
-                    entity_type=pdef.entity_type,
-                    confidence=pdef.confidence,
-                    detector=self.name,
-                    tier=self.tier,
-                )
-                spans.append(span)
-
-        return spans
+            batch.append(start, end, pdef.entity_type, pdef.confidence, self.name, self.tier)
+
+        return batch
 
     def _validate_jwt(self, token: str) -> bool:
         """Basic JWT structure validation."""
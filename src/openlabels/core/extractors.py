@@ -3,14 +3,23 @@ Text extractors for various file formats.
 
 Each extractor implements a common interface for extracting text content
 from files, with security protections against decompression bombs.
+
+``extract()`` returns the whole document as one string. ``iter_segments()``
+yields the same text incrementally (PDF pages, spreadsheet and CSV row
+blocks) as ``TextSegment`` objects whose concatenation equals
+``extract().text``, so huge files can be detected without materializing
+the full decoded document.
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import logging
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -21,6 +30,9 @@ from .constants import (
     MAX_EXTRACTION_RATIO,
     MAX_SPREADSHEET_ROWS,
     MIN_NATIVE_TEXT_LENGTH,
+    STREAM_DECODE_CHUNK_BYTES,
+    STREAM_SEGMENT_ROWS,
+    STREAM_WINDOW_CHARS,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,6 +68,107 @@ class ExtractionResult:
         return sum(1 for p in self.page_infos if p.is_scanned)
 
 
+@dataclass
+class TextSegment:
+    """A contiguous piece of a document's extracted text."""
+    text: str
+    offset: int  # Character offset of text[0] in the full extracted text
+    label: str = ""  # Human-readable origin, e.g. "page 3" or "lines 1-5000"
+
+
+def detect_encoding(
+    content: bytes,
+    encodings: Sequence[str],
+    chunk_bytes: int = STREAM_DECODE_CHUNK_BYTES,
+) -> str | None:
+    """
+    Return the first encoding that decodes *content* without errors.
+
+    Same answer as trying ``content.decode(encoding)`` in order, but the
+    decoded text is discarded chunk by chunk instead of held in memory.
+    """
+    view = memoryview(content)
+    for encoding in encodings:
+        try:
+            encoding = _incremental_encoding(encoding, content)
+            decoder = codecs.getincrementaldecoder(encoding)()
+            for pos in range(0, len(view), chunk_bytes):
+                decoder.decode(view[pos:pos + chunk_bytes])
+            decoder.decode(b"", final=True)
+            return encoding
+        except (UnicodeError, LookupError):
+            # This encoding doesn't work - try next one
+            continue
+    return None
+
+
+def _incremental_encoding(encoding: str, content: bytes) -> str:
+    """
+    Name of the codec whose incremental decoder matches ``bytes.decode``.
+
+    ``bytes.decode("utf-16")`` assumes native byte order when there is no
+    BOM, whereas the incremental UTF-16/32 decoders reject such input.
+    """
+    name = codecs.lookup(encoding).name
+    if name in ("utf-16", "utf-32"):
+        boms = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE) if name == "utf-16" else (
+            codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)
+        if not content.startswith(boms):
+            return f"{name}-{'le' if sys.byteorder == 'little' else 'be'}"
+    return encoding
+
+
+def iter_decoded(
+    content: bytes,
+    encoding: str,
+    errors: str = "strict",
+    chunk_bytes: int = STREAM_DECODE_CHUNK_BYTES,
+) -> Iterator[str]:
+    """Decode *content* incrementally, yielding text roughly *chunk_bytes* at a time."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    view = memoryview(content)
+    for pos in range(0, len(view), chunk_bytes):
+        text = decoder.decode(view[pos:pos + chunk_bytes])
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _line_segments(
+    lines: Iterable[str],
+    rows_per_segment: int = STREAM_SEGMENT_ROWS,
+    max_chars: int = STREAM_WINDOW_CHARS,
+) -> Iterator[TextSegment]:
+    """Group lines into segments whose concatenation equals ``"\n".join(lines)``."""
+    offset = 0
+    first_line = 1
+    batch: list[str] = []
+    batch_chars = 0
+
+    def flush(last_line: int) -> TextSegment:
+        nonlocal offset, first_line, batch, batch_chars
+        text = "\n".join(batch)
+        if offset:
+            text = "\n" + text  # Separator from the previous segment
+        segment = TextSegment(text=text, offset=offset, label=f"lines {first_line}-{last_line}")
+        offset += len(text)
+        first_line = last_line + 1
+        batch = []
+        batch_chars = 0
+        return segment
+
+    line_no = 0
+    for line_no, line in enumerate(lines, start=1):
+        batch.append(line)
+        batch_chars += len(line) + 1
+        if len(batch) >= rows_per_segment or batch_chars >= max_chars:
+            yield flush(line_no)
+    if batch:
+        yield flush(line_no)
+
+
 class BaseExtractor(ABC):
     """Base class for format-specific extractors."""
 
@@ -87,6 +200,30 @@ class BaseExtractor(ABC):
         """
         pass
 
+    def iter_segments(
+        self,
+        content: bytes,
+        filename: str,
+        warnings: list[str] | None = None,
+    ) -> Iterator[TextSegment]:
+        """
+        Extract text incrementally.
+
+        Segments concatenate to exactly ``extract(content, filename).text``.
+        The default implementation extracts everything and yields it as one
+        segment; formats that can be read piecewise override this.
+
+        Args:
+            content: Raw file bytes
+            filename: Original filename
+            warnings: Optional list that non-fatal issues are appended to
+        """
+        result = self.extract(content, filename)
+        if warnings is not None:
+            warnings.extend(result.warnings)
+        if result.text:
+            yield TextSegment(text=result.text, offset=0, label="document")
+
 
 class PDFExtractor(BaseExtractor):
     """
@@ -120,87 +257,16 @@ class PDFExtractor(BaseExtractor):
 
         doc = fitz.open(stream=content, filetype="pdf")
 
-        pages_text = []
         page_infos = []
         ocr_pages = []
         ocr_confidences = []
         warnings = []
 
         try:
-            for i, page in enumerate(doc):
-                # Early exit if page limit exceeded (prevents DoS via large PDFs)
-                if i >= MAX_DOCUMENT_PAGES:
-                    logger.warning(f"PDF exceeds {MAX_DOCUMENT_PAGES} page limit, truncating")
-                    warnings.append(f"Document truncated at {MAX_DOCUMENT_PAGES} pages")
-                    break
-
-                # Try to extract text layer
-                native_text = page.get_text().strip()
-
-                # Check if this page has meaningful native text
-                has_native_text = len(native_text) >= MIN_NATIVE_TEXT_LENGTH
-
-                if has_native_text:
-                    # Native text page
-                    pages_text.append(native_text)
-                    page_infos.append(PageInfo(
-                        page_num=i,
-                        text=native_text,
-                        is_scanned=False,
-                    ))
-                    logger.debug(f"Page {i+1}: native text ({len(native_text)} chars)")
-
-                elif self.ocr_engine and hasattr(self.ocr_engine, 'is_available') and self.ocr_engine.is_available:
-                    # Scanned page - needs OCR
-                    logger.debug(f"Page {i+1}: scanned, using OCR")
-
-                    try:
-                        # Render page to image
-                        pix = page.get_pixmap(dpi=self.RENDER_DPI)
-
-                        # Convert to PIL Image and numpy array
-                        import numpy as np
-                        from PIL import Image
-
-                        img = Image.frombytes(
-                            "RGB",
-                            [pix.width, pix.height],
-                            pix.samples
-                        )
-                        img_array = np.array(img)
-
-                        # Run OCR
-                        ocr_text = self.ocr_engine.extract_text(img_array)
-
-                        pages_text.append(ocr_text)
-                        ocr_pages.append(i)
-
-                        page_infos.append(PageInfo(
-                            page_num=i,
-                            text=ocr_text,
-                            is_scanned=True,
-                        ))
-
-                    except (OSError, ValueError, RuntimeError, MemoryError) as e:
-                        # Log OCR failures with full context - may indicate corrupted pages or OCR issues
-                        logger.warning(f"OCR failed for page {i+1} of {filename}: {type(e).__name__}: {e}")
-                        pages_text.append("")
-                        warnings.append(f"OCR failed for page {i+1}: {e}")
-                        page_infos.append(PageInfo(
-                            page_num=i,
-                            text="",
-                            is_scanned=True,
-                        ))
-                else:
-                    # No OCR available
-                    pages_text.append("")
-                    page_infos.append(PageInfo(
-                        page_num=i,
-                        text="",
-                        is_scanned=True,  # Assume scanned if no text
-                    ))
-                    if not self.ocr_engine:
-                        warnings.append(f"Page {i+1} is scanned but OCR not available")
+            for info, used_ocr in self._iter_pages(doc, filename, warnings):
+                page_infos.append(info)
+                if used_ocr:
+                    ocr_pages.append(info.page_num)
 
             # Calculate average OCR confidence
             avg_confidence = 1.0
@@ -208,7 +274,7 @@ class PDFExtractor(BaseExtractor):
                 avg_confidence = sum(ocr_confidences) / len(ocr_confidences)
 
             return ExtractionResult(
-                text="\n\n".join(pages_text),
+                text="\n\n".join(info.text for info in page_infos),
                 pages=len(doc),
                 needs_ocr=len(ocr_pages) > 0,
                 ocr_pages=ocr_pages,
@@ -220,6 +286,87 @@ class PDFExtractor(BaseExtractor):
         finally:
             doc.close()
 
+    def iter_segments(
+        self,
+        content: bytes,
+        filename: str,
+        warnings: list[str] | None = None,
+    ) -> Iterator[TextSegment]:
+        """Yield one segment per page (joined with blank lines, as extract())."""
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            raise ImportError("PyMuPDF not installed. Run: pip install pymupdf") from None
+
+        doc = fitz.open(stream=content, filetype="pdf")
+        warnings = warnings if warnings is not None else []
+        try:
+            offset = 0
+            for info, _used_ocr in self._iter_pages(doc, filename, warnings):
+                text = "\n\n" + info.text if info.page_num else info.text
+                yield TextSegment(text=text, offset=offset, label=f"page {info.page_num + 1}")
+                offset += len(text)
+        finally:
+            doc.close()
+
+    def _iter_pages(
+        self, doc: Any, filename: str, warnings: list[str],
+    ) -> Iterator[tuple[PageInfo, bool]]:
+        """Extract pages one at a time as ``(page, ocr_succeeded)``, with OCR fallback."""
+        for i, page in enumerate(doc):
+            # Early exit if page limit exceeded (prevents DoS via large PDFs)
+            if i >= MAX_DOCUMENT_PAGES:
+                logger.warning(f"PDF exceeds {MAX_DOCUMENT_PAGES} page limit, truncating")
+                warnings.append(f"Document truncated at {MAX_DOCUMENT_PAGES} pages")
+                break
+
+            # Try to extract text layer
+            native_text = page.get_text().strip()
+
+            # Check if this page has meaningful native text
+            has_native_text = len(native_text) >= MIN_NATIVE_TEXT_LENGTH
+
+            if has_native_text:
+                # Native text page
+                logger.debug(f"Page {i+1}: native text ({len(native_text)} chars)")
+                yield PageInfo(page_num=i, text=native_text, is_scanned=False), False
+
+            elif self.ocr_engine and hasattr(self.ocr_engine, 'is_available') and self.ocr_engine.is_available:
+                # Scanned page - needs OCR
+                logger.debug(f"Page {i+1}: scanned, using OCR")
+
+                try:
+                    # Render page to image
+                    pix = page.get_pixmap(dpi=self.RENDER_DPI)
+
+                    # Convert to PIL Image and numpy array
+                    import numpy as np
+                    from PIL import Image
+
+                    img = Image.frombytes(
+                        "RGB",
+                        [pix.width, pix.height],
+                        pix.samples
+                    )
+                    img_array = np.array(img)
+
+                    # Run OCR
+                    ocr_text = self.ocr_engine.extract_text(img_array)
+
+                except (OSError, ValueError, RuntimeError, MemoryError) as e:
+                    # Log OCR failures with full context - may indicate corrupted pages or OCR issues
+                    logger.warning(f"OCR failed for page {i+1} of {filename}: {type(e).__name__}: {e}")
+                    warnings.append(f"OCR failed for page {i+1}: {e}")
+                    yield PageInfo(page_num=i, text="", is_scanned=True), False
+                else:
+                    yield PageInfo(page_num=i, text=ocr_text, is_scanned=True), True
+            else:
+                # No OCR available
+                if not self.ocr_engine:
+                    warnings.append(f"Page {i+1} is scanned but OCR not available")
+                # Assume scanned if no text
+                yield PageInfo(page_num=i, text="", is_scanned=True), False
+
 
 class DOCXExtractor(BaseExtractor):
     """Word document extractor using python-docx."""
@@ -350,55 +497,99 @@ class XLSXExtractor(BaseExtractor):
         else:
             return self._extract_xlsx(content, filename)
 
-    def _extract_csv(self, content: bytes, delimiter: str) -> ExtractionResult:
-        """Extract from CSV/TSV."""
-        # Try common encodings - UnicodeDecodeError is expected for wrong encodings
-        text_content = None
-        for encoding in ["utf-8", "utf-8-sig", "latin-1", "cp1252"]:
+    def iter_segments(
+        self,
+        content: bytes,
+        filename: str,
+        warnings: list[str] | None = None,
+    ) -> Iterator[TextSegment]:
+        """Yield blocks of rows; legacy XLS falls back to a single segment."""
+        ext = Path(filename).suffix.lower()
+        warnings = warnings if warnings is not None else []
+
+        if ext in (".csv", ".tsv"):
+            encoding = detect_encoding(content, self._CSV_ENCODINGS)
+            if encoding is None:
+                warnings.append("Failed to decode CSV file")
+                return
+            delimiter = "\t" if ext == ".tsv" else ","
+            yield from _line_segments(self._iter_csv_rows(content, encoding, delimiter))
+        elif ext == ".xls":
+            yield from super().iter_segments(content, filename, warnings)
+        else:
+            wb = self._open_xlsx(content)
             try:
-                text_content = content.decode(encoding)
-                break
-            except UnicodeDecodeError:
-                # This encoding doesn't work - try next one
-                continue
+                yield from _line_segments(
+                    self._iter_xlsx_lines(wb, filename, len(content), warnings)
+                )
+            finally:
+                wb.close()
 
-        if text_content is None:
+    # Tried in order; latin-1 accepts any byte sequence
+    _CSV_ENCODINGS = ("utf-8", "utf-8-sig", "latin-1", "cp1252")
+
+    def _extract_csv(self, content: bytes, delimiter: str) -> ExtractionResult:
+        """Extract from CSV/TSV."""
+        encoding = detect_encoding(content, self._CSV_ENCODINGS)
+        if encoding is None:
             return ExtractionResult(
                 text="",
                 warnings=["Failed to decode CSV file"],
             )
 
-        rows = []
-        reader = csv.reader(io.StringIO(text_content), delimiter=delimiter)
-        for row in reader:
-            if any(cell.strip() for cell in row):
-                rows.append(" | ".join(cell.strip() for cell in row if cell.strip()))
-
         return ExtractionResult(
-            text="\n".join(rows),
+            text="\n".join(self._iter_csv_rows(content, encoding, delimiter)),
             pages=1,
         )
 
-    def _extract_xlsx(self, content: bytes, filename: str) -> ExtractionResult:
-        """Extract from XLSX."""
+    @staticmethod
+    def _iter_csv_rows(content: bytes, encoding: str, delimiter: str) -> Iterator[str]:
+        """Yield non-empty rows as ``cell | cell`` lines, decoding lazily."""
+        stream = io.TextIOWrapper(io.BytesIO(content), encoding=encoding, newline="")
+        for row in csv.reader(stream, delimiter=delimiter):
+            if any(cell.strip() for cell in row):
+                yield " | ".join(cell.strip() for cell in row if cell.strip())
+
+    @staticmethod
+    def _open_xlsx(content: bytes) -> Any:
         try:
             from openpyxl import load_workbook
         except ImportError:
             raise ImportError("openpyxl not installed. Run: pip install openpyxl") from None
+        return load_workbook(io.BytesIO(content), read_only=True, data_only=True)
 
-        # SECURITY: Track total extracted size to prevent decompression bombs
-        compressed_size = len(content)
+    def _extract_xlsx(self, content: bytes, filename: str) -> ExtractionResult:
+        """Extract from XLSX."""
+        wb = self._open_xlsx(content)
+        warnings: list[str] = []
+        try:
+            text = "\n".join(self._iter_xlsx_lines(wb, filename, len(content), warnings))
+            # Store sheet count before closing workbook
+            sheet_count = len(wb.sheetnames) if hasattr(wb, 'sheetnames') else 1
+        finally:
+            wb.close()
 
-        wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        return ExtractionResult(
+            text=text,
+            pages=sheet_count,
+            warnings=warnings,
+        )
 
-        all_text = []
-        warnings = []
+    def _iter_xlsx_lines(
+        self,
+        wb: Any,
+        filename: str,
+        compressed_size: int,
+        warnings: list[str],
+    ) -> Iterator[str]:
+        """Yield a workbook's text line by line: a header per sheet, then its rows."""
+        # SECURITY: Track total extracted size to prevent decompression bombs
         total_chars = 0
 
         for sheet_name in wb.sheetnames:
             sheet = wb[sheet_name]
-            sheet_rows = []
             row_count = 0
+            header_done = False
 
             for row in sheet.iter_rows(values_only=True):
                 # Limit rows per sheet to prevent DoS
@@ -410,25 +601,22 @@ class XLSXExtractor(BaseExtractor):
                 cells = [str(cell).strip() for cell in row if cell is not None]
                 if cells:
                     row_text = " | ".join(cells)
-                    sheet_rows.append(row_text)
                     total_chars += len(row_text)
 
                     # SECURITY: Check for decompression bomb
                     if total_chars > MAX_DECOMPRESSED_SIZE:
-                        wb.close()
                         raise ValueError(
                             f"Decompression bomb detected: extracted content exceeds "
                             f"{MAX_DECOMPRESSED_SIZE // (1024*1024)}MB limit"
                         )
 
-            if sheet_rows:
-                all_text.append(f"[Sheet: {sheet_name}]")
-                all_text.extend(sheet_rows)
-                all_text.append("")
+                    if not header_done:
+                        yield f"[Sheet: {sheet_name}]"
+                        header_done = True
+                    yield row_text
 
-        # Store sheet count before closing workbook
-        sheet_count = len(wb.sheetnames) if hasattr(wb, 'sheetnames') else 1
-        wb.close()
+            if header_done:
+                yield ""
 
         # SECURITY: Final check on extraction ratio
         if compressed_size > 0 and total_chars > 0:
@@ -439,12 +627,6 @@ class XLSXExtractor(BaseExtractor):
                     f"({compressed_size} bytes -> {total_chars} chars)"
                 )
 
-        return ExtractionResult(
-            text="\n".join(all_text),
-            pages=sheet_count,
-            warnings=warnings,
-        )
-
     def _extract_xls(self, content: bytes, filename: str) -> ExtractionResult:
         """Extract from legacy XLS."""
         try:
@@ -1179,3 +1361,45 @@ def extract_text(
         )
 
     return extractor.extract(content, filename)
+
+
+def iter_text_segments(
+    content: bytes,
+    filename: str,
+    content_type: str | None = None,
+    ocr_engine: Any | None = None,
+    warnings: list[str] | None = None,
+) -> Iterator[TextSegment]:
+    """
+    Extract text from file content incrementally.
+
+    Streaming counterpart of ``extract_text``: segments concatenate to the
+    same text, but PDFs, XLSX workbooks and CSV/TSV files are produced a
+    page or row block at a time.
+
+    Args:
+        content: Raw file bytes
+        filename: Original filename
+        content_type: Optional MIME type (will be guessed if not provided)
+        ocr_engine: Optional OCR engine for image/PDF extraction
+        warnings: Optional list that non-fatal issues are appended to
+
+    Yields:
+        TextSegment objects in document order
+    """
+    import mimetypes
+
+    ext = Path(filename).suffix.lower()
+
+    if content_type is None:
+        content_type, _ = mimetypes.guess_type(filename)
+        content_type = content_type or ""
+
+    extractor = get_extractor(content_type, ext, ocr_engine=ocr_engine)
+
+    if extractor is None:
+        if warnings is not None:
+            warnings.append(f"No extractor available for file type: {ext} ({content_type})")
+        return
+
+    yield from extractor.iter_segments(content, filename, warnings)
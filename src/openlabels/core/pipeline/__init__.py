@@ -15,6 +15,8 @@ from .confidence import (
 from .context_enhancer import (
     ContextEnhancer,
     EnhancementResult,
+    EnhancementStats,
+    HotwordIndex,
     create_enhancer,
 )
 from .entity_resolver import (
@@ -63,6 +65,8 @@ __all__ = [
     "ContextEnhancer",
     "create_enhancer",
     "EnhancementResult",
+    "EnhancementStats",
+    "HotwordIndex",
     # Validation
     "validate_span_positions",
     "validate_after_coref",
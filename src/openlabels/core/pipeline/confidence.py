@@ -11,7 +11,7 @@ even if the raw scores look similar.
 
 from __future__ import annotations
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 
 # Tier floors — the minimum calibrated score for each tier.
 # A CHECKSUM span will always score >= 0.90 after calibration,
@@ -58,6 +58,17 @@ def calibrate_spans(spans: list[Span]) -> list[Span]:
     ]
 
 
+def calibrate_batch(batch: SpanBatch) -> None:
+    """Calibrate every row's confidence in place (see ``calibrate_confidence``)."""
+    scale = {
+        tier.value: (_TIER_FLOORS[tier], _next_ceiling(tier) - _TIER_FLOORS[tier]) for tier in Tier
+    }
+    confidences = batch.confidences
+    for row, tier in enumerate(batch.tiers):
+        floor, width = scale[tier]
+        confidences[row] = floor + confidences[row] * width
+
+
 def _next_ceiling(tier: Tier) -> float:
     """Ceiling for a tier = floor of the next tier, or 1.0."""
     ordered = [Tier.ML, Tier.PATTERN, Tier.STRUCTURED, Tier.CHECKSUM]
@@ -19,10 +19,13 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Any
 
-from ..types import Span, Tier
+from ..types import Span, SpanBatch, Tier
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +193,77 @@ NAME_NEGATIVE_HOTWORDS: list[HotwordRule] = [
 ]
 
 
+# Hotword rule sets by (upper-cased) entity type
+_HOTWORD_RULES: dict[str, tuple[list[HotwordRule], list[HotwordRule]]] = {
+    "NAME": (NAME_POSITIVE_HOTWORDS, NAME_NEGATIVE_HOTWORDS),
+    "PERSON": (NAME_POSITIVE_HOTWORDS, NAME_NEGATIVE_HOTWORDS),
+    "PER": (NAME_POSITIVE_HOTWORDS, NAME_NEGATIVE_HOTWORDS),
+}
+
+
+@cache
+def _unanchored(pattern: re.Pattern, anchor: str) -> re.Pattern | None:
+    """*pattern* without its leading ``^`` or trailing ``$`` (None if it has none)."""
+    source = pattern.pattern
+    if anchor == "$" and source.endswith("$") and not source.endswith("\\$"):
+        return re.compile(source[:-1], pattern.flags)
+    if anchor == "^" and source.startswith("^"):
+        return re.compile(source[1:], pattern.flags)
+    return None
+
+
+class HotwordIndex:
+    """
+    Document-wide hotword hits, for scoring many spans of one document.
+
+    A before-rule (``...$``, matched against the text ending at the span)
+    is run once over the whole document without its ``$``, and the start
+    offsets of its hits are kept sorted; an after-rule (``^...``) likewise
+    keeps its hits' end offsets. A span's window is then checked with two
+    bisects, and the rule's own search on the window (as in
+    ``_apply_hotwords``) only runs for spans with a hit in the window.
+    Rules without such an anchor are always searched.
+
+    Hits are computed lazily, per rule, on first use.
+    """
+
+    __slots__ = ("text", "_hits")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._hits: dict[tuple[int, str], list[int] | None] = {}
+
+    def may_match(self, rule: HotwordRule, start: int, end: int) -> bool:
+        """Whether *rule* can fire for a span at ``[start, end)``."""
+        if rule.window_before > 0:
+            starts = self._offsets(rule, "$")
+            if starts is None:
+                return True
+            i = bisect_left(starts, max(0, start - rule.window_before))
+            if i < len(starts) and starts[i] < start:
+                return True
+        if rule.window_after > 0:
+            ends = self._offsets(rule, "^")
+            if ends is None:
+                return True
+            i = bisect_right(ends, end)
+            if i < len(ends) and ends[i] <= end + rule.window_after:
+                return True
+        return False
+
+    def _offsets(self, rule: HotwordRule, anchor: str) -> list[int] | None:
+        key = (id(rule.pattern), anchor)
+        if key not in self._hits:
+            pattern = _unanchored(rule.pattern, anchor)
+            if pattern is None:
+                self._hits[key] = None
+            elif anchor == "$":
+                self._hits[key] = [m.start() for m in pattern.finditer(self.text)]
+            else:
+                self._hits[key] = [m.end() for m in pattern.finditer(self.text)]
+        return self._hits[key]
+
+
 # PATTERN EXCLUSIONS
 # Pattern: "X, Y and Z" or "X and Y" - likely a company/firm name
 COMPANY_PATTERN = re.compile(
@@ -252,6 +326,16 @@ class EnhancementResult:
     span: Any | None = None  # Updated span (if text was modified), else None
 
 
+@dataclass
+class EnhancementStats:
+    """Aggregate outcome of enhancing one document."""
+    kept: int = 0
+    needs_llm: int = 0
+    rejected: int = 0
+    # Rejections by reason kind ("deny_list", "low_confidence", ...)
+    reject_reasons: Counter[str] = field(default_factory=Counter)
+
+
 class ContextEnhancer:
     """
     Context-aware enhancement for PII detection.
@@ -410,22 +494,26 @@ class ContextEnhancer:
         self,
         text: str,
         span: Span,
-        current_confidence: float
+        current_confidence: float,
+        hotwords: HotwordIndex | None = None,
     ) -> tuple[float, list[str]]:
-        """Apply hotword rules to adjust confidence."""
+        """Apply hotword rules to adjust confidence.
+
+        With *hotwords* (an index over *text*), rules with no hit in the
+        span's windows are skipped without slicing or searching.
+        """
         confidence = current_confidence
         reasons = []
 
-        entity_type = span.entity_type.upper()
-
-        if entity_type in ("NAME", "PERSON", "PER"):
-            positive_rules = NAME_POSITIVE_HOTWORDS
-            negative_rules = NAME_NEGATIVE_HOTWORDS
-        else:
+        rules = _HOTWORD_RULES.get(span.entity_type.upper())
+        if rules is None:
             return confidence, reasons
+        positive_rules, negative_rules = rules
 
         # Apply positive hotwords
         for rule in positive_rules:
+            if hotwords is not None and not hotwords.may_match(rule, span.start, span.end):
+                continue
             text_before, text_after = self._get_context_window(
                 text, span, rule.window_before, rule.window_after
             )
@@ -439,6 +527,8 @@ class ContextEnhancer:
 
         # Apply negative hotwords
         for rule in negative_rules:
+            if hotwords is not None and not hotwords.may_match(rule, span.start, span.end):
+                continue
             text_before, text_after = self._get_context_window(
                 text, span, rule.window_before, rule.window_after
             )
@@ -452,8 +542,17 @@ class ContextEnhancer:
 
         return confidence, reasons
 
-    def enhance_span(self, text: str, span: Span) -> EnhancementResult:
-        """Enhance a single span with context analysis."""
+    def enhance_span(
+        self,
+        text: str,
+        span: Span,
+        hotwords: HotwordIndex | None = None,
+    ) -> EnhancementResult:
+        """Enhance a single span with context analysis.
+
+        *hotwords* is an optional ``HotwordIndex`` over *text*, shared by
+        all spans of the document.
+        """
         reasons = []
         confidence = span.confidence
 
@@ -489,7 +588,9 @@ class ContextEnhancer:
 
         # Stage 3: Hotword adjustment
         if self.enable_hotwords:
-            confidence, hotword_reasons = self._apply_hotwords(text, span, confidence)
+            confidence, hotword_reasons = self._apply_hotwords(
+                text, span, confidence, hotwords,
+            )
             reasons.extend(hotword_reasons)
 
         # Stage 4: Route based on confidence
@@ -520,48 +621,89 @@ class ContextEnhancer:
         if not spans:
             return spans
 
-        kept = []
-        rejected = 0
-        needs_llm = 0
-        passed_through = 0
+        batch = SpanBatch.from_spans(text, spans)
+        self.enhance_batch(text, batch, return_stats=return_stats)
+        return batch.to_spans()
+
+    def enhance_batch(
+        self,
+        text: str,
+        batch: SpanBatch,
+        return_stats: bool = False
+    ) -> EnhancementStats:
+        """
+        Enhance a ``SpanBatch`` in place.
+
+        Rejected rows are dropped; kept rows get their adjusted confidence
+        (and offsets, if text was stripped), and "verify" rows are marked
+        for review. Only rows of an enhanced type are materialized as
+        ``Span`` objects; all others pass through untouched. Hotword
+        rules are scored against one ``HotwordIndex`` for the document.
+
+        Outcomes are counted rather than logged per span; one summary
+        line is logged per document.
+
+        Args:
+            text: Original text (the batch's source)
+            batch: Detected spans
+            return_stats: If True, always log the summary
+
+        Returns:
+            EnhancementStats for the batch
+        """
+        stats = EnhancementStats()
+        if not len(batch):
+            return stats
+
+        enhanced_ids = {
+            type_id for type_id, entity_type in enumerate(batch.entity_types)
+            if entity_type.upper() in self.enhanced_types
+        }
+        hotwords = HotwordIndex(text) if self.enable_hotwords else None
+        total = len(batch)
+        type_ids = batch.type_ids
+        kept_rows: list[int] = []
+
+        for row in range(total):
+            if type_ids[row] not in enhanced_ids:
+                kept_rows.append(row)
+                stats.kept += 1
+                continue
+
+            span = batch.span(row)
+            result = self.enhance_span(text, span, hotwords)
+
+            if result.action == "reject":
+                stats.rejected += 1
+                for reason in result.reasons:
+                    stats.reject_reasons[reason.split(":", 1)[0]] += 1
+                continue
 
-        for span in spans:
-            result = self.enhance_span(text, span)
             # Use returned span (may be a new object if text was modified)
             updated_span = result.span if result.span is not None else span
+            if updated_span is not span:
+                batch.starts[row] = updated_span.start
+                batch.ends[row] = updated_span.end
+                batch.set_text(row, updated_span.text)
+            batch.confidences[row] = result.confidence
+            kept_rows.append(row)
 
             if result.action == "keep":
-                from dataclasses import replace
-                updated_span = replace(updated_span, confidence=result.confidence)
-                kept.append(updated_span)
-                passed_through += 1
-                logger.debug(
-                    f"ContextEnhancer: KEEP '{updated_span.text}' ({updated_span.entity_type}) "
-                    f"conf={result.confidence:.2f} reasons={result.reasons}"
-                )
-            elif result.action == "reject":
-                rejected += 1
-                logger.info(
-                    f"ContextEnhancer: REJECT '{updated_span.text}' ({updated_span.entity_type}) "
-                    f"reasons={result.reasons}"
-                )
+                stats.kept += 1
             else:  # verify
-                from dataclasses import replace
-                updated_span = replace(updated_span, confidence=result.confidence, needs_review=True, review_reason="llm_verification")
-                kept.append(updated_span)
-                needs_llm += 1
-                logger.debug(
-                    f"ContextEnhancer: VERIFY '{updated_span.text}' ({updated_span.entity_type}) "
-                    f"conf={result.confidence:.2f} reasons={result.reasons}"
-                )
-
-        if return_stats or rejected > 0 or needs_llm > 0:
+                batch.mark_for_review(row, "llm_verification")
+                stats.needs_llm += 1
+
+        if stats.rejected:
+            batch.select(kept_rows)
+
+        if return_stats or stats.rejected > 0 or stats.needs_llm > 0:
             logger.info(
-                f"ContextEnhancer: {len(spans)} spans -> "
-                f"{passed_through} kept, {needs_llm} need LLM, {rejected} rejected"
+                f"ContextEnhancer: {total} spans -> "
+                f"{stats.kept} kept, {stats.needs_llm} need LLM, {stats.rejected} rejected"
+                f"{f' {dict(stats.reject_reasons)}' if stats.rejected else ''}"
             )
-
-        return kept
+        return stats
 
 
 def create_enhancer(**kwargs) -> ContextEnhancer:
@@ -0,0 +1,181 @@
+"""
+Region planning for tiered ML escalation.
+
+In ``ml_mode="tiered"`` the orchestrator runs the pattern detectors
+first and sends only parts of the document to the ML detectors:
+windows around stage-1 spans that ML can improve (low confidence, or
+an ``ML_BENEFICIAL_TYPES`` type not already near-certain) and around
+medical-context indicators (clinical workflow terms, healthcare
+professions, ICD-10 codes). Documents with none of these skip ML.
+
+Usage:
+    plan = plan_escalation(text, stage1_batch, window=256,
+                           medical_dictionaries=get_dictionary_loader())
+    for start, end in plan.regions:
+        ...  # run ML on text[start:end]
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..types import SpanBatch, normalize_entity_type
+from .tiered import ESCALATION_THRESHOLD, ML_BENEFICIAL_TYPES
+
+if TYPE_CHECKING:
+    from openlabels.dictionaries import DictionaryLoader
+
+logger = logging.getLogger(__name__)
+
+# Characters of context sent to ML on each side of a trigger
+ML_WINDOW_CHARS = 256
+
+# ML-beneficial spans at or above this confidence don't need ML
+ML_BENEFICIAL_CONFIDENCE_CAP = 0.9
+
+# How far a region edge may move to land on whitespace (never mid-word)
+_SNAP_CHARS = 32
+
+# Dictionaries whose matches mark medical-context regions
+_MEDICAL_DICTS = ("clinical_workflow", "professions")
+_ICD10_RE = re.compile(r"\b[A-Z]\d{2}\.?\d*\b")
+
+
+@dataclass
+class EscalationPlan:
+    """Which parts of a document to send to the ML detectors."""
+
+    regions: list[tuple[int, int]] = field(default_factory=list)
+    reason: str | None = None
+    medical_context: bool = False
+
+    @property
+    def ml_chars(self) -> int:
+        """Characters covered by the regions."""
+        return sum(end - start for start, end in self.regions)
+
+
+def medical_hits(text: str, dictionaries: DictionaryLoader) -> list[tuple[int, int]]:
+    """Offsets of medical-context indicators in *text*.
+
+    The same terms count as in ``DictionaryLoader.has_medical_context``
+    (4+ characters, not a stopword).
+    """
+    stopwords = dictionaries.get_terms("clinical_stopwords")
+    hits: list[tuple[int, int]] = []
+    for name in _MEDICAL_DICTS:
+        for match in dictionaries.find_spans(name, text):
+            if len(match.term) >= 4 and match.term not in stopwords:
+                hits.append((match.start, match.end))
+    hits.extend(m.span() for m in _ICD10_RE.finditer(text))
+    return hits
+
+
+def merge_regions(
+    text: str,
+    hits: list[tuple[int, int]],
+    window: int,
+) -> list[tuple[int, int]]:
+    """Widen each hit by *window*, snap to whitespace, and merge.
+
+    Regions closer than *window* to each other are merged, since the gap
+    would be context for both anyway and every region costs a model call.
+    """
+    text_len = len(text)
+    widened = []
+    for start, end in hits:
+        start = max(0, min(start, text_len) - window)
+        end = min(text_len, max(end, 0) + window)
+        if start > 0:
+            ws = max(
+                text.rfind(" ", max(0, start - _SNAP_CHARS), start),
+                text.rfind("\n", max(0, start - _SNAP_CHARS), start),
+            )
+            start = ws + 1 if ws >= 0 else start
+        if end < text_len:
+            cuts = [
+                i
+                for i in (
+                    text.find(" ", end, end + _SNAP_CHARS),
+                    text.find("\n", end, end + _SNAP_CHARS),
+                )
+                if i >= 0
+            ]
+            end = min(cuts) if cuts else end
+        if start < end:
+            widened.append((start, end))
+
+    widened.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in widened:
+        if merged and start - merged[-1][1] <= window:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def plan_escalation(
+    text: str,
+    batch: SpanBatch,
+    *,
+    threshold: float = ESCALATION_THRESHOLD,
+    window: int = ML_WINDOW_CHARS,
+    medical_dictionaries: DictionaryLoader | None = None,
+) -> EscalationPlan:
+    """
+    Decide where ML should run, from the stage-1 spans in *batch*.
+
+    Args:
+        text: Document text
+        batch: Raw (uncalibrated) spans from the pattern detectors
+        threshold: Spans below this confidence are escalated
+        window: Context characters on each side of a trigger
+        medical_dictionaries: Optional dictionaries marking medical context
+
+    Returns:
+        EscalationPlan; empty ``regions`` means ML is not needed
+    """
+    hits: list[tuple[int, int]] = []
+    low_confidence = 0
+    beneficial_type = None
+
+    for row in range(len(batch)):
+        confidence = batch.confidences[row]
+        if confidence < threshold:
+            low_confidence += 1
+        elif (
+            confidence < ML_BENEFICIAL_CONFIDENCE_CAP
+            and normalize_entity_type(batch.entity_type(row)) in ML_BENEFICIAL_TYPES
+        ):
+            beneficial_type = beneficial_type or batch.entity_type(row)
+        else:
+            continue
+        hits.append((batch.starts[row], batch.ends[row]))
+
+    medical: list[tuple[int, int]] = []
+    if medical_dictionaries is not None:
+        try:
+            medical = medical_hits(text, medical_dictionaries)
+        except (RuntimeError, ValueError, OSError) as e:
+            logger.debug(f"Medical context detection failed: {e}")
+    hits.extend(medical)
+
+    if low_confidence:
+        reason = f"low_confidence_spans: {low_confidence}"
+    elif beneficial_type:
+        reason = f"ml_beneficial_type: {beneficial_type}"
+    elif medical:
+        reason = "medical_context_detected"
+    else:
+        return EscalationPlan()
+
+    return EscalationPlan(
+        regions=merge_regions(text, hits, window),
+        reason=reason,
+        medical_context=bool(medical),
+    )
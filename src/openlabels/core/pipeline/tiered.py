@@ -39,6 +39,7 @@ from ..constants import DETECTOR_TIMEOUT
 from ..policies.engine import get_policy_engine
 from ..policies.schema import EntityMatch, PolicyResult
 from ..types import DetectionResult, Span, normalize_entity_type
+from .span_resolver import drop_contained_spans
 
 logger = logging.getLogger(__name__)
 
@@ -635,31 +636,7 @@ class TieredPipeline:
 
     def _deduplicate(self, spans: list[Span]) -> list[Span]:
         """Remove duplicate/overlapping spans (higher tier wins)."""
-        if not spans:
-            return []
-
-        # Sort by start, then tier (descending), then confidence (descending)
-        sorted_spans = sorted(
-            spans,
-            key=lambda s: (s.start, -s.tier.value, -s.confidence)
-        )
-
-        result = []
-        for span in sorted_spans:
-            overlaps = False
-            for accepted in result:
-                if span.overlaps(accepted):
-                    if span.start == accepted.start and span.end == accepted.end:
-                        overlaps = True
-                        break
-                    if accepted.contains(span):
-                        overlaps = True
-                        break
-
-            if not overlaps:
-                result.append(span)
-
-        return result
+        return drop_contained_spans(spans)
 
     # OCR INTEGRATION
     def detect_image(
@@ -10,26 +10,45 @@ Pipeline:
     3. Run detection engine
     4. Score entities
     5. Return classification result
+
+Files above ``STREAMING_THRESHOLD_BYTES`` are extracted incrementally
+(pages, row blocks, decoded chunks) and detected window by window with
+overlapping context, so the full decoded document is never held at once.
 """
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import hashlib
 import logging
 import mimetypes
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from openlabels.exceptions import DetectionError, ExtractionError, SecurityError
 
-from .constants import DEFAULT_MODELS_DIR
+from .constants import (
+    DEFAULT_MODELS_DIR,
+    STREAM_OVERLAP_CHARS,
+    STREAM_WINDOW_CHARS,
+    STREAMING_THRESHOLD_BYTES,
+)
 from .detectors.config import DetectionConfig
 from .detectors.orchestrator import DetectorOrchestrator
+from .extractors import (
+    TextSegment,
+    detect_encoding,
+    iter_decoded,
+    iter_text_segments,
+)
 from .extractors import extract_text as _extract_text_from_file
+from .profiling import profile_stage
 from .scoring.scorer import score
-from .types import ExposureLevel, RiskTier, Span
+from .types import ExposureLevel, RiskTier, Span, normalize_entity_type
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +71,24 @@ OFFICE_EXTENSIONS: set[str] = frozenset({
 # PDF extension
 PDF_EXTENSIONS: set[str] = frozenset({".pdf"})
 
+# Formats extracted incrementally when large (plain text is decoded in chunks)
+STREAMING_EXTENSIONS: set[str] = frozenset({".pdf", ".xlsx", ".csv", ".tsv"}) | TEXT_EXTENSIONS
+
+# Same order as _decode_text
+_TEXT_ENCODINGS = ("utf-8", "utf-16", "latin-1", "cp1252")
+
 # Image extensions (require OCR)
 IMAGE_EXTENSIONS: set[str] = frozenset({
     ".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".gif", ".webp",
 })
 
+# DetectionConfig fields that only affect throughput, not results; they are
+# left out of FileProcessor.fingerprint so tuning them keeps cached results.
+_RUNTIME_ONLY_FIELDS = frozenset({
+    "max_workers", "execution_mode", "process_workers", "process_batch_size",
+    "ml_batch_size", "ml_batch_wait_ms",
+})
+
 
 @dataclass
 class FileClassification:
@@ -78,6 +110,15 @@ class FileClassification:
     exposure_multiplier: float = 1.0
     co_occurrence_rules: list[str] = field(default_factory=list)
 
+    # Policy evaluation done during detection (PolicyResult; None if the
+    # policy engine is disabled or the file was detected window by window)
+    policy_result: Any | None = None
+
+    # Characters detected, and how many of them were sent to ML detectors
+    # (streamed files count window overlaps, as that is what was sent)
+    text_length: int = 0
+    ml_chars: int = 0
+
     # Metadata
     processed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     processing_time_ms: float = 0.0
@@ -98,6 +139,8 @@ class FileClassification:
             "co_occurrence_rules": self.co_occurrence_rules,
             "processed_at": self.processed_at.isoformat(),
             "processing_time_ms": self.processing_time_ms,
+            "text_length": self.text_length,
+            "ml_chars": self.ml_chars,
             "error": self.error,
         }
 
@@ -122,6 +165,7 @@ class FileProcessor:
         config: DetectionConfig | None = None,
         enable_ocr: bool = True,
         max_file_size: int = 50 * 1024 * 1024,  # 50 MB
+        streaming_threshold: int = STREAMING_THRESHOLD_BYTES,
     ):
         """
         Initialize the processor.
@@ -130,18 +174,59 @@ class FileProcessor:
             config: Detection configuration (defaults to patterns-only)
             enable_ocr: Enable OCR for images and scanned PDFs
             max_file_size: Maximum file size to process (bytes)
+            streaming_threshold: Files at least this large (bytes) in a
+                streamable format are extracted and detected incrementally
         """
         self.config = config or DetectionConfig()
         self.max_file_size = max_file_size
+        self.streaming_threshold = streaming_threshold
         self.enable_ocr = enable_ocr
         self._ocr_engine = None
         self._ml_model_dir = self.config.ml_model_dir or DEFAULT_MODELS_DIR
         self._orchestrator = DetectorOrchestrator(config=self.config)
+        self._fingerprint: str | None = None
 
         # Lazily initialize OCR engine when needed
         if enable_ocr:
             self._init_ocr_engine()
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        Stable hash of everything that determines this processor's output.
+
+        Covers the package version, result-affecting detection settings,
+        the configured detectors (not the loaded ones, which are empty in
+        the parent process in process mode), OCR, and the installed ML model files (name,
+        size, mtime). Two processors with the same fingerprint produce the
+        same spans for the same bytes, so it is safe as a cache key part.
+        """
+        if self._fingerprint is None:
+            from openlabels import __version__
+
+            parts: list[str] = [f"openlabels={__version__}", f"ocr={self.enable_ocr}"]
+            for f in dataclasses.fields(self.config):
+                if f.name not in _RUNTIME_ONLY_FIELDS:
+                    parts.append(f"{f.name}={getattr(self.config, f.name)!r}")
+            if self._orchestrator is not None:
+                parts.append("detectors=" + ",".join(
+                    self._orchestrator.configured_detector_names()
+                ))
+            if self.config.enable_ml:
+                model_dir = Path(self._ml_model_dir)
+                try:
+                    for model_file in sorted(model_dir.rglob("*")):
+                        if model_file.is_file():
+                            stat = model_file.stat()
+                            parts.append(
+                                f"model={model_file.relative_to(model_dir)}:"
+                                f"{stat.st_size}:{int(stat.st_mtime)}"
+                            )
+                except OSError as e:
+                    logger.debug(f"Could not fingerprint models in {model_dir}: {e}")
+            self._fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+        return self._fingerprint
+
     def _init_ocr_engine(self) -> None:
         """Initialize OCR engine lazily."""
         try:
@@ -205,27 +290,42 @@ class FileProcessor:
             return result
 
         try:
-            # Extract text if bytes
-            if isinstance(content, bytes):
-                text = await self._extract_text(content, file_path)
+            spans = None
+            if isinstance(content, bytes) and self._should_stream(file_path, len(content)):
+                with profile_stage("stream"):
+                    spans = await self._detect_streaming(content, file_path, result)
+
+            if spans is not None:
+                result.spans = spans
+                result.entity_counts = _count_entities(spans)
             else:
-                text = content
-
-            if not text or not text.strip():
-                result.processing_time_ms = (time.time() - start_time) * 1000
-                return result
-
-            # Run detection (async — delegates to thread pool)
-            detection_result = await self._orchestrator.detect(text)
-            result.spans = detection_result.spans
-            result.entity_counts = detection_result.entity_counts
+                # Extract text if bytes
+                if isinstance(content, bytes):
+                    with profile_stage("extract"):
+                        text = await self._extract_text(content, file_path)
+                else:
+                    text = content
+
+                if not text or not text.strip():
+                    result.processing_time_ms = (time.time() - start_time) * 1000
+                    return result
+
+                # Run detection (async — delegates to thread pool)
+                with profile_stage("detect"):
+                    detection_result = await self._orchestrator.detect(text)
+                result.spans = detection_result.spans
+                result.entity_counts = detection_result.entity_counts
+                result.policy_result = detection_result.policy_result
+                result.text_length = detection_result.text_length
+                result.ml_chars = detection_result.ml_chars
 
             # Score entities
-            if detection_result.entity_counts:
-                score_result = score(
-                    entities=detection_result.entity_counts,
-                    exposure=exposure_level,
-                )
+            if result.entity_counts:
+                with profile_stage("score"):
+                    score_result = score(
+                        entities=result.entity_counts,
+                        exposure=exposure_level,
+                    )
                 result.risk_score = score_result.score
                 result.risk_tier = score_result.tier
                 result.content_score = score_result.content_score
@@ -302,6 +402,117 @@ class FileProcessor:
                 result = await coro
                 yield result
 
+    def _should_stream(self, file_path: str, size: int) -> bool:
+        """Whether a file is large enough, and in a format, to stream."""
+        return (
+            size >= self.streaming_threshold
+            and Path(file_path).suffix.lower() in STREAMING_EXTENSIONS
+        )
+
+    def _iter_segments(self, content: bytes, file_path: str, warnings: list[str]):
+        """Incremental counterpart of _extract_text (same text, in pieces)."""
+        if Path(file_path).suffix.lower() in TEXT_EXTENSIONS:
+            return _iter_plain_text_segments(content)
+        return iter_text_segments(
+            content, file_path, ocr_engine=self._ocr_engine, warnings=warnings,
+        )
+
+    async def _detect_streaming(
+        self,
+        content: bytes,
+        file_path: str,
+        usage: FileClassification | None = None,
+    ) -> list[Span] | None:
+        """
+        Detect entities segment by segment with overlapping windows.
+
+        Segments are accumulated into windows of about ``STREAM_WINDOW_CHARS``.
+        Each window is detected with ``STREAM_OVERLAP_CHARS`` of context on
+        both sides: a span is kept by the window in which it *starts* past
+        the previous commit point, and spans starting in a window's trailing
+        overlap are left to the next window, which sees them in full.
+
+        Returns:
+            Spans with offsets into the full extracted text, or None if the
+            format could not be opened for streaming (the caller then falls
+            back to whole-document extraction). If extraction fails after
+            the first segment, the spans found so far are returned and the
+            failure is recorded on *usage*. Detected and ML character
+            counts are added to *usage* when given.
+        """
+        warnings: list[str] = []
+        try:
+            segments = self._iter_segments(content, file_path, warnings)
+        except Exception as e:  # noqa: BLE001 — same fallbacks as _extract_text
+            logger.debug(f"Streaming extraction unavailable for {file_path}: {type(e).__name__}: {e}")
+            return None
+        spans: list[Span] = []
+
+        buffer = ""
+        buffer_start = 0  # Absolute offset of buffer[0]
+        committed = 0  # Spans starting before this offset were already kept
+        window_limit = STREAM_WINDOW_CHARS + STREAM_OVERLAP_CHARS
+
+        async def flush(final: bool) -> None:
+            nonlocal buffer, buffer_start, committed
+            buffer_end = buffer_start + len(buffer)
+            cut = buffer_end if final else buffer_end - STREAM_OVERLAP_CHARS
+            if buffer.strip():
+                with profile_stage("detect"):
+                    detection = await self._orchestrator.detect(buffer)
+                if usage is not None:
+                    usage.text_length += detection.text_length
+                    usage.ml_chars += detection.ml_chars
+                for span in detection.spans:
+                    start = span.start + buffer_start
+                    if committed <= start < cut:
+                        spans.append(dataclasses.replace(
+                            span, start=start, end=span.end + buffer_start,
+                        ))
+            if not final:
+                # Next window re-reads the overlap before the cut as left context
+                keep_from = max(cut - STREAM_OVERLAP_CHARS, buffer_start)
+                buffer = buffer[keep_from - buffer_start:]
+                buffer_start = keep_from
+                committed = cut
+
+        try:
+            try:
+                with profile_stage("extract"):
+                    segment = await asyncio.to_thread(next, segments, None)
+            except Exception as e:  # noqa: BLE001 — same fallbacks as _extract_text
+                logger.debug(f"Streaming extraction unavailable for {file_path}: {type(e).__name__}: {e}")
+                return None
+
+            while segment is not None:
+                buffer += segment.text
+                if len(buffer) >= window_limit:
+                    await flush(final=False)
+                try:
+                    with profile_stage("extract"):
+                        segment = await asyncio.to_thread(next, segments, None)
+                except ValueError:
+                    raise  # Decompression bomb or other security issue
+                except Exception as e:  # noqa: BLE001 — third-party parser failed partway
+                    # Keep what was read so far and report the rest as unread
+                    logger.warning(
+                        f"Streaming extraction failed partway through {file_path}: "
+                        f"{type(e).__name__}: {e}"
+                    )
+                    if usage is not None:
+                        usage.error = (
+                            f"Extraction stopped after {buffer_start + len(buffer):,} "
+                            f"characters: {type(e).__name__}: {e}"
+                        )
+                    segment = None
+            await flush(final=True)
+        finally:
+            segments.close()
+
+        for warning in warnings:
+            logger.warning(f"{file_path}: {warning}")
+        return spans
+
     async def _extract_text(self, content: bytes, file_path: str) -> str:
         """
         Extract text from file content using secure extractors.
@@ -449,6 +660,8 @@ class FileProcessor:
         # Clear detectors in orchestrator (releases ML model memory)
         if self._orchestrator is not None:
             try:
+                # Stop the detector thread pool / worker processes
+                self._orchestrator.shutdown()
                 # Clear detector list to release references to ML models
                 self._orchestrator.detectors.clear()
                 # Clear pipeline components
@@ -481,3 +694,24 @@ async def process_file(
     """
     processor = FileProcessor(config=config)
     return await processor.process_file(file_path, content, exposure_level)
+
+
+def _iter_plain_text_segments(content: bytes):
+    """Decode a text file in chunks, using _decode_text's encoding order."""
+    encoding = detect_encoding(content, _TEXT_ENCODINGS)
+    errors = "strict"
+    if encoding is None:
+        encoding, errors = "utf-8", "replace"
+    offset = 0
+    for chunk in iter_decoded(content, encoding, errors=errors):
+        yield TextSegment(text=chunk, offset=offset)
+        offset += len(chunk)
+
+
+def _count_entities(spans: list[Span]) -> dict[str, int]:
+    """Entity counts keyed by normalized type (as DetectorOrchestrator reports them)."""
+    counts: dict[str, int] = {}
+    for span in spans:
+        normalized = normalize_entity_type(span.entity_type)
+        counts[normalized] = counts.get(normalized, 0) + 1
+    return counts
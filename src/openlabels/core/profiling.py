@@ -0,0 +1,442 @@
+"""
+Per-stage latency profiling for the classification hot path.
+
+``processing_time_ms`` says how long a file took, not where the time
+went. A ``StageProfiler`` records a latency histogram for every stage a
+file passes through (listing, read, extraction, each detector,
+post-processing, policy evaluation, database writes) and can render the
+result as a flame-style text report.
+
+Stages nest: a stage opened inside another is recorded under the parent's
+path (``file/classify/detect/detector:checksum``), so the report shows
+both inclusive and self time per level.
+
+The active profiler and the current stage path live in context
+variables, so concurrent scan jobs in one worker each profile only their
+own files. When no profiler is active, ``profile_stage`` returns a shared
+no-op context manager: the cost on the hot path is one ContextVar read.
+
+Usage:
+    profiler = StageProfiler(trace_sample_rate=0.01)
+    with use_profiler(profiler):
+        with profiler.trace(path), profile_stage("file"):
+            with profile_stage("read"):
+                ...
+    print(profiler.format_report())
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import heapq
+import json
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Histogram bucket upper bounds in milliseconds (roughly 1-2.5-5 steps)
+BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+)
+
+# Slowest sampled file traces kept per profiler
+DEFAULT_MAX_TRACES = 20
+
+STAGE_SEPARATOR = "/"
+
+_NULL_CONTEXT = nullcontext()
+
+_current_profiler: contextvars.ContextVar[StageProfiler | None] = contextvars.ContextVar(
+    "openlabels_profiler",
+    default=None,
+)
+_current_stage: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "openlabels_profile_stage",
+    default="",
+)
+_current_trace: contextvars.ContextVar[FileTrace | None] = contextvars.ContextVar(
+    "openlabels_profile_trace",
+    default=None,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, total, min and max."""
+
+    __slots__ = ("count", "total_ms", "min_ms", "max_ms", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        # One slot per bound plus an overflow bucket
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms < self.min_ms:
+            self.min_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the q-th percentile (0-100) in milliseconds.
+
+        Returns the upper bound of the bucket holding the percentile,
+        clamped to the observed maximum.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(q / 100 * self.count)))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+        }
+
+
+@dataclass
+class FileTrace:
+    """Stage timings of one sampled file, in completion order."""
+
+    file_path: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    total_ms: float = 0.0
+    stages: list[tuple[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "file_path": self.file_path,
+            "started_at": self.started_at.isoformat(),
+            "total_ms": round(self.total_ms, 3),
+            "stages": [{"stage": s, "ms": round(ms, 3)} for s, ms in self.stages],
+        }
+
+
+class _StageTimer:
+    """Times one stage and records it on exit."""
+
+    __slots__ = ("_profiler", "_path", "_token", "_start")
+
+    def __init__(self, profiler: StageProfiler, name: str):
+        self._profiler = profiler
+        parent = _current_stage.get()
+        self._path = f"{parent}{STAGE_SEPARATOR}{name}" if parent else name
+
+    def __enter__(self) -> _StageTimer:
+        self._token = _current_stage.set(self._path)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        _current_stage.reset(self._token)
+        self._profiler.record(self._path, elapsed_ms)
+
+
+class StageProfiler:
+    """
+    Collects per-stage latency histograms and sampled per-file traces.
+
+    Thread-safe: detectors and extractors record from worker threads.
+    """
+
+    def __init__(
+        self,
+        trace_sample_rate: float = 0.0,
+        max_traces: int = DEFAULT_MAX_TRACES,
+    ):
+        """
+        Args:
+            trace_sample_rate: Fraction of files (0.0-1.0) traced stage by stage
+            max_traces: Slowest sampled traces kept
+        """
+        self.trace_sample_rate = min(max(trace_sample_rate, 0.0), 1.0)
+        self.max_traces = max(0, max_traces)
+        self._stages: dict[str, LatencyHistogram] = {}
+        self._traces: list[tuple[float, int, FileTrace]] = []  # min-heap by total_ms
+        self._trace_seq = 0
+        self.files_traced = 0
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Record one timing for a stage path (and the current trace, if any)."""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = LatencyHistogram()
+            histogram.observe(elapsed_ms)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.stages.append((stage, elapsed_ms))
+
+    def stage(self, name: str) -> _StageTimer:
+        """Context manager timing a stage nested under the current one."""
+        return _StageTimer(self, name)
+
+    @contextmanager
+    def trace(self, file_path: str) -> Iterator[FileTrace | None]:
+        """Trace the stages of one file if it is sampled."""
+        if not self.trace_sample_rate or random.random() >= self.trace_sample_rate:
+            yield None
+            return
+
+        file_trace = FileTrace(file_path=file_path)
+        token = _current_trace.set(file_trace)
+        start = time.perf_counter()
+        try:
+            yield file_trace
+        finally:
+            file_trace.total_ms = (time.perf_counter() - start) * 1000
+            _current_trace.reset(token)
+            self._keep_trace(file_trace)
+
+    def _keep_trace(self, file_trace: FileTrace) -> None:
+        with self._lock:
+            self.files_traced += 1
+            if not self.max_traces:
+                return
+            self._trace_seq += 1
+            item = (file_trace.total_ms, self._trace_seq, file_trace)
+            if len(self._traces) < self.max_traces:
+                heapq.heappush(self._traces, item)
+            elif file_trace.total_ms > self._traces[0][0]:
+                heapq.heapreplace(self._traces, item)
+
+    @property
+    def traces(self) -> list[FileTrace]:
+        """Kept traces, slowest first."""
+        with self._lock:
+            return [t for _, _, t in sorted(self._traces, key=lambda i: -i[0])]
+
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Snapshot of the per-stage histograms."""
+        with self._lock:
+            snapshot = {}
+            for name, histogram in self._stages.items():
+                copy = LatencyHistogram()
+                copy.merge(histogram)
+                snapshot[name] = copy
+            return snapshot
+
+    def summary(self, include_traces: bool = True) -> dict:
+        """JSON-serializable summary (stage histograms with self time)."""
+        histograms = self.histograms()
+        child_totals: dict[str, float] = {}
+        for name, histogram in histograms.items():
+            parent, sep, _ = name.rpartition(STAGE_SEPARATOR)
+            if sep:
+                child_totals[parent] = child_totals.get(parent, 0.0) + histogram.total_ms
+
+        stages = {}
+        for name in sorted(histograms):
+            entry = histograms[name].to_dict()
+            # Children may overlap (parallel detectors), so self time is a floor
+            entry["self_ms"] = round(
+                max(histograms[name].total_ms - child_totals.get(name, 0.0), 0.0), 3
+            )
+            stages[name] = entry
+
+        summary: dict[str, Any] = {
+            "wall_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "stages": stages,
+            "files_traced": self.files_traced,
+        }
+        if include_traces:
+            summary["traces"] = [t.to_dict() for t in self.traces]
+        return summary
+
+    def format_report(self, width: int = 30) -> str:
+        """
+        Render the stage tree as text, one line per stage path.
+
+        Bars show each stage's inclusive time relative to the sum of the
+        top-level stages; indentation follows nesting.
+        """
+        histograms = self.histograms()
+        if not histograms:
+            return "No stages recorded."
+
+        root_total = (
+            sum(h.total_ms for name, h in histograms.items() if STAGE_SEPARATOR not in name) or 1.0
+        )
+        name_width = max(
+            len(name.rsplit(STAGE_SEPARATOR, 1)[-1]) + 2 * name.count(STAGE_SEPARATOR)
+            for name in histograms
+        )
+        name_width = max(name_width, len("stage"))
+
+        lines = [
+            f"{'stage':<{name_width}}  {'calls':>7}  {'total ms':>10}  {'mean ms':>9}  "
+            f"{'p95 ms':>9}  {'share':>6}",
+        ]
+        for name in _tree_order(histograms):
+            histogram = histograms[name]
+            depth = name.count(STAGE_SEPARATOR)
+            label = "  " * depth + name.rsplit(STAGE_SEPARATOR, 1)[-1]
+            share = histogram.total_ms / root_total
+            bar = "#" * max(1 if histogram.total_ms else 0, int(round(share * width)))
+            lines.append(
+                f"{label:<{name_width}}  {histogram.count:>7}  {histogram.total_ms:>10.1f}  "
+                f"{histogram.mean_ms:>9.2f}  {histogram.percentile(95):>9.2f}  "
+                f"{share:>6.1%}  {bar}"
+            )
+        return "\n".join(lines)
+
+    def dump_traces(self, path: str | Path) -> int:
+        """Write kept traces to *path* as JSON lines. Returns the count written."""
+        traces = self.traces
+        with open(path, "w", encoding="utf-8") as f:
+            for file_trace in traces:
+                f.write(json.dumps(file_trace.to_dict()) + "\n")
+        return len(traces)
+
+
+def _tree_order(histograms: dict[str, LatencyHistogram]) -> list[str]:
+    """Stage paths depth-first, siblings by descending total time."""
+    children: dict[str, list[str]] = {}
+    for name in histograms:
+        parent, _, _ = name.rpartition(STAGE_SEPARATOR)
+        children.setdefault(parent, []).append(name)
+
+    ordered: list[str] = []
+
+    def visit(parent: str) -> None:
+        for name in sorted(children.get(parent, ()), key=lambda n: -histograms[n].total_ms):
+            ordered.append(name)
+            visit(name)
+
+    visit("")
+    return ordered
+
+
+def get_profiler() -> StageProfiler | None:
+    """The profiler active in the current context, if any."""
+    return _current_profiler.get()
+
+
+@contextmanager
+def use_profiler(profiler: StageProfiler | None) -> Iterator[StageProfiler | None]:
+    """Activate *profiler* for the current context (None is a no-op)."""
+    if profiler is None:
+        yield None
+        return
+    token = _current_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current_profiler.reset(token)
+
+
+def profile_stage(name: str) -> Any:
+    """Time a stage with the active profiler, or do nothing if there is none."""
+    profiler = _current_profiler.get()
+    if profiler is None:
+        return _NULL_CONTEXT
+    return _StageTimer(profiler, name)
+
+
+def profile_trace(file_path: str) -> Any:
+    """Trace one file with the active profiler if it is sampled."""
+    profiler = _current_profiler.get()
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.trace(file_path)
+
+
+def in_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Bind *fn* to a copy of the current context when profiling is active.
+
+    Executor threads do not inherit context variables; wrap callables
+    handed to ``run_in_executor`` / ``Executor.submit`` with this so their
+    stages nest under the caller's and land in the right profiler.
+    """
+    if _current_profiler.get() is None:
+        return fn
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+async def profile_aiter(iterable: AsyncIterator[T], name: str) -> AsyncIterator[T]:
+    """
+    Pass an async iterator through, recording each ``__anext__`` as a stage.
+
+    Used for adapter listings, where time is spent between yields.
+    """
+    profiler = _current_profiler.get()
+    if profiler is None:
+        async for item in iterable:
+            yield item
+        return
+
+    parent = _current_stage.get()
+    path = f"{parent}{STAGE_SEPARATOR}{name}" if parent else name
+    iterator = iterable.__aiter__()
+    while True:
+        start = time.perf_counter()
+        try:
+            item = await iterator.__anext__()
+        except StopAsyncIteration:
+            profiler.record(path, (time.perf_counter() - start) * 1000)
+            return
+        profiler.record(path, (time.perf_counter() - start) * 1000)
+        yield item
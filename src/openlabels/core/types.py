@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 from typing import Any
@@ -24,6 +27,7 @@ __all__ = [
     # Data classes
     "SpanContext",
     "Span",
+    "SpanBatch",
     "DetectionResult",
     "ScoringResult",
 ]
@@ -427,6 +431,239 @@ class Span:
         return d
 
 
+# COMPACT SPAN STORAGE
+# Optional Span fields kept sparsely by SpanBatch (unset for almost every row)
+_SPAN_EXTRAS = ("context", "review_reason", "coref_anchor_value")
+
+
+class SpanBatch:
+    """
+    Columnar storage for the spans detected in one document.
+
+    Each span is a row across parallel ``array`` columns: ``starts``,
+    ``ends``, ``confidences``, ``tiers``, ``type_ids`` (into
+    ``entity_types``), ``detector_ids`` (into ``detectors``) and
+    ``needs_review``. Span text is not stored; it is ``text[start:end]``
+    of the source document. The few rows whose text differs from that
+    slice, and the optional ``context``/``review_reason``/
+    ``coref_anchor_value`` fields, live in sparse per-row maps.
+
+    Detectors append rows, post-processors edit the columns in place,
+    and ``Span`` objects are only built by ``span``/``to_spans`` when
+    results leave the detection pipeline.
+    """
+
+    __slots__ = (
+        "text", "starts", "ends", "confidences", "tiers", "type_ids",
+        "detector_ids", "needs_review", "entity_types", "detectors",
+        "_type_index", "_detector_index", "_texts", "_extras",
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+        self.starts = array("q")
+        self.ends = array("q")
+        self.confidences = array("d")
+        self.tiers = array("b")
+        self.type_ids = array("i")
+        self.detector_ids = array("i")
+        self.needs_review = array("b")
+        self.entity_types: list[str] = []
+        self.detectors: list[str] = []
+        self._type_index: dict[str, int] = {}
+        self._detector_index: dict[str, int] = {}
+        self._texts: dict[int, str] = {}
+        self._extras: dict[int, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f"SpanBatch(rows={len(self)}, entity_types={self.entity_types!r})"
+
+    @classmethod
+    def from_spans(cls, text: str, spans: Iterable[Span]) -> SpanBatch:
+        """Columnar copy of *spans*, which must have offsets into *text*."""
+        batch = cls(text)
+        for span in spans:
+            row = batch.append(
+                span.start, span.end, span.entity_type,
+                span.confidence, span.detector, span.tier,
+                text=span.text,
+            )
+            if span.needs_review:
+                batch.needs_review[row] = 1
+            for name in _SPAN_EXTRAS:
+                value = getattr(span, name)
+                if value is not None:
+                    batch.set_extra(row, name, value)
+        return batch
+
+    def type_id(self, entity_type: str) -> int:
+        """Interned id of *entity_type*, added on first use."""
+        type_id = self._type_index.get(entity_type)
+        if type_id is None:
+            type_id = self._type_index[entity_type] = len(self.entity_types)
+            self.entity_types.append(entity_type)
+        return type_id
+
+    def detector_id(self, detector: str) -> int:
+        """Interned id of *detector*, added on first use."""
+        detector_id = self._detector_index.get(detector)
+        if detector_id is None:
+            detector_id = self._detector_index[detector] = len(self.detectors)
+            self.detectors.append(detector)
+        return detector_id
+
+    def append(
+        self,
+        start: int,
+        end: int,
+        entity_type: str,
+        confidence: float,
+        detector: str,
+        tier: int,
+        text: str | None = None,
+    ) -> int:
+        """
+        Add a row and return its index.
+
+        *text* is only needed when it may differ from the source slice
+        ``self.text[start:end]``; an equal text is not stored.
+        """
+        if start < 0 or start >= end:
+            raise ValueError(f"Invalid span: start={start}, end={end}")
+        if not 0.0 <= confidence <= 1.0:
+            raise ValueError(f"Invalid confidence: {confidence}")
+        row = len(self.starts)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.confidences.append(confidence)
+        self.tiers.append(tier)
+        self.type_ids.append(self.type_id(entity_type))
+        self.detector_ids.append(self.detector_id(detector))
+        self.needs_review.append(0)
+        if text is not None:
+            self.set_text(row, text)
+        return row
+
+    def extend(self, other: SpanBatch, offset: int = 0) -> None:
+        """
+        Append every row of *other*.
+
+        *other* is a batch over the same source text, or, with *offset*,
+        over the slice of it starting at *offset* (its rows are shifted).
+        """
+        if offset:
+            if self.text[offset:offset + len(other.text)] != other.text:
+                raise ValueError("Span batch text is not a slice of this batch's text")
+        elif other.text is not self.text and other.text != self.text:
+            raise ValueError("Cannot combine span batches over different texts")
+        row_offset = len(self)
+        type_map = [self.type_id(t) for t in other.entity_types]
+        detector_map = [self.detector_id(d) for d in other.detectors]
+        if offset:
+            self.starts.extend(start + offset for start in other.starts)
+            self.ends.extend(end + offset for end in other.ends)
+        else:
+            self.starts.extend(other.starts)
+            self.ends.extend(other.ends)
+        self.confidences.extend(other.confidences)
+        self.tiers.extend(other.tiers)
+        self.type_ids.extend(map(type_map.__getitem__, other.type_ids))
+        self.detector_ids.extend(map(detector_map.__getitem__, other.detector_ids))
+        self.needs_review.extend(other.needs_review)
+        for row, text in other._texts.items():
+            self._texts[row + row_offset] = text
+        for row, extras in other._extras.items():
+            self._extras[row + row_offset] = dict(extras)
+
+    def select(self, rows: Sequence[int]) -> None:
+        """Keep only *rows*, in the given order (in place)."""
+        self.starts = array("q", map(self.starts.__getitem__, rows))
+        self.ends = array("q", map(self.ends.__getitem__, rows))
+        self.confidences = array("d", map(self.confidences.__getitem__, rows))
+        self.tiers = array("b", map(self.tiers.__getitem__, rows))
+        self.type_ids = array("i", map(self.type_ids.__getitem__, rows))
+        self.detector_ids = array("i", map(self.detector_ids.__getitem__, rows))
+        self.needs_review = array("b", map(self.needs_review.__getitem__, rows))
+        if self._texts or self._extras:
+            texts, extras = self._texts, self._extras
+            self._texts, self._extras = {}, {}
+            for new, old in enumerate(rows):
+                if old in texts:
+                    self._texts[new] = texts[old]
+                if old in extras:
+                    self._extras[new] = dict(extras[old])
+
+    def filter_confidence(self, threshold: float) -> None:
+        """Drop rows with confidence below *threshold* (in place)."""
+        if threshold <= 0.0:
+            return
+        confidences = self.confidences
+        self.select([i for i in range(len(confidences)) if confidences[i] >= threshold])
+
+    def entity_type(self, row: int) -> str:
+        return self.entity_types[self.type_ids[row]]
+
+    def detector(self, row: int) -> str:
+        return self.detectors[self.detector_ids[row]]
+
+    def span_text(self, row: int) -> str:
+        """Text of *row*: its override if set, else the source slice."""
+        text = self._texts.get(row)
+        if text is None:
+            text = self.text[self.starts[row]:self.ends[row]]
+        return text
+
+    def has_text_override(self, row: int) -> bool:
+        return row in self._texts
+
+    def set_text(self, row: int, text: str) -> None:
+        """Set *row*'s text; stored only if it differs from the source slice."""
+        if text == self.text[self.starts[row]:self.ends[row]]:
+            self._texts.pop(row, None)
+        else:
+            self._texts[row] = text
+
+    def set_extra(self, row: int, name: str, value: Any) -> None:
+        """Set one of the optional ``Span`` fields on *row*."""
+        if name not in _SPAN_EXTRAS:
+            raise KeyError(name)
+        self._extras.setdefault(row, {})[name] = value
+
+    def mark_for_review(self, row: int, reason: str) -> None:
+        self.needs_review[row] = 1
+        self.set_extra(row, "review_reason", reason)
+
+    def entity_counts(self) -> dict[str, int]:
+        """Row counts keyed by normalized entity type."""
+        counts: dict[str, int] = {}
+        for type_id, count in Counter(self.type_ids).items():
+            normalized = normalize_entity_type(self.entity_types[type_id])
+            counts[normalized] = counts.get(normalized, 0) + count
+        return counts
+
+    def span(self, row: int) -> Span:
+        """Materialize *row* as a ``Span``."""
+        extras = self._extras.get(row)
+        return Span(
+            start=self.starts[row],
+            end=self.ends[row],
+            text=self.span_text(row),
+            entity_type=self.entity_types[self.type_ids[row]],
+            confidence=self.confidences[row],
+            detector=self.detectors[self.detector_ids[row]],
+            tier=Tier(self.tiers[row]),
+            needs_review=bool(self.needs_review[row]),
+            **(extras or {}),
+        )
+
+    def to_spans(self) -> list[Span]:
+        """Materialize every row, in row order."""
+        return [self.span(row) for row in range(len(self))]
+
+
 # RESULT DATA CLASSES
 @dataclass
 class DetectionResult:
@@ -437,6 +674,7 @@ class DetectionResult:
     detectors_used: list[str]
     text_length: int
     policy_result: Any | None = None  # Optional[PolicyResult] -- avoids circular import
+    ml_chars: int = 0  # Characters sent to ML detectors (text_length when all of it)
 
     def __repr__(self) -> str:
         return (
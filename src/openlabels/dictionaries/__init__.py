@@ -14,23 +14,33 @@ Dictionaries included:
 - us_cities, us_counties, us_states: US geography
 - clinical_workflow: High-signal medical workflow terms
 - clinical_stopwords: Terms to exclude from matching
+
+Text matching goes through a per-dictionary ``TermMatcher`` (see
+``matcher.py``), built on first use and cached on disk in the user cache
+directory (``DEFAULT_CACHE_DIR``) so other processes load it instead of
+rebuilding.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, FrozenSet, Optional, Set
 
-from openlabels.core.constants import DEFAULT_DICTIONARIES_DIR
+from openlabels.core.constants import DEFAULT_CACHE_DIR, DEFAULT_DICTIONARIES_DIR
+from openlabels.dictionaries.matcher import TermMatch, TermMatcher
 
 logger = logging.getLogger(__name__)
 
 # Directory containing dictionary files
 DICT_DIR = DEFAULT_DICTIONARIES_DIR
 
+# Matcher indexes, one subdirectory per dictionary directory
+INDEX_CACHE_DIR = DEFAULT_CACHE_DIR / "dictionary-index"
+
 
 class DictionaryLoader:
     """
@@ -76,15 +86,22 @@ class DictionaryLoader:
         "professions",
     ]
 
-    def __init__(self, dict_dir: Path | None = None):
+    def __init__(self, dict_dir: Path | None = None, index_dir: Path | None = None):
         """
         Initialize the dictionary loader.
 
         Args:
             dict_dir: Optional custom directory containing dictionary files
+            index_dir: Where matcher indexes are persisted (default: a
+                per-``dict_dir`` subdirectory of ``INDEX_CACHE_DIR``)
         """
         self.dict_dir = Path(dict_dir) if dict_dir else DICT_DIR
+        if index_dir is None:
+            dir_key = hashlib.sha256(str(self.dict_dir.resolve()).encode()).hexdigest()[:16]
+            index_dir = INDEX_CACHE_DIR / dir_key
+        self.index_dir = Path(index_dir)
         self._cache: dict[str, frozenset[str]] = {}
+        self._matchers: dict[str, TermMatcher] = {}
         self._loaded = False
 
     def _load_dictionary(self, name: str) -> frozenset[str]:
@@ -146,6 +163,64 @@ class DictionaryLoader:
         """
         return term.lower() in self._load_dictionary(name)
 
+    def get_matcher(self, name: str) -> TermMatcher:
+        """
+        Get the precompiled matcher for a dictionary.
+
+        Built on first use. The index is loaded from ``index_dir`` when
+        a copy for the current dictionary file exists, otherwise built
+        and saved there for other processes.
+
+        Args:
+            name: Dictionary name
+
+        Returns:
+            TermMatcher over the dictionary's terms
+        """
+        matcher = self._matchers.get(name)
+        if matcher is not None:
+            return matcher
+
+        terms = self._load_dictionary(name)
+        source = self._index_source(name)
+        index_path = self.index_dir / f"{name}.json"
+
+        matcher = TermMatcher.load(index_path, terms, source) if source else None
+        if matcher is None:
+            matcher = TermMatcher.build(terms)
+            if source and terms:
+                try:
+                    matcher.save(index_path, source)
+                except OSError as e:
+                    logger.debug(f"Could not persist dictionary index {index_path}: {e}")
+
+        self._matchers[name] = matcher
+        return matcher
+
+    def _index_source(self, name: str) -> str | None:
+        """Fingerprint of a dictionary file, used to detect stale indexes."""
+        filename = self.DICTIONARY_FILES[name]
+        try:
+            st = (self.dict_dir / filename).stat()
+        except OSError:
+            return None
+        return f"{filename}:{st.st_size}:{st.st_mtime_ns}"
+
+    def find_spans(self, name: str, text: str) -> list[TermMatch]:
+        """
+        Find every occurrence of a dictionary term in text.
+
+        Terms match case-insensitively on word boundaries.
+
+        Args:
+            name: Dictionary name
+            text: Text to search
+
+        Returns:
+            Matches with offsets into the lowercased text, in text order
+        """
+        return list(self.get_matcher(name).finditer(text))
+
     def find_matches(self, name: str, text: str) -> set[str]:
         """
         Find all dictionary terms that appear in text.
@@ -157,24 +232,12 @@ class DictionaryLoader:
         Returns:
             Set of matched terms (in their dictionary form)
         """
-        terms = self._load_dictionary(name)
-        text_lower = text.lower()
-        matches = set()
-
-        # For efficiency, check shorter terms with word boundaries
-        for term in terms:
-            if len(term) >= 3:  # Skip very short terms
-                # Use word boundary matching for multi-word terms
-                if " " in term:
-                    if term in text_lower:
-                        matches.add(term)
-                else:
-                    # Single word - use word boundary
-                    pattern = rf"\b{re.escape(term)}\b"
-                    if re.search(pattern, text_lower):
-                        matches.add(term)
-
-        return matches
+        # Skip very short terms
+        return {
+            match.term
+            for match in self.get_matcher(name).finditer(text)
+            if len(match.term) >= 3
+        }
 
     def has_medical_context(
         self,
@@ -202,31 +265,18 @@ class DictionaryLoader:
         # Load stopwords if needed
         stopwords = self.get_terms("clinical_stopwords") if exclude_stopwords else frozenset()
 
-        # Check clinical workflow terms first (high signal)
-        workflow_terms = self.get_terms("clinical_workflow")
-        for term in workflow_terms:
-            if len(term) >= 4 and term not in stopwords:
-                if " " in term:
-                    if term in text_lower:
-                        indicator_count += 1
-                        if indicator_count >= min_indicators:
-                            return True
-                else:
-                    pattern = rf"\b{re.escape(term)}\b"
-                    if re.search(pattern, text_lower):
-                        indicator_count += 1
-                        if indicator_count >= min_indicators:
-                            return True
-
-        # Check professions (healthcare role mentions)
-        professions = self.get_terms("professions")
-        for term in professions:
-            if len(term) >= 4 and term not in stopwords:
-                pattern = rf"\b{re.escape(term)}\b"
-                if re.search(pattern, text_lower):
-                    indicator_count += 1
-                    if indicator_count >= min_indicators:
-                        return True
+        # Clinical workflow terms first (high signal), then professions
+        # (healthcare role mentions). Each distinct term counts once.
+        for name in ("clinical_workflow", "professions"):
+            seen: set[str] = set()
+            for match in self.get_matcher(name).finditer(text_lower):
+                term = match.term
+                if len(term) < 4 or term in stopwords or term in seen:
+                    continue
+                seen.add(term)
+                indicator_count += 1
+                if indicator_count >= min_indicators:
+                    return True
 
         # Check for drug names (strong medical indicator)
         # Only sample common drug patterns to avoid O(n*m) complexity
@@ -0,0 +1,143 @@
+"""
+Multi-term dictionary matcher.
+
+Finds every dictionary term in a text with one pass over its tokens
+instead of one regex search per term. Terms and text are split into
+word runs (``\\w+``) and single punctuation characters; the index maps
+each term's first token to the token counts of the terms starting with
+it. At every text token the candidate n-grams are sliced out of the
+lowercased text and looked up in the term set, so separators must match
+the term exactly. A match also needs regex word boundaries (``\\b``) at
+both ends, which gives the same results as ``\\bterm\\b``.
+
+The index depends only on the term set, so it can be written to disk
+once and loaded by every process::
+
+    matcher = TermMatcher.build(terms)
+    matcher.save(path, source="diagnoses.txt:123:456")
+    matcher = TermMatcher.load(path, terms, source="diagnoses.txt:123:456")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when tokenization or the on-disk layout changes
+INDEX_FORMAT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@dataclass(frozen=True, slots=True)
+class TermMatch:
+    """One occurrence of a dictionary term.
+
+    Offsets index the lowercased text, which has the same offsets as the
+    original unless lowercasing changed its length.
+    """
+
+    start: int
+    end: int
+    term: str
+
+
+class TermMatcher:
+    """Precompiled matcher for one dictionary's terms."""
+
+    def __init__(self, terms: frozenset[str], index: dict[str, tuple[int, ...]]) -> None:
+        self.terms = terms
+        self._index = index
+
+    @classmethod
+    def build(cls, terms: Iterable[str]) -> TermMatcher:
+        """Index *terms* (already lowercased) by their first token."""
+        terms = terms if isinstance(terms, frozenset) else frozenset(terms)
+        lengths: dict[str, set[int]] = {}
+        for term in terms:
+            tokens = _TOKEN_RE.findall(term)
+            if tokens:
+                lengths.setdefault(tokens[0], set()).add(len(tokens))
+        index = {first: tuple(sorted(ns)) for first, ns in lengths.items()}
+        return cls(terms, index)
+
+    def finditer(self, text: str) -> Iterator[TermMatch]:
+        """Yield every term occurrence in *text*, in order of start offset."""
+        if not self._index:
+            return
+        text = text.lower()
+        spans = [m.span() for m in _TOKEN_RE.finditer(text)]
+        index = self._index
+        terms = self.terms
+        n_tokens = len(spans)
+        text_len = len(text)
+
+        for i, (start, first_end) in enumerate(spans):
+            counts = index.get(text[start:first_end])
+            if counts is None:
+                continue
+            # \b before the term: word-ness must change at ``start``
+            prev_word = start > 0 and _is_word(text[start - 1])
+            if prev_word == _is_word(text[start]):
+                continue
+            for n in counts:
+                if i + n > n_tokens:
+                    break
+                end = spans[i + n - 1][1]
+                candidate = text[start:end]
+                if candidate not in terms:
+                    continue
+                next_word = end < text_len and _is_word(text[end])
+                if next_word == _is_word(text[end - 1]):
+                    continue
+                yield TermMatch(start, end, candidate)
+
+    def find_all(self, text: str) -> set[str]:
+        """Return the distinct terms that occur in *text*."""
+        return {match.term for match in self.finditer(text)}
+
+    def save(self, path: Path, source: str) -> None:
+        """Write the index to *path* atomically, tagged with *source*."""
+        payload = {
+            "format": INDEX_FORMAT_VERSION,
+            "source": source,
+            "index": self._index,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path, terms: frozenset[str], source: str) -> TermMatcher | None:
+        """Load an index saved for *source*; None if missing or stale."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable dictionary index {path}: {e}")
+            return None
+
+        if payload.get("format") != INDEX_FORMAT_VERSION or payload.get("source") != source:
+            return None
+        index = {first: tuple(ns) for first, ns in payload.get("index", {}).items()}
+        return cls(terms, index)
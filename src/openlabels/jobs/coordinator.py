@@ -3,7 +3,13 @@ Scan coordinator for horizontal scaling.
 
 Splits large scan jobs into partitions that can be processed by multiple
 workers in parallel. Uses adapter-specific strategies to partition the
-keyspace (S3 prefixes, filesystem directories, etc.).
+keyspace:
+
+- S3/GCS/Azure Blob: top-level prefixes, or key ranges from sampled keys
+- Filesystem: directory subtrees from the ``directory_tree`` index, split
+  until no subtree holds more than its share of files, then bin-packed
+- SharePoint/OneDrive (``scan_all_sites``/``scan_all_users``): batches of
+  sites or users
 
 Decision flow:
 1. User starts a scan → enqueues a ``scan`` job
@@ -14,16 +20,21 @@ Decision flow:
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openlabels.adapters.base import PartitionSpec
 from openlabels.core.types import AdapterType, JobStatus
 from openlabels.server.models import (
+    DirectoryTree,
+    FolderInventory,
     ScanJob,
     ScanPartition,
     ScanTarget,
@@ -38,6 +49,11 @@ DEFAULT_FANOUT_ENABLED = True
 DEFAULT_FANOUT_THRESHOLD = 10_000
 DEFAULT_FANOUT_MAX_PARTITIONS = 16
 MIN_PARTITION_SIZE = 1000  # Don't create partitions smaller than this
+# Upper bound on subtrees the filesystem planner splits the tree into
+MAX_SUBTREE_UNITS = 4096
+
+OBJECT_STORE_ADAPTERS = (AdapterType.S3, AdapterType.GCS, AdapterType.AZURE_BLOB)
+GRAPH_ADAPTERS = (AdapterType.SHAREPOINT, AdapterType.ONEDRIVE)
 
 
 class FanoutDecision:
@@ -70,6 +86,7 @@ class ScanCoordinator:
         self.session = session
         self.tenant_id = tenant_id
         self._settings: TenantSettings | None = None
+        self._graph_units: dict[UUID, list[str]] = {}
 
     async def _load_settings(self) -> None:
         """Load tenant fan-out settings (cached per instance)."""
@@ -123,10 +140,45 @@ class ScanCoordinator:
         if not self.fanout_enabled:
             return FanoutDecision(False, "fanout_disabled")
 
-        # Only cloud object stores benefit from fan-out
-        if target.adapter not in (AdapterType.S3, AdapterType.GCS, AdapterType.AZURE_BLOB):
-            return FanoutDecision(False, f"adapter_{target.adapter}_not_partitionable")
+        if target.adapter in OBJECT_STORE_ADAPTERS:
+            return await self._evaluate_object_store(target, adapter)
+        if target.adapter == AdapterType.FILESYSTEM:
+            return await self._evaluate_filesystem(target)
+        if target.adapter in GRAPH_ADAPTERS:
+            return await self._evaluate_graph(target, adapter)
+        return FanoutDecision(False, f"adapter_{target.adapter}_not_partitionable")
 
+    def _decide(
+        self,
+        estimated_count: int,
+        max_partitions: int | None = None,
+    ) -> FanoutDecision:
+        """Apply the threshold and size the partition count."""
+        # Below threshold — single worker is fine
+        if estimated_count < self.fanout_threshold:
+            return FanoutDecision(
+                False,
+                f"below_threshold ({estimated_count} < {self.fanout_threshold})",
+                estimated_files=estimated_count,
+            )
+
+        # Calculate partition count
+        num_partitions = min(
+            self.fanout_max_partitions,
+            max(2, estimated_count // MIN_PARTITION_SIZE),
+        )
+        if max_partitions is not None:
+            num_partitions = min(num_partitions, max_partitions)
+
+        return FanoutDecision(
+            should_fanout=True,
+            reason=f"above_threshold ({estimated_count} >= {self.fanout_threshold})",
+            estimated_files=estimated_count,
+            num_partitions=num_partitions,
+        )
+
+    async def _evaluate_object_store(self, target: ScanTarget, adapter) -> FanoutDecision:
+        """Estimate bucket size by listing (S3/GCS/Azure Blob)."""
         # Check if adapter has estimation capability
         if not hasattr(adapter, "estimate_object_count"):
             return FanoutDecision(False, "adapter_missing_estimate_method")
@@ -141,27 +193,106 @@ class ScanCoordinator:
             logger.warning("Failed to estimate object count for %s: %s", target.id, e)
             return FanoutDecision(False, f"estimate_failed: {e}")
 
-        # Below threshold — single worker is fine
-        if estimated_count < self.fanout_threshold:
+        return self._decide(estimated_count)
+
+    async def _evaluate_filesystem(self, target: ScanTarget) -> FanoutDecision:
+        """
+        Estimate a filesystem target from its ``directory_tree`` index.
+
+        Walking the share to count files would cost as much as listing it,
+        so fan-out is only considered once the tree has been bootstrapped.
+        """
+        try:
+            result = await self.session.execute(
+                select(
+                    func.count(DirectoryTree.id),
+                    func.coalesce(func.sum(DirectoryTree.child_file_count), 0),
+                ).where(
+                    DirectoryTree.tenant_id == self.tenant_id,
+                    DirectoryTree.target_id == target.id,
+                )
+            )
+            dir_count, file_count = result.one()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to estimate directory tree for %s: %s", target.id, e)
+            return FanoutDecision(False, f"estimate_failed: {e}")
+
+        if not dir_count:
+            return FanoutDecision(False, "filesystem_directory_tree_not_indexed")
+        if dir_count < 2:
             return FanoutDecision(
-                False,
-                f"below_threshold ({estimated_count} < {self.fanout_threshold})",
-                estimated_files=estimated_count,
+                False, "filesystem_single_directory", estimated_files=int(file_count),
             )
+        return self._decide(int(file_count), max_partitions=int(dir_count))
 
-        # Calculate partition count
-        num_partitions = min(
-            self.fanout_max_partitions,
-            max(2, estimated_count // MIN_PARTITION_SIZE),
-        )
+    async def _evaluate_graph(self, target: ScanTarget, adapter) -> FanoutDecision:
+        """
+        Fan out tenant-wide SharePoint/OneDrive scans by site or user.
+
+        Only targets that enumerate all sites/users are partitionable. The
+        file count comes from the previous scan's folder inventory; a
+        target that was never scanned is split by site/user count alone.
+        """
+        units = await self._list_graph_units(target, adapter)
+        if units is None:
+            return FanoutDecision(False, f"adapter_{target.adapter}_single_resource")
+        if len(units) < 2:
+            return FanoutDecision(False, f"too_few_resources ({len(units)})")
+
+        try:
+            result = await self.session.execute(
+                select(func.coalesce(func.sum(FolderInventory.file_count), 0)).where(
+                    FolderInventory.tenant_id == self.tenant_id,
+                    FolderInventory.target_id == target.id,
+                )
+            )
+            estimated_count = int(result.scalar() or 0)
+        except SQLAlchemyError as e:
+            logger.warning("Failed to estimate inventory size for %s: %s", target.id, e)
+            estimated_count = 0
+
+        if estimated_count:
+            return self._decide(estimated_count, max_partitions=len(units))
 
         return FanoutDecision(
             should_fanout=True,
-            reason=f"above_threshold ({estimated_count} >= {self.fanout_threshold})",
-            estimated_files=estimated_count,
-            num_partitions=num_partitions,
+            reason=f"not_inventoried ({len(units)} resources)",
+            num_partitions=min(self.fanout_max_partitions, len(units)),
         )
 
+    async def _list_graph_units(self, target: ScanTarget, adapter) -> list[str] | None:
+        """
+        Site or user IDs a tenant-wide target covers (cached per instance).
+
+        Returns None when the target names a single site/user.
+        """
+        if target.id in self._graph_units:
+            return self._graph_units[target.id]
+
+        from openlabels.server.config import get_settings
+
+        target_path = target.config.get("path") or target.config.get("site_id")
+        if target_path:
+            return None
+
+        settings = get_settings()
+        try:
+            if target.adapter == AdapterType.SHAREPOINT:
+                if not settings.adapters.sharepoint.scan_all_sites:
+                    return None
+                resources = await adapter.list_sites()
+            else:
+                if not settings.adapters.onedrive.scan_all_users:
+                    return None
+                resources = await adapter.list_users()
+        except (ConnectionError, OSError, RuntimeError, ValueError) as e:
+            logger.warning("Failed to enumerate resources for %s: %s", target.id, e)
+            return []
+
+        units = [r["id"] for r in resources if r.get("id")]
+        self._graph_units[target.id] = units
+        return units
+
     async def create_partitions(
         self,
         job: ScanJob,
@@ -185,17 +316,26 @@ class ScanCoordinator:
         """
         target_path = target.config.get("path") or target.config.get("bucket") or ""
 
-        # Try prefix-based partitioning first (natural directory boundaries)
-        partition_specs = await self._compute_prefix_partitions(
-            adapter, target_path, num_partitions
-        )
-
-        # Fall back to key-range partitioning if we don't have enough prefixes
-        if len(partition_specs) < 2:
-            partition_specs = await self._compute_keyrange_partitions(
+        if target.adapter == AdapterType.FILESYSTEM:
+            partition_specs = await self._compute_subtree_partitions(
+                target, target_path, num_partitions
+            )
+        elif target.adapter in GRAPH_ADAPTERS:
+            partition_specs = await self._compute_resource_partitions(
+                target, adapter, num_partitions
+            )
+        else:
+            # Try prefix-based partitioning first (natural directory boundaries)
+            partition_specs = await self._compute_prefix_partitions(
                 adapter, target_path, num_partitions
             )
 
+            # Fall back to key-range partitioning if we don't have enough prefixes
+            if len(partition_specs) < 2:
+                partition_specs = await self._compute_keyrange_partitions(
+                    adapter, target_path, num_partitions
+                )
+
         actual_count = len(partition_specs)
 
         # Update parent job
@@ -246,6 +386,76 @@ class ScanCoordinator:
 
         return partitions
 
+    async def split_partition(
+        self,
+        job_id: UUID,
+        partition_id: UUID,
+        remaining: PartitionSpec,
+        tail: PartitionSpec,
+    ) -> ScanPartition:
+        """
+        Publish the tail of a running partition as a new partition.
+
+        Shrinks the running partition's stored spec to *remaining* (so a
+        retry does not rescan the tail), appends a partition for *tail*
+        to the parent job and enqueues it for any idle worker.
+
+        Args:
+            job_id: Parent scan job
+            partition_id: The running (straggling) partition
+            remaining: Its spec with ``end_before`` moved to the cut
+            tail: Spec of the range handed off
+
+        Returns:
+            The new ScanPartition
+        """
+        # Atomic increment: concurrent splits of sibling partitions each
+        # get their own index
+        result = await self.session.execute(
+            update(ScanJob)
+            .where(ScanJob.id == job_id)
+            .values(total_partitions=ScanJob.total_partitions + 1)
+            .returning(ScanJob.total_partitions)
+        )
+        total = result.scalar_one()
+
+        await self.session.execute(
+            update(ScanPartition)
+            .where(ScanPartition.id == partition_id)
+            .values(partition_spec=remaining.to_dict())
+        )
+
+        partition = ScanPartition(
+            id=generate_uuid(),
+            tenant_id=self.tenant_id,
+            job_id=job_id,
+            partition_index=total - 1,
+            total_partitions=total,
+            partition_spec=tail.to_dict(),
+            status=JobStatus.PENDING,
+        )
+        self.session.add(partition)
+        await self.session.flush()
+
+        from openlabels.jobs.queue import JobQueue
+        queue = JobQueue(self.session, self.tenant_id)
+        await queue.enqueue(
+            task_type="scan_partition",
+            payload={
+                "partition_id": str(partition.id),
+                "job_id": str(job_id),
+            },
+            priority=60,
+        )
+
+        await self.session.commit()
+
+        logger.info(
+            "Split partition %s of job %s: new partition %d starts after %s",
+            partition_id, job_id, partition.partition_index, tail.start_after,
+        )
+        return partition
+
     async def _compute_prefix_partitions(
         self,
         adapter,
@@ -330,3 +540,138 @@ class ScanCoordinator:
             specs.append(PartitionSpec(start_after=start_after, end_before=end_before))
 
         return specs
+
+    async def _compute_subtree_partitions(
+        self,
+        target: ScanTarget,
+        target_path: str,
+        num_partitions: int,
+    ) -> list[PartitionSpec]:
+        """Partition a filesystem target along its indexed directory tree."""
+        result = await self.session.execute(
+            select(
+                DirectoryTree.id,
+                DirectoryTree.parent_id,
+                DirectoryTree.dir_path,
+                DirectoryTree.child_file_count,
+            ).where(
+                DirectoryTree.tenant_id == self.tenant_id,
+                DirectoryTree.target_id == target.id,
+            )
+        )
+        specs = plan_subtree_partitions(result.all(), target_path, num_partitions)
+        return specs or [PartitionSpec(directory=target_path)]
+
+    async def _compute_resource_partitions(
+        self,
+        target: ScanTarget,
+        adapter,
+        num_partitions: int,
+    ) -> list[PartitionSpec]:
+        """Split SharePoint sites or OneDrive users into round-robin batches."""
+        units = await self._list_graph_units(target, adapter) or []
+        batches = [units[i::num_partitions] for i in range(num_partitions)]
+        if target.adapter == AdapterType.SHAREPOINT:
+            return [PartitionSpec(site_ids=batch) for batch in batches if batch]
+        return [PartitionSpec(user_ids=batch) for batch in batches if batch]
+
+
+def plan_subtree_partitions(
+    directories: Sequence[tuple[UUID, UUID | None, str, int | None]],
+    root_path: str,
+    num_partitions: int,
+    max_units: int = MAX_SUBTREE_UNITS,
+) -> list[PartitionSpec]:
+    """
+    Split a directory tree into ``num_partitions`` balanced partitions.
+
+    Starting from the root subtree, the heaviest subtree (by file count)
+    is repeatedly split into its own directory plus one unit per child
+    subtree, until none is heavier than an even share or ``max_units`` is
+    reached. Units are then assigned heaviest-first to the lightest
+    partition (LPT bin packing).
+
+    A split directory is still walked recursively by its partition, with
+    the children owned by other units excluded. Directories created after
+    the tree was indexed are therefore still covered.
+
+    Args:
+        directories: ``(id, parent_id, dir_path, child_file_count)`` rows
+        root_path: Scan target path (the tree's root directory)
+        num_partitions: Desired partition count
+        max_units: Cap on the number of subtrees produced by splitting
+
+    Returns:
+        Partition specs, or an empty list if the root is not indexed
+    """
+    paths: dict[UUID, str] = {}
+    own_files: dict[UUID, int] = {}
+    children: dict[UUID, list[UUID]] = {}
+    for dir_id, parent_id, dir_path, file_count in directories:
+        paths[dir_id] = dir_path
+        own_files[dir_id] = file_count or 0
+        if parent_id is not None:
+            children.setdefault(parent_id, []).append(dir_id)
+
+    root_norm = root_path.rstrip("/\\") or root_path
+    root = next(
+        (d for d, p in paths.items() if (p.rstrip("/\\") or p) == root_norm),
+        None,
+    )
+    if root is None or num_partitions < 1:
+        return []
+
+    # Subtree file totals, children before parents
+    order = [root]
+    for dir_id in order:
+        order.extend(children.get(dir_id, ()))
+    totals = {dir_id: own_files[dir_id] for dir_id in order}
+    for dir_id in reversed(order):
+        for child in children.get(dir_id, ()):
+            totals[dir_id] += totals[child]
+
+    # Split the heaviest subtree until each fits an even share
+    share = totals[root] / num_partitions
+    weights: dict[UUID, int] = {}  # unit root -> files it is responsible for
+    split: set[UUID] = set()
+    heap = [(-totals[root], 0, root)]
+    seq = 1
+    while heap:
+        negative, _, dir_id = heap[0]
+        kids = children.get(dir_id)
+        if -negative <= share or len(weights) + len(heap) + len(kids or ()) > max_units:
+            break
+        heapq.heappop(heap)
+        if not kids:
+            weights[dir_id] = -negative
+            continue
+        split.add(dir_id)
+        weights[dir_id] = own_files[dir_id]
+        for child in kids:
+            heapq.heappush(heap, (-totals[child], seq, child))
+            seq += 1
+    for negative, _, dir_id in heap:
+        weights[dir_id] = -negative
+
+    # LPT: heaviest unit onto the lightest partition
+    bins: list[list[UUID]] = [[] for _ in range(num_partitions)]
+    loads = [(0, i) for i in range(num_partitions)]
+    for dir_id in sorted(weights, key=lambda d: (-weights[d], paths[d])):
+        load, index = heapq.heappop(loads)
+        bins[index].append(dir_id)
+        heapq.heappush(loads, (load + weights[dir_id], index))
+
+    specs = []
+    for units in bins:
+        if not units:
+            continue
+        excluded = sorted(
+            paths[child]
+            for dir_id in units if dir_id in split
+            for child in children[dir_id]
+        )
+        specs.append(PartitionSpec(
+            directories=sorted(paths[d] for d in units),
+            exclude_directories=excluded or None,
+        ))
+    return specs
@@ -0,0 +1,252 @@
+"""
+Content-addressed cache of detection results.
+
+The same attachment, template or export often exists thousands of times
+across sites, drives and shares. Detection output is a pure function of
+the file bytes, how they are extracted (file extension), the exposure
+level used for scoring and the detector/model configuration, so a result
+computed once can be reused for every identical copy.
+
+Keys combine:
+- tenant (results never cross tenants)
+- ``FileProcessor.fingerprint`` plus the policy pack versions
+- file extension and exposure level
+- the SHA-256 content hash already computed for delta scanning
+
+Two tiers:
+- a bounded in-process LRU, always on
+- an optional shared tier in Redis (via ``CacheManager``), so workers and
+  later rescans reuse each other's results
+
+Concurrent requests for the same key are coalesced: one coroutine runs
+detection, the others wait for its result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+
+    class RedisError(Exception):  # type: ignore[no-redef]
+        """Placeholder when redis is not installed."""
+
+        pass
+
+
+if TYPE_CHECKING:
+    from openlabels.server.cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# Default sizing for the local tier and TTL for the shared tier (7 days)
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_SHARED_TTL = 7 * 24 * 3600
+
+_KEY_PREFIX = "detect"
+
+
+def detection_cache_key(
+    tenant_id: Any,
+    fingerprint: str,
+    file_path: str,
+    exposure_level: str,
+    content_hash: str,
+) -> str:
+    """Build the cache key for one file's detection result."""
+    extension = Path(file_path).suffix.lower()
+    return f"{_KEY_PREFIX}:{tenant_id}:{fingerprint}:{extension}:{exposure_level}:{content_hash}"
+
+
+def policy_fingerprint(engine: Any) -> str:
+    """Short hash of the loaded policy packs (name and version)."""
+    packs = sorted(
+        f"{p.name}@{getattr(p, 'version', '')}" for p in getattr(engine, "_policies", ())
+    )
+    return hashlib.sha256("\n".join(packs).encode()).hexdigest()[:16]
+
+
+@dataclass
+class DetectionCacheStats:
+    """Counters for cache effectiveness."""
+
+    hits: int = 0
+    local_hits: int = 0
+    shared_hits: int = 0
+    coalesced: int = 0  # Waited on an in-flight computation of the same key
+    misses: int = 0
+    stores: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class DetectionCache:
+    """
+    Two-tier (local LRU + optional Redis) cache of detection results.
+
+    Values are the JSON-serializable dicts returned by ``_detect_and_score``.
+    Results carrying an ``error`` are never cached, so transient extraction
+    failures are retried on the next copy.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        shared_ttl: int = DEFAULT_SHARED_TTL,
+        use_shared: bool = True,
+        cache_manager: Optional[CacheManager] = None,
+    ):
+        self._max_entries = max(1, max_entries)
+        self._shared_ttl = shared_ttl
+        self._use_shared = use_shared
+        self._cache_manager = cache_manager
+        self._local: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._initialized = False
+        self.stats = DetectionCacheStats()
+
+    async def initialize(self) -> None:
+        """Attach the shared tier if Redis is configured and reachable."""
+        if self._initialized:
+            return
+        self._initialized = True
+
+        if not self._use_shared:
+            return
+        try:
+            if self._cache_manager is None:
+                from openlabels.server.cache import get_cache_manager
+
+                self._cache_manager = await get_cache_manager()
+        except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+            logger.warning(f"Detection cache shared tier unavailable: {type(e).__name__}: {e}")
+            self._cache_manager = None
+
+    @property
+    def shared_enabled(self) -> bool:
+        """Whether lookups go to Redis after a local miss."""
+        return self._shared_tier() is not None
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a result in the local tier, then the shared tier."""
+        cached = self._local.get(key)
+        if cached is not None:
+            self._local.move_to_end(key)
+            self.stats.hits += 1
+            self.stats.local_hits += 1
+            return copy.deepcopy(cached)
+
+        manager = self._shared_tier()
+        if manager is not None:
+            try:
+                shared = await manager.get(key)
+            except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+                logger.debug(f"Detection cache shared get failed: {e}")
+                shared = None
+            if isinstance(shared, dict):
+                self._store_local(key, shared)
+                self.stats.hits += 1
+                self.stats.shared_hits += 1
+                return copy.deepcopy(shared)
+
+        self.stats.misses += 1
+        return None
+
+    async def put(self, key: str, result: dict[str, Any]) -> bool:
+        """Store a result in both tiers. Returns False if it is not cacheable."""
+        if result.get("error"):
+            return False
+        self._store_local(key, copy.deepcopy(result))
+        self.stats.stores += 1
+        manager = self._shared_tier()
+        if manager is not None:
+            try:
+                await manager.set(key, result, ttl=self._shared_ttl)
+            except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+                logger.debug(f"Detection cache shared set failed: {e}")
+        return True
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Return ``(result, cache_hit)``, running *compute* only on a miss.
+
+        If another coroutine is already computing the same key, wait for it
+        instead of running detection twice. An error result from that
+        computation is not shared (it would not have been cached either):
+        the waiter computes independently and counts as a miss.
+        """
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                result = await asyncio.shield(pending)
+            except BaseException:
+                if not pending.done():
+                    raise  # This waiter itself was cancelled
+                # The leader failed; compute independently below
+            else:
+                if not result.get("error"):
+                    self.stats.hits += 1
+                    self.stats.coalesced += 1
+                    return copy.deepcopy(result), True
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached = await self.get(key)
+            hit = cached is not None
+            result = cached if cached is not None else await compute()
+        except BaseException:
+            future.cancel()  # Waiters fall back to computing themselves
+            raise
+        else:
+            future.set_result(result)
+            if not hit:
+                await self.put(key, result)
+            return result, hit
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop all local entries (the shared tier expires by TTL)."""
+        self._local.clear()
+
+    def _shared_tier(self) -> CacheManager | None:
+        """The cache manager if the shared tier is enabled and connected."""
+        manager = self._cache_manager
+        if not self._use_shared or manager is None or not manager.is_redis_connected:
+            return None
+        return manager
+
+    def _store_local(self, key: str, result: dict[str, Any]) -> None:
+        self._local[key] = result
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
@@ -2,7 +2,9 @@
 Data inventory service for delta scanning.
 - Folder-level tracking for non-sensitive content
 - File-level tracking for sensitive files
+- Metadata-first change detection (size, mtime, ETag/cTag) before reading content
 - Content hash comparison for change detection
+- Page-level prefetch of inventory rows and bulk upserts of scan results
 - Distributed caching via Redis for multi-worker consistency
 """
 
@@ -13,12 +15,14 @@ import hashlib
 import json
 import logging
 from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, case, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
@@ -28,11 +32,12 @@ except ImportError:
         """Placeholder when redis is not installed."""
         pass
 
-from openlabels.adapters.base import FileInfo
+from openlabels.adapters.base import FileInfo, chunked
 from openlabels.server.models import (
     FileInventory,
     FolderInventory,
     ScanResult,
+    generate_uuid,
 )
 
 if TYPE_CHECKING:
@@ -47,6 +52,25 @@ DEFAULT_INVENTORY_TTL = 3600
 _FILE_CACHE_MAX = 2000
 _FOLDER_CACHE_MAX = 500
 
+# Listing page size for inventory prefetch (kept below _FILE_CACHE_MAX so a
+# prefetched page is still cached when its files are processed)
+PREFETCH_PAGE_SIZE = 500
+
+# Max rows per multi-row INSERT ... ON CONFLICT (bind parameter limit)
+_UPSERT_CHUNK_ROWS = 500
+
+# Columns a rescan overwrites on an existing file_inventory row
+_FILE_INVENTORY_UPSERT_COLUMNS = (
+    "content_hash", "file_size", "file_modified", "change_token",
+    "risk_score", "risk_tier", "entity_counts", "total_entities",
+    "exposure_level", "owner", "last_scanned_at", "last_scan_job_id",
+)
+
+# First-stage (metadata-only) delta decisions, see check_file_metadata()
+DELTA_SCAN = "scan"  # Changed or unknown to inventory: read and scan
+DELTA_SKIP = "skip"  # Metadata proves the file unchanged: do not read it
+DELTA_VERIFY = "verify"  # Ambiguous: read and compare content hash
+
 
 class DistributedScanInventory:
     """
@@ -369,6 +393,39 @@ class DistributedScanInventory:
             logger.debug(f"Set file in local cache: {path}")
             return True
 
+    async def set_files(self, files: dict[str, dict]) -> bool:
+        """
+        Set data for many files in one round trip.
+
+        Args:
+            files: Mapping of file path to file data dictionary
+
+        Returns:
+            True if successful
+        """
+        if not files:
+            return True
+        await self.initialize()
+
+        if self._use_redis:
+            try:
+                key = self._make_redis_key(self._files_key)
+                mapping = {path: self._serialize(data) for path, data in files.items()}
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    pipe.hset(key, mapping=mapping)
+                    pipe.expire(key, self.ttl, nx=True)
+                    await pipe.execute()
+                logger.debug(f"Set {len(files)} files in Redis")
+                return True
+            except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+                logger.warning(f"Redis set_files error for {len(files)} files: {type(e).__name__}: {e}")
+                # Fall through to local cache
+
+        # Use local cache
+        async with self._local_lock:
+            self._local_file_cache.update(files)
+            return True
+
     async def get_all_files(self) -> dict[str, dict]:
         """
         Get all file data from cache.
@@ -757,6 +814,8 @@ class InventoryService:
         self.target_id = target_id
         self._folder_cache: OrderedDict[str, FolderInventory] = OrderedDict()
         self._file_cache: OrderedDict[str, FileInventory] = OrderedDict()
+        # Paths a prefetch proved absent from file_inventory (negative cache)
+        self._absent_files: OrderedDict[str, None] = OrderedDict()
 
         # Distributed cache for multi-worker consistency
         self._use_distributed_cache = use_distributed_cache
@@ -809,6 +868,8 @@ class InventoryService:
         if file_path in self._file_cache:
             self._file_cache.move_to_end(file_path)
             return self._file_cache[file_path]
+        if file_path in self._absent_files:
+            return None
 
         query = select(FileInventory).where(
             and_(
@@ -833,11 +894,98 @@ class InventoryService:
 
     def _cache_file(self, path: str, inv: FileInventory) -> None:
         """Add to bounded LRU cache, evicting oldest if over limit."""
+        self._absent_files.pop(path, None)
         self._file_cache[path] = inv
         self._file_cache.move_to_end(path)
         while len(self._file_cache) > _FILE_CACHE_MAX:
             self._file_cache.popitem(last=False)
 
+    def _cache_absent_file(self, path: str) -> None:
+        """Remember that a path has no inventory row, bounded like the LRU."""
+        self._absent_files[path] = None
+        self._absent_files.move_to_end(path)
+        while len(self._absent_files) > _FILE_CACHE_MAX:
+            self._absent_files.popitem(last=False)
+
+    async def prefetch_files(self, file_paths: list[str]) -> int:
+        """
+        Load inventory rows for a page of files in one query.
+
+        Rows found go into the LRU cache; paths without a row are
+        remembered as absent, so the per-file delta checks that follow
+        do not query the database at all.
+
+        Args:
+            file_paths: Paths from one listing page
+
+        Returns:
+            Number of inventory rows found
+        """
+        paths = [p for p in dict.fromkeys(file_paths) if p not in self._file_cache]
+        if not paths:
+            return 0
+
+        found = 0
+        for chunk in chunked(paths, _UPSERT_CHUNK_ROWS * 2):
+            query = select(FileInventory).where(
+                and_(
+                    FileInventory.tenant_id == self.tenant_id,
+                    FileInventory.target_id == self.target_id,
+                    FileInventory.file_path.in_(chunk),
+                )
+            )
+            result = await self.session.execute(query)
+            rows = {inv.file_path: inv for inv in result.scalars().all()}
+            found += len(rows)
+            for path in chunk:
+                if path in rows:
+                    self._cache_file(path, rows[path])
+                else:
+                    self._cache_absent_file(path)
+        return found
+
+    async def prefetch_folders(self, folder_paths: list[str]) -> int:
+        """Load folder inventory rows for many folders in one query per chunk."""
+        paths = [p for p in dict.fromkeys(folder_paths) if p not in self._folder_cache]
+        found = 0
+        for chunk in chunked(paths, _UPSERT_CHUNK_ROWS * 2):
+            query = select(FolderInventory).where(
+                and_(
+                    FolderInventory.tenant_id == self.tenant_id,
+                    FolderInventory.target_id == self.target_id,
+                    FolderInventory.folder_path.in_(chunk),
+                )
+            )
+            result = await self.session.execute(query)
+            for folder_inv in result.scalars().all():
+                self._cache_folder(folder_inv.folder_path, folder_inv)
+                found += 1
+        return found
+
+    async def iter_prefetched(
+        self,
+        files: AsyncIterator[FileInfo],
+        page_size: int = PREFETCH_PAGE_SIZE,
+    ) -> AsyncIterator[FileInfo]:
+        """
+        Pass a file listing through, prefetching inventory page by page.
+
+        Buffers ``page_size`` files, loads their inventory rows with
+        prefetch_files(), then yields them unchanged.
+        """
+        page: list[FileInfo] = []
+        async for file_info in files:
+            page.append(file_info)
+            if len(page) >= page_size:
+                await self.prefetch_files([f.path for f in page])
+                for item in page:
+                    yield item
+                page = []
+        if page:
+            await self.prefetch_files([f.path for f in page])
+            for item in page:
+                yield item
+
     async def sync_folder_to_distributed_cache(self, folder_path: str, folder_inv: FolderInventory) -> None:
         """
         Sync a folder inventory entry to the distributed cache.
@@ -874,29 +1022,21 @@ class InventoryService:
         if not self._distributed_inventory:
             return
 
-        file_data = {
-            "file_path": file_inv.file_path,
-            "file_name": file_inv.file_name,
-            "adapter": file_inv.adapter,
-            "content_hash": file_inv.content_hash,
-            "file_size": file_inv.file_size,
-            "file_modified": file_inv.file_modified.isoformat() if file_inv.file_modified else None,
-            "risk_score": file_inv.risk_score,
-            "risk_tier": file_inv.risk_tier,
-            "entity_counts": file_inv.entity_counts,
-            "total_entities": file_inv.total_entities,
-            "exposure_level": file_inv.exposure_level,
-            "owner": file_inv.owner,
-            "current_label_id": file_inv.current_label_id,
-            "current_label_name": file_inv.current_label_name,
-            "label_applied_at": file_inv.label_applied_at.isoformat() if file_inv.label_applied_at else None,
-            "last_scanned_at": file_inv.last_scanned_at.isoformat() if file_inv.last_scanned_at else None,
-            "last_scan_job_id": str(file_inv.last_scan_job_id) if file_inv.last_scan_job_id else None,
-            "needs_rescan": file_inv.needs_rescan,
-            "scan_count": file_inv.scan_count,
-            "content_changed_count": file_inv.content_changed_count,
-        }
-        await self._distributed_inventory.set_file(file_path, file_data)
+        await self._distributed_inventory.set_file(file_path, _file_cache_data(file_inv))
+
+    async def sync_files_to_distributed_cache(self, file_invs: list[Any]) -> None:
+        """
+        Sync many file inventory entries to the distributed cache at once.
+
+        Args:
+            file_invs: FileInventory models or rows with the same columns
+        """
+        if not self._distributed_inventory or not file_invs:
+            return
+
+        await self._distributed_inventory.set_files(
+            {inv.file_path: _file_cache_data(inv) for inv in file_invs}
+        )
 
     async def mark_file_scanned_distributed(self, file_path: str) -> bool:
         """
@@ -992,6 +1132,85 @@ class InventoryService:
 
         return False
 
+    async def check_file_metadata(
+        self,
+        file_info: FileInfo,
+        force_full_scan: bool = False,
+    ) -> tuple[str, str]:
+        """
+        First-stage delta check using listing metadata only.
+
+        Compares size, modification time and the adapter's change token
+        (ETag, cTag, generation) against the inventory without reading the
+        file. Only files this cannot decide need to be downloaded and
+        hashed for should_scan_file().
+
+        Args:
+            file_info: File information from the adapter listing
+            force_full_scan: Force scan regardless of inventory
+
+        Returns:
+            Tuple of (decision, reason) where decision is DELTA_SCAN,
+            DELTA_SKIP or DELTA_VERIFY
+        """
+        if force_full_scan:
+            return DELTA_SCAN, "full_scan"
+
+        file_inv = await self._get_file_inv(file_info.path)
+
+        if file_inv is None:
+            return DELTA_SCAN, "new_file"
+
+        if file_inv.needs_rescan:
+            return DELTA_SCAN, "flagged_rescan"
+
+        if file_inv.file_size is not None and file_info.size != file_inv.file_size:
+            return DELTA_SCAN, "size_changed"
+
+        # Adapter change tokens are authoritative when both sides have one
+        if file_info.change_token and file_inv.change_token:
+            if file_info.change_token != file_inv.change_token:
+                return DELTA_SCAN, "token_changed"
+            return DELTA_SKIP, "unchanged_token"
+
+        if file_info.modified and file_inv.file_modified:
+            if file_info.modified > file_inv.file_modified:
+                return DELTA_SCAN, "modified_time"
+            if file_info.modified == file_inv.file_modified and file_inv.file_size is not None:
+                return DELTA_SKIP, "unchanged_metadata"
+
+        # Missing metadata or mtime moved backwards (restore, copy): hash it
+        return DELTA_VERIFY, "metadata_ambiguous"
+
+    async def file_seen_row(self, file_info: FileInfo, job_id: UUID) -> dict | None:
+        """
+        Build the values that record an unchanged file as seen by a scan.
+
+        The row is for bulk_mark_files_seen(): it stamps
+        ``last_scan_job_id`` so mark_missing_files() does not flag the
+        skipped file, and stores the current listing metadata so the next
+        delta scan can decide from metadata alone instead of falling back
+        to a content hash again. The ORM row itself is left untouched, so
+        skipped files add no per-row UPDATE to the session flush.
+
+        Args:
+            file_info: File information from the adapter listing
+            job_id: Current scan job ID
+
+        Returns:
+            Row values, or None if the file has no inventory entry
+        """
+        file_inv = await self._get_file_inv(file_info.path)
+        if file_inv is None:
+            return None
+        return {
+            "id": file_inv.id,
+            "file_path": file_info.path,
+            "file_modified": file_info.modified,
+            "change_token": file_info.change_token,
+            "last_scan_job_id": job_id,
+        }
+
     async def should_scan_file(
         self,
         file_info: FileInfo,
@@ -1137,6 +1356,7 @@ class InventoryService:
             file_inv.content_hash = content_hash
             file_inv.file_size = file_info.size
             file_inv.file_modified = file_info.modified
+            file_inv.change_token = file_info.change_token
             file_inv.risk_score = scan_result.risk_score
             file_inv.risk_tier = scan_result.risk_tier
             file_inv.entity_counts = scan_result.entity_counts
@@ -1164,6 +1384,7 @@ class InventoryService:
                 content_hash=content_hash,
                 file_size=file_info.size,
                 file_modified=file_info.modified,
+                change_token=file_info.change_token,
                 risk_score=scan_result.risk_score,
                 risk_tier=scan_result.risk_tier,
                 entity_counts=scan_result.entity_counts,
@@ -1184,6 +1405,155 @@ class InventoryService:
 
         return file_inv
 
+    def file_inventory_row(
+        self,
+        file_info: FileInfo,
+        scan_row: dict,
+        content_hash: str,
+        job_id: UUID,
+        scanned_at: datetime | None = None,
+    ) -> dict:
+        """
+        Build the file_inventory insert values for bulk_upsert_file_inventory().
+
+        Args:
+            file_info: File information
+            scan_row: Column values of the file's scan result
+            content_hash: SHA-256 hash of file content
+            job_id: Current scan job ID
+            scanned_at: Scan timestamp (default: now)
+        """
+        return {
+            "id": generate_uuid(),
+            "tenant_id": self.tenant_id,
+            "target_id": self.target_id,
+            "file_path": file_info.path,
+            "file_name": file_info.name,
+            "adapter": file_info.adapter,
+            "content_hash": content_hash,
+            "file_size": file_info.size,
+            "file_modified": file_info.modified,
+            "change_token": file_info.change_token,
+            "risk_score": scan_row["risk_score"],
+            "risk_tier": scan_row["risk_tier"],
+            "entity_counts": scan_row["entity_counts"],
+            "total_entities": scan_row["total_entities"],
+            "exposure_level": scan_row["exposure_level"],
+            "owner": scan_row["owner"],
+            "last_scanned_at": scanned_at or datetime.now(timezone.utc),
+            "last_scan_job_id": job_id,
+            "scan_count": 1,
+            "content_changed_count": 0,
+            "is_monitored": True,
+            "needs_rescan": False,
+        }
+
+    async def bulk_upsert_file_inventory(self, rows: list[dict]) -> int:
+        """
+        Insert or update many file inventory rows with multi-row upserts.
+
+        Bulk equivalent of update_file_inventory(): on conflict the scan
+        columns are overwritten, scan_count is incremented, and
+        content_changed_count is incremented when the hash differs.
+        Label columns are left alone.
+
+        Args:
+            rows: Values from file_inventory_row(); a path appearing more
+                than once keeps its last row
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        by_path = {row["file_path"]: row for row in rows}
+        table = FileInventory.__table__
+        written: list[Any] = []
+
+        for chunk in chunked(by_path.values(), _UPSERT_CHUNK_ROWS):
+            stmt = pg_insert(table).values(chunk)
+            excluded = stmt.excluded
+            set_ = {col: excluded[col] for col in _FILE_INVENTORY_UPSERT_COLUMNS}
+            set_.update({
+                "scan_count": table.c.scan_count + 1,
+                "content_changed_count": table.c.content_changed_count + case(
+                    (table.c.content_hash.is_distinct_from(excluded.content_hash), 1),
+                    else_=0,
+                ),
+                "needs_rescan": False,
+                "updated_at": func.now(),
+            })
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["tenant_id", "target_id", "file_path"],
+                set_=set_,
+            )
+            if self._distributed_inventory:
+                result = await self.session.execute(stmt.returning(*table.c))
+                written.extend(result.all())
+            else:
+                await self.session.execute(stmt)
+
+        # Cached ORM rows for these paths are now stale
+        for path in by_path:
+            self._file_cache.pop(path, None)
+            self._absent_files.pop(path, None)
+
+        await self.sync_files_to_distributed_cache(written)
+        return len(by_path)
+
+    async def bulk_mark_files_seen(self, rows: list[dict]) -> int:
+        """
+        Apply file_seen_row() values with one ``UPDATE ... FROM (VALUES ...)``
+        per chunk.
+
+        A missing change token keeps the stored one.
+
+        Args:
+            rows: Values from file_seen_row(); a path appearing more than
+                once keeps its last row
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        by_path = {row["file_path"]: row for row in rows}
+
+        for chunk in chunked(by_path.values(), _UPSERT_CHUNK_ROWS):
+            values_sql = ", ".join(
+                f"(CAST(:id_{i} AS uuid), CAST(:mod_{i} AS timestamptz), "
+                f"CAST(:tok_{i} AS varchar), CAST(:job_{i} AS uuid))"
+                for i in range(len(chunk))
+            )
+            params: dict[str, Any] = {}
+            for i, row in enumerate(chunk):
+                params[f"id_{i}"] = row["id"]
+                params[f"mod_{i}"] = row["file_modified"]
+                params[f"tok_{i}"] = row["change_token"]
+                params[f"job_{i}"] = row["last_scan_job_id"]
+
+            await self.session.execute(
+                text(f"""
+                    UPDATE file_inventory AS fi
+                       SET file_modified = v.file_modified,
+                           change_token = COALESCE(v.change_token, fi.change_token),
+                           last_scan_job_id = v.last_scan_job_id,
+                           updated_at = now()
+                      FROM (VALUES {values_sql})
+                           AS v(id, file_modified, change_token, last_scan_job_id)
+                     WHERE fi.id = v.id
+                """),
+                params,
+            )
+
+        # Cached ORM rows for these paths are now stale
+        for path in by_path:
+            self._file_cache.pop(path, None)
+
+        return len(by_path)
+
     async def mark_missing_files(self, job_id: UUID) -> int:
         """
         Mark files not seen in the current scan for rescan.
@@ -1280,6 +1650,33 @@ class InventoryService:
         return stats
 
 
+def _file_cache_data(file_inv: Any) -> dict:
+    """Distributed-cache representation of a file inventory model or row."""
+    return {
+        "file_path": file_inv.file_path,
+        "file_name": file_inv.file_name,
+        "adapter": file_inv.adapter,
+        "content_hash": file_inv.content_hash,
+        "file_size": file_inv.file_size,
+        "file_modified": file_inv.file_modified.isoformat() if file_inv.file_modified else None,
+        "change_token": file_inv.change_token,
+        "risk_score": file_inv.risk_score,
+        "risk_tier": file_inv.risk_tier,
+        "entity_counts": file_inv.entity_counts,
+        "total_entities": file_inv.total_entities,
+        "exposure_level": file_inv.exposure_level,
+        "owner": file_inv.owner,
+        "current_label_id": file_inv.current_label_id,
+        "current_label_name": file_inv.current_label_name,
+        "label_applied_at": file_inv.label_applied_at.isoformat() if file_inv.label_applied_at else None,
+        "last_scanned_at": file_inv.last_scanned_at.isoformat() if file_inv.last_scanned_at else None,
+        "last_scan_job_id": str(file_inv.last_scan_job_id) if file_inv.last_scan_job_id else None,
+        "needs_rescan": file_inv.needs_rescan,
+        "scan_count": file_inv.scan_count,
+        "content_changed_count": file_inv.content_changed_count,
+    }
+
+
 def get_folder_path(file_path: str) -> str:
     """Extract folder path from file path."""
     return str(Path(file_path).parent)
@@ -0,0 +1,158 @@
+"""
+Wake-ups for job dispatch: Postgres LISTEN/NOTIFY with a polling fallback.
+
+``JobQueue.enqueue`` issues ``pg_notify`` on ``JOB_NOTIFY_CHANNEL``. Each
+worker process holds one dedicated connection that LISTENs on it, so an
+idle worker sleeps until a job is actually committed instead of polling
+every second.
+
+Polling is kept as a fallback, with adaptive backoff:
+- jobs scheduled for later (retries) are not notified when they come due
+- notifications are lost while the listening connection is down
+- LISTEN does not work through PgBouncer in transaction pooling mode
+
+The poll interval starts at ``min_delay`` and doubles after every empty
+poll up to ``max_delay``; it resets whenever jobs are found or a
+notification arrives.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from openlabels.jobs.queue import JOB_NOTIFY_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between attempts to re-establish a lost LISTEN connection
+RECONNECT_INTERVAL_SECONDS = 30.0
+
+
+class PollBackoff:
+    """Exponential backoff for the fallback poll interval."""
+
+    def __init__(self, min_delay: float = 1.0, max_delay: float = 30.0):
+        self.min_delay = max(0.0, min_delay)
+        self.max_delay = max(self.min_delay, max_delay)
+        self._delay = self.min_delay
+
+    @property
+    def delay(self) -> float:
+        """Seconds to wait before the next poll."""
+        return self._delay
+
+    def reset(self) -> None:
+        """Jobs were found (or announced): poll again soon."""
+        self._delay = self.min_delay
+
+    def increase(self) -> float:
+        """An empty poll: wait longer next time. Returns the new delay."""
+        self._delay = min(max(self._delay * 2, self.min_delay or 0.1), self.max_delay)
+        return self._delay
+
+
+class JobNotificationListener:
+    """
+    Holds a dedicated connection LISTENing on ``JOB_NOTIFY_CHANNEL``.
+
+    ``wait(timeout)`` returns True as soon as a notification arrives, or
+    False when the timeout elapses. If the connection cannot be
+    established (non-asyncpg driver, PgBouncer, database down) the
+    listener degrades to a plain sleep and retries the connection every
+    ``RECONNECT_INTERVAL_SECONDS``.
+    """
+
+    def __init__(self, engine: Any = None, channel: str = JOB_NOTIFY_CHANNEL):
+        """
+        Args:
+            engine: SQLAlchemy AsyncEngine (defaults to the server engine)
+            channel: NOTIFY channel name
+        """
+        self._engine = engine
+        self.channel = channel
+        self._event = asyncio.Event()
+        self._connection: Any = None  # SQLAlchemy AsyncConnection
+        self._driver: Any = None  # asyncpg.Connection
+        self._last_attempt = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._driver is not None and not self._driver.is_closed()
+
+    async def start(self) -> bool:
+        """Open the listening connection. Returns True if LISTEN is active."""
+        self._last_attempt = time.monotonic()
+        try:
+            if self._engine is None:
+                from openlabels.server.db import get_engine
+
+                self._engine = get_engine()
+
+            self._connection = await self._engine.connect()
+            raw = await self._connection.get_raw_connection()
+            driver = raw.driver_connection
+            if not hasattr(driver, "add_listener"):
+                logger.info(
+                    "Job notifications unavailable (driver has no LISTEN support); polling only"
+                )
+                await self._close_connection()
+                return False
+
+            await driver.add_listener(self.channel, self._on_notify)
+            self._driver = driver
+            logger.info(f"Listening for job notifications on '{self.channel}'")
+            return True
+
+        except (SQLAlchemyError, OSError, RuntimeError, asyncio.TimeoutError) as e:
+            logger.warning(
+                f"Job notification listener unavailable, polling only: {type(e).__name__}: {e}"
+            )
+            await self._close_connection()
+            return False
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a notification."""
+        if (
+            not self.connected
+            and time.monotonic() - self._last_attempt >= RECONNECT_INTERVAL_SECONDS
+        ):
+            await self._close_connection()
+            await self.start()
+
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def notify(self) -> None:
+        """Wake the waiter locally (e.g. on shutdown)."""
+        self._event.set()
+
+    async def close(self) -> None:
+        """Stop listening and return the connection."""
+        if self.connected:
+            try:
+                await self._driver.remove_listener(self.channel, self._on_notify)
+            except (OSError, RuntimeError) as e:
+                logger.debug(f"Failed to remove job notification listener: {e}")
+        await self._close_connection()
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._event.set()
+
+    async def _close_connection(self) -> None:
+        self._driver = None
+        if self._connection is not None:
+            try:
+                await self._connection.close()
+            except (SQLAlchemyError, OSError, RuntimeError) as e:
+                logger.debug(f"Error closing job notification connection: {e}")
+            self._connection = None
@@ -0,0 +1,182 @@
+"""
+Work stealing for key-range scan partitions.
+
+The coordinator cuts an object-store keyspace into ranges up front from a
+sample of keys. A range that turns out to hold huge objects or OCR-heavy
+images becomes a straggler, and the whole fan-out job waits on it.
+
+``PartitionSplitter`` wraps a partition's file listing. Once the partition
+has run for ``split_after_seconds`` it looks ahead in its remaining range:
+
+- The listing rate (kept close to the processing rate by the pipeline's
+  backpressure) says how many files the worker gets through in
+  ``target_seconds``. The worker keeps that many keys.
+- If at least ``min_tail_files`` more keys follow, the range is cut there.
+  The tail is published as a new partition that any idle worker can
+  claim, and this worker stops listing at the cut.
+
+The check repeats every ``check_interval_seconds``, so new partitions
+split again if they straggle too.
+
+Usage:
+    splitter = PartitionSplitter(adapter, target_path, spec, publish_fn)
+    files = splitter.iter_files(adapter.list_files(target_path, partition=spec))
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import replace
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from openlabels.adapters.base import FileInfo, PartitionSpec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPLIT_AFTER_SECONDS = 300.0
+DEFAULT_TARGET_SECONDS = 120.0
+DEFAULT_CHECK_INTERVAL_SECONDS = 60.0
+DEFAULT_MIN_TAIL_FILES = 500
+# Fewest keys a partition keeps for itself when it splits
+MIN_KEEP_FILES = 50
+# Cap on keys listed ahead of the worker per split check
+MAX_LOOKAHEAD_FILES = 20_000
+
+PublishFn = Callable[[PartitionSpec, PartitionSpec], Awaitable[None]]
+
+
+class PartitionSplitter:
+    """
+    Splits off the unlisted tail of a running key-range partition.
+
+    ``spec`` is updated in place when a split is published: its
+    ``end_before`` moves down to the cut.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        target_path: str,
+        spec: PartitionSpec,
+        publish: PublishFn,
+        split_after_seconds: float = DEFAULT_SPLIT_AFTER_SECONDS,
+        target_seconds: float = DEFAULT_TARGET_SECONDS,
+        check_interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        min_tail_files: int = DEFAULT_MIN_TAIL_FILES,
+        max_lookahead: int = MAX_LOOKAHEAD_FILES,
+        inclusive_start: bool = False,
+    ):
+        """
+        Args:
+            adapter: Object-store adapter (S3, GCS, Azure Blob)
+            target_path: Listing target passed to ``list_files``
+            spec: The running partition's spec
+            publish: ``publish(remaining, tail)`` persists the shrunk
+                spec of this partition and creates the tail partition
+            split_after_seconds: Runtime before the first split check
+            target_seconds: Work this partition keeps when it splits
+            check_interval_seconds: Time between split checks
+            min_tail_files: Smallest tail worth publishing
+            max_lookahead: Most keys listed ahead in one check
+            inclusive_start: The adapter lists ``start_after`` itself (GCS
+                ``start_offset``), so tails must start at the cut key
+        """
+        self.adapter = adapter
+        self.target_path = target_path
+        self.spec = spec
+        self.publish = publish
+        self.split_after_seconds = split_after_seconds
+        self.target_seconds = target_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.min_tail_files = max(1, min_tail_files)
+        self.max_lookahead = max(MIN_KEEP_FILES + self.min_tail_files, max_lookahead)
+        self.inclusive_start = inclusive_start
+
+        self.splits = 0
+        self.files_listed = 0
+        self._started = time.monotonic()
+        self._next_check = self._started + split_after_seconds
+        self._exhausted = False
+
+    @property
+    def files_per_second(self) -> float:
+        """Listing throughput of this partition so far."""
+        elapsed = time.monotonic() - self._started
+        return self.files_listed / elapsed if elapsed > 0 else 0.0
+
+    async def iter_files(self, files: AsyncIterator[FileInfo]) -> AsyncIterator[FileInfo]:
+        """Yield from *files*, splitting periodically and stopping at the cut."""
+        async with aclosing(files) as listing:
+            async for file_info in listing:
+                key = file_info.item_id or file_info.path
+                if self.spec.end_before and key >= self.spec.end_before:
+                    return
+                self.files_listed += 1
+                yield file_info
+
+                if not self._exhausted and time.monotonic() >= self._next_check:
+                    await self.maybe_split(key)
+
+    async def maybe_split(self, last_key: str) -> PartitionSpec | None:
+        """
+        Look ahead of *last_key* and publish the tail if it is large enough.
+
+        Returns the published tail spec, or None if no split was made.
+        """
+        self._next_check = time.monotonic() + self.check_interval_seconds
+
+        keep = int(self.files_per_second * self.target_seconds)
+        keep = min(max(keep, MIN_KEEP_FILES), self.max_lookahead - self.min_tail_files)
+        needed = keep + self.min_tail_files
+
+        try:
+            keys = await self._lookahead(last_key, needed)
+        except (ConnectionError, OSError, RuntimeError, ValueError) as e:
+            logger.warning("Partition lookahead failed, not splitting: %s", e)
+            return None
+
+        if len(keys) < needed:
+            # Remaining range is small: this worker will finish it soon
+            self._exhausted = True
+            return None
+
+        cut = keys[keep]
+        remaining = replace(self.spec, end_before=cut)
+        # The tail begins at the cut key: start_after is exclusive on S3 and
+        # Azure, but GCS lists from start_after inclusive
+        tail_start = cut if self.inclusive_start else keys[keep - 1]
+        tail = replace(self.spec, start_after=tail_start)
+        try:
+            await self.publish(remaining, tail)
+        except (SQLAlchemyError, ConnectionError, OSError, RuntimeError) as e:
+            logger.warning("Failed to publish partition split at %s: %s", cut, e)
+            return None
+
+        self.spec.end_before = cut
+        self.splits += 1
+        logger.info(
+            "Split partition at %s after %d files (%.1f files/s); keeping %d files",
+            cut,
+            self.files_listed,
+            self.files_per_second,
+            keep,
+        )
+        return tail
+
+    async def _lookahead(self, last_key: str, limit: int) -> list[str]:
+        """Up to *limit* keys after *last_key* in the current range."""
+        ahead = replace(self.spec, start_after=last_key)
+        keys: list[str] = []
+        async with aclosing(self.adapter.list_files(self.target_path, partition=ahead)) as listing:
+            async for file_info in listing:
+                key = file_info.item_id or file_info.path
+                if key == last_key:
+                    continue  # Listed again by an inclusive start_after
+                keys.append(key)
+                if len(keys) >= limit:
+                    break
+        return keys
@@ -20,6 +20,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable, Coroutine
 
+from openlabels.core.profiling import profile_stage, profile_trace
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,7 +117,12 @@ class PipelineStats:
     low_count: int = 0
     minimal_count: int = 0
     files_skipped: int = 0
+    files_skipped_unread: int = 0  # Subset of files_skipped decided from metadata alone
     files_errored: int = 0
+    detection_cache_hits: int = 0  # Results reused from identical content
+    detection_cache_misses: int = 0
+    detected_chars: int = 0  # Extracted text run through detection (cache misses)
+    ml_chars: int = 0  # Subset of detected_chars sent to ML detectors
     pipeline_concurrency_high_water: int = 0
 
     def to_dict(self) -> dict:
@@ -129,7 +136,12 @@ class PipelineStats:
             "low_count": self.low_count,
             "minimal_count": self.minimal_count,
             "files_skipped": self.files_skipped,
+            "files_skipped_unread": self.files_skipped_unread,
             "files_errored": self.files_errored,
+            "detection_cache_hits": self.detection_cache_hits,
+            "detection_cache_misses": self.detection_cache_misses,
+            "detected_chars": self.detected_chars,
+            "ml_chars": self.ml_chars,
             "pipeline_concurrency_high_water": self.pipeline_concurrency_high_water,
         }
 
@@ -144,6 +156,11 @@ class PipelineStats:
         if current is not None:
             setattr(self, tier_key, current + 1)
 
+    def record_detection(self, text_length: int, ml_chars: int) -> None:
+        """Record how much text one detection run covered, and sent to ML."""
+        self.detected_chars += text_length
+        self.ml_chars += ml_chars
+
 
 @dataclass
 class PipelineContext:
@@ -253,12 +270,12 @@ class FilePipeline:
                         self._ctx.cancelled = True
                         break
 
-                # Wait for a concurrency slot
-                await self._concurrency_sem.acquire()
-
-                # Wait for memory budget (using file size as estimate)
+                # Wait for a concurrency slot, then for memory budget
+                # (using file size as estimate)
                 file_size = max(file_info.size, 1024)  # minimum 1KB estimate
-                await self._memory_budget.acquire(file_size)
+                with profile_stage("wait"):
+                    await self._concurrency_sem.acquire()
+                    await self._memory_budget.acquire(file_size)
 
                 task = asyncio.create_task(
                     self._run_one(file_info, file_size),
@@ -287,7 +304,8 @@ class FilePipeline:
 
             # Final commit for any remaining unflushed writes
             try:
-                await self._commit_fn()
+                with profile_stage("commit"):
+                    await self._commit_fn()
             except (OSError, RuntimeError) as e:
                 logger.error("Final pipeline commit failed: %s", e)
 
@@ -297,12 +315,14 @@ class FilePipeline:
         """Process a single file within the pipeline."""
         try:
             await self._ctx.increment_active()
-            await self._process_fn(file_info, self._ctx)
+            with profile_trace(file_info.path), profile_stage("file"):
+                await self._process_fn(file_info, self._ctx)
 
             # Periodic commit
             if await self._ctx.should_commit():
                 try:
-                    await self._commit_fn()
+                    with profile_stage("commit"):
+                        await self._commit_fn()
                 except (OSError, RuntimeError) as e:
                     logger.warning("Pipeline periodic commit failed: %s", e)
         except (PermissionError, OSError, UnicodeDecodeError, ValueError) as e:
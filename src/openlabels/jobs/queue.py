@@ -6,6 +6,7 @@ Features:
 - Exponential backoff for retries (2^n seconds, capped at 1 hour)
 - Dead letter queue for permanently failed jobs
 - Concurrent worker support via SELECT FOR UPDATE SKIP LOCKED
+- NOTIFY on enqueue so idle workers wake immediately (see jobs.notify)
 """
 
 from __future__ import annotations
@@ -15,7 +16,7 @@ from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from openlabels.core.types import JobStatus
@@ -34,12 +35,29 @@ MAX_RETRY_DELAY_SECONDS = 3600  # Cap at 1 hour
 # Job timeout - jobs running longer than this are considered stuck
 DEFAULT_JOB_TIMEOUT_SECONDS = 3600  # 1 hour
 
+# Postgres NOTIFY channel signalled when runnable jobs are added
+JOB_NOTIFY_CHANNEL = "openlabels_jobs"
+
 logger = logging.getLogger(__name__)
 
 # Callback invoked when a job completes or fails permanently.
 JobCallback = Callable[["JobQueueModel"], Awaitable[None]]
 
 
+async def notify_jobs_available(session: AsyncSession, tenant_id: UUID | None = None) -> None:
+    """
+    Signal listening workers that runnable jobs were added.
+
+    NOTIFY is transactional: Postgres delivers it only when the enclosing
+    transaction commits, so workers never wake before the job is visible.
+    Identical notifications within one transaction are collapsed.
+    """
+    await session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": JOB_NOTIFY_CHANNEL, "payload": str(tenant_id or "")},
+    )
+
+
 def calculate_retry_delay(retry_count: int) -> timedelta:
     """
     Calculate retry delay using exponential backoff.
@@ -110,6 +128,10 @@ class JobQueue:
         self.session.add(job)
         await self.session.flush()
 
+        # Delayed jobs are picked up by the workers' fallback poll
+        if scheduled_for is None or scheduled_for <= datetime.now(timezone.utc):
+            await notify_jobs_available(self.session, self.tenant_id)
+
         # Record metrics
         record_job_enqueued(task_type)
 
@@ -378,6 +400,7 @@ class JobQueue:
             job.retry_count = 0
 
         await self.session.flush()
+        await notify_jobs_available(self.session, self.tenant_id)
         return True
 
     async def requeue_all_failed(
@@ -419,6 +442,8 @@ class JobQueue:
             .values(**values)
         )
         await self.session.flush()
+        if result.rowcount:
+            await notify_jobs_available(self.session, self.tenant_id)
         return result.rowcount
 
     async def purge_failed(
@@ -770,23 +795,29 @@ class JobQueue:
         return stats
 
 
-async def dequeue_next_job(
+async def dequeue_jobs(
     session: AsyncSession,
     worker_id: str,
-) -> JobQueueModel | None:
+    limit: int = 1,
+) -> list[JobQueueModel]:
     """
-    Dequeue the next available job across all tenants in a single query.
+    Claim up to ``limit`` available jobs across all tenants in one query.
 
-    Replaces per-tenant iteration with one SELECT FOR UPDATE SKIP LOCKED,
-    reducing the polling cost from O(tenants) queries to O(1).
+    Uses SELECT FOR UPDATE SKIP LOCKED so concurrent workers never claim
+    the same job, and marks every claimed job running in the same
+    transaction.
 
     Args:
         session: Database session
-        worker_id: Identifier of the worker claiming the job
+        worker_id: Identifier of the worker claiming the jobs
+        limit: Maximum number of jobs to claim
 
     Returns:
-        Job model or None if no jobs available
+        Claimed jobs in priority order (empty if none are available)
     """
+    if limit < 1:
+        return []
+
     now = datetime.now(timezone.utc)
 
     query = (
@@ -799,17 +830,70 @@ async def dequeue_next_job(
             JobQueueModel.priority.desc(),
             JobQueueModel.created_at.asc(),
         )
-        .limit(1)
+        .limit(limit)
         .with_for_update(skip_locked=True)
     )
 
     result = await session.execute(query)
-    job = result.scalar_one_or_none()
+    jobs = list(result.scalars().all())
 
-    if job:
+    for job in jobs:
         job.status = JobStatus.RUNNING
         job.worker_id = worker_id
         job.started_at = now
+    if jobs:
         await session.flush()
 
-    return job
+    return jobs
+
+
+async def dequeue_next_job(
+    session: AsyncSession,
+    worker_id: str,
+) -> JobQueueModel | None:
+    """
+    Dequeue the next available job across all tenants in a single query.
+
+    Replaces per-tenant iteration with one SELECT FOR UPDATE SKIP LOCKED,
+    reducing the polling cost from O(tenants) queries to O(1).
+
+    Args:
+        session: Database session
+        worker_id: Identifier of the worker claiming the job
+
+    Returns:
+        Job model or None if no jobs available
+    """
+    jobs = await dequeue_jobs(session, worker_id, limit=1)
+    return jobs[0] if jobs else None
+
+
+async def release_jobs(
+    session: AsyncSession,
+    job_ids: list[UUID],
+    worker_id: str,
+) -> int:
+    """
+    Return claimed-but-unstarted jobs to the queue (e.g. on shutdown).
+
+    Only jobs still running under ``worker_id`` are released, so a job
+    that was reclaimed or cancelled in the meantime is left alone.
+
+    Returns:
+        Number of jobs released
+    """
+    if not job_ids:
+        return 0
+
+    result = await session.execute(
+        update(JobQueueModel)
+        .where(
+            JobQueueModel.id.in_(job_ids),
+            JobQueueModel.status == JobStatus.RUNNING,
+            JobQueueModel.worker_id == worker_id,
+        )
+        .values(status=JobStatus.PENDING, worker_id=None, started_at=None)
+    )
+    if result.rowcount:
+        await notify_jobs_available(session)
+    return result.rowcount
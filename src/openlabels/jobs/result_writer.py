@@ -0,0 +1,249 @@
+"""
+Batched persistence of scan results and file inventory.
+
+Scans used to ``session.add(ScanResult(...))`` and call
+``InventoryService.update_file_inventory`` once per file. Each call does
+an ORM unit-of-work round trip, an inventory lookup and a distributed
+cache write. ``ScanResultWriter`` buffers the column values instead, and
+flushes them as:
+
+- one executemany INSERT into scan_results per batch (SQLAlchemy sends
+  these as multi-row VALUES statements)
+- multi-row ``INSERT ... ON CONFLICT DO UPDATE`` into file_inventory
+- ``UPDATE ... FROM (VALUES ...)`` for unchanged files the delta check
+  skipped (see ``mark_seen``)
+- one pipelined distributed-cache write for the whole batch
+
+Rows are flushed when the buffer reaches ``batch_size`` and on every
+pipeline commit (see ``commit_with``), so the commit interval still
+bounds how much work a crash can lose.
+
+Usage:
+    writer = ScanResultWriter(session, inventory, job.tenant_id, job.id)
+    result_id = await writer.add(file_info, result, content_hash)
+    ...
+    await writer.flush()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openlabels.server.models import ScanResult, generate_uuid
+
+if TYPE_CHECKING:
+    from openlabels.adapters.base import FileInfo
+    from openlabels.jobs.inventory import InventoryService
+
+logger = logging.getLogger(__name__)
+
+# Rows buffered before an automatic flush
+DEFAULT_BATCH_SIZE = 500
+
+
+def scan_result_row(
+    tenant_id: UUID,
+    job_id: UUID,
+    file_info: FileInfo,
+    result: dict,
+    content_hash: str,
+    result_id: UUID | None = None,
+    scanned_at: datetime | None = None,
+) -> dict:
+    """Column values for one scan_results row (same fields the ORM path set)."""
+    return {
+        "id": result_id or generate_uuid(),
+        "tenant_id": tenant_id,
+        "job_id": job_id,
+        "file_path": file_info.path,
+        "file_name": file_info.name,
+        "file_size": file_info.size,
+        "file_modified": file_info.modified,
+        "content_hash": content_hash,
+        "adapter_item_id": file_info.item_id,
+        "risk_score": result["risk_score"],
+        "risk_tier": result["risk_tier"],
+        "entity_counts": result["entity_counts"],
+        "total_entities": result["total_entities"],
+        "exposure_level": file_info.exposure.value,
+        "owner": file_info.owner,
+        "content_score": result.get("content_score"),
+        "exposure_multiplier": result.get("exposure_multiplier"),
+        "co_occurrence_rules": result.get("co_occurrence_rules"),
+        "findings": result.get("findings"),
+        "policy_violations": result.get("policy_violations"),
+        "label_applied": False,
+        "scanned_at": scanned_at or datetime.now(timezone.utc),
+    }
+
+
+@dataclass
+class ResultWriterStats:
+    """Counters for batched writes."""
+
+    results_written: int = 0
+    inventory_rows_written: int = 0
+    seen_rows_written: int = 0
+    flushes: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "results_written": self.results_written,
+            "inventory_rows_written": self.inventory_rows_written,
+            "seen_rows_written": self.seen_rows_written,
+            "flushes": self.flushes,
+        }
+
+
+class ScanResultWriter:
+    """
+    Buffers scan result and file inventory rows and writes them in bulk.
+
+    Safe to call from the concurrent pipeline tasks of one scan: buffer
+    swaps and flushes are serialized by a lock.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        inventory: InventoryService,
+        tenant_id: UUID,
+        job_id: UUID,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Args:
+            session: Database session of the scan
+            inventory: Inventory service for the scan target
+            tenant_id: Tenant ID
+            job_id: Scan job ID
+            batch_size: Buffered results that trigger a flush
+        """
+        self.session = session
+        self.inventory = inventory
+        self.tenant_id = tenant_id
+        self.job_id = job_id
+        self.batch_size = max(1, batch_size)
+        self._results: list[dict] = []
+        self._inventory_rows: list[dict] = []
+        self._seen_rows: list[dict] = []
+        self._lock = asyncio.Lock()
+        self.stats = ResultWriterStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered scan results."""
+        return len(self._results)
+
+    async def add(
+        self,
+        file_info: FileInfo,
+        result: dict,
+        content_hash: str,
+        update_inventory: bool = True,
+    ) -> UUID:
+        """
+        Buffer one file's scan result (and inventory row).
+
+        Args:
+            file_info: File information
+            result: Output of _detect_and_score
+            content_hash: SHA-256 hash of file content
+            update_inventory: Also upsert the file's inventory row
+
+        Returns:
+            ID the scan result row will have
+        """
+        now = datetime.now(timezone.utc)
+        row = scan_result_row(
+            self.tenant_id,
+            self.job_id,
+            file_info,
+            result,
+            content_hash,
+            scanned_at=now,
+        )
+        self._results.append(row)
+        if update_inventory:
+            self._inventory_rows.append(
+                self.inventory.file_inventory_row(
+                    file_info,
+                    row,
+                    content_hash,
+                    self.job_id,
+                    scanned_at=now,
+                )
+            )
+
+        if len(self._results) >= self.batch_size:
+            await self.flush()
+        return row["id"]
+
+    async def mark_seen(self, file_info: FileInfo) -> None:
+        """
+        Buffer an inventory refresh for a file the delta check skipped.
+
+        Args:
+            file_info: File information from the adapter listing
+        """
+        row = await self.inventory.file_seen_row(file_info, self.job_id)
+        if row is None:
+            return
+        self._seen_rows.append(row)
+        if len(self._seen_rows) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered rows. Returns the number of scan results written.
+
+        Scan results are inserted before the inventory is upserted, in the
+        caller's transaction; nothing is committed here.
+        """
+        async with self._lock:
+            results, self._results = self._results, []
+            inventory_rows, self._inventory_rows = self._inventory_rows, []
+            seen_rows, self._seen_rows = self._seen_rows, []
+            if not results and not inventory_rows and not seen_rows:
+                return 0
+
+            if results:
+                await self.session.execute(insert(ScanResult.__table__), results)
+            if inventory_rows:
+                await self.inventory.bulk_upsert_file_inventory(inventory_rows)
+            if seen_rows:
+                await self.inventory.bulk_mark_files_seen(seen_rows)
+
+            self.stats.results_written += len(results)
+            self.stats.inventory_rows_written += len(inventory_rows)
+            self.stats.seen_rows_written += len(seen_rows)
+            self.stats.flushes += 1
+            logger.debug(
+                "Flushed %d scan results, %d inventory rows and %d seen files for job %s",
+                len(results),
+                len(inventory_rows),
+                len(seen_rows),
+                self.job_id,
+            )
+            return len(results)
+
+    def commit_with(
+        self,
+        commit_fn: Callable[[], Awaitable[Any]],
+    ) -> Callable[[], Awaitable[None]]:
+        """Wrap a commit function so buffered rows are flushed first."""
+
+        async def _flush_and_commit() -> None:
+            await self.flush()
+            await commit_fn()
+
+        return _flush_and_commit
@@ -2,6 +2,8 @@
 
 Collects filesystem permissions (POSIX uid/gid/mode or NTFS DACL),
 deduplicates by SHA-256 hash, and populates ``security_descriptors``.
+Each new descriptor is also expanded into ``principal_grants`` rows so
+principal access lookups never have to scan descriptor JSON.
 """
 
 from __future__ import annotations
@@ -18,17 +20,36 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import and_, or_, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from openlabels.server.models import SecurityDescriptor
+from openlabels.server.models import DirectoryTree, PrincipalGrant, SecurityDescriptor
 
 logger = logging.getLogger(__name__)
 
 _READ_BATCH = 5000
 _UPSERT_BATCH = 2000
 
+# POSIX "other" bits are indexed under the Everyone SID so one principal
+# lookup treats world access the same way on both platforms.
+WORLD_PRINCIPAL = "S-1-1-0"
+
+_ACCESS_ALLOWED_ACE_TYPE = 0
+
+# (access-mask bits, permission name) for NTFS directory ACEs.  Generic
+# rights are included because inheritable ACEs often carry them unmapped.
+_FULL_CONTROL_MASK = 0x1F01FF
+_GENERIC_ALL = 0x10000000
+_MASK_PERMISSIONS = (
+    (0x80000001, "read"),  # GENERIC_READ | FILE_LIST_DIRECTORY
+    (0x40000006, "write"),  # GENERIC_WRITE | FILE_ADD_FILE | FILE_ADD_SUBDIRECTORY
+    (0x20000020, "execute"),  # GENERIC_EXECUTE | FILE_TRAVERSE
+    (0x00010040, "delete"),  # DELETE | FILE_DELETE_CHILD
+    (0x00040000, "change_permissions"),  # WRITE_DAC
+    (0x00080000, "take_ownership"),  # WRITE_OWNER
+)
+
 
 @dataclass(frozen=True, slots=True)
 class SDInfo:
@@ -193,7 +214,7 @@ def collect_windows_sd(dir_path: str) -> SDInfo | None:
             ace = dacl.GetAce(i)
             sid = ace[2]
             sid_str = win32security.ConvertSidToStringSid(sid)
-            aces.append({"sid": sid_str, "mask": ace[1]})
+            aces.append({"sid": sid_str, "mask": ace[1], "type": ace[0][0]})
 
             if sid_str == everyone_sid_str:
                 world_accessible = True
@@ -224,6 +245,89 @@ def collect_sd(dir_path: str) -> SDInfo | None:
     return collect_posix_sd(dir_path)
 
 
+def normalize_principal(principal: str) -> str:
+    """Canonical index key for a principal (SIDs upper-cased, names as-is)."""
+    principal = principal.strip()
+    if principal[:4].upper() == "S-1-":
+        return principal.upper()
+    return principal
+
+
+def _mask_permissions(mask: int) -> list[str]:
+    """Translate an NTFS access mask into permission names."""
+    if mask & _GENERIC_ALL or mask & _FULL_CONTROL_MASK == _FULL_CONTROL_MASK:
+        return ["full_control"]
+    return [name for bits, name in _MASK_PERMISSIONS if mask & bits]
+
+
+def _posix_permissions(permissions: dict, who: str) -> list[str]:
+    """Permission names for one of the ``owner``/``group``/``other`` classes."""
+    return [
+        name for bit, name in (("read", "read"), ("write", "write"), ("exec", "execute"))
+        if permissions.get(f"{who}_{bit}")
+    ]
+
+
+def principal_grants(
+    owner_sid: str | None,
+    group_sid: str | None,
+    permissions_json: dict | None,
+) -> dict[str, list[str]]:
+    """Expand a security descriptor into ``{principal: [permissions]}``.
+
+    Understands the three ``permissions_json`` shapes in the table:
+    Windows ``{"aces": [...]}`` (allow ACEs only -- deny ACEs are not
+    subtracted), POSIX mode bits (owner, group and ``WORLD_PRINCIPAL``),
+    and the plain ``{principal: [permissions]}`` form.
+    """
+    if not permissions_json:
+        return {}
+
+    grants: dict[str, set[str]] = {}
+
+    def grant(principal: str | None, perms: list[str]) -> None:
+        if principal and perms:
+            grants.setdefault(normalize_principal(principal), set()).update(perms)
+
+    if "aces" in permissions_json:
+        for ace in permissions_json["aces"] or ():
+            if ace.get("type", _ACCESS_ALLOWED_ACE_TYPE) != _ACCESS_ALLOWED_ACE_TYPE:
+                continue
+            grant(ace.get("sid"), _mask_permissions(int(ace.get("mask") or 0)))
+    elif "mode" in permissions_json:
+        grant(owner_sid, _posix_permissions(permissions_json, "owner"))
+        grant(group_sid, _posix_permissions(permissions_json, "group"))
+        grant(WORLD_PRINCIPAL, _posix_permissions(permissions_json, "other"))
+    else:
+        for principal, perms in permissions_json.items():
+            if isinstance(perms, dict):
+                perms = list(perms.keys())
+            if isinstance(perms, list):
+                grant(principal, [str(p) for p in perms])
+
+    return {principal: sorted(perms) for principal, perms in grants.items()}
+
+
+def _grant_rows(
+    tenant_id: UUID,
+    sd_hash: bytes,
+    owner_sid: str | None,
+    group_sid: str | None,
+    permissions_json: dict | None,
+) -> list[dict]:
+    return [
+        {
+            "tenant_id": tenant_id,
+            "principal": principal,
+            "sd_hash": sd_hash,
+            "permissions": perms,
+        }
+        for principal, perms in principal_grants(
+            owner_sid, group_sid, permissions_json,
+        ).items()
+    ]
+
+
 def _collect_batch_sync(paths: list[str]) -> list[tuple[str, SDInfo]]:
     """Collect SDs for a batch of paths (synchronous, runs in thread).
 
@@ -247,7 +351,8 @@ async def collect_security_descriptors(
 
     Reads ``directory_tree`` rows (those without an ``sd_hash``),
     collects filesystem permissions, deduplicates, and writes to
-    ``security_descriptors`` + updates ``directory_tree.sd_hash``.
+    ``security_descriptors`` + ``principal_grants`` and updates
+    ``directory_tree.sd_hash``.
 
     Args:
         session: Active async database session.
@@ -257,6 +362,7 @@ async def collect_security_descriptors(
 
     Returns:
         Dict with ``total_dirs``, ``unique_sds``, ``world_accessible``,
+        ``indexed_sds`` (descriptors backfilled into ``principal_grants``),
         ``elapsed_seconds``.
     """
     start = time.monotonic()
@@ -275,10 +381,12 @@ async def collect_security_descriptors(
 
     if total_dirs == 0:
         logger.info("All directories already have security descriptors.")
+        backfilled = await index_principal_grants(session, tenant_id)
         return {
             "total_dirs": 0,
             "unique_sds": 0,
             "world_accessible": 0,
+            "indexed_sds": backfilled,
             "elapsed_seconds": 0.0,
         }
 
@@ -286,6 +394,7 @@ async def collect_security_descriptors(
 
     seen_hashes: set[bytes] = set()
     sd_rows: list[dict] = []
+    grant_rows: list[dict] = []
     update_rows: list[dict] = []
     processed = 0
     world_accessible_count = 0
@@ -344,11 +453,19 @@ async def collect_security_descriptors(
                     "world_accessible": sd_info.world_accessible,
                     "authenticated_users": sd_info.authenticated_users,
                     "custom_acl": sd_info.custom_acl,
+                    "principals_indexed": True,
                 })
+                grant_rows.extend(_grant_rows(
+                    tenant_id, h,
+                    sd_info.owner_sid, sd_info.group_sid, sd_info.permissions_json,
+                ))
 
             if len(sd_rows) >= _UPSERT_BATCH:
+                # Grants reference their descriptor, so they follow it out.
                 await _upsert_sd_batch(session, sd_rows)
+                await _upsert_grant_batch(session, grant_rows)
                 sd_rows.clear()
+                grant_rows.clear()
 
             if len(update_rows) >= _UPSERT_BATCH:
                 await _update_dirtree_hashes(session, update_rows)
@@ -361,9 +478,14 @@ async def collect_security_descriptors(
 
     if sd_rows:
         await _upsert_sd_batch(session, sd_rows)
+        await _upsert_grant_batch(session, grant_rows)
     if update_rows:
         await _update_dirtree_hashes(session, update_rows)
 
+    # Descriptors that predate the grant index, or that another run
+    # inserted first, are picked up here.
+    backfilled = await index_principal_grants(session, tenant_id)
+
     await session.flush()
 
     elapsed = time.monotonic() - start
@@ -379,10 +501,105 @@ async def collect_security_descriptors(
         "total_dirs": processed,
         "unique_sds": unique_count,
         "world_accessible": world_accessible_count,
+        "indexed_sds": backfilled,
         "elapsed_seconds": round(elapsed, 2),
     }
 
 
+async def index_principal_grants(session: AsyncSession, tenant_id: UUID) -> int:
+    """Write ``principal_grants`` rows for descriptors not yet indexed.
+
+    Descriptors are content-addressed and shared across tenants, so the
+    candidates are those referenced by this tenant's directories, walked by
+    keyset on ``sd_hash``.  ``principals_indexed`` only records that the
+    tenant which stored a descriptor has its grants; a descriptor stored by
+    another tenant is indexed when this tenant has no grants for it yet.
+
+    Returns:
+        Number of descriptors indexed.
+    """
+    indexed = 0
+    last_hash = b""
+
+    tenant_hashes = (
+        select(DirectoryTree.sd_hash)
+        .where(DirectoryTree.tenant_id == tenant_id, DirectoryTree.sd_hash.is_not(None))
+    )
+    has_grants = (
+        select(PrincipalGrant.sd_hash)
+        .where(
+            PrincipalGrant.tenant_id == tenant_id,
+            PrincipalGrant.sd_hash == SecurityDescriptor.sd_hash,
+        )
+        .exists()
+    )
+
+    while True:
+        result = await session.execute(
+            select(
+                SecurityDescriptor.sd_hash,
+                SecurityDescriptor.tenant_id,
+                SecurityDescriptor.owner_sid,
+                SecurityDescriptor.group_sid,
+                SecurityDescriptor.permissions_json,
+            )
+            .where(
+                SecurityDescriptor.sd_hash.in_(tenant_hashes),
+                SecurityDescriptor.sd_hash > last_hash,
+                or_(
+                    and_(
+                        SecurityDescriptor.tenant_id == tenant_id,
+                        # Same predicate as ix_security_descriptors_unindexed
+                        SecurityDescriptor.principals_indexed.is_not(True),
+                    ),
+                    and_(SecurityDescriptor.tenant_id != tenant_id, ~has_grants),
+                ),
+            )
+            .order_by(SecurityDescriptor.sd_hash)
+            .limit(_UPSERT_BATCH)
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        last_hash = rows[-1].sd_hash
+        grant_rows: list[dict] = []
+        for row in rows:
+            grant_rows.extend(_grant_rows(
+                tenant_id, row.sd_hash, row.owner_sid, row.group_sid, row.permissions_json,
+            ))
+
+        await _upsert_grant_batch(session, grant_rows)
+        # The flag belongs to the storing tenant; setting it from another
+        # tenant would hide that tenant's descriptors from its own backfill.
+        owned = [row.sd_hash for row in rows if row.tenant_id == tenant_id]
+        if owned:
+            await session.execute(
+                update(SecurityDescriptor)
+                .where(SecurityDescriptor.sd_hash.in_(owned))
+                .values(principals_indexed=True)
+            )
+        indexed += len(rows)
+
+    if indexed:
+        logger.info("Indexed principal grants for %d security descriptors", indexed)
+    return indexed
+
+
+async def _upsert_grant_batch(session: AsyncSession, rows: list[dict]) -> None:
+    """INSERT ... ON CONFLICT DO NOTHING into ``principal_grants``.
+
+    A descriptor with a long DACL expands into many rows, so inserts are
+    chunked to stay under the driver's bind-parameter limit.
+    """
+    for i in range(0, len(rows), _UPSERT_BATCH):
+        stmt = pg_insert(PrincipalGrant.__table__).values(rows[i:i + _UPSERT_BATCH])
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=["tenant_id", "principal", "sd_hash"],
+        )
+        await session.execute(stmt)
+
+
 async def _upsert_sd_batch(session: AsyncSession, rows: list[dict]) -> None:
     """INSERT ... ON CONFLICT DO NOTHING (content-addressed by hash)."""
     stmt = pg_insert(SecurityDescriptor.__table__).values(rows)
@@ -13,6 +13,7 @@ Supports two execution modes:
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -33,11 +34,20 @@ from openlabels.core.policies.engine import get_policy_engine
 from openlabels.core.types import AdapterType, ExposureLevel, JobStatus
 from openlabels.core.policies.schema import EntityMatch
 from openlabels.core.processor import FileProcessor
+from openlabels.core.profiling import StageProfiler, profile_aiter, profile_stage, use_profiler
 from openlabels.exceptions import AdapterError, JobError
+from openlabels.jobs.detection_cache import (
+    DetectionCache,
+    detection_cache_key,
+    policy_fingerprint,
+)
 from openlabels.jobs.pipeline import FilePipeline, PipelineConfig, PipelineContext
+from openlabels.jobs.result_writer import ScanResultWriter
 from openlabels.labeling.engine import create_labeling_engine
+from openlabels.labeling.executor import LabelingExecutor, LabelTask
 from openlabels.server.config import get_settings
 from openlabels.server.metrics import (
+    record_detection_chars,
     record_entities_found,
     record_file_processed,
     record_processing_duration,
@@ -62,6 +72,10 @@ except ImportError:
 # IMPORTANT: Call cleanup_processor() during worker shutdown to release memory
 _processor: FileProcessor | None = None
 
+# Content-addressed detection result cache, shared by all scans in this worker
+_detection_cache: DetectionCache | None = None
+_detection_cache_ready = False
+
 # Registry of shutdown callbacks for graceful cleanup
 _shutdown_callbacks: list = []
 
@@ -105,14 +119,26 @@ def get_processor(enable_ml: bool | None = None) -> FileProcessor:
             return _processor
 
     from openlabels.core.detectors.config import DetectionConfig
+
+    detection = settings.detection
     _processor = FileProcessor(
         config=DetectionConfig(
             enable_ml=enable_ml,
             ml_model_dir=getattr(settings, 'ml_model_dir', None),
             confidence_threshold=getattr(settings, 'confidence_threshold', 0.70),
+            execution_mode=detection.execution_mode,
+            process_workers=detection.process_workers,
+            process_batch_size=detection.process_batch_size,
+            ml_batch_size=detection.ml_batch_size,
+            ml_batch_wait_ms=detection.ml_batch_wait_ms,
+            ml_mode=detection.ml_mode,
+            ml_window_chars=detection.ml_window_chars,
         ),
     )
-    logger.info("Created processor instance (enable_ml=%s)", enable_ml)
+    logger.info(
+        "Created processor instance (enable_ml=%s, ml_mode=%s, execution_mode=%s)",
+        enable_ml, detection.ml_mode, detection.execution_mode,
+    )
     return _processor
 
 
@@ -135,6 +161,36 @@ def cleanup_processor() -> None:
             _processor = None
 
 
+async def get_detection_cache() -> DetectionCache | None:
+    """
+    Get or create the worker's detection result cache.
+
+    Returns None when disabled via detection.result_cache_enabled.
+    """
+    global _detection_cache, _detection_cache_ready
+    if _detection_cache_ready:
+        return _detection_cache
+
+    detection = get_settings().detection
+    if detection.result_cache_enabled:
+        cache = DetectionCache(
+            max_entries=detection.result_cache_max_entries,
+            shared_ttl=detection.result_cache_ttl_seconds,
+            use_shared=detection.result_cache_shared,
+        )
+        await cache.initialize()
+        _detection_cache = cache
+    _detection_cache_ready = True
+    return _detection_cache
+
+
+def reset_detection_cache() -> None:
+    """Drop the worker's detection cache (recreated on next use)."""
+    global _detection_cache, _detection_cache_ready
+    _detection_cache = None
+    _detection_cache_ready = False
+
+
 def run_shutdown_callbacks() -> None:
     """
     Run all registered shutdown callbacks.
@@ -143,6 +199,7 @@ def run_shutdown_callbacks() -> None:
     """
     # Always cleanup the processor
     cleanup_processor()
+    reset_detection_cache()
 
     # Run any additional registered callbacks
     for callback in _shutdown_callbacks:
@@ -193,7 +250,12 @@ async def execute_scan_task(
     Returns:
         Result dictionary with scan statistics
     """
-    from openlabels.jobs.inventory import InventoryService, get_folder_path
+    from openlabels.jobs.inventory import (
+        DELTA_SKIP,
+        DELTA_VERIFY,
+        InventoryService,
+        get_folder_path,
+    )
 
     job_id = UUID(payload["job_id"])
     force_full_scan = payload.get("force_full_scan", False)
@@ -266,13 +328,15 @@ async def execute_scan_task(
     adapter = _get_adapter(target.adapter, target.config)
     await adapter.__aenter__()
 
-    # Initialize inventory service for delta scanning (on-demand lookups, no bulk load)
+    # Initialize inventory service for delta scanning (page prefetch + on-demand lookups)
     inventory = InventoryService(session, job.tenant_id, target.id)
+    result_writer = ScanResultWriter(session, inventory, job.tenant_id, job.id)
     folder_stats: dict[str, dict] = {}
 
     # Security: Get max file size limit to prevent DoS via memory exhaustion
     settings = get_settings()
     max_file_size_bytes = settings.detection.max_file_size_mb * 1024 * 1024
+    profiler = _build_profiler(settings)
 
     # Resolve enable_ml: tenant setting overrides server config
     enable_ml: bool = getattr(settings.detection, "enable_ml", True)
@@ -378,6 +442,9 @@ async def execute_scan_task(
                     )
                     # Continue to next path instead of aborting entire scan
 
+        # Detection cache key part, fixed for the whole job
+        cache_fingerprint = detection_fingerprint(enable_ml=enable_ml)
+
         # Build per-file processing function for the pipeline
         async def _process_one_file(file_info: FileInfo, ctx: PipelineContext) -> None:
             """Process a single file — called concurrently by the pipeline."""
@@ -404,49 +471,52 @@ async def execute_scan_task(
                 ctx.stats.files_skipped += 1
                 return
 
-            # Read file content with size limit
-            content = await adapter.read_file(file_info, max_size_bytes=max_file_size_bytes)
-            content_hash = inventory.compute_content_hash(content)
-
-            # Check if file needs scanning (delta mode)
-            should_scan, scan_reason = await inventory.should_scan_file(
-                file_info, content_hash, force_full_scan
-            )
-            if not should_scan:
+            # Delta stage 1: size/mtime/change token against inventory, no read
+            with profile_stage("delta_metadata"):
+                decision, scan_reason = await inventory.check_file_metadata(
+                    file_info, force_full_scan
+                )
+            if decision == DELTA_SKIP:
+                await result_writer.mark_seen(file_info)
                 ctx.stats.files_skipped += 1
-                logger.debug("Skipping unchanged file: %s", file_info.path)
+                ctx.stats.files_skipped_unread += 1
+                logger.debug("Skipping unchanged file (%s): %s", scan_reason, file_info.path)
                 return
 
+            # Read file content with size limit
+            with profile_stage("read"):
+                content = await adapter.read_file(file_info, max_size_bytes=max_file_size_bytes)
+            with profile_stage("hash"):
+                content_hash = inventory.compute_content_hash(content)
+
+            # Delta stage 2: only ambiguous files are decided by content hash
+            if decision == DELTA_VERIFY:
+                with profile_stage("delta_verify"):
+                    should_scan, scan_reason = await inventory.should_scan_file(
+                        file_info, content_hash, force_full_scan
+                    )
+                if not should_scan:
+                    await result_writer.mark_seen(file_info)
+                    ctx.stats.files_skipped += 1
+                    logger.debug("Skipping unchanged file: %s", file_info.path)
+                    return
+
             # Run detection
-            result = await _detect_and_score(content, file_info, target.adapter, enable_ml=enable_ml)
+            with profile_stage("classify"):
+                result = await _detect_and_score_cached(
+                    content, content_hash, file_info, target.adapter,
+                    job.tenant_id, ctx.stats, enable_ml=enable_ml,
+                    fingerprint=cache_fingerprint,
+                )
 
             # Update pipeline stats (all files, regardless of sensitivity)
             ctx.stats.record_result(result["risk_tier"], result["total_entities"])
 
             # Only persist ScanResult + inventory for sensitive files
             if result["total_entities"] > 0:
-                scan_result = ScanResult(
-                    tenant_id=job.tenant_id,
-                    job_id=job.id,
-                    file_path=file_info.path,
-                    file_name=file_info.name,
-                    file_size=file_info.size,
-                    file_modified=file_info.modified,
-                    content_hash=content_hash,
-                    adapter_item_id=file_info.item_id,
-                    risk_score=result["risk_score"],
-                    risk_tier=result["risk_tier"],
-                    entity_counts=result["entity_counts"],
-                    total_entities=result["total_entities"],
-                    exposure_level=file_info.exposure.value,
-                    owner=file_info.owner,
-                    content_score=result.get("content_score"),
-                    exposure_multiplier=result.get("exposure_multiplier"),
-                    co_occurrence_rules=result.get("co_occurrence_rules"),
-                    findings=result.get("findings"),
-                    policy_violations=result.get("policy_violations"),
-                )
-                session.add(scan_result)
+                # Buffered; written in bulk with the file's inventory row
+                with profile_stage("persist"):
+                    scan_result_id = await result_writer.add(file_info, result, content_hash)
 
                 # Execute policy-triggered remediation actions
                 if result.get("policy_violations"):
@@ -455,11 +525,11 @@ async def execute_scan_task(
                             PolicyActionContext,
                             PolicyActionExecutor,
                         )
-                        await session.flush()
+                        await result_writer.flush()
                         action_ctx = PolicyActionContext(
                             file_path=file_info.path,
                             tenant_id=job.tenant_id,
-                            scan_result_id=scan_result.id,
+                            scan_result_id=scan_result_id,
                             risk_tier=result["risk_tier"],
                             violations=result["policy_violations"],
                         )
@@ -482,16 +552,6 @@ async def execute_scan_task(
                 if current_risk is None or RISK_TIER_PRIORITY.get(new_risk, 0) > RISK_TIER_PRIORITY.get(current_risk, 0):
                     folder_stats[folder_path]["highest_risk"] = new_risk
 
-                try:
-                    await inventory.update_file_inventory(
-                        file_info=file_info,
-                        scan_result=scan_result,
-                        content_hash=content_hash,
-                        job_id=job.id,
-                    )
-                except (OSError, RuntimeError, ValueError) as inv_err:
-                    logger.warning("Inventory update failed for %s: %s", file_info.path, inv_err)
-
             # Update job progress
             job.files_scanned = ctx.stats.files_scanned
             job.files_with_pii = ctx.stats.files_with_pii
@@ -533,17 +593,24 @@ async def execute_scan_task(
         # Determine pipeline configuration
         pipeline_config = await _build_pipeline_config(settings, job.tenant_id, session)
 
-        # Run the pipeline
+        # Run the pipeline; buffered results are flushed on every commit
         pipeline = FilePipeline(
             config=pipeline_config,
             process_fn=_process_one_file,
-            commit_fn=session.commit,
+            commit_fn=result_writer.commit_with(session.commit),
             cancellation_fn=lambda: _check_cancellation(session, job_id),
         )
-        pipeline_stats = await pipeline.run(_iter_all_files())
+        files = profile_aiter(_iter_all_files(), "list")
+        if not force_full_scan:
+            # One inventory query per listing page instead of one per file
+            files = inventory.iter_prefetched(files)
+        with use_profiler(profiler):
+            pipeline_stats = await pipeline.run(files)
 
         # Merge pipeline stats into legacy stats dict for backward compat
         stats.update(pipeline_stats.to_dict())
+        if profiler is not None:
+            _attach_profile(profiler, stats, settings, f"scan-{job.id}")
 
         # Handle cancellation detected by pipeline
         if pipeline.cancelled:
@@ -567,6 +634,8 @@ async def execute_scan_task(
             return stats
 
         # Update folder inventory
+        if folder_stats:
+            await inventory.prefetch_folders(list(folder_stats))
         for folder_path, fstats in folder_stats.items():
             try:
                 await inventory.update_folder_inventory(
@@ -627,6 +696,7 @@ async def execute_scan_task(
                 auto_label_stats = await _auto_label_results(session, job)
                 stats["auto_labeled"] = auto_label_stats.get("labeled", 0)
                 stats["auto_label_errors"] = auto_label_stats.get("errors", 0)
+                stats["auto_labels_per_second"] = auto_label_stats.get("labels_per_second", 0.0)
             except PermissionError as e:
                 logger.error(f"Auto-labeling failed - permission denied: {e}")
                 stats["auto_label_error"] = str(e)
@@ -861,12 +931,18 @@ async def _auto_label_results(session: AsyncSession, job: ScanJob) -> dict:
     """
     Automatically apply labels to scan results based on rules.
 
+    Results are labeled in pages of ``labeling.auto_label_batch_size``
+    through a :class:`LabelingExecutor` and committed page by page, with
+    running counts in ``job.progress["auto_label"]``. Only results that
+    are still unlabeled are selected, so re-running after an
+    interruption resumes the work.
+
     Args:
         session: Database session
         job: Completed scan job
 
     Returns:
-        Dict with labeling statistics
+        Dict with labeling statistics, including ``labels_per_second``
     """
     settings = get_settings()
     stats = {"labeled": 0, "errors": 0, "skipped": 0}
@@ -917,52 +993,64 @@ async def _auto_label_results(session: AsyncSession, job: ScanJob) -> dict:
                 if rule.match_value not in entity_type_rules:
                     entity_type_rules[rule.match_value] = (rule, label)
 
-    # Initialize labeling engine
+    def match_label(result: ScanResult) -> SensitivityLabel | None:
+        # Try to match by entity type first (highest priority)
+        if entity_type_rules and result.entity_counts:
+            for entity_type in result.entity_counts.keys():
+                if entity_type in entity_type_rules:
+                    return entity_type_rules[entity_type][1]
+
+        # Fall back to risk tier matching
+        if risk_tier_rules and result.risk_tier in risk_tier_rules:
+            return risk_tier_rules[result.risk_tier][1]
+        if settings.labeling.risk_tier_mapping:
+            # Use settings mapping as fallback with prefetched labels
+            label_name = settings.labeling.risk_tier_mapping.get(result.risk_tier)
+            if label_name and label_name in labels_by_name:
+                return labels_by_name[label_name]
+        return None
+
+    # Initialize labeling engine and executor
     labeling_engine = create_labeling_engine()
+    executor = LabelingExecutor(
+        labeling_engine,
+        local_concurrency=settings.labeling.auto_label_local_concurrency,
+        graph_concurrency=settings.labeling.auto_label_graph_concurrency,
+    )
 
     # Get target for adapter info
     target = await session.get(ScanTarget, job.target_id)
 
-    # Stream unlabeled results in batches to avoid loading all into memory
-    results_query = (
-        select(ScanResult)
-        .where(ScanResult.job_id == job.id)
-        .where(ScanResult.label_applied == False)
-    )
-    result_stream = await session.stream(results_query)
-    has_results = False
+    # Page through unlabeled results by primary key and commit after each
+    # page, so no transaction spans the whole run and a restarted job only
+    # revisits results that are still unlabeled.
+    batch_size = max(1, settings.labeling.auto_label_batch_size)
+    last_id = None
+    processed = 0
+    started = time.monotonic()
 
-    async for partition in result_stream.scalars().partitions(500):
-        for result in partition:
-            has_results = True
-            try:
-                matched_label = None
-                matched_label_name = None
-
-                # Try to match by entity type first (highest priority)
-                if entity_type_rules and result.entity_counts:
-                    for entity_type in result.entity_counts.keys():
-                        if entity_type in entity_type_rules:
-                            rule, label = entity_type_rules[entity_type]
-                            matched_label = label.id
-                            matched_label_name = label.name
-                            break
-
-                # Fall back to risk tier matching
-                if not matched_label:
-                    if risk_tier_rules and result.risk_tier in risk_tier_rules:
-                        rule, label = risk_tier_rules[result.risk_tier]
-                        matched_label = label.id
-                        matched_label_name = label.name
-                    elif settings.labeling.risk_tier_mapping:
-                        # Use settings mapping as fallback with prefetched labels
-                        label_name = settings.labeling.risk_tier_mapping.get(result.risk_tier)
-                        if label_name and label_name in labels_by_name:
-                            label = labels_by_name[label_name]
-                            matched_label = label.id
-                            matched_label_name = label.name
-
-                if not matched_label:
+    try:
+        while True:
+            page_query = (
+                select(ScanResult)
+                .where(ScanResult.job_id == job.id)
+                .where(ScanResult.label_applied == False)
+                .order_by(ScanResult.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                page_query = page_query.where(ScanResult.id > last_id)
+            page = (await session.execute(page_query)).scalars().all()
+            if not page:
+                break
+            last_id = page[-1].id
+            processed += len(page)
+
+            pending: list[tuple[ScanResult, SensitivityLabel]] = []
+            tasks: list[LabelTask] = []
+            for result in page:
+                label = match_label(result)
+                if label is None:
                     stats["skipped"] += 1
                     continue
 
@@ -972,40 +1060,51 @@ async def _auto_label_results(session: AsyncSession, job: ScanJob) -> dict:
                     adapter=target.adapter if target else "filesystem",
                     exposure=ExposureLevel(result.exposure_level) if result.exposure_level else None,
                 )
+                pending.append((result, label))
+                tasks.append(LabelTask(file_info, label.id, label.name))
 
-                # Apply label
-                label_result = await labeling_engine.apply_label(
-                    file_info=file_info,
-                    label_id=matched_label,
-                    label_name=matched_label_name,
-                )
+            label_results = await executor.run(tasks)
 
+            applied_at = datetime.now(timezone.utc)
+            for (result, label), label_result in zip(pending, label_results, strict=True):
                 if label_result.success:
-                    result.current_label_id = matched_label
-                    result.current_label_name = matched_label_name
+                    result.current_label_id = label.id
+                    result.current_label_name = label.name
                     result.label_applied = True
-                    result.label_applied_at = datetime.now(timezone.utc)
+                    result.label_applied_at = applied_at
+                    result.label_error = None
                     stats["labeled"] += 1
-                    logger.info(f"Applied label '{matched_label_name}' to {result.file_path}")
+                    logger.debug(f"Applied label '{label.name}' to {result.file_path}")
                 else:
                     result.label_error = label_result.error
                     stats["errors"] += 1
                     logger.warning(f"Failed to label {result.file_path}: {label_result.error}")
 
-            except PermissionError as e:
-                stats["errors"] += 1
-                logger.error(f"Permission denied auto-labeling {result.file_path}: {e}")
-            except OSError as e:
-                stats["errors"] += 1
-                logger.error(f"OS error auto-labeling {result.file_path}: {e}")
-            except RuntimeError as e:
-                stats["errors"] += 1
-                logger.error(f"Runtime error auto-labeling {result.file_path}: {e}")
+            elapsed = time.monotonic() - started
+            job.progress = {
+                **(job.progress or {}),
+                "auto_label": {
+                    "processed": processed,
+                    "labeled": stats["labeled"],
+                    "errors": stats["errors"],
+                    "skipped": stats["skipped"],
+                    "labels_per_second": round(stats["labeled"] / elapsed, 1) if elapsed else 0.0,
+                },
+            }
+            await session.commit()
+            logger.info(
+                f"Auto-labeling job {job.id}: {processed} results processed, "
+                f"{stats['labeled']} labeled, {stats['errors']} errors"
+            )
+    finally:
+        await labeling_engine.close()
 
-    if not has_results:
+    if not processed:
         logger.info(f"No unlabeled results for job {job.id}")
 
-    await session.commit()
+    elapsed = time.monotonic() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["labels_per_second"] = round(stats["labeled"] / elapsed, 1) if elapsed else 0.0
     return stats
 
 
@@ -1092,6 +1191,36 @@ async def _cloud_label_sync_back(
     return sync_stats
 
 
+def _build_profiler(settings) -> StageProfiler | None:
+    """Create a stage profiler if ``jobs.profiling_enabled`` is set."""
+    jobs = settings.jobs
+    if not jobs.profiling_enabled:
+        return None
+    return StageProfiler(
+        trace_sample_rate=jobs.profiling_trace_sample_rate,
+        max_traces=jobs.profiling_max_traces,
+    )
+
+
+def _attach_profile(profiler: StageProfiler, stats: dict, settings, name: str) -> None:
+    """Add the profile summary to *stats* and write traces if configured."""
+    stats["profile"] = profiler.summary()
+    logger.info("Stage profile for %s:\n%s", name, profiler.format_report())
+
+    trace_dir = settings.jobs.profiling_trace_dir
+    if trace_dir and profiler.traces:
+        try:
+            from pathlib import Path
+
+            trace_file = Path(trace_dir) / f"{name}-traces.jsonl"
+            trace_file.parent.mkdir(parents=True, exist_ok=True)
+            written = profiler.dump_traces(trace_file)
+            stats["profile"]["trace_file"] = str(trace_file)
+            logger.info("Wrote %d file traces for %s to %s", written, name, trace_file)
+        except OSError as e:
+            logger.warning("Could not write profile traces for %s: %s", name, e)
+
+
 async def _build_pipeline_config(settings, tenant_id=None, session=None) -> PipelineConfig:
     """Build pipeline config from settings, with optional tenant overrides.
 
@@ -1147,6 +1276,64 @@ async def _build_pipeline_config(settings, tenant_id=None, session=None) -> Pipe
     return config
 
 
+def detection_fingerprint(enable_ml: bool | None = None) -> str:
+    """
+    Detection cache key part for the current processor and policy packs.
+
+    Computed once per job and passed to ``_detect_and_score_cached``.
+    """
+    return (
+        f"{get_processor(enable_ml=enable_ml).fingerprint}"
+        f"{policy_fingerprint(get_policy_engine())}"
+    )
+
+
+async def _detect_and_score_cached(
+    content: bytes,
+    content_hash: str,
+    file_info,
+    adapter_type: str,
+    tenant_id,
+    stats,
+    enable_ml: bool | None = None,
+    fingerprint: str | None = None,
+) -> dict:
+    """
+    ``_detect_and_score`` behind the content-hash detection cache.
+
+    Identical bytes (same extension, exposure, tenant and detector/model
+    fingerprint) are detected once; every further copy costs one lookup.
+    Hits and misses are counted on *stats* (a PipelineStats). Pass the
+    job's ``detection_fingerprint`` as *fingerprint*; it is computed here
+    only when omitted.
+    """
+    cache = await get_detection_cache()
+    if cache is None:
+        result = await _detect_and_score(content, file_info, adapter_type, enable_ml=enable_ml)
+        stats.record_detection(result.get("text_length", 0), result.get("ml_chars", 0))
+        return result
+
+    exposure = getattr(file_info, "exposure", None) or ExposureLevel.PRIVATE
+    if fingerprint is None:
+        fingerprint = detection_fingerprint(enable_ml=enable_ml)
+    key = detection_cache_key(
+        tenant_id, fingerprint, file_info.path, getattr(exposure, "value", exposure), content_hash,
+    )
+    result, hit = await cache.get_or_compute(
+        key,
+        lambda: _detect_and_score(content, file_info, adapter_type, enable_ml=enable_ml),
+    )
+    if hit:
+        stats.detection_cache_hits += 1
+        record_file_processed(adapter_type)
+        if result.get("entity_counts"):
+            record_entities_found(result["entity_counts"])
+    else:
+        stats.detection_cache_misses += 1
+        stats.record_detection(result.get("text_length", 0), result.get("ml_chars", 0))
+    return result
+
+
 async def _detect_and_score(
     content: bytes,
     file_info,
@@ -1194,6 +1381,8 @@ async def _detect_and_score(
             record_entities_found(result.entity_counts)
         if result.processing_time_ms:
             record_processing_duration(adapter_type, result.processing_time_ms / 1000.0)
+        if result.text_length:
+            record_detection_chars(result.text_length, result.ml_chars)
 
         # Build findings list from spans (for detailed reporting)
         findings = []
@@ -1212,19 +1401,24 @@ async def _detect_and_score(
         policy_violations = None
         if result.spans:
             try:
-                entity_matches = [
-                    EntityMatch(
-                        entity_type=span.entity_type,
-                        value=span.text,
-                        confidence=span.confidence,
-                        start=span.start,
-                        end=span.end,
-                        source=span.detector,
-                    )
-                    for span in result.spans
-                ]
                 engine = get_policy_engine()
-                policy_result = engine.evaluate(entity_matches)
+                # Already evaluated by the detection pipeline, except for
+                # streamed files (detected window by window)
+                policy_result = result.policy_result
+                if policy_result is None:
+                    entity_matches = [
+                        EntityMatch(
+                            entity_type=span.entity_type,
+                            value=span.text,
+                            confidence=span.confidence,
+                            start=span.start,
+                            end=span.end,
+                            source=span.detector,
+                        )
+                        for span in result.spans
+                    ]
+                    with profile_stage("policy"):
+                        policy_result = engine.evaluate(entity_matches)
                 if policy_result.is_sensitive:
                     policy_data = policy_result.to_dict()
                     # Map policy names to their framework categories
@@ -1264,6 +1458,8 @@ async def _detect_and_score(
             "findings": findings_dict,
             "policy_violations": policy_violations,
             "processing_time_ms": result.processing_time_ms,
+            "text_length": result.text_length,
+            "ml_chars": result.ml_chars,
             "error": result.error,
         }
 
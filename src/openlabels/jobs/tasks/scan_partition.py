@@ -2,7 +2,8 @@
 Partitioned scan task for horizontal scaling.
 
 Processes a single partition of a fan-out scan job. Each partition scans
-a slice of the target keyspace (e.g. an S3 prefix range) independently.
+a slice of the target keyspace (an S3 prefix range, a set of directory
+subtrees, a batch of SharePoint sites or OneDrive users) independently.
 When a partition completes, it checks if all sibling partitions are done
 and aggregates results into the parent ScanJob if so.
 """
@@ -10,24 +11,31 @@ and aggregates results into the parent ScanJob if so.
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from uuid import UUID
 
 from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from openlabels.adapters.base import PartitionSpec
+from openlabels.adapters.base import FileInfo, PartitionSpec
 from openlabels.core.constants import RISK_TIER_PRIORITY
+from openlabels.core.profiling import profile_aiter, profile_stage, use_profiler
 from openlabels.core.types import AdapterType, JobStatus
 from openlabels.exceptions import JobError
+from openlabels.jobs.partition_split import PartitionSplitter
 from openlabels.jobs.pipeline import FilePipeline, PipelineConfig, PipelineContext
+from openlabels.jobs.result_writer import ScanResultWriter
 from openlabels.jobs.tasks.scan import (
     CANCELLATION_CHECK_INTERVAL,
+    _attach_profile,
     _build_pipeline_config,
+    _build_profiler,
     _check_cancellation,
-    _detect_and_score,
+    _detect_and_score_cached,
     _get_adapter,
     cleanup_processor,
+    detection_fingerprint,
     get_processor,
 )
 from openlabels.server.config import get_settings
@@ -63,7 +71,12 @@ async def execute_scan_partition_task(
     Returns:
         Result dictionary with partition scan statistics
     """
-    from openlabels.jobs.inventory import InventoryService, get_folder_path
+    from openlabels.jobs.inventory import (
+        DELTA_SKIP,
+        DELTA_VERIFY,
+        InventoryService,
+        get_folder_path,
+    )
 
     partition_id = UUID(payload["partition_id"])
     job_id = UUID(payload["job_id"])
@@ -114,10 +127,12 @@ async def execute_scan_partition_task(
 
     # Initialize inventory
     inventory = InventoryService(session, job.tenant_id, target.id)
+    result_writer = ScanResultWriter(session, inventory, job.tenant_id, job.id)
     folder_stats: dict[str, dict] = {}
 
     settings = get_settings()
     max_file_size_bytes = settings.detection.max_file_size_mb * 1024 * 1024
+    profiler = _build_profiler(settings)
     force_full_scan = job.progress.get("force_full_scan", False) if job.progress else False
 
     stats = {
@@ -137,6 +152,9 @@ async def execute_scan_partition_task(
         # Get target path
         target_path = target.config.get("path") or target.config.get("site_id") or ""
 
+        # Detection cache key part, fixed for the whole partition
+        cache_fingerprint = detection_fingerprint()
+
         # Build per-file processing function for the pipeline
         async def _process_one_file(file_info, ctx: PipelineContext) -> None:
             folder_path = get_folder_path(file_info.path)
@@ -157,43 +175,46 @@ async def execute_scan_partition_task(
                 ctx.stats.files_skipped += 1
                 return
 
-            # Read + hash + delta check
-            content = await adapter.read_file(file_info, max_size_bytes=max_file_size_bytes)
-            content_hash = inventory.compute_content_hash(content)
-
-            should_scan, scan_reason = await inventory.should_scan_file(
-                file_info, content_hash, force_full_scan
-            )
-            if not should_scan:
+            # Metadata-only delta check first; read only when it can't decide
+            with profile_stage("delta_metadata"):
+                decision, scan_reason = await inventory.check_file_metadata(
+                    file_info, force_full_scan
+                )
+            if decision == DELTA_SKIP:
+                await result_writer.mark_seen(file_info)
                 ctx.stats.files_skipped += 1
+                ctx.stats.files_skipped_unread += 1
                 return
 
+            # Read + hash + content delta check
+            with profile_stage("read"):
+                content = await adapter.read_file(file_info, max_size_bytes=max_file_size_bytes)
+            with profile_stage("hash"):
+                content_hash = inventory.compute_content_hash(content)
+
+            if decision == DELTA_VERIFY:
+                with profile_stage("delta_verify"):
+                    should_scan, scan_reason = await inventory.should_scan_file(
+                        file_info, content_hash, force_full_scan
+                    )
+                if not should_scan:
+                    await result_writer.mark_seen(file_info)
+                    ctx.stats.files_skipped += 1
+                    return
+
             # Detection
-            result = await _detect_and_score(content, file_info, target.adapter)
-
-            # Save result
-            scan_result = ScanResult(
-                tenant_id=job.tenant_id,
-                job_id=job.id,
-                file_path=file_info.path,
-                file_name=file_info.name,
-                file_size=file_info.size,
-                file_modified=file_info.modified,
-                content_hash=content_hash,
-                adapter_item_id=file_info.item_id,
-                risk_score=result["risk_score"],
-                risk_tier=result["risk_tier"],
-                entity_counts=result["entity_counts"],
-                total_entities=result["total_entities"],
-                exposure_level=file_info.exposure.value,
-                owner=file_info.owner,
-                content_score=result.get("content_score"),
-                exposure_multiplier=result.get("exposure_multiplier"),
-                co_occurrence_rules=result.get("co_occurrence_rules"),
-                findings=result.get("findings"),
-                policy_violations=result.get("policy_violations"),
-            )
-            session.add(scan_result)
+            with profile_stage("classify"):
+                result = await _detect_and_score_cached(
+                    content, content_hash, file_info, target.adapter,
+                    job.tenant_id, ctx.stats, fingerprint=cache_fingerprint,
+                )
+
+            # Save result (buffered; inventory only tracks sensitive files)
+            with profile_stage("persist"):
+                scan_result_id = await result_writer.add(
+                    file_info, result, content_hash,
+                    update_inventory=result["total_entities"] > 0,
+                )
 
             # Policy actions
             if result.get("policy_violations"):
@@ -202,11 +223,11 @@ async def execute_scan_partition_task(
                         PolicyActionContext,
                         PolicyActionExecutor,
                     )
-                    await session.flush()
+                    await result_writer.flush()
                     action_ctx = PolicyActionContext(
                         file_path=file_info.path,
                         tenant_id=job.tenant_id,
-                        scan_result_id=scan_result.id,
+                        scan_result_id=scan_result_id,
                         risk_tier=result["risk_tier"],
                         violations=result["policy_violations"],
                     )
@@ -227,16 +248,6 @@ async def execute_scan_partition_task(
                 if current_risk is None or RISK_TIER_PRIORITY.get(new_risk, 0) > RISK_TIER_PRIORITY.get(current_risk, 0):
                     folder_stats[folder_path]["highest_risk"] = new_risk
 
-                try:
-                    await inventory.update_file_inventory(
-                        file_info=file_info,
-                        scan_result=scan_result,
-                        content_hash=content_hash,
-                        job_id=job.id,
-                    )
-                except (OSError, RuntimeError, ValueError) as inv_err:
-                    logger.warning("Inventory update failed for %s: %s", file_info.path, inv_err)
-
             # Update partition progress
             partition.files_scanned = ctx.stats.files_scanned
             partition.files_with_pii = ctx.stats.files_with_pii
@@ -267,15 +278,28 @@ async def execute_scan_partition_task(
         pipeline = FilePipeline(
             config=pipeline_config,
             process_fn=_process_one_file,
-            commit_fn=session.commit,
+            commit_fn=result_writer.commit_with(session.commit),
             cancellation_fn=lambda: _check_cancellation(session, job_id),
         )
-        pipeline_stats = await pipeline.run(
-            adapter.list_files(target_path, partition=spec)
-        )
+        files = _iter_partition_files(adapter, target.adapter, target_path, spec)
+        splitter = _build_splitter(settings, adapter, target, target_path, spec, job, partition)
+        if splitter is not None:
+            files = splitter.iter_files(files)
+        files = profile_aiter(files, "list")
+        if not force_full_scan:
+            files = inventory.iter_prefetched(files)
+        with use_profiler(profiler):
+            pipeline_stats = await pipeline.run(files)
 
         # Merge stats from pipeline
         stats.update(pipeline_stats.to_dict())
+        if splitter is not None:
+            stats["partition_splits"] = splitter.splits
+            stats["files_per_second"] = round(splitter.files_per_second, 2)
+        if profiler is not None:
+            _attach_profile(
+                profiler, stats, settings, f"scan-{job.id}-partition-{partition.partition_index}",
+            )
 
         # Handle cancellation
         if pipeline.cancelled:
@@ -289,6 +313,8 @@ async def execute_scan_partition_task(
             return {**stats, "status": JobStatus.CANCELLED}
 
         # Update folder inventory
+        if folder_stats:
+            await inventory.prefetch_folders(list(folder_stats))
         for folder_path, fstats in folder_stats.items():
             try:
                 await inventory.update_folder_inventory(
@@ -340,6 +366,73 @@ async def execute_scan_partition_task(
         cleanup_processor()
 
 
+def _build_splitter(
+    settings,
+    adapter,
+    target: ScanTarget,
+    target_path: str,
+    spec: PartitionSpec,
+    job: ScanJob,
+    partition: ScanPartition,
+) -> PartitionSplitter | None:
+    """Work stealing for key-range partitions, if enabled for this adapter."""
+    jobs = settings.jobs
+    if not jobs.partition_split_enabled:
+        return None
+    if target.adapter not in (AdapterType.S3, AdapterType.GCS, AdapterType.AZURE_BLOB):
+        return None
+    if spec.listing_roots():
+        return None
+
+    async def _publish(remaining: PartitionSpec, tail: PartitionSpec) -> None:
+        # Own session: the scan's session is busy with the pipeline
+        from openlabels.jobs.coordinator import ScanCoordinator
+        from openlabels.server.db import get_session_context
+
+        async with get_session_context() as split_session:
+            coordinator = ScanCoordinator(split_session, job.tenant_id)
+            await coordinator.split_partition(job.id, partition.id, remaining, tail)
+
+    return PartitionSplitter(
+        adapter,
+        target_path,
+        spec,
+        _publish,
+        split_after_seconds=jobs.partition_split_after_seconds,
+        target_seconds=jobs.partition_split_target_seconds,
+        check_interval_seconds=jobs.partition_split_check_seconds,
+        min_tail_files=jobs.partition_split_min_files,
+        inclusive_start=target.adapter == AdapterType.GCS,
+    )
+
+
+async def _iter_partition_files(
+    adapter,
+    adapter_type: str,
+    target_path: str,
+    spec: PartitionSpec,
+) -> AsyncIterator[FileInfo]:
+    """
+    Enumerate the files of one partition.
+
+    Object stores and the filesystem adapter take the spec directly.
+    SharePoint/OneDrive partitions are batches of sites/users, listed one
+    after another; a site or user that fails to list is logged and skipped
+    so it does not fail the rest of the batch.
+    """
+    if adapter_type not in (AdapterType.SHAREPOINT, AdapterType.ONEDRIVE):
+        async for file_info in adapter.list_files(target_path, partition=spec):
+            yield file_info
+        return
+
+    for resource in spec.listing_roots() or [target_path]:
+        try:
+            async for file_info in adapter.list_files(resource):
+                yield file_info
+        except (ConnectionError, OSError, RuntimeError, ValueError) as e:
+            logger.warning("Failed to list %s %s: %s", adapter_type, resource, e)
+
+
 async def _check_and_aggregate(
     session: AsyncSession,
     job: ScanJob,
@@ -2,6 +2,8 @@
 Worker process for job execution.
 
 Features:
+- Event-driven dispatch: LISTEN/NOTIFY wake-ups, batched job claims,
+  adaptive fallback polling
 - Configurable concurrency at runtime via shared state
 - Graceful shutdown with signal handlers
 - Per-tenant job isolation
@@ -18,7 +20,7 @@ import signal
 import socket
 import time
 from typing import Any, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -29,13 +31,16 @@ except ImportError:
         """Placeholder when redis is not installed."""
         pass
 
+from openlabels.core.types import JobStatus
 from openlabels.exceptions import JobError
-from openlabels.jobs.queue import JobQueue, dequeue_next_job
+from openlabels.jobs.notify import JobNotificationListener, PollBackoff
+from openlabels.jobs.queue import JobQueue, dequeue_jobs, release_jobs
 from openlabels.jobs.tasks.label import execute_label_task
 from openlabels.jobs.tasks.label_sync import execute_label_sync_task
 from openlabels.jobs.tasks.scan import execute_scan_task, run_shutdown_callbacks
 from openlabels.server.config import get_settings
 from openlabels.server.db import get_session_context, init_db
+from openlabels.server.models import JobQueue as JobQueueModel
 
 logger = logging.getLogger(__name__)
 
@@ -355,6 +360,11 @@ class Worker:
 
     Supports runtime concurrency adjustment via Redis-based state management.
     State is automatically synced to Redis (or in-memory fallback) with TTL-based expiration.
+
+    A single dispatcher coroutine claims jobs for the whole process, up to
+    the number of idle slots per round trip, and hands them to the slot
+    coroutines through an in-process queue. It sleeps on Postgres
+    LISTEN between claims, polling with adaptive backoff as a fallback.
     """
 
     def __init__(self, concurrency: int | None = None) -> None:
@@ -373,6 +383,12 @@ class Worker:
         self._concurrency_check_interval = 5  # Check for concurrency changes every 5 seconds
         self._state_manager: WorkerStateManager | None = None
 
+        # Dispatch: claimed job IDs waiting for an idle slot
+        self._ready: asyncio.Queue[UUID] = asyncio.Queue()
+        self._idle_slots = 0
+        self._slot_available = asyncio.Event()
+        self._listener: JobNotificationListener | None = None
+
     async def start(self) -> None:
         """Start the worker loop with dynamic concurrency support."""
         settings = get_settings()
@@ -409,6 +425,9 @@ class Worker:
             for i in range(self.concurrency)
         ]
 
+        # Start dispatcher (claims jobs for the worker slots)
+        dispatch_task = asyncio.create_task(self._dispatch_loop())
+
         # Start concurrency monitor (also handles heartbeat)
         monitor_task = asyncio.create_task(self._concurrency_monitor())
 
@@ -424,11 +443,13 @@ class Worker:
         try:
             # Wait for all workers
             await asyncio.gather(
-                *self._worker_tasks, monitor_task, reclaimer_task, cleanup_task,
-                partition_task,
+                *self._worker_tasks, dispatch_task, monitor_task, reclaimer_task,
+                cleanup_task, partition_task,
                 return_exceptions=True
             )
         finally:
+            await self._release_ready_jobs()
+
             # Clean up state on shutdown
             if self._state_manager:
                 await self._state_manager.delete_state(self.worker_id)
@@ -438,6 +459,11 @@ class Worker:
         logger.info(f"Worker {self.worker_id} shutting down...")
         self.running = False
 
+        # Wake the dispatcher so it can exit promptly
+        self._slot_available.set()
+        if self._listener:
+            self._listener.notify()
+
         # Schedule async state update for "stopping" status
         # The actual state deletion happens in start()'s finally block
         if self._state_manager:
@@ -645,51 +671,179 @@ class Worker:
 
         logger.info(f"Concurrency adjusted: {old_concurrency} -> {new_concurrency}")
 
+    async def _dispatch_loop(self) -> None:
+        """
+        Claim jobs for idle slots, waking on NOTIFY or the fallback poll.
+
+        Claims at most ``min(idle slots, dispatch_batch_size)`` jobs per
+        round trip. After a partial (or empty) claim it sleeps until a job
+        is announced or the poll interval, which backs off exponentially
+        while the queue stays empty, elapses.
+        """
+        settings = get_settings()
+        jobs_settings = settings.jobs
+        batch_size = max(1, jobs_settings.dispatch_batch_size)
+        backoff = PollBackoff(
+            jobs_settings.dispatch_poll_min_seconds,
+            jobs_settings.dispatch_poll_max_seconds,
+        )
+
+        if jobs_settings.dispatch_listen_enabled and not settings.database.pgbouncer_mode:
+            self._listener = JobNotificationListener()
+            await self._listener.start()
+
+        try:
+            while self.running:
+                free_slots = self._idle_slots - self._ready.qsize()
+                if free_slots <= 0:
+                    # All slots busy: wait for one to free up
+                    self._slot_available.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self._slot_available.wait(), timeout=self._concurrency_check_interval,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                limit = min(free_slots, batch_size)
+                claimed = 0
+                try:
+                    async with get_session_context() as session:
+                        jobs = await dequeue_jobs(session, self.worker_id, limit=limit)
+                        job_ids = [job.id for job in jobs]
+                    for job_id in job_ids:
+                        self._ready.put_nowait(job_id)
+                    claimed = len(job_ids)
+                except SQLAlchemyError as e:
+                    logger.error(
+                        f"Worker {self.worker_id} database error while claiming jobs: "
+                        f"{type(e).__name__}: {e}"
+                    )
+                except OSError as e:
+                    logger.error(
+                        f"Worker {self.worker_id} OS error (network/filesystem issue): "
+                        f"{type(e).__name__}: {e}"
+                    )
+                except RuntimeError as e:
+                    logger.error(
+                        f"Worker {self.worker_id} runtime error while claiming jobs: "
+                        f"{type(e).__name__}: {e}"
+                    )
+
+                if claimed:
+                    backoff.reset()
+                    if claimed == limit:
+                        continue  # Likely more waiting; claim again once slots free up
+                    delay = backoff.delay
+                else:
+                    delay = backoff.delay
+                    backoff.increase()
+
+                if self._listener is not None:
+                    if await self._listener.wait(delay):
+                        backoff.reset()
+                else:
+                    await asyncio.sleep(delay)
+        finally:
+            if self._listener is not None:
+                await self._listener.close()
+                self._listener = None
+
+    async def _release_ready_jobs(self) -> None:
+        """Return jobs claimed but never started to the queue."""
+        job_ids: list[UUID] = []
+        while not self._ready.empty():
+            job_ids.append(self._ready.get_nowait())
+        if not job_ids:
+            return
+
+        try:
+            async with get_session_context() as session:
+                released = await release_jobs(session, job_ids, self.worker_id)
+            logger.info(f"Worker {self.worker_id} released {released} unstarted jobs")
+        except (SQLAlchemyError, ConnectionError, OSError, RuntimeError) as e:
+            logger.warning(
+                f"Failed to release {len(job_ids)} claimed jobs - they will be reclaimed "
+                f"as stuck: {type(e).__name__}: {e}"
+            )
+
     async def _worker_loop(self, worker_num: int) -> None:
         """
         Main worker loop for processing jobs.
 
+        Takes job IDs claimed by the dispatcher and executes them, each in
+        its own session.
+
         Args:
             worker_num: Worker number for logging
         """
         worker_tag = f"{self.worker_id}:{worker_num}"
 
-        while self.running:
-            # Check if this worker should exit due to concurrency reduction
-            active_workers = len([t for t in self._worker_tasks if not t.done()])
-            if worker_num >= self.target_concurrency and active_workers > self.target_concurrency:
-                logger.info(f"Worker {worker_tag} exiting (concurrency reduced)")
-                return
-
-            try:
-                async with get_session_context() as session:
-                    job = await dequeue_next_job(session, worker_tag)
-
-                    if job:
+        pending_get: asyncio.Task[UUID] | None = None
+        try:
+            while self.running:
+                # Check if this worker should exit due to concurrency reduction
+                active_workers = len([t for t in self._worker_tasks if not t.done()])
+                if worker_num >= self.target_concurrency and active_workers > self.target_concurrency:
+                    logger.info(f"Worker {worker_tag} exiting (concurrency reduced)")
+                    return
+
+                self._idle_slots += 1
+                self._slot_available.set()
+                try:
+                    # The get() outlives a timeout: cancelling it (as wait_for
+                    # does) can lose a job ID it already took on Python < 3.12
+                    if pending_get is None:
+                        pending_get = asyncio.create_task(self._ready.get())
+                    done, _ = await asyncio.wait(
+                        {pending_get}, timeout=self._concurrency_check_interval,
+                    )
+                finally:
+                    self._idle_slots -= 1
+                if not done:
+                    continue
+                job_id = pending_get.result()
+                pending_get = None
+
+                try:
+                    async with get_session_context() as session:
+                        job = await session.get(JobQueueModel, job_id)
+                        if job is None or job.status != JobStatus.RUNNING:
+                            # Cancelled or reclaimed between claim and start
+                            logger.debug(f"Worker {worker_tag} skipping job {job_id}: no longer running")
+                            continue
+
+                        job.worker_id = worker_tag
                         queue = JobQueue(session, job.tenant_id)
                         await self._execute_job(session, queue, job)
 
-            except SQLAlchemyError as e:
-                logger.error(
-                    f"Worker {worker_tag} database error while polling for jobs: "
-                    f"{type(e).__name__}: {e}"
-                )
-            except OSError as e:
-                logger.error(
-                    f"Worker {worker_tag} OS error (network/filesystem issue): "
-                    f"{type(e).__name__}: {e}"
-                )
-            except asyncio.CancelledError:
-                logger.info(f"Worker {worker_tag} task cancelled during shutdown")
-                raise
-            except RuntimeError as e:
-                logger.error(
-                    f"Worker {worker_tag} runtime error during job polling: "
-                    f"{type(e).__name__}: {e}"
-                )
-
-            # Sleep between poll cycles
-            await asyncio.sleep(1)
+                except SQLAlchemyError as e:
+                    logger.error(
+                        f"Worker {worker_tag} database error while running job {job_id}: "
+                        f"{type(e).__name__}: {e}"
+                    )
+                except OSError as e:
+                    logger.error(
+                        f"Worker {worker_tag} OS error (network/filesystem issue): "
+                        f"{type(e).__name__}: {e}"
+                    )
+                except asyncio.CancelledError:
+                    logger.info(f"Worker {worker_tag} task cancelled during shutdown")
+                    raise
+                except RuntimeError as e:
+                    logger.error(
+                        f"Worker {worker_tag} runtime error while running job {job_id}: "
+                        f"{type(e).__name__}: {e}"
+                    )
+        finally:
+            if pending_get is not None:
+                if not pending_get.done():
+                    # Queue.get() only removes an item once it returns
+                    pending_get.cancel()
+                elif not pending_get.cancelled():
+                    # Taken but never started: hand back for _release_ready_jobs
+                    self._ready.put_nowait(pending_get.result())
 
     async def _execute_job(self, session, queue: JobQueue, job) -> None:
         """
@@ -5,6 +5,7 @@ Provides:
 - LabelingEngine: Unified interface for applying sensitivity labels
 - MIPClient: Microsoft Information Protection SDK wrapper
 - LabelCache: Thread-safe label caching with TTL
+- LabelingExecutor: Concurrent, batched label application for bulk labeling
 - Cross-platform fallbacks (Office metadata, PDF metadata, Sidecar)
 """
 
@@ -16,6 +17,7 @@ from .engine import (
     create_labeling_engine,
     get_label_cache,
 )
+from .executor import LabelingExecutor, LabelTask
 from .mip import (
     LabelingResult,
     MIPClient,
@@ -28,6 +30,8 @@ __all__ = [
     "LabelingEngine",
     "LabelResult",
     "create_labeling_engine",
+    "LabelingExecutor",
+    "LabelTask",
     # Caching
     "LabelCache",
     "CachedLabel",
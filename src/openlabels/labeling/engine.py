@@ -21,10 +21,8 @@ Features:
 from __future__ import annotations
 
 import asyncio
-import io
 import json
 import logging
-import os
 import re
 import threading
 import zipfile
@@ -39,6 +37,7 @@ from openlabels.adapters.base import FileInfo
 from openlabels.adapters.graph_client import GraphClient
 from openlabels.core.types import AdapterType
 from openlabels.exceptions import GraphAPIError
+from openlabels.labeling.ooxml import read_part, replace_parts
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +45,9 @@ from openlabels.core.constants import MAX_DECOMPRESSED_SIZE
 
 _MAX_FILE_BYTES = MAX_DECOMPRESSED_SIZE
 
+# Maximum requests per JSON $batch call (Graph service limit)
+GRAPH_BATCH_LIMIT = 20
+
 
 # LABEL CACHE
 @dataclass
@@ -225,26 +227,18 @@ class LocalLabelWriter:
 
         Reads the Office Open XML package, inserts / updates the
         ``OpenLabels_*`` and ``Classification`` custom properties, and
-        writes the modified package back to *file_path*.
+        replaces only those parts in *file_path* (see ``ooxml.replace_parts``);
+        the other members are copied without recompression.
         """
         try:
-            file_size = os.path.getsize(file_path)
-            if file_size > _MAX_FILE_BYTES:
-                return LabelResult(
-                    success=False,
-                    error=f"File too large ({file_size / 1024 / 1024:.0f} MB, limit {_MAX_FILE_BYTES // 1024 // 1024} MB)",
-                )
-
-            with open(file_path, "rb") as f:
-                content = f.read()
-
-            with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                file_list = zf.namelist()
+            custom_props_path = "docProps/custom.xml"
+            parts: dict[str, bytes] = {}
 
+            with zipfile.ZipFile(file_path, "r") as zf:
                 # Read existing custom properties or create new
-                custom_props_path = "docProps/custom.xml"
-                if custom_props_path in file_list:
-                    custom_xml = zf.read(custom_props_path).decode("utf-8")
+                existing = read_part(zf, custom_props_path, _MAX_FILE_BYTES)
+                if existing is not None:
+                    custom_xml = existing.decode("utf-8")
                 else:
                     custom_xml = (
                         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
@@ -286,28 +280,24 @@ class LocalLabelWriter:
                 # Insert before closing tag
                 custom_xml = custom_xml.replace("</Properties>", new_props + "</Properties>")
 
-                # Write updated file
-                output = io.BytesIO()
-                with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as out_zf:
-                    for item in file_list:
-                        if item != custom_props_path:
-                            out_zf.writestr(item, zf.read(item))
-                    out_zf.writestr(custom_props_path, custom_xml.encode("utf-8"))
-
-                    # Update content types if custom.xml is new
-                    if custom_props_path not in file_list:
-                        content_types = zf.read("[Content_Types].xml").decode("utf-8")
-                        if "custom.xml" not in content_types:
-                            content_types = content_types.replace(
-                                "</Types>",
-                                '<Override PartName="/docProps/custom.xml" '
-                                'ContentType="application/vnd.openxmlformats-officedocument.'
-                                'custom-properties+xml"/></Types>',
-                            )
-                            out_zf.writestr("[Content_Types].xml", content_types.encode("utf-8"))
-
-                with open(file_path, "wb") as f:
-                    f.write(output.getvalue())
+                parts[custom_props_path] = custom_xml.encode("utf-8")
+
+                # Update content types if custom.xml is new
+                if existing is None:
+                    content_types = read_part(zf, "[Content_Types].xml", _MAX_FILE_BYTES)
+                    if content_types is None:
+                        raise zipfile.BadZipFile("Missing [Content_Types].xml")
+                    content_types_xml = content_types.decode("utf-8")
+                    if "custom.xml" not in content_types_xml:
+                        content_types_xml = content_types_xml.replace(
+                            "</Types>",
+                            '<Override PartName="/docProps/custom.xml" '
+                            'ContentType="application/vnd.openxmlformats-officedocument.'
+                            'custom-properties+xml"/></Types>',
+                        )
+                        parts["[Content_Types].xml"] = content_types_xml.encode("utf-8")
+
+            replace_parts(file_path, parts)
 
             return LabelResult(
                 success=True,
@@ -420,45 +410,26 @@ class LocalLabelWriter:
     def remove_office_label(self, file_path: str) -> LabelResult:
         """Remove sensitivity label from an Office document's custom properties."""
         try:
-            file_size = os.path.getsize(file_path)
-            if file_size > _MAX_FILE_BYTES:
-                return LabelResult(
-                    success=False,
-                    error=f"File too large ({file_size / 1024 / 1024:.0f} MB, limit {_MAX_FILE_BYTES // 1024 // 1024} MB)",
-                )
-
-            with open(file_path, "rb") as f:
-                content = f.read()
-
-            with zipfile.ZipFile(io.BytesIO(content), "r") as zf:
-                file_list = zf.namelist()
-                custom_props_path = "docProps/custom.xml"
+            custom_props_path = "docProps/custom.xml"
 
-                if custom_props_path not in file_list:
-                    return LabelResult(success=True, method="no_label_found")
+            with zipfile.ZipFile(file_path, "r") as zf:
+                existing = read_part(zf, custom_props_path, _MAX_FILE_BYTES)
+            if existing is None:
+                return LabelResult(success=True, method="no_label_found")
 
-                custom_xml = zf.read(custom_props_path).decode("utf-8")
+            custom_xml = existing.decode("utf-8")
 
-                # Remove OpenLabels and Classification properties
-                custom_xml = re.sub(
-                    r'<property[^>]*name="OpenLabels_[^"]*"[^>]*>.*?</property>\s*',
-                    '', custom_xml, flags=re.DOTALL,
-                )
-                custom_xml = re.sub(
-                    r'<property[^>]*name="Classification"[^>]*>.*?</property>\s*',
-                    '', custom_xml, flags=re.DOTALL,
-                )
-
-                # Write updated file
-                output = io.BytesIO()
-                with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as out_zf:
-                    for item in file_list:
-                        if item != custom_props_path:
-                            out_zf.writestr(item, zf.read(item))
-                    out_zf.writestr(custom_props_path, custom_xml.encode("utf-8"))
+            # Remove OpenLabels and Classification properties
+            custom_xml = re.sub(
+                r'<property[^>]*name="OpenLabels_[^"]*"[^>]*>.*?</property>\s*',
+                '', custom_xml, flags=re.DOTALL,
+            )
+            custom_xml = re.sub(
+                r'<property[^>]*name="Classification"[^>]*>.*?</property>\s*',
+                '', custom_xml, flags=re.DOTALL,
+            )
 
-                with open(file_path, "wb") as f:
-                    f.write(output.getvalue())
+            replace_parts(file_path, {custom_props_path: custom_xml.encode("utf-8")})
 
             return LabelResult(success=True, method="office_metadata_removed")
 
@@ -918,6 +889,32 @@ class LabelingEngine:
             return LabelResult(success=True, method="sidecar_removed")
 
     # Graph API operations (SharePoint / OneDrive)
+    @staticmethod
+    def _drive_item_endpoint(file_info: FileInfo) -> str | None:
+        """Graph driveItem path from *file_info*, or None if it needs a share-URL lookup.
+
+        item_id may be "sites/{site_id}/drive/items/{item_id}" or just the
+        item ID, combined with site_id (SharePoint) or user_id (OneDrive).
+        """
+        item_id = file_info.item_id or ""
+        if "/drive/items/" in item_id:
+            return f"/{item_id}"
+        if file_info.adapter == "sharepoint":
+            if file_info.site_id and item_id:
+                return f"/sites/{file_info.site_id}/drive/items/{item_id}"
+        elif file_info.user_id and item_id:
+            return f"/users/{file_info.user_id}/drive/items/{item_id}"
+        return None
+
+    @staticmethod
+    def _label_payload(label_id: str) -> dict:
+        return {
+            "sensitivityLabel": {
+                "labelId": label_id,
+                "assignmentMethod": "standard",
+            }
+        }
+
     async def _apply_graph_label(
         self,
         file_info: FileInfo,
@@ -926,50 +923,20 @@ class LabelingEngine:
     ) -> LabelResult:
         """Apply label using Graph API for SharePoint/OneDrive files."""
         try:
-            # Build Graph API endpoint from file_info attributes
-            # item_id format may be: "sites/{site_id}/drive/items/{item_id}" or just item ID
-            item_id = file_info.item_id or ""
-
-            # Determine the Graph API endpoint
-            if file_info.adapter == "sharepoint":
-                # SharePoint: /sites/{site_id}/drive/items/{item_id}
-                if "/drive/items/" in item_id:
-                    endpoint = f"/{item_id}"
-                elif file_info.site_id and item_id:
-                    endpoint = f"/sites/{file_info.site_id}/drive/items/{item_id}"
-                else:
-                    # Try to resolve from URL using shares API
-                    endpoint = await self._resolve_share_url(file_info.path)
-                    if not endpoint:
-                        return LabelResult(
-                            success=False,
-                            label_id=label_id,
-                            error="Could not resolve SharePoint file ID",
-                        )
-            else:
-                # OneDrive: /users/{user_id}/drive/items/{item_id}
-                if "/drive/items/" in item_id:
-                    endpoint = f"/{item_id}"
-                elif file_info.user_id and item_id:
-                    endpoint = f"/users/{file_info.user_id}/drive/items/{item_id}"
-                else:
-                    endpoint = await self._resolve_share_url(file_info.path)
-                    if not endpoint:
-                        return LabelResult(
-                            success=False,
-                            label_id=label_id,
-                            error="Could not resolve OneDrive file ID",
-                        )
+            endpoint = self._drive_item_endpoint(file_info)
+            if endpoint is None:
+                # Try to resolve from URL using shares API
+                endpoint = await self._resolve_share_url(file_info.path)
+                if not endpoint:
+                    kind = "SharePoint" if file_info.adapter == "sharepoint" else "OneDrive"
+                    return LabelResult(
+                        success=False,
+                        label_id=label_id,
+                        error=f"Could not resolve {kind} file ID",
+                    )
 
             # Apply sensitivity label via PATCH
-            label_payload = {
-                "sensitivityLabel": {
-                    "labelId": label_id,
-                    "assignmentMethod": "standard",
-                }
-            }
-
-            response = await self._graph_request("PATCH", endpoint, label_payload)
+            response = await self._graph_request("PATCH", endpoint, self._label_payload(label_id))
 
             if response.status_code in (200, 204):
                 return LabelResult(
@@ -995,6 +962,77 @@ class LabelingEngine:
                 error=str(e),
             )
 
+    async def apply_graph_labels(
+        self,
+        items: list[tuple[FileInfo, str, str | None]],
+    ) -> list[LabelResult]:
+        """
+        Apply labels to up to ``GRAPH_BATCH_LIMIT`` SharePoint/OneDrive files
+        with one JSON ``$batch`` call.
+
+        Items whose driveItem path needs a share-URL lookup, and
+        sub-requests that were throttled or hit a server error, go through
+        :meth:`_apply_graph_label` one by one so GraphClient's retry and
+        backoff apply to them.
+
+        Args:
+            items: (file_info, label_id, label_name) tuples
+
+        Returns:
+            One LabelResult per item, in input order
+        """
+        if len(items) > GRAPH_BATCH_LIMIT:
+            raise ValueError(f"At most {GRAPH_BATCH_LIMIT} items per batch")
+
+        results: list[LabelResult | None] = [None] * len(items)
+        requests = []
+        for i, (file_info, label_id, _label_name) in enumerate(items):
+            endpoint = self._drive_item_endpoint(file_info)
+            if endpoint is not None:
+                requests.append({
+                    "id": str(i),
+                    "method": "PATCH",
+                    "url": endpoint,
+                    "body": self._label_payload(label_id),
+                    "headers": {"Content-Type": "application/json"},
+                })
+
+        if requests:
+            try:
+                response = await self._graph_request("POST", "/$batch", {"requests": requests})
+                responses = response.json().get("responses", []) if response.status_code == 200 else []
+            except GraphAPIError as e:
+                logger.warning(f"Graph label batch of {len(requests)} failed, retrying singly: {e}")
+                responses = []
+
+            for sub in responses:
+                try:
+                    i = int(sub["id"])
+                    _file_info, label_id, label_name = items[i]
+                except (KeyError, ValueError, IndexError):
+                    continue
+                status = sub.get("status", 0)
+                if status in (200, 204):
+                    results[i] = LabelResult(
+                        success=True,
+                        label_id=label_id,
+                        label_name=label_name,
+                        method="graph_api",
+                    )
+                elif status != 429 and status < 500:
+                    error_msg = ((sub.get("body") or {}).get("error") or {}).get("message", status)
+                    results[i] = LabelResult(
+                        success=False,
+                        label_id=label_id,
+                        error=f"Graph API error: {error_msg}",
+                    )
+
+        # Anything the batch did not settle is retried one request at a time
+        return [
+            result if result is not None else await self._apply_graph_label(*item)
+            for result, item in zip(results, items, strict=True)
+        ]
+
     async def _resolve_share_url(self, url: str) -> str | None:
         """Resolve a SharePoint/OneDrive URL to a Graph API driveItem path."""
         try:
@@ -0,0 +1,154 @@
+"""
+In-place part replacement for Office Open XML packages.
+
+Labeling an Office document changes one or two small XML parts
+(``docProps/custom.xml``, ``[Content_Types].xml``), but rebuilding the
+ZIP with ``zipfile`` inflates and re-deflates every member. Instead,
+``replace_parts`` copies each unchanged member's local header and
+compressed bytes verbatim, deflates only the replaced parts, and writes
+a new central directory. The result is streamed to a temporary file in
+the same directory, so a corrupt package is rejected before the original
+is touched and memory use is bounded by the replaced parts.
+
+The temporary file then atomically replaces the original (``os.replace``)
+after taking over its owner, group, mode and extended attributes (which
+include POSIX ACLs and SELinux labels on Linux), so a crash never leaves a
+half-written document. Two cases cannot be handled by swapping in a new
+inode: a file with other hard links (they would keep the old content) and
+a file whose owner this process cannot assign. Those are rewritten in
+place from the first byte that differs instead, which keeps the inode but
+is not atomic: a crash or full disk during the copy can leave the
+document truncated or corrupt.
+
+Usage:
+    with zipfile.ZipFile(path) as zf:
+        custom = read_part(zf, "docProps/custom.xml", max_bytes=limit)
+    replace_parts(path, {"docProps/custom.xml": new_custom})
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Chunk size for copying raw member bytes
+_COPY_CHUNK = 1024 * 1024
+
+
+def read_part(zf: zipfile.ZipFile, name: str, max_bytes: int) -> bytes | None:
+    """Read part *name* from *zf*, or None if the package has no such part.
+
+    Raises:
+        zipfile.BadZipFile: If the part declares more than *max_bytes*
+            uncompressed (decompression bomb protection).
+    """
+    try:
+        info = zf.getinfo(name)
+    except KeyError:
+        return None
+    if info.file_size > max_bytes:
+        raise zipfile.BadZipFile(f"{name} too large ({info.file_size} bytes, limit {max_bytes})")
+    return zf.read(info)
+
+
+def _copy_range(src, dst, length: int) -> None:
+    while length > 0:
+        chunk = src.read(min(_COPY_CHUNK, length))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated ZIP member data")
+        dst.write(chunk)
+        length -= len(chunk)
+
+
+def replace_parts(file_path: str | os.PathLike, parts: dict[str, bytes]) -> None:
+    """Replace or add the given parts of the package at *file_path*.
+
+    Members not named in *parts* keep their compressed bytes, CRC,
+    timestamps and attributes. Replaced members keep their position in
+    the central directory; new ones are appended. *parts* values are
+    written deflated.
+
+    Raises:
+        zipfile.BadZipFile: If *file_path* is not a valid ZIP archive
+        OSError: If the file or its directory is not writable
+    """
+    path = Path(file_path)
+    # Leading bytes the rewritten package shares with the original
+    unchanged = 0
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(path, "rb") as src, zipfile.ZipFile(src) as zin, os.fdopen(fd, "wb") as dst:
+            infos = zin.infolist()
+            # A member's raw bytes (local header, data and any data
+            # descriptor) run up to the next member or the central directory.
+            bounds = sorted({info.header_offset for info in infos} | {zin.start_dir})
+            span_end = dict(zip(bounds, bounds[1:], strict=False))
+
+            with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zout:
+                zout.comment = zin.comment
+                in_place = True
+                for info in infos:
+                    if info.filename in parts:
+                        in_place = False
+                        continue
+                    out_info = copy.copy(info)
+                    out_info.header_offset = dst.tell()
+                    in_place = in_place and out_info.header_offset == info.header_offset
+                    src.seek(info.header_offset)
+                    _copy_range(src, dst, span_end[info.header_offset] - info.header_offset)
+                    if in_place:
+                        unchanged = dst.tell()
+                    zout.filelist.append(out_info)
+                    zout.NameToInfo[out_info.filename] = out_info
+
+                # New parts are written after the copied members
+                zout.start_dir = dst.tell()
+                for name, data in parts.items():
+                    zout.writestr(name, data)
+
+                # Central directory in the original member order
+                written = {info.filename: info for info in zout.filelist}
+                order = dict.fromkeys([info.filename for info in infos] + list(parts))
+                zout.filelist[:] = [written[name] for name in order]
+
+        st = path.stat()
+        if st.st_nlink == 1 and _take_over_metadata(path, tmp, st):
+            with open(tmp, "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        else:
+            _copy_back(tmp, path, unchanged)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _take_over_metadata(path: Path, tmp: str, st: os.stat_result) -> bool:
+    """Give *tmp* the owner, mode and xattrs of *path*; False if the owner can't be set."""
+    if hasattr(os, "chown") and (st.st_uid, st.st_gid) != _owner(tmp):
+        try:
+            os.chown(tmp, st.st_uid, st.st_gid)
+        except PermissionError:
+            return False
+    # Mode, flags and extended attributes; the times are reset below, as
+    # the content did change
+    shutil.copystat(path, tmp)
+    os.utime(tmp)
+    return True
+
+
+def _owner(file_path: str) -> tuple[int, int]:
+    st = os.stat(file_path)
+    return st.st_uid, st.st_gid
+
+
+def _copy_back(tmp: str, path: Path, unchanged: int) -> None:
+    """Rewrite *path* in place from *tmp*, skipping the first *unchanged* bytes."""
+    with open(tmp, "rb") as src, open(path, "r+b") as dst:
+        src.seek(unchanged)
+        dst.seek(unchanged)
+        shutil.copyfileobj(src, dst, _COPY_CHUNK)
+        dst.truncate()
@@ -8,7 +8,8 @@ Pipeline::
         → RawAccessEvent
             → filter invalid actions
                 → resolve monitored_file_id
-                    → INSERT FileAccessEvent row
+                    → COPY file_access_events rows
+                        → aggregated monitored_files counter UPDATE
 
 The harvester tracks a per-provider checkpoint timestamp so that each
 cycle only fetches *new* events.  Checkpoints are updated only after
@@ -24,21 +25,17 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from openlabels.monitoring.ingest import (
+    VALID_DB_ACTIONS,
+    persist_access_events,
+    resolve_monitored_files,
+)
 from openlabels.monitoring.providers.base import EventProvider, RawAccessEvent
-from openlabels.server.models import FileAccessEvent, MonitoredFile
 
 logger = logging.getLogger(__name__)
 
-# Valid action values for the DB access_action enum.
-# AccessAction.UNKNOWN ("unknown") is NOT in the DB enum and must be
-# filtered out before persistence.
-_VALID_DB_ACTIONS = frozenset({
-    "read", "write", "delete", "rename", "permission_change", "execute",
-})
-
 
 class EventHarvester:
     """Periodically collect events from providers and persist to DB.
@@ -96,7 +93,8 @@ class EventHarvester:
            thread executor (the providers use synchronous subprocess calls).
         2. Filter out events with invalid action values.
         3. Resolve ``file_path → monitored_file_id`` via a DB lookup.
-        4. Batch-insert ``FileAccessEvent`` rows.
+        4. COPY ``FileAccessEvent`` rows and apply per-file counters
+           in one aggregated UPDATE.
         5. Update the checkpoint for each provider (only on commit).
         """
         from openlabels.server.db import get_session_context
@@ -193,7 +191,7 @@ class EventHarvester:
                 continue
 
             # Filter out events with actions not in the DB enum
-            valid_events = [e for e in raw_events if e.action in _VALID_DB_ACTIONS]
+            valid_events = [e for e in raw_events if e.action in VALID_DB_ACTIONS]
             skipped = len(raw_events) - len(valid_events)
             if skipped:
                 logger.debug(
@@ -235,7 +233,12 @@ class EventHarvester:
         session: AsyncSession,
         events: list[RawAccessEvent],
     ) -> int:
-        """Map RawAccessEvents to FileAccessEvent rows and add to session."""
+        """Bulk-write RawAccessEvents as FileAccessEvent rows.
+
+        Events are copied into ``file_access_events`` on the session's
+        connection and ``access_count`` / ``last_event_at`` are applied
+        per file in bulk; both commit with the cycle's transaction.
+        """
         if not events:
             return 0
 
@@ -245,46 +248,13 @@ class EventHarvester:
             session, file_paths,
         )
 
-        persisted = 0
-        for event in events:
-            monitored = path_to_monitored.get(event.file_path)
-            if monitored is None:
-                # File is not in the monitored registry — skip
-                logger.debug(
-                    "Skipping event for unmonitored file: %s",
-                    event.file_path,
-                )
-                continue
-
-            row = FileAccessEvent(
-                tenant_id=monitored.tenant_id,
-                monitored_file_id=monitored.id,
-                file_path=event.file_path,
-                action=event.action,
-                success=event.success,
-                user_sid=event.user_sid,
-                user_name=event.user_name,
-                user_domain=event.user_domain,
-                process_name=event.process_name,
-                process_id=event.process_id,
-                event_id=event.event_id,
-                event_source=event.event_source,
-                event_time=event.event_time,
-                raw_event=event.raw if self._store_raw else None,
-            )
-            session.add(row)
-            persisted += 1
-
-            # Update monitored file stats
-            monitored.access_count = (monitored.access_count or 0) + 1
-            if (
-                monitored.last_event_at is None
-                or event.event_time > monitored.last_event_at
-            ):
-                monitored.last_event_at = event.event_time
-
-        if persisted:
-            await session.flush()
+        persisted = await persist_access_events(
+            session, events, path_to_monitored, store_raw=self._store_raw,
+        )
+        skipped = len(events) - persisted
+        if skipped:
+            # Files not in the monitored registry are skipped
+            logger.debug("Skipped %d events for unmonitored files", skipped)
 
         return persisted
 
@@ -292,12 +262,12 @@ class EventHarvester:
     async def _resolve_monitored_files(
         session: AsyncSession,
         file_paths: set[str],
-    ) -> dict[str, MonitoredFile]:
-        """Batch-resolve file paths to MonitoredFile instances.
+    ) -> dict:
+        """Batch-resolve file paths to ``(id, tenant_id, file_path)`` rows.
 
-        Returns a dict mapping ``file_path`` → ``MonitoredFile`` for
-        paths that have a row in the database.  Paths not found are
-        simply omitted.
+        Returns a dict mapping ``file_path`` → row for paths that have a
+        ``MonitoredFile`` in the database.  Paths not found are simply
+        omitted.
 
         Note: in a multi-tenant deployment, the same file_path may
         exist under multiple tenants.  We return only the first match
@@ -306,22 +276,7 @@ class EventHarvester:
         that owns the monitored file.  If multiple tenants monitor
         the same path, the first tenant (by ID) wins.
         """
-        if not file_paths:
-            return {}
-
-        result = await session.execute(
-            select(MonitoredFile)
-            .where(MonitoredFile.file_path.in_(file_paths))
-            .order_by(MonitoredFile.tenant_id)
-        )
-        rows = result.scalars().all()
-        # First-match-wins: only the first tenant's MonitoredFile is
-        # used for each path.  This is deterministic across cycles.
-        mapping: dict[str, MonitoredFile] = {}
-        for row in rows:
-            if row.file_path not in mapping:
-                mapping[row.file_path] = row
-        return mapping
+        return await resolve_monitored_files(session, file_paths)
 
 
 # Convenience coroutine for lifespan registration
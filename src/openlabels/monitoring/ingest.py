@@ -0,0 +1,299 @@
+"""
+Bulk persistence of access events.
+
+Shared by ``EventHarvester`` and ``EventStreamManager``. Instead of one
+ORM object per event plus per-row ``MonitoredFile`` mutations, a flush:
+
+1. resolves file paths to ``(monitored_file_id, tenant_id)`` with one
+   column-only SELECT,
+2. writes all events with a single ``COPY`` into ``file_access_events``
+   (asyncpg), falling back to an executemany INSERT on other drivers,
+3. applies per-file ``access_count`` / ``last_event_at`` deltas with one
+   ``UPDATE ... FROM (VALUES ...)`` per chunk of files.
+
+Also provides ``AdaptiveFlushSizer``, which sizes stream flushes from the
+measured ingest rate and the current backlog.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from openlabels.monitoring.providers.base import RawAccessEvent
+from openlabels.server.models import FileAccessEvent, MonitoredFile, generate_uuid
+
+logger = logging.getLogger(__name__)
+
+# Valid action values for the DB access_action enum.
+# AccessAction.UNKNOWN ("unknown") is NOT in the DB enum and must be
+# filtered out before persistence.
+VALID_DB_ACTIONS = frozenset(
+    {
+        "read",
+        "write",
+        "delete",
+        "rename",
+        "permission_change",
+        "execute",
+    }
+)
+
+# Column order for COPY; collected_at is left to its server default.
+EVENT_COLUMNS = (
+    "id",
+    "tenant_id",
+    "monitored_file_id",
+    "file_path",
+    "action",
+    "success",
+    "user_sid",
+    "user_name",
+    "user_domain",
+    "process_name",
+    "process_id",
+    "event_id",
+    "event_source",
+    "event_time",
+    "raw_event",
+)
+
+# Files per UPDATE ... FROM (VALUES ...) statement (3 bind params each)
+_STATS_CHUNK = 5000
+
+
+@dataclass
+class FileStats:
+    """Per-file counter delta accumulated over one flush."""
+
+    count: int = 0
+    last_event_at: datetime | None = None
+
+    def add(self, event_time: datetime) -> None:
+        self.count += 1
+        if self.last_event_at is None or event_time > self.last_event_at:
+            self.last_event_at = event_time
+
+
+async def resolve_monitored_files(
+    session: AsyncSession,
+    file_paths: Iterable[str],
+) -> dict[str, Any]:
+    """Batch-resolve file paths to ``(id, tenant_id, file_path)`` rows.
+
+    Only the three columns are loaded -- no ORM identity map entries.
+    If several tenants monitor the same path, the first tenant (by ID)
+    wins, deterministically across flushes.
+    """
+    file_paths = set(file_paths)
+    if not file_paths:
+        return {}
+
+    result = await session.execute(
+        select(MonitoredFile.id, MonitoredFile.tenant_id, MonitoredFile.file_path)
+        .where(MonitoredFile.file_path.in_(file_paths))
+        .order_by(MonitoredFile.tenant_id)
+    )
+    mapping: dict[str, Any] = {}
+    for row in result:
+        if row.file_path not in mapping:
+            mapping[row.file_path] = row
+    return mapping
+
+
+def build_event_rows(
+    events: Iterable[RawAccessEvent],
+    path_to_monitored: dict[str, Any],
+    *,
+    store_raw: bool = False,
+) -> tuple[list[tuple], dict[UUID, FileStats]]:
+    """Turn events into COPY records (``EVENT_COLUMNS`` order) and file deltas.
+
+    Events for unmonitored paths or with actions outside the DB enum are
+    skipped. ``raw_event`` is serialized to JSON text for the jsonb column.
+    """
+    records: list[tuple] = []
+    stats: dict[UUID, FileStats] = {}
+
+    for event in events:
+        if event.action not in VALID_DB_ACTIONS:
+            continue
+        monitored = path_to_monitored.get(event.file_path)
+        if monitored is None:
+            continue
+
+        raw = json.dumps(event.raw, default=str) if store_raw and event.raw else None
+        records.append(
+            (
+                generate_uuid(),
+                monitored.tenant_id,
+                monitored.id,
+                event.file_path,
+                event.action,
+                event.success,
+                event.user_sid,
+                event.user_name,
+                event.user_domain,
+                event.process_name,
+                event.process_id,
+                event.event_id,
+                event.event_source,
+                event.event_time,
+                raw,
+            )
+        )
+
+        file_stats = stats.get(monitored.id)
+        if file_stats is None:
+            file_stats = stats[monitored.id] = FileStats()
+        file_stats.add(event.event_time)
+
+    return records, stats
+
+
+async def copy_access_events(session: AsyncSession, records: list[tuple]) -> None:
+    """Write event records into ``file_access_events``.
+
+    Uses asyncpg ``COPY`` on the session's own connection, so the rows
+    commit or roll back with the session. The session must already have
+    executed a statement (the monitored-file lookup does) so the
+    transaction is open on that connection.
+    """
+    if not records:
+        return
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    if hasattr(driver, "copy_records_to_table"):
+        await driver.copy_records_to_table(
+            FileAccessEvent.__tablename__,
+            records=records,
+            columns=EVENT_COLUMNS,
+        )
+        return
+
+    # Other drivers (tests, SQLite): executemany INSERT
+    rows = []
+    for record in records:
+        row = dict(zip(EVENT_COLUMNS, record, strict=True))
+        if row["raw_event"] is not None:
+            row["raw_event"] = json.loads(row["raw_event"])
+        rows.append(row)
+    await session.execute(insert(FileAccessEvent.__table__), rows)
+
+
+async def apply_file_stats(session: AsyncSession, stats: dict[UUID, FileStats]) -> None:
+    """Add per-file counts and advance ``last_event_at`` in bulk."""
+    items = list(stats.items())
+    for start in range(0, len(items), _STATS_CHUNK):
+        chunk = items[start : start + _STATS_CHUNK]
+        values_sql = ", ".join(
+            f"(CAST(:id_{i} AS uuid), CAST(:n_{i} AS integer), CAST(:t_{i} AS timestamptz))"
+            for i in range(len(chunk))
+        )
+        params: dict[str, Any] = {}
+        for i, (file_id, file_stats) in enumerate(chunk):
+            params[f"id_{i}"] = file_id
+            params[f"n_{i}"] = file_stats.count
+            params[f"t_{i}"] = file_stats.last_event_at
+
+        await session.execute(
+            text(f"""
+                UPDATE monitored_files AS mf
+                   SET access_count = COALESCE(mf.access_count, 0) + v.n,
+                       last_event_at = GREATEST(mf.last_event_at, v.last_event_at)
+                  FROM (VALUES {values_sql}) AS v(id, n, last_event_at)
+                 WHERE mf.id = v.id
+            """),
+            params,
+        )
+
+
+async def persist_access_events(
+    session: AsyncSession,
+    events: list[RawAccessEvent],
+    path_to_monitored: dict[str, Any],
+    *,
+    store_raw: bool = False,
+) -> int:
+    """COPY events and apply file counters; returns the number persisted.
+
+    Callers are responsible for committing the session.
+    """
+    records, stats = build_event_rows(events, path_to_monitored, store_raw=store_raw)
+    if not records:
+        return 0
+    await copy_access_events(session, records)
+    await apply_file_stats(session, stats)
+    return len(records)
+
+
+class AdaptiveFlushSizer:
+    """Size stream flushes from measured throughput and backlog.
+
+    Tracks an exponentially weighted ingest rate (events/second of DB
+    time) and targets flushes that take about *target_seconds*, clamped
+    to ``[min_size, max_size]``. When the backlog is larger than the
+    target, the whole backlog (up to *max_size*) is flushed at once --
+    larger COPYs amortize the per-flush round trips exactly when the
+    writer is falling behind.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 500,
+        max_size: int = 20_000,
+        target_seconds: float = 0.5,
+        smoothing: float = 0.3,
+    ) -> None:
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.target_seconds = target_seconds
+        self.smoothing = smoothing
+        self.rate: float | None = None  # events/second, None until measured
+        self.last_flush_size = 0
+        self.last_flush_seconds = 0.0
+
+    @property
+    def target_size(self) -> int:
+        """Flush size expected to take about ``target_seconds``."""
+        if self.rate is None:
+            return self.min_size
+        size = int(self.rate * self.target_seconds)
+        return max(self.min_size, min(self.max_size, size))
+
+    def next_size(self, backlog: int) -> int:
+        """How many buffered events the next flush should take."""
+        if backlog > self.target_size:
+            return min(backlog, self.max_size)
+        return backlog
+
+    def should_flush(self, backlog: int) -> bool:
+        """Whether the backlog is large enough to flush before the interval."""
+        return backlog >= self.target_size
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def record(self, size: int, started: float) -> None:
+        """Fold one completed flush into the rate estimate."""
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        self.last_flush_size = size
+        self.last_flush_seconds = elapsed
+        if size <= 0:
+            return
+        rate = size / elapsed
+        if self.rate is None:
+            self.rate = rate
+        else:
+            self.rate += self.smoothing * (rate - self.rate)
@@ -8,8 +8,13 @@ performs batched database writes.  Runs alongside the existing
 
 Design:
 * Each streaming provider runs in its own ``asyncio.Task``.
-* Events are buffered in-memory and flushed to the database either
-  when the buffer reaches *batch_size* or every *flush_interval* seconds.
+* Events are buffered in-memory and drained by a single flush task,
+  woken when the backlog reaches the adaptive flush size or every
+  *flush_interval* seconds.
+* Each flush is one ``COPY`` plus one aggregated ``monitored_files``
+  update (see :mod:`openlabels.monitoring.ingest`).  Flush size tracks
+  the measured ingest rate and grows with the backlog, between
+  *batch_size* and *max_batch_size*.
 * Integrates with ``ScanTriggerBuffer`` to queue real-time scans.
 """
 
@@ -19,16 +24,16 @@ import asyncio
 import logging
 from typing import Protocol, runtime_checkable
 
+from openlabels.monitoring.ingest import (
+    VALID_DB_ACTIONS,
+    AdaptiveFlushSizer,
+    persist_access_events,
+    resolve_monitored_files,
+)
 from openlabels.monitoring.providers.base import RawAccessEvent
 
 logger = logging.getLogger(__name__)
 
-# Valid action values for the DB access_action enum (shared with harvester).
-_VALID_DB_ACTIONS = frozenset({
-    "read", "write", "delete", "rename", "permission_change", "execute",
-})
-
-
 
 @runtime_checkable
 class StreamProvider(Protocol):
@@ -66,6 +71,8 @@ class EventStreamManager:
         providers: list[StreamProvider],
         *,
         batch_size: int = 500,
+        max_batch_size: int = 20_000,
+        flush_target_seconds: float = 0.5,
         flush_interval: float = 5.0,
         max_buffer_size: int = 50_000,
         scan_trigger: object | None = None,
@@ -77,11 +84,18 @@ class EventStreamManager:
         self._max_buffer_size = max_buffer_size
         self._scan_trigger = scan_trigger
         self._change_providers = change_providers or []
+        self._sizer = AdaptiveFlushSizer(
+            min_size=batch_size,
+            max_size=max_batch_size,
+            target_seconds=flush_target_seconds,
+        )
 
         # Shared event buffer (append-only from provider tasks, drained
         # by the flush task — guarded by an asyncio.Lock)
         self._buffer: list[RawAccessEvent] = []
         self._buffer_lock = asyncio.Lock()
+        # Set by readers when the backlog reaches the flush size
+        self._flush_wanted = asyncio.Event()
 
         # Stats
         self.total_events_received: int = 0
@@ -112,10 +126,11 @@ class EventStreamManager:
         tasks.append(flush_task)
 
         logger.info(
-            "EventStreamManager started: %d providers, batch_size=%d, "
+            "EventStreamManager started: %d providers, batch_size=%d..%d, "
             "flush_interval=%.1fs",
             len(self._providers),
-            self._batch_size,
+            self._sizer.min_size,
+            self._sizer.max_size,
             self._flush_interval,
         )
 
@@ -123,12 +138,13 @@ class EventStreamManager:
             # Wait for shutdown
             await shutdown_event.wait()
         finally:
-            # Cancel all tasks
+            # Cancel the readers; the flush task is woken instead, so a
+            # chunk it is persisting is never abandoned mid-write
             for t in tasks:
-                if not t.done():
+                if t is not flush_task and not t.done():
                     t.cancel()
+            self._flush_wanted.set()
 
-            # Wait for tasks to finish with timeout
             await asyncio.gather(*tasks, return_exceptions=True)
 
             # Final flush
@@ -186,9 +202,10 @@ class EventStreamManager:
                             for cp in self._change_providers:
                                 cp.notify(event.file_path, event.action)
 
-                # Flush immediately if buffer exceeds batch size
-                if len(self._buffer) >= self._batch_size:
-                    await self._flush_buffer()
+                # Wake the flush task once the backlog is worth a flush;
+                # readers never write to the DB themselves.
+                if self._sizer.should_flush(len(self._buffer)):
+                    self._flush_wanted.set()
 
         except asyncio.CancelledError:
             pass
@@ -201,123 +218,107 @@ class EventStreamManager:
         self,
         shutdown_event: asyncio.Event,
     ) -> None:
-        """Periodically flush the event buffer to the database."""
+        """Flush the buffer when signalled by a reader or on the interval.
+
+        This is the only task that writes to the database, so flushes
+        never overlap and each one sees the whole backlog.
+        """
         try:
             while not shutdown_event.is_set():
                 try:
                     await asyncio.wait_for(
-                        shutdown_event.wait(),
+                        self._flush_wanted.wait(),
                         timeout=self._flush_interval,
                     )
-                    break  # Shutdown signalled
                 except asyncio.TimeoutError:
                     pass
+                self._flush_wanted.clear()
 
+                if shutdown_event.is_set():
+                    break  # run() does the final flush
                 await self._flush_buffer()
         except asyncio.CancelledError:
             pass
 
     async def _flush_buffer(self) -> None:
-        """Drain the buffer and persist events to the database."""
-        async with self._buffer_lock:
-            if not self._buffer:
-                return
-            batch = list(self._buffer)
-            self._buffer.clear()
+        """Drain the buffer to the database in adaptively sized chunks.
 
-        if not batch:
-            return
+        Each chunk is sized by ``AdaptiveFlushSizer`` from the current
+        backlog.  On failure the chunk is put back at the front of the
+        buffer (best-effort) and draining stops until the next wake-up.
+        """
+        while True:
+            async with self._buffer_lock:
+                size = self._sizer.next_size(len(self._buffer))
+                if size == 0:
+                    return
+                batch = self._buffer[:size]
+                del self._buffer[:size]
+
+            started = self._sizer.start()
+            try:
+                count = await self._persist_events(batch)
+            except asyncio.CancelledError:
+                # run() itself was cancelled; keep the chunk for a later flush
+                self._rebuffer(batch)
+                raise
+            except Exception:  # noqa: BLE001 — catch-all for flush resilience
+                self._rebuffer(batch)
+                logger.error("Stream flush failed", exc_info=True)
+                return
 
-        try:
-            count = await self._persist_events(batch)
+            self._sizer.record(len(batch), started)
             self.total_events_flushed += count
             self.total_flush_cycles += 1
 
             if count > 0:
                 logger.debug(
-                    "Stream flush: %d events persisted (cycle %d)",
+                    "Stream flush: %d/%d events persisted in %.3fs (cycle %d)",
                     count,
+                    len(batch),
+                    self._sizer.last_flush_seconds,
                     self.total_flush_cycles,
                 )
-        except Exception:  # noqa: BLE001 — catch-all for flush resilience
-            # Re-buffer events on failure (best-effort)
-            async with self._buffer_lock:
-                headroom = self._max_buffer_size - len(self._buffer)
-                re_buffered = batch[:headroom]
-                self._buffer[:0] = re_buffered
-                dropped = len(batch) - len(re_buffered)
-                if dropped:
-                    self.total_events_dropped += dropped
-            logger.error("Stream flush failed", exc_info=True)
+
+    def _rebuffer(self, batch: list[RawAccessEvent]) -> None:
+        """Put an unpersisted chunk back at the front of the buffer (best-effort).
+
+        Synchronous, so it cannot be interrupted by cancellation; events
+        beyond the buffer's headroom are counted as dropped.
+        """
+        headroom = self._max_buffer_size - len(self._buffer)
+        re_buffered = batch[:max(headroom, 0)]
+        self._buffer[:0] = re_buffered
+        dropped = len(batch) - len(re_buffered)
+        if dropped:
+            self.total_events_dropped += dropped
 
     async def _persist_events(
         self, events: list[RawAccessEvent],
     ) -> int:
         """Write events to the database.
 
-        Mirrors ``EventHarvester._persist_events`` — resolves monitored
-        files from the DB and creates ``FileAccessEvent`` rows.
+        Same path as ``EventHarvester._persist_events``: one column-only
+        monitored-file lookup, one ``COPY`` of the event rows and one
+        aggregated ``monitored_files`` update, in a single transaction.
         """
-        from sqlalchemy import select
-
         from openlabels.server.db import get_session_context
-        from openlabels.server.models import FileAccessEvent, MonitoredFile
 
-        valid_events = [e for e in events if e.action in _VALID_DB_ACTIONS]
+        valid_events = [e for e in events if e.action in VALID_DB_ACTIONS]
         if not valid_events:
             return 0
 
-        persisted = 0
-
         async with get_session_context() as session:
-            # Batch-resolve file paths to MonitoredFile rows
-            file_paths = {e.file_path for e in valid_events}
-            result = await session.execute(
-                select(MonitoredFile)
-                .where(MonitoredFile.file_path.in_(file_paths))
-                .order_by(MonitoredFile.tenant_id)
+            path_to_monitored = await resolve_monitored_files(
+                session, {e.file_path for e in valid_events},
+            )
+            persisted = await persist_access_events(
+                session, valid_events, path_to_monitored,
             )
-            rows = result.scalars().all()
-            path_to_monitored: dict[str, MonitoredFile] = {}
-            for row in rows:
-                if row.file_path not in path_to_monitored:
-                    path_to_monitored[row.file_path] = row
-
-            for event in valid_events:
-                monitored = path_to_monitored.get(event.file_path)
-                if monitored is None:
-                    continue
-
-                session.add(FileAccessEvent(
-                    tenant_id=monitored.tenant_id,
-                    monitored_file_id=monitored.id,
-                    file_path=event.file_path,
-                    action=event.action,
-                    success=event.success,
-                    user_sid=event.user_sid,
-                    user_name=event.user_name,
-                    user_domain=event.user_domain,
-                    process_name=event.process_name,
-                    process_id=event.process_id,
-                    event_id=event.event_id,
-                    event_source=event.event_source,
-                    event_time=event.event_time,
-                ))
-                persisted += 1
-
-                # Update monitored file stats
-                monitored.access_count = (monitored.access_count or 0) + 1
-                if (
-                    monitored.last_event_at is None
-                    or event.event_time > monitored.last_event_at
-                ):
-                    monitored.last_event_at = event.event_time
-
             await session.commit()
 
         return persisted
 
-
     def get_stats(self) -> dict:
         """Return current stream manager statistics."""
         return {
@@ -326,5 +327,8 @@ class EventStreamManager:
             "total_events_dropped": self.total_events_dropped,
             "total_flush_cycles": self.total_flush_cycles,
             "buffer_size": len(self._buffer),
+            "flush_size": self._sizer.target_size,
+            "ingest_rate": round(self._sizer.rate or 0.0, 1),
+            "last_flush_seconds": round(self._sizer.last_flush_seconds, 4),
             "providers": [p.name for p in self._providers],
         }
@@ -92,6 +92,15 @@ class InMemoryCache:
             self._hits += 1
             return value
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values; missing or expired keys are omitted."""
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in cache with optional TTL."""
         async with self._lock:
@@ -260,6 +269,31 @@ class RedisCache:
             self._misses += 1
             return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values with one MGET; missing keys are omitted."""
+        if not self._connected or not self._client or not keys:
+            return {}
+
+        try:
+            values = await self._client.mget([self._make_key(k) for k in keys])
+        except (RedisError, ConnectionError, OSError, TimeoutError) as e:
+            # Redis errors should be logged for monitoring
+            logger.warning(f"Redis mget error for {len(keys)} keys: {type(e).__name__}: {e}")
+            self._misses += len(keys)
+            return {}
+
+        found = {}
+        for key, value in zip(keys, values, strict=True):
+            if value is None:
+                self._misses += 1
+                continue
+            self._hits += 1
+            try:
+                found[key] = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                found[key] = value
+        return found
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in Redis with optional TTL."""
         if not self._connected or not self._client:
@@ -448,6 +482,12 @@ class CacheManager:
             return None
         return await self._backend.get(key)
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache; missing keys are omitted."""
+        if not self._enabled:
+            return {}
+        return await self._backend.get_many(keys)
+
     async def set(
         self,
         key: str,
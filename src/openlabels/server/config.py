@@ -115,6 +115,10 @@ class AuthSettings(BaseSettings):
     # If not set, tokens are stored in plaintext (a warning is logged on startup).
     session_encryption_key: str | None = None
 
+    # Pre-resolve SIDs found in stored security descriptors at startup so
+    # the first ACL and access-event views don't wait on Graph.
+    sid_cache_warmup: bool = False
+
     @property
     def authority(self) -> str | None:
         if self.tenant_id:
@@ -251,6 +255,11 @@ class LabelingSettings(BaseSettings):
     sync_interval_hours: int = 24  # How often to auto-sync labels
     cache: LabelCacheSettings = Field(default_factory=LabelCacheSettings)
     mip: MipSettings = Field(default_factory=MipSettings)
+    # Auto-labeling executor: results are labeled and committed in batches
+    # of auto_label_batch_size, so an interrupted run resumes where it stopped
+    auto_label_batch_size: int = 500
+    auto_label_local_concurrency: int = 8  # Local files labeled at once
+    auto_label_graph_concurrency: int = 4  # Graph $batch calls in flight per adapter
     risk_tier_mapping: dict[str, str | None] = Field(
         default_factory=lambda: {
             "CRITICAL": "Highly Confidential",
@@ -270,6 +279,33 @@ class DetectionSettings(BaseSettings):
     enable_ocr: bool = True
     max_file_size_mb: int = 100
 
+    # Detection execution backend. "process" runs detection in a pool of
+    # worker processes so one scan worker can use every core on the box;
+    # pair it with jobs.pipeline_max_concurrent_files >= process_workers.
+    execution_mode: Literal["thread", "process"] = "thread"
+    process_workers: int = 0  # 0 = one per CPU core
+    process_batch_size: int = 8  # Max texts per worker round trip
+
+    # Dynamic batching for ONNX NER inference (chunks from concurrent files
+    # are padded into shared tensor batches)
+    ml_batch_size: int = 16  # 1 = no batching
+    ml_batch_wait_ms: float = 5.0
+
+    # "tiered" runs PHI-BERT/PII-BERT only on documents the pattern
+    # detectors flag, and only on windows of ml_window_chars around
+    # low-confidence / ML-beneficial spans and medical-context terms;
+    # "full" runs them over every document's whole text
+    ml_mode: Literal["full", "tiered"] = "full"
+    ml_window_chars: int = 256
+
+    # Content-addressed detection result cache: identical files (same
+    # SHA-256, extension, exposure and detector/model fingerprint) across
+    # targets and rescans are detected once
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 10_000  # Local LRU tier
+    result_cache_shared: bool = True  # Also use Redis when it is configured
+    result_cache_ttl_seconds: int = 7 * 24 * 3600  # Shared tier TTL
+
 
 class LoggingSettings(BaseSettings):
     """Logging configuration."""
@@ -495,11 +531,33 @@ class JobSettings(BaseSettings):
     default_worker_concurrency: int = 4
     max_worker_concurrency: int = 32
 
+    # Dispatch: workers wake on NOTIFY and fall back to adaptive polling
+    dispatch_listen_enabled: bool = True  # LISTEN for enqueue notifications
+    dispatch_batch_size: int = 8  # Max jobs claimed per round trip
+    dispatch_poll_min_seconds: float = 1.0  # Fallback poll interval after activity
+    dispatch_poll_max_seconds: float = 30.0  # Fallback poll interval when idle
+
     # Pipeline parallelism (within a single worker)
     pipeline_enabled: bool = True  # Enable concurrent file processing
     pipeline_max_concurrent_files: int = 8  # Max files in flight per worker
     pipeline_memory_budget_mb: int = 512  # Max cumulative in-flight content
 
+    # Stage latency profiling: per-stage/per-detector histograms attached to
+    # the scan job result under "profile"
+    profiling_enabled: bool = False
+    profiling_trace_sample_rate: float = 0.0  # Fraction of files traced stage by stage
+    profiling_max_traces: int = 20  # Slowest sampled traces kept in the summary
+    profiling_trace_dir: str | None = None  # Also write traces as JSON lines here
+
+    # Work stealing for object-store fan-out: a partition running longer than
+    # partition_split_after_seconds hands the tail of its key range to a new
+    # partition, keeping about partition_split_target_seconds of work
+    partition_split_enabled: bool = True
+    partition_split_after_seconds: float = 300.0
+    partition_split_target_seconds: float = 120.0
+    partition_split_check_seconds: float = 60.0  # Between later split checks
+    partition_split_min_files: int = 500  # Smallest tail worth a new partition
+
 
 class SchedulerSettings(BaseSettings):
     """
@@ -621,8 +679,14 @@ class MonitoringSettings(BaseSettings):
     stream_enabled: bool = False
     # Stream providers to activate (usn_journal on Windows, fanotify on Linux)
     stream_providers: list[str] = Field(default_factory=lambda: ["usn_journal", "fanotify"])
-    # Batch size for stream flush to DB
+    # Minimum batch size for stream flush to DB (flushes grow with backlog)
     stream_batch_size: int = 500
+    # Upper bound on events per flush (one COPY per flush)
+    stream_max_batch_size: int = 20_000
+    # Target wall time (seconds) per flush used to size adaptive batches
+    stream_flush_target_seconds: float = 0.5
+    # Maximum buffered events before new events are dropped
+    stream_max_buffer_size: int = 50_000
     # Flush interval (seconds) for stream buffer
     stream_flush_interval: float = 5.0
     # USN journal drive letter (Windows only)
@@ -732,6 +796,13 @@ class CatalogSettings(BaseSettings):
     # DuckDB tuning
     duckdb_memory_limit: str = "2GB"
     duckdb_threads: int = 4
+    # Concurrent DuckDB queries (one cursor per executor thread)
+    duckdb_query_workers: int = 4
+    # Dashboard query result cache (0 disables); invalidated by catalog flushes
+    duckdb_query_cache_entries: int = 256
+    duckdb_query_cache_ttl_seconds: float = 60.0
+    # How often the API polls the catalog data version written by flushes
+    data_version_check_seconds: float = 5.0
 
 
 class Settings(BaseSettings):
@@ -128,6 +128,13 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+def get_engine() -> AsyncEngine:
+    """Get the engine for direct connection use (e.g., LISTEN/NOTIFY)."""
+    if _engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _engine
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get the session factory for direct use (e.g., WebSocket handlers)."""
     if _session_factory is None:
@@ -120,7 +120,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             threads=settings.catalog.duckdb_threads,
             storage_config=settings.catalog,
         )
-        analytics_svc = AnalyticsService(engine)
+        analytics_svc = AnalyticsService(
+            engine,
+            max_workers=settings.catalog.duckdb_query_workers,
+            storage=catalog_storage,
+            cache_entries=settings.catalog.duckdb_query_cache_entries,
+            cache_ttl_seconds=settings.catalog.duckdb_query_cache_ttl_seconds,
+            version_check_seconds=settings.catalog.data_version_check_seconds,
+        )
         app.state.analytics = analytics_svc
         app.state.catalog_storage = catalog_storage
         app.state.dashboard_service = DuckDBDashboardService(analytics_svc)
@@ -207,6 +214,30 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                 type(e).__name__, e,
             )
 
+    # SID cache warm-up (background; Graph lookups can take a while)
+    sid_warmup_task: asyncio.Task | None = None
+    if settings.auth.sid_cache_warmup and settings.auth.provider == "azure_ad":
+        try:
+            from openlabels.auth.sid_resolver import get_sid_resolver
+            from openlabels.server.db import get_session_context
+
+            async def _warm_sid_cache() -> None:
+                try:
+                    async with get_session_context() as session:
+                        await get_sid_resolver().warm_up(session)
+                except Exception as e:
+                    logger.warning(
+                        "SID cache warm-up failed: %s: %s", type(e).__name__, e,
+                    )
+
+            sid_warmup_task = asyncio.create_task(_warm_sid_cache())
+            logger.info("SID cache warm-up started")
+        except Exception as e:
+            logger.warning(
+                "Failed to start SID cache warm-up: %s: %s",
+                type(e).__name__, e,
+            )
+
     # Periodic monitoring registry cache sync (re-populates from DB)
     monitoring_sync_shutdown = asyncio.Event()
     monitoring_sync_task: asyncio.Task | None = None
@@ -381,7 +412,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                 manager = EventStreamManager(
                     providers=stream_providers,
                     batch_size=settings.monitoring.stream_batch_size,
+                    max_batch_size=settings.monitoring.stream_max_batch_size,
+                    flush_target_seconds=settings.monitoring.stream_flush_target_seconds,
                     flush_interval=settings.monitoring.stream_flush_interval,
+                    max_buffer_size=settings.monitoring.stream_max_buffer_size,
                     scan_trigger=scan_trigger,
                     change_providers=change_providers,
                 )
@@ -522,6 +556,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.debug("Graph client close failed: %s", e)
 
+    # Stop SID cache warm-up if still running
+    if sid_warmup_task and not sid_warmup_task.done():
+        sid_warmup_task.cancel()
+        try:
+            await sid_warmup_task
+        except asyncio.CancelledError:
+            pass
+
     # Stop periodic monitoring cache sync
     if monitoring_sync_task and not monitoring_sync_task.done():
         monitoring_sync_shutdown.set()
@@ -85,6 +85,13 @@ entities_found_total = Counter(
     registry=registry,
 )
 
+detection_chars_total = Counter(
+    "openlabels_detection_chars_total",
+    "Characters of extracted text detected (stage=all) and sent to ML detectors (stage=ml)",
+    labelnames=["stage"],
+    registry=registry,
+)
+
 processing_duration_seconds = Histogram(
     "openlabels_processing_duration_seconds",
     "File processing duration in seconds",
@@ -193,6 +200,12 @@ def record_entities_found(entity_counts: dict[str, int]) -> None:
         entities_found_total.labels(entity_type=entity_type).inc(count)
 
 
+def record_detection_chars(text_length: int, ml_chars: int) -> None:
+    """Record characters detected and characters sent to ML."""
+    detection_chars_total.labels(stage="all").inc(text_length)
+    detection_chars_total.labels(stage="ml").inc(ml_chars)
+
+
 def record_processing_duration(adapter: str, duration: float) -> None:
     """Record file processing duration."""
     processing_duration_seconds.labels(adapter=adapter).observe(duration)
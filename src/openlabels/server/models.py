@@ -325,8 +325,9 @@ class ScanPartition(Base):
 
     # What to scan — adapter-specific partition boundaries
     # S3/GCS/Azure: {"start_after": "m", "end_before": "t", "prefix": "data/"}
-    # Filesystem: {"directory": "/mnt/share/finance"}
-    # SharePoint: {"site_id": "abc123"}
+    #   (end_before shrinks when a running partition splits off its tail)
+    # Filesystem: {"directories": [...], "exclude_directories": [...]}
+    # SharePoint/OneDrive: {"site_ids": [...]} / {"user_ids": [...]}
     partition_spec: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     # Execution state
@@ -611,6 +612,7 @@ class FileInventory(Base):
     content_hash: Mapped[str | None] = mapped_column(String(64))  # SHA-256
     file_size: Mapped[int | None] = mapped_column(BigInteger)
     file_modified: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    change_token: Mapped[str | None] = mapped_column(String(255))  # ETag / cTag / generation
 
     # Risk information
     risk_score: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1083,6 +1085,9 @@ class SecurityDescriptor(Base):
     authenticated_users: Mapped[bool] = mapped_column(Boolean, server_default="false")  # Authenticated Users group
     custom_acl: Mapped[bool] = mapped_column(Boolean, server_default="false")  # Non-inherited explicit ACE
 
+    # Whether this descriptor's grants have been written to principal_grants
+    principals_indexed: Mapped[bool] = mapped_column(Boolean, server_default="false")
+
     # Timestamps
     discovered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
@@ -1090,6 +1095,33 @@ class SecurityDescriptor(Base):
         Index('ix_security_descriptors_tenant', 'tenant_id'),
         Index('ix_security_descriptors_world', 'tenant_id',
               postgresql_where='world_accessible = true'),
+        Index('ix_security_descriptors_unindexed', 'tenant_id', 'sd_hash',
+              postgresql_where='principals_indexed IS NOT TRUE'),
+    )
+
+
+class PrincipalGrant(Base):
+    """Inverted index from principal to the security descriptors granting it access.
+
+    One row per (principal, descriptor) pair, derived from the descriptor's
+    ACEs (Windows) or owner/group/other bits (POSIX). Descriptors are
+    content-addressed, so rows never change once written and the index is
+    maintained incrementally by SD collection. "What can this principal
+    reach?" becomes an index range scan instead of a JSONB scan over every
+    descriptor.
+    """
+
+    __tablename__ = "principal_grants"
+
+    tenant_id: Mapped[PyUUID] = mapped_column(ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    principal: Mapped[str] = mapped_column(String(255), primary_key=True)  # SID, or POSIX user/group name
+    sd_hash: Mapped[bytes] = mapped_column(
+        ForeignKey("security_descriptors.sd_hash", ondelete="CASCADE"), primary_key=True
+    )
+    permissions: Mapped[list] = mapped_column(JSONB, nullable=False)  # ["read", "write", ...]
+
+    __table_args__ = (
+        Index('ix_principal_grants_sd', 'sd_hash'),
     )
 
 
@@ -13,21 +13,26 @@ Endpoints:
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select, text, tuple_
 
+from openlabels.auth.sid_resolver import get_sid_resolver
+from openlabels.jobs.sd_collect import normalize_principal
 from openlabels.server.dependencies import DbSessionDep, TenantContextDep
-from openlabels.server.models import DirectoryTree, SecurityDescriptor
+from openlabels.server.models import DirectoryTree, PrincipalGrant, SecurityDescriptor
 from openlabels.server.schemas.pagination import (
+    CursorPaginatedResponse,
+    CursorPaginationParams,
     PaginatedResponse,
     PaginationParams,
     create_paginated_response,
+    decode_cursor,
+    encode_cursor,
 )
 
 logger = logging.getLogger(__name__)
@@ -93,6 +98,7 @@ class PrincipalAccess(BaseModel):
     dir_name: str
     target_id: UUID
     permissions: list[str]  # Permissions granted to this principal
+    granted_via: list[str] = []  # The principal itself and/or its groups
 
 
 # Helpers
@@ -326,97 +332,114 @@ async def get_directory_acl(
 
 @router.get(
     "/principal/{principal}",
-    response_model=PaginatedResponse[PrincipalAccess],
+    response_model=CursorPaginatedResponse[PrincipalAccess],
 )
 async def lookup_principal_access(
     principal: str,
     db: DbSessionDep,
     tenant: TenantContextDep,
     target_id: UUID | None = Query(None, description="Scope to a specific target"),
-    pagination: PaginationParams = Depends(),
-) -> PaginatedResponse[PrincipalAccess]:
+    expand_groups: bool = Query(
+        True, description="Include access granted through group membership",
+    ),
+    pagination: CursorPaginationParams = Depends(),
+) -> CursorPaginatedResponse[PrincipalAccess]:
     """
-    Find all directories accessible by a given principal (SID or name).
+    Find all directories accessible by a given principal (SID, UPN or name).
 
-    Searches the ``permissions_json`` JSONB field on security descriptors
-    for entries matching the principal. Returns directories with the
-    specific permissions granted.
+    The principal is expanded to its transitive groups (cached by the SID
+    resolver), matched against the ``principal_grants`` inverted index,
+    and directories sharing a granting descriptor are returned in
+    ``(target_id, dir_path)`` order using keyset pagination.
     """
-    # Build conditions
-    conditions = [
-        "d.tenant_id = :tenant_id",
-        "sd.permissions_json IS NOT NULL",
-        "sd.permissions_json ? :principal",  # JSONB ? operator: key exists
-    ]
-    params: dict = {
-        "tenant_id": str(tenant.tenant_id),
-        "principal": principal,
-    }
-
-    if target_id:
-        conditions.append("d.target_id = :target_id")
-        params["target_id"] = str(target_id)
-
-    where = " AND ".join(conditions)
+    if expand_groups:
+        principals = await get_sid_resolver().expand_principal(principal)
+    else:
+        principals = frozenset({normalize_principal(principal)})
 
-    # Count query
-    count_result = await db.execute(
-        text(f"""
-            SELECT count(*) AS cnt
-            FROM directory_tree d
-            JOIN security_descriptors sd ON d.sd_hash = sd.sd_hash
-            WHERE {where}
-        """),
-        params,
+    granting = select(PrincipalGrant.sd_hash).where(
+        PrincipalGrant.tenant_id == tenant.tenant_id,
+        PrincipalGrant.principal.in_(principals),
     )
-    total = count_result.scalar() or 0
-
-    # Data query
-    params["limit"] = pagination.limit
-    params["offset"] = pagination.offset
-    result = await db.execute(
-        text(f"""
-            SELECT
-                d.id AS dir_id,
-                d.dir_path,
-                d.dir_name,
-                d.target_id,
-                sd.permissions_json -> :principal AS principal_perms
-            FROM directory_tree d
-            JOIN security_descriptors sd ON d.sd_hash = sd.sd_hash
-            WHERE {where}
-            ORDER BY d.dir_path
-            LIMIT :limit OFFSET :offset
-        """),
-        params,
+    stmt = select(
+        DirectoryTree.id,
+        DirectoryTree.dir_path,
+        DirectoryTree.dir_name,
+        DirectoryTree.target_id,
+        DirectoryTree.sd_hash,
+    ).where(
+        DirectoryTree.tenant_id == tenant.tenant_id,
+        DirectoryTree.sd_hash.in_(granting),
     )
-    rows = result.all()
+    if target_id:
+        stmt = stmt.where(DirectoryTree.target_id == target_id)
+
+    # dir_path is unique per target, so (target_id, dir_path) is a total
+    # order served by ix_dirtree_tenant_target_path.
+    key = tuple_(DirectoryTree.target_id, DirectoryTree.dir_path)
+    backward = pagination.direction == "backward"
+    if pagination.cursor:
+        try:
+            values, _ = decode_cursor(pagination.cursor)
+            position = (UUID(values["target_id"]), values["dir_path"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor") from None
+        stmt = stmt.where(key < position if backward else key > position)
+
+    if backward:
+        stmt = stmt.order_by(DirectoryTree.target_id.desc(), DirectoryTree.dir_path.desc())
+    else:
+        stmt = stmt.order_by(DirectoryTree.target_id, DirectoryTree.dir_path)
+
+    rows = (await db.execute(stmt.limit(pagination.limit))).all()
+    has_more = len(rows) > pagination.page_size
+    rows = rows[: pagination.page_size]
+    if backward:
+        rows = list(rows)[::-1]
+
+    # Permissions only for the descriptors on this page
+    grants: dict[bytes, tuple[set[str], set[str]]] = {}
+    if rows:
+        grant_rows = await db.execute(
+            select(
+                PrincipalGrant.sd_hash,
+                PrincipalGrant.principal,
+                PrincipalGrant.permissions,
+            ).where(
+                PrincipalGrant.tenant_id == tenant.tenant_id,
+                PrincipalGrant.principal.in_(principals),
+                PrincipalGrant.sd_hash.in_({row.sd_hash for row in rows}),
+            )
+        )
+        for grant in grant_rows:
+            perms, via = grants.setdefault(grant.sd_hash, (set(), set()))
+            perms.update(grant.permissions or ())
+            via.add(grant.principal)
 
     items = []
     for row in rows:
-        perms = row.principal_perms
-        if isinstance(perms, str):
-            perms = json.loads(perms)
-        if isinstance(perms, list):
-            perm_list = perms
-        elif isinstance(perms, dict):
-            perm_list = list(perms.keys())
-        else:
-            perm_list = []
-
+        perms, via = grants.get(row.sd_hash, (set(), set()))
         items.append(PrincipalAccess(
-            dir_id=row.dir_id,
+            dir_id=row.id,
             dir_path=row.dir_path,
             dir_name=row.dir_name,
             target_id=row.target_id,
-            permissions=perm_list,
+            permissions=sorted(perms),
+            granted_via=sorted(via),
         ))
 
-    return PaginatedResponse[PrincipalAccess](
-        **create_paginated_response(
-            items=items,
-            total=total,
-            page=pagination.page,
-            page_size=pagination.page_size,
+    def _cursor(row, direction: str) -> str:
+        return encode_cursor(
+            {"target_id": row.target_id, "dir_path": row.dir_path}, direction,
         )
+
+    has_next = has_more if not backward else pagination.cursor is not None
+    has_previous = has_more if backward else pagination.cursor is not None
+    return CursorPaginatedResponse[PrincipalAccess](
+        items=items,
+        next_cursor=_cursor(rows[-1], "forward") if rows and has_next else None,
+        previous_cursor=_cursor(rows[0], "backward") if rows and has_previous else None,
+        has_next=has_next,
+        has_previous=has_previous,
+        page_size=pagination.page_size,
     )
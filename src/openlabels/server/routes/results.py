@@ -177,12 +177,22 @@ async def export_results(
     job_id: UUID | None = Query(None, alias="scan_id", description="Job/Scan ID to export (optional)"),
     risk_tier: Literal["MINIMAL", "LOW", "MEDIUM", "HIGH", "CRITICAL"] | None = Query(None, description="Filter by risk tier"),
     has_label: str | None = Query(None, description="Filter by label status"),
-    format: Literal["csv", "json"] = Query("csv", description="Export format (csv or json)"),
+    format: Literal["csv", "json", "parquet", "arrow"] = Query(
+        "csv", description="Export format (csv, json, parquet or arrow IPC stream)",
+    ),
 ) -> StreamingResponse:
-    """Export scan results as CSV or JSON."""
-    import csv
-    import io
-    import json
+    """Export scan results as CSV, JSON, Parquet or Arrow IPC.
+
+    The response is streamed batch by batch, so memory use does not grow
+    with the number of exported results.
+    """
+    import pyarrow as pa
+
+    from openlabels.analytics.export import (
+        SCAN_RESULTS_EXPORT_COLUMNS,
+        SCAN_RESULTS_EXPORT_SCHEMA,
+        create_encoder,
+    )
 
     filename_parts = ["results"]
     if job_id:
@@ -191,11 +201,7 @@ async def export_results(
         filename_parts.append(risk_tier.lower())
     filename = "_".join(filename_parts)
 
-    _EXPORT_COLS = [
-        "file_path", "file_name", "risk_score", "risk_tier",
-        "total_entities", "exposure_level", "owner",
-        "current_label_name", "recommended_label_name", "label_applied",
-    ]
+    encoder = create_encoder(format, SCAN_RESULTS_EXPORT_COLUMNS, SCAN_RESULTS_EXPORT_SCHEMA)
 
     # Resolve data source — DuckDB (all filters pushed down) or PG (post-filter)
     analytics = getattr(request.app.state, "analytics", None)
@@ -205,13 +211,14 @@ async def export_results(
             has_label_bool = True
         elif has_label == "false":
             has_label_bool = False
-        rows = await analytics.export_scan_results(
+        chunks = analytics.stream_scan_results(
             _tenant.tenant_id,
+            encoder,
             job_id=job_id,
             risk_tier=risk_tier,
             has_label=has_label_bool,
         )
-        return _build_export_response(rows, format, filename, _EXPORT_COLS)
+        return _build_export_response(chunks, encoder, filename)
 
     # PostgreSQL fallback — stream with post-filtering
     def _matches_filters(row_dict: dict) -> bool:
@@ -223,90 +230,41 @@ async def export_results(
             return False
         return True
 
-    async def _pg_row_iter():
-        async for row_dict in result_service.stream_results_as_dicts(job_id=job_id):
+    def _encode(rows: list[dict]) -> bytes:
+        return encoder.encode(pa.RecordBatch.from_pylist(rows, schema=SCAN_RESULTS_EXPORT_SCHEMA))
+
+    async def _pg_chunks():
+        yield encoder.begin()
+        rows: list[dict] = []
+        async for row_dict in result_service.stream_results_as_dicts(
+            job_id=job_id, fields=SCAN_RESULTS_EXPORT_COLUMNS,
+        ):
             if not _matches_filters(row_dict):
                 continue
-            yield row_dict
-
-    if format == "csv":
-        async def _csv_generator():
-            header_buf = io.StringIO()
-            writer = csv.writer(header_buf)
-            writer.writerow(_EXPORT_COLS)
-            yield header_buf.getvalue()
-
-            async for row_dict in _pg_row_iter():
-                row_buf = io.StringIO()
-                row_writer = csv.writer(row_buf)
-                row_writer.writerow([row_dict.get(c, "") for c in _EXPORT_COLS])
-                yield row_buf.getvalue()
-
-        return StreamingResponse(
-            _csv_generator(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}.csv"},
-        )
-    else:
-        async def _json_generator():
-            yield "[\n"
-            first = True
-            async for row_dict in _pg_row_iter():
-                if not first:
-                    yield ",\n"
-                first = False
-                yield json.dumps(
-                    {c: row_dict.get(c) for c in _EXPORT_COLS},
-                    indent=2,
-                    default=str,
-                )
-            yield "\n]\n"
-
-        return StreamingResponse(
-            _json_generator(),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}.json"},
-        )
+            rows.append(row_dict)
+            if len(rows) >= _PG_EXPORT_BATCH_ROWS:
+                yield _encode(rows)
+                rows = []
+        if rows:
+            yield _encode(rows)
+        yield encoder.finish()
 
+    return _build_export_response(_pg_chunks(), encoder, filename)
 
-def _build_export_response(
-    rows: list[dict], format: str, filename: str, columns: list[str],
-) -> StreamingResponse:
-    """Build a CSV or JSON streaming response from pre-fetched DuckDB rows."""
-    import csv
-    import io
-    import json
-
-    if format == "csv":
-        def _csv_gen():
-            header_buf = io.StringIO()
-            writer = csv.writer(header_buf)
-            writer.writerow(columns)
-            yield header_buf.getvalue()
-            for r in rows:
-                buf = io.StringIO()
-                csv.writer(buf).writerow([r.get(c, "") for c in columns])
-                yield buf.getvalue()
-
-        return StreamingResponse(
-            _csv_gen(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}.csv"},
-        )
-    else:
-        def _json_gen():
-            yield "[\n"
-            for i, r in enumerate(rows):
-                if i:
-                    yield ",\n"
-                yield json.dumps({c: r.get(c) for c in columns}, indent=2)
-            yield "\n]\n"
-
-        return StreamingResponse(
-            _json_gen(),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}.json"},
-        )
+
+# Rows per encoded batch on the PostgreSQL export path
+_PG_EXPORT_BATCH_ROWS = 1000
+
+
+def _build_export_response(chunks, encoder, filename: str) -> StreamingResponse:
+    """Wrap encoded export chunks in a download response."""
+    return StreamingResponse(
+        chunks,
+        media_type=encoder.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}.{encoder.extension}",
+        },
+    )
 
 
 @router.get("/{result_id}", response_model=ResultDetailResponse)
@@ -293,3 +293,80 @@ class TestDefaultFilter:
         assert DEFAULT_FILTER.should_include(node_file) is False
 
 
+
+
+class TestIterPagesInThread:
+    """Tests for background page streaming of blocking SDK iterators."""
+
+    @staticmethod
+    def _tracking_pages(count, fetched):
+        for i in range(count):
+            fetched.append(i)
+            yield [f"key-{i}"]
+
+    async def test_yields_all_pages_in_order(self):
+        from openlabels.adapters.base import iter_pages_in_thread
+
+        fetched: list[int] = []
+        pages = [p async for p in iter_pages_in_thread(self._tracking_pages(5, fetched))]
+
+        assert pages == [[f"key-{i}"] for i in range(5)]
+
+    async def test_look_ahead_is_bounded(self):
+        import asyncio
+
+        from openlabels.adapters.base import iter_pages_in_thread
+
+        fetched: list[int] = []
+        stream = iter_pages_in_thread(self._tracking_pages(100, fetched), prefetch=1)
+        first = await stream.__anext__()
+        # Give the background fetcher time to run ahead as far as it can
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+
+        assert first == ["key-0"]
+        # Page 0 consumed, one page buffered, at most one more in flight
+        assert len(fetched) <= 3
+        await stream.aclose()
+
+    async def test_early_exit_stops_fetching(self):
+        import asyncio
+        from contextlib import aclosing
+
+        from openlabels.adapters.base import iter_pages_in_thread
+
+        fetched: list[int] = []
+        async with aclosing(iter_pages_in_thread(self._tracking_pages(100, fetched))) as pages:
+            async for _ in pages:
+                break
+        await asyncio.sleep(0.05)
+
+        assert len(fetched) < 100
+
+    async def test_errors_surface_to_consumer(self):
+        from openlabels.adapters.base import iter_pages_in_thread
+
+        def failing_pages():
+            yield ["ok"]
+            raise ConnectionError("listing failed")
+
+        received = []
+        with pytest.raises(ConnectionError, match="listing failed"):
+            async for page in iter_pages_in_thread(failing_pages()):
+                received.append(page)
+
+        assert received == [["ok"]]
+
+
+class TestChunked:
+    """Tests for chunked()."""
+
+    def test_groups_items(self):
+        from openlabels.adapters.base import chunked
+
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_empty(self):
+        from openlabels.adapters.base import chunked
+
+        assert list(chunked([], 3)) == []
@@ -673,3 +673,44 @@ class TestFilesystemTimezones:
             assert len(folders) == 1
             assert folders[0].modified is not None
             assert folders[0].modified.tzinfo is not None
+
+
+class TestFilesystemAdapterPartition:
+    """Tests for listing a directory-tree partition."""
+
+    async def _names(self, adapter, root, spec):
+        return sorted([f.name async for f in adapter.list_files(root, partition=spec)])
+
+    async def test_lists_partition_directories_only(self, tmp_path):
+        from openlabels.adapters.base import PartitionSpec
+
+        for sub in ("a", "b", "c"):
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / f"{sub}.txt").write_text(sub)
+        (tmp_path / "root.txt").write_text("root")
+
+        spec = PartitionSpec(directories=[str(tmp_path / "a"), str(tmp_path / "c")])
+        assert await self._names(FilesystemAdapter(), str(tmp_path), spec) == ["a.txt", "c.txt"]
+
+    async def test_excluded_subtrees_are_pruned(self, tmp_path):
+        from openlabels.adapters.base import PartitionSpec
+
+        (tmp_path / "owned").mkdir()
+        (tmp_path / "owned" / "skip.txt").write_text("x")
+        (tmp_path / "new").mkdir()  # created after indexing: still covered
+        (tmp_path / "new" / "new.txt").write_text("x")
+        (tmp_path / "root.txt").write_text("x")
+
+        spec = PartitionSpec(
+            directories=[str(tmp_path)],
+            exclude_directories=[str(tmp_path / "owned")],
+        )
+        assert await self._names(FilesystemAdapter(), str(tmp_path), spec) == ["new.txt", "root.txt"]
+
+    async def test_missing_partition_directory_skipped(self, tmp_path):
+        from openlabels.adapters.base import PartitionSpec
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "a.txt").write_text("a")
+        spec = PartitionSpec(directories=[str(tmp_path / "gone"), str(tmp_path / "a")])
+        assert await self._names(FilesystemAdapter(), str(tmp_path), spec) == ["a.txt"]
@@ -111,3 +111,69 @@ class TestDuckDBEngine:
     def test_invalid_threads_raises(self, catalog_dir):
         with pytest.raises(ValueError, match="duckdb_threads must be"):
             DuckDBEngine(str(catalog_dir), threads=-1)
+
+    def test_iter_record_batches(self, storage: LocalStorage, engine: DuckDBEngine):
+        write_scan_results(storage)
+        engine.refresh_views()
+
+        batches = list(engine.iter_record_batches(
+            "SELECT file_name FROM scan_results ORDER BY risk_score DESC", batch_size=1,
+        ))
+        assert [b.num_rows for b in batches] == [1, 1]
+        assert batches[0].column(0).to_pylist() == ["report.pdf"]
+
+    def test_iter_record_batches_leaves_shared_connection_usable(
+        self, storage: LocalStorage, engine: DuckDBEngine,
+    ):
+        """A half-consumed stream does not disturb queries on the engine."""
+        write_scan_results(storage)
+        engine.refresh_views()
+
+        stream = engine.iter_record_batches("SELECT * FROM scan_results", batch_size=1)
+        first = next(stream)
+        rows = engine.fetch_all("SELECT count(*) AS cnt FROM scan_results")
+        rest = list(stream)
+
+        assert rows[0]["cnt"] == 2
+        assert first.num_rows + sum(b.num_rows for b in rest) == 2
+
+    def test_refresh_keeps_views_visible_to_concurrent_queries(
+        self, storage: LocalStorage, engine: DuckDBEngine,
+    ):
+        """Queries on other cursors never catch a view mid-replacement."""
+        import threading
+
+        write_scan_results(storage)
+        engine.refresh_views()
+        done = threading.Event()
+
+        def refresh_loop():
+            while not done.is_set():
+                engine.refresh_views()
+
+        refresher = threading.Thread(target=refresh_loop)
+        refresher.start()
+        try:
+            counts = [
+                engine.fetch_all("SELECT count(*) AS cnt FROM scan_results")[0]["cnt"]
+                for _ in range(200)
+            ]
+        finally:
+            done.set()
+            refresher.join()
+
+        assert counts == [2] * 200
+        assert "scan_results" not in engine.stub_views
+
+    def test_refresh_replaces_stub_once_data_arrives(
+        self, storage: LocalStorage, engine: DuckDBEngine,
+    ):
+        assert "scan_results" in engine.stub_views
+        engine.refresh_views()
+        assert "scan_results" in engine.stub_views
+
+        write_scan_results(storage)
+        engine.refresh_views()
+
+        assert "scan_results" not in engine.stub_views
+        assert engine.fetch_all("SELECT count(*) AS cnt FROM scan_results")[0]["cnt"] == 2
@@ -0,0 +1,122 @@
+"""Tests for the per-batch export encoders."""
+
+import csv
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from openlabels.analytics.export import (
+    SCAN_RESULTS_EXPORT_COLUMNS,
+    SCAN_RESULTS_EXPORT_SCHEMA,
+    ArrowStreamBatchEncoder,
+    CsvBatchEncoder,
+    JsonBatchEncoder,
+    ParquetBatchEncoder,
+    create_encoder,
+)
+
+COLUMNS = ["file_path", "risk_score", "label_applied"]
+SCHEMA = pa.schema([
+    pa.field("file_path", pa.utf8()),
+    pa.field("risk_score", pa.int32()),
+    pa.field("label_applied", pa.bool_()),
+])
+
+
+def _batches():
+    return [
+        pa.RecordBatch.from_pylist(
+            [{"file_path": "/a.docx", "risk_score": 90, "label_applied": True},
+             {"file_path": "/b.xlsx", "risk_score": 40, "label_applied": None}],
+            schema=SCHEMA,
+        ),
+        pa.RecordBatch.from_pylist([], schema=SCHEMA),
+        pa.RecordBatch.from_pylist(
+            [{"file_path": "/c.pdf", "risk_score": 10, "label_applied": False}],
+            schema=SCHEMA,
+        ),
+    ]
+
+
+def _run(encoder, batches) -> bytes:
+    parts = [encoder.begin()]
+    parts.extend(encoder.encode(b) for b in batches)
+    parts.append(encoder.finish())
+    return b"".join(parts)
+
+
+class TestTextEncoders:
+    def test_csv(self):
+        body = _run(CsvBatchEncoder(COLUMNS), _batches()).decode()
+        rows = list(csv.reader(io.StringIO(body)))
+        assert rows == [
+            COLUMNS,
+            ["/a.docx", "90", "True"],
+            ["/b.xlsx", "40", ""],
+            ["/c.pdf", "10", "False"],
+        ]
+
+    def test_csv_fills_missing_columns(self):
+        encoder = CsvBatchEncoder(["file_path", "owner"])
+        body = _run(encoder, _batches()[:1]).decode()
+        assert body.splitlines()[1] == "/a.docx,"
+
+    def test_json_is_one_array_across_batches(self):
+        body = _run(JsonBatchEncoder(COLUMNS), _batches())
+        data = json.loads(body)
+        assert [r["file_path"] for r in data] == ["/a.docx", "/b.xlsx", "/c.pdf"]
+        assert data[1]["label_applied"] is None
+        # One compact object per line, no per-row indentation
+        assert len(body.splitlines()) == 2 + len(data)
+
+    def test_json_empty(self):
+        assert json.loads(_run(JsonBatchEncoder(COLUMNS), [])) == []
+
+
+class TestBinaryEncoders:
+    def test_parquet_row_group_per_batch(self):
+        body = _run(ParquetBatchEncoder(COLUMNS), _batches())
+        pf = pq.ParquetFile(io.BytesIO(body))
+        assert pf.metadata.num_row_groups == 2  # empty batch is skipped
+        assert pf.read().column("file_path").to_pylist() == ["/a.docx", "/b.xlsx", "/c.pdf"]
+
+    def test_parquet_chunks_emitted_per_batch(self):
+        encoder = ParquetBatchEncoder(COLUMNS)
+        encoder.begin()
+        assert encoder.encode(_batches()[0])  # row group bytes leave immediately
+
+    def test_parquet_empty_uses_fallback_schema(self):
+        encoder = ParquetBatchEncoder(SCAN_RESULTS_EXPORT_COLUMNS, SCAN_RESULTS_EXPORT_SCHEMA)
+        table = pq.read_table(io.BytesIO(_run(encoder, [])))
+        assert table.num_rows == 0
+        assert table.schema.names == SCAN_RESULTS_EXPORT_COLUMNS
+
+    def test_arrow_stream(self):
+        body = _run(ArrowStreamBatchEncoder(COLUMNS), _batches())
+        table = pa.ipc.open_stream(body).read_all()
+        assert table.num_rows == 3
+        assert table.schema == SCHEMA
+
+    def test_binary_selects_export_columns(self):
+        wide = pa.RecordBatch.from_pylist(
+            [{"file_path": "/a", "risk_score": 1, "label_applied": True, "extra": "x"}],
+        )
+        body = _run(ArrowStreamBatchEncoder(COLUMNS), [wide])
+        assert pa.ipc.open_stream(body).read_all().column_names == COLUMNS
+
+
+class TestCreateEncoder:
+    @pytest.mark.parametrize(
+        "fmt,cls",
+        [("csv", CsvBatchEncoder), ("json", JsonBatchEncoder),
+         ("parquet", ParquetBatchEncoder), ("arrow", ArrowStreamBatchEncoder)],
+    )
+    def test_formats(self, fmt, cls):
+        assert isinstance(create_encoder(fmt, COLUMNS), cls)
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            create_encoder("xml", COLUMNS)
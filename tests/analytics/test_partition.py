@@ -74,3 +74,10 @@ def test_timestamped_part_filename_format_and_uniqueness():
     assert ts_a.isdigit(), f"Timestamp portion should be numeric, got {ts_a!r}"
     assert ts_b.isdigit(), f"Timestamp portion should be numeric, got {ts_b!r}"
     assert a != b, "Two calls should produce different filenames"
+
+
+def test_timestamped_part_filename_sequence():
+    a = timestamped_part_filename(7)
+    assert a.startswith("part-")
+    assert a.endswith("-00007.parquet")
+    assert a[len("part-"):-len("-00007.parquet")].isdigit()
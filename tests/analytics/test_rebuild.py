@@ -0,0 +1,312 @@
+"""Tests for the keyset-paginated catalog rebuild."""
+
+from __future__ import annotations
+
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pyarrow as pa
+
+from openlabels.analytics.arrow_convert import file_inventory_to_arrow, scan_results_to_arrow
+from openlabels.analytics.flush import load_flush_state, read_data_version
+from openlabels.analytics.rebuild import (
+    TABLES,
+    CatalogRebuilder,
+    finish_rebuild,
+    key_ranges,
+    partition_groups,
+    rows_to_arrow,
+)
+from openlabels.analytics.storage import LocalStorage
+from openlabels.server.models import generate_uuid
+
+from .conftest import TARGET_1, TENANT_A, TENANT_B
+from .test_arrow_convert import _make_fake
+
+SCAN_RESULTS = next(t for t in TABLES if t.name == "scan_results")
+FILE_INVENTORY = next(t for t in TABLES if t.name == "file_inventory")
+ACCESS_EVENTS = next(t for t in TABLES if t.name == "access_events")
+
+
+class FakeRow:
+    """Attribute bag standing in for an ORM instance."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def _scan_row(target_id=TARGET_1, **overrides) -> tuple:
+    fake = _make_fake(tenant_id=TENANT_A, **overrides)
+    return tuple(
+        target_id if name == "target_id" else getattr(fake, name, None)
+        for name in SCAN_RESULTS.columns
+    )
+
+
+def _inventory_row(n: int, tenant_id=TENANT_A, target_id=TARGET_1) -> tuple:
+    values = dict.fromkeys(FILE_INVENTORY.columns)
+    values.update(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        target_id=target_id,
+        file_path=f"/share/file{n:03d}.txt",
+        file_name=f"file{n:03d}.txt",
+        adapter="filesystem",
+        risk_score=n,
+        risk_tier="LOW",
+        entity_counts={"SSN": n},
+        total_entities=n,
+        is_monitored=False,
+        needs_rescan=False,
+    )
+    return tuple(values[name] for name in FILE_INVENTORY.columns)
+
+
+def _access_row(collected_at: datetime) -> tuple:
+    values = dict.fromkeys(ACCESS_EVENTS.columns)
+    values.update(
+        id=generate_uuid(),
+        tenant_id=TENANT_A,
+        monitored_file_id=uuid4(),
+        file_path="/share/report.txt",
+        action="read",
+        success=True,
+        event_time=collected_at - timedelta(minutes=5),
+        collected_at=collected_at,
+    )
+    return tuple(values[name] for name in ACCESS_EVENTS.columns)
+
+
+class FakeDatabase:
+    """Serves keyset pages from in-memory rows and records every call."""
+
+    def __init__(self, rows: dict[str, list[tuple]]):
+        self.rows = rows
+        self.calls: list[tuple] = []
+
+    async def fetch_page(self, spec, unit, after, limit, until):
+        self.calls.append((spec.name, unit, after, limit))
+        key = spec.columns.index(spec.keyset)
+        rows = self.rows.get(spec.name, [])
+        if spec.cursor is not None and until is not None:
+            cursor = spec.columns.index(spec.cursor[1])
+            rows = [r for r in rows if r[cursor] <= until]
+        if spec.snapshot:
+            tenant, target = spec.columns.index("tenant_id"), spec.columns.index("target_id")
+            rows = [r for r in rows if (r[tenant], r[target]) == unit]
+        else:
+            low, high = unit
+            rows = [
+                r for r in rows
+                if (low is None or r[key] >= low) and (high is None or r[key] < high)
+            ]
+        rows = sorted((r for r in rows if after is None or r[key] > after), key=lambda r: r[key])
+        return rows[:limit]
+
+    async def key_bounds(self, spec, shards):
+        """``percentile_disc`` at i/shards: the first key at or past that fraction."""
+        key = spec.columns.index(spec.keyset)
+        keys = sorted(r[key] for r in self.rows.get(spec.name, []))
+        if not keys:
+            return []
+        return [keys[max(math.ceil(i * len(keys) / shards) - 1, 0)] for i in range(1, shards)]
+
+    async def list_snapshot_units(self, spec):
+        tenant, target = spec.columns.index("tenant_id"), spec.columns.index("target_id")
+        return sorted({(r[tenant], r[target]) for r in self.rows.get(spec.name, [])}, key=str)
+
+
+class TestRowsToArrow:
+    def test_matches_orm_converter_for_scan_results(self):
+        rows = [
+            _scan_row(policy_violations={"pci": ["card"]}),
+            _scan_row(content_score=None, entity_counts=None, risk_tier="CRITICAL"),
+        ]
+        fakes = [FakeRow(**dict(zip(SCAN_RESULTS.columns, r, strict=True))) for r in rows]
+
+        assert rows_to_arrow(SCAN_RESULTS, rows).equals(scan_results_to_arrow(fakes))
+
+    def test_matches_orm_converter_for_file_inventory(self):
+        rows = [_inventory_row(n) for n in range(3)]
+        fakes = [FakeRow(**dict(zip(FILE_INVENTORY.columns, r, strict=True))) for r in rows]
+
+        assert rows_to_arrow(FILE_INVENTORY, rows).equals(file_inventory_to_arrow(fakes))
+
+    def test_empty_page(self):
+        table = rows_to_arrow(SCAN_RESULTS, [])
+        assert table.num_rows == 0
+        assert table.schema.equals(SCAN_RESULTS.schema)
+
+
+def test_partition_groups_by_date():
+    day = datetime(2026, 2, 1, 9, 0, tzinfo=timezone.utc)
+    rows = [
+        _scan_row(scanned_at=day),
+        _scan_row(scanned_at=day + timedelta(hours=5)),
+        _scan_row(scanned_at=day + timedelta(days=1)),
+    ]
+
+    groups = partition_groups(SCAN_RESULTS, rows)
+
+    assert groups == {
+        (TENANT_A, TARGET_1, day.date()): [0, 1],
+        (TENANT_A, TARGET_1, (day + timedelta(days=1)).date()): [2],
+    }
+
+
+def test_key_ranges_cover_key_space():
+    bounds = [UUID(int=3), UUID(int=1), UUID(int=2), UUID(int=2)]
+    ranges = key_ranges(bounds)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    for (_, high), (low, _) in zip(ranges, ranges[1:], strict=False):
+        assert high == low
+    assert [high for _, high in ranges[:-1]] == [UUID(int=1), UUID(int=2), UUID(int=3)]
+    assert key_ranges([]) == [(None, None)]
+
+
+class TestCatalogRebuilder:
+    async def test_pages_by_keyset_and_partitions(self, storage: LocalStorage):
+        rows = [_scan_row(id=UUID(int=n << 120)) for n in range(1, 30)]
+        db = FakeDatabase({"scan_results": rows})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            batch_size=4, workers=2,
+        )
+
+        report = await rebuilder.run([SCAN_RESULTS])
+
+        assert report.tables["scan_results"].rows == len(rows)
+        assert report.rows == len(rows)
+        written = pa.concat_tables(
+            storage.read_parquet(f) for f in storage.list_files("scan_results")
+        )
+        assert sorted(written.column("id").to_pylist()) == sorted(r[0].bytes for r in rows)
+        # Each range starts from the beginning and resumes after the last key seen
+        for unit in key_ranges(await db.key_bounds(SCAN_RESULTS, 2)):
+            cursors = [after for _, u, after, _ in db.calls if u == unit]
+            assert cursors[0] is None
+            assert cursors[1:] == sorted(cursors[1:])
+
+    async def test_uuid7_keys_spread_across_workers(self, storage: LocalStorage):
+        rows = [_scan_row(id=generate_uuid()) for _ in range(40)]
+        db = FakeDatabase({"scan_results": rows})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            batch_size=100, workers=4,
+        )
+
+        report = await rebuilder.run([SCAN_RESULTS])
+
+        assert report.rows == len(rows)
+        # Each range holds about a quarter of the rows; none is empty
+        ranges = key_ranges(await db.key_bounds(SCAN_RESULTS, 4))
+        sizes = [
+            sum((low is None or r[0] >= low) and (high is None or r[0] < high) for r in rows)
+            for low, high in ranges
+        ]
+        assert sizes == [9, 10, 10, 11]
+        assert {unit for _, unit, _, _ in db.calls} == set(ranges)
+
+    async def test_inventory_snapshot_spans_pages(self, storage: LocalStorage):
+        target_2 = uuid4()
+        rows = [_inventory_row(n) for n in range(10)]
+        rows += [_inventory_row(n, tenant_id=TENANT_B, target_id=target_2) for n in range(3)]
+        db = FakeDatabase({"file_inventory": rows})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            batch_size=3, workers=2,
+        )
+
+        report = await rebuilder.run([FILE_INVENTORY])
+
+        snapshot = storage.read_parquet(
+            f"file_inventory/tenant={TENANT_A}/target={TARGET_1}/snapshot.parquet"
+        )
+        assert snapshot.column("file_path").to_pylist() == [
+            f"/share/file{n:03d}.txt" for n in range(10)
+        ]
+        assert report.tables["file_inventory"].files == 2
+
+    async def test_clears_stale_files(self, storage: LocalStorage):
+        stale = "scan_results/tenant=old/target=old/scan_date=2020-01-01/part-00000.parquet"
+        storage.write_parquet(stale, rows_to_arrow(SCAN_RESULTS, [_scan_row()]))
+        db = FakeDatabase({})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage, list_snapshot_units=db.list_snapshot_units,
+            key_bounds=db.key_bounds,
+        )
+
+        report = await rebuilder.run([SCAN_RESULTS])
+
+        assert not storage.exists(stale)
+        assert report.rows == 0
+
+    async def test_rows_past_flush_cursor_left_to_flush(self, storage: LocalStorage):
+        cursor = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+        before = [_access_row(cursor - timedelta(hours=n)) for n in range(3)]
+        late = _access_row(cursor + timedelta(seconds=1))
+        db = FakeDatabase({"access_events": [*before, late]})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            workers=2, cursors={"last_access_event_flush": cursor},
+        )
+
+        report = await rebuilder.run([ACCESS_EVENTS])
+
+        written = pa.concat_tables(
+            storage.read_parquet(f) for f in storage.list_files("access_events")
+        )
+        assert report.rows == len(before)
+        assert late[0].bytes not in written.column("id").to_pylist()
+
+    async def test_table_empty_at_cursor_read_is_left_to_flush(self, storage: LocalStorage):
+        db = FakeDatabase({"access_events": [_access_row(datetime.now(timezone.utc))]})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            cursors={"last_access_event_flush": None},
+        )
+
+        report = await rebuilder.run([ACCESS_EVENTS])
+
+        assert report.rows == 0
+        assert db.calls == []
+
+    async def test_part_files_named_by_timestamp(self, storage: LocalStorage):
+        db = FakeDatabase({"scan_results": [_scan_row() for _ in range(3)]})
+        rebuilder = CatalogRebuilder(
+            db.fetch_page, storage,
+            list_snapshot_units=db.list_snapshot_units, key_bounds=db.key_bounds,
+            batch_size=1, workers=1,
+        )
+
+        await rebuilder.run([SCAN_RESULTS])
+
+        names = [f.rsplit("/", 1)[-1] for f in storage.list_files("scan_results")]
+        assert len(names) == 3
+        assert "part-00000.parquet" not in names
+        assert all(re.fullmatch(r"part-\d+-\d{5}\.parquet", n) for n in names)
+
+
+def test_finish_rebuild_resets_cursors_and_bumps_version(storage: LocalStorage):
+    latest = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+
+    finish_rebuild(storage, {
+        "last_access_event_flush": latest,
+        "last_audit_log_flush": None,
+        "last_remediation_action_flush": latest,
+    })
+
+    state = load_flush_state(storage)
+    assert state["last_access_event_flush"] == latest.isoformat()
+    assert state["last_audit_log_flush"] is None
+    assert state["schema_version"] == 1
+    assert read_data_version(storage) is not None
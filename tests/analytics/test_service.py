@@ -1,9 +1,19 @@
 """Tests for AnalyticsService (async wrapper) and DuckDBDashboardService."""
 
+import io
+import json
 from datetime import datetime, timedelta, timezone
 
+import duckdb
+import pyarrow.parquet as pq
 import pytest
 
+from openlabels.analytics.export import (
+    SCAN_RESULTS_EXPORT_COLUMNS,
+    SCAN_RESULTS_EXPORT_SCHEMA,
+    create_encoder,
+)
+
 from openlabels.analytics.service import (
     AccessStats,
     AnalyticsService,
@@ -11,6 +21,7 @@ from openlabels.analytics.service import (
     EntityTrendsData,
     FileStats,
     HeatmapFileRow,
+    QueryResultCache,
     RemediationStats,
     TrendPoint,
 )
@@ -53,6 +64,186 @@ class TestAnalyticsService:
         assert table.num_rows == 2  # sensitive files only
 
 
+# ── Result cache and cursor pool ────────────────────────────────────
+
+@pytest.mark.asyncio
+class TestQueryCache:
+    async def test_repeated_query_served_from_cache(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        first = await analytics.query("SELECT count(*) AS cnt FROM scan_results")
+        # Whitespace differences normalize to the same key
+        second = await analytics.query("SELECT count(*)  AS cnt\n FROM scan_results")
+
+        assert first == second == [{"cnt": 2}]
+        stats = analytics.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    async def test_params_are_part_of_the_key(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        sql = "SELECT count(*) AS cnt FROM scan_results WHERE risk_score > ?"
+        assert (await analytics.query(sql, [50]))[0]["cnt"] == 2
+        assert (await analytics.query(sql, [70]))[0]["cnt"] == 1
+
+    async def test_cached_rows_not_shared_with_callers(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        rows = await analytics.query("SELECT count(*) AS cnt FROM scan_results")
+        rows[0]["cnt"] = 999
+        again = await analytics.query("SELECT count(*) AS cnt FROM scan_results")
+        assert again[0]["cnt"] == 2
+
+    async def test_refresh_views_invalidates(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        from tests.analytics.conftest import TENANT_B
+
+        write_scan_results(storage)
+        analytics.refresh_views()
+        sql = "SELECT count(*) AS cnt FROM scan_results"
+        assert (await analytics.query(sql))[0]["cnt"] == 2
+
+        write_scan_results(storage, tenant_id=TENANT_B, scan_date="2026-02-02")
+        assert (await analytics.query(sql))[0]["cnt"] == 2  # still cached
+
+        analytics.refresh_views()
+        assert (await analytics.query(sql))[0]["cnt"] == 4
+
+    async def test_data_version_bump_invalidates(
+        self, storage: LocalStorage, engine,
+    ):
+        from openlabels.analytics.flush import bump_data_version
+        from tests.analytics.conftest import TENANT_B
+
+        write_scan_results(storage)
+        engine.refresh_views()
+        svc = AnalyticsService(engine, max_workers=1, storage=storage, version_check_seconds=0)
+        sql = "SELECT count(*) AS cnt FROM scan_results"
+        try:
+            assert (await svc.query(sql))[0]["cnt"] == 2
+            write_scan_results(storage, tenant_id=TENANT_B, scan_date="2026-02-02")
+            assert (await svc.query(sql))[0]["cnt"] == 2  # same version, cached
+
+            bump_data_version(storage)  # e.g. a flush from a worker process
+            assert (await svc.query(sql))[0]["cnt"] == 4
+        finally:
+            svc.close()
+
+    async def test_data_version_refreshes_stub_views(
+        self, storage: LocalStorage, engine,
+    ):
+        from openlabels.analytics.flush import bump_data_version
+
+        svc = AnalyticsService(engine, max_workers=1, storage=storage, version_check_seconds=0)
+        try:
+            assert "scan_results" in engine.stub_views
+            write_scan_results(storage)
+            bump_data_version(storage)
+
+            rows = await svc.query("SELECT count(*) AS cnt FROM scan_results")
+            assert rows[0]["cnt"] == 2
+            assert "scan_results" not in engine.stub_views
+        finally:
+            svc.close()
+
+    async def test_concurrent_identical_queries_coalesce(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        import asyncio
+
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        results = await asyncio.gather(*[
+            analytics.query("SELECT count(*) AS cnt FROM scan_results") for _ in range(8)
+        ])
+
+        assert all(r == [{"cnt": 2}] for r in results)
+        assert analytics.get_cache_stats()["coalesced"] == 7
+
+    async def test_errors_are_not_cached(self, analytics: AnalyticsService):
+        with pytest.raises(duckdb.Error):
+            await analytics.query("SELECT no_such_column FROM scan_results")
+        assert analytics.get_cache_stats()["entries"] == 0
+
+    async def test_cache_disabled(self, engine):
+        svc = AnalyticsService(engine, max_workers=1, cache_entries=0)
+        try:
+            await svc.query("SELECT 1 AS one")
+            await svc.query("SELECT 1 AS one")
+            assert svc.get_cache_stats() == {
+                "enabled": False, "entries": 0, "hits": 0, "misses": 0,
+                "coalesced": 0, "generation": 0, "data_version": None,
+                "cursors": engine.cursor_count,
+            }
+        finally:
+            svc.close()
+
+    async def test_parallel_queries_use_one_cursor_per_thread(
+        self, storage: LocalStorage, engine,
+    ):
+        import asyncio
+
+        write_scan_results(storage)
+        engine.refresh_views()
+        svc = AnalyticsService(engine, max_workers=4, cache_entries=0)
+        try:
+            results = await asyncio.gather(*[
+                svc.query("SELECT count(*) AS cnt FROM scan_results WHERE risk_score > ?", [i])
+                for i in range(40)
+            ])
+            assert all(r[0]["cnt"] in (0, 1, 2) for r in results)
+            assert 1 <= engine.cursor_count <= 4
+        finally:
+            svc.close()
+
+
+class TestQueryResultCache:
+    def test_lru_eviction(self):
+        cache = QueryResultCache(max_entries=2)
+        keys = [cache.key(f"SELECT {i}", None) for i in range(3)]
+        for k in keys:
+            cache.put(k, [{"v": 1}])
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) == [{"v": 1}]
+
+    def test_ttl_expiry(self):
+        cache = QueryResultCache(ttl_seconds=0.0)
+        key = cache.key("SELECT 1", None)
+        cache.put(key, [{"v": 1}])
+        assert cache.get(key) is None
+
+    def test_stale_generation_not_stored(self):
+        cache = QueryResultCache()
+        key = cache.key("SELECT 1", [1])
+        cache.invalidate()
+        cache.put(key, [{"v": 1}])
+        assert len(cache) == 0
+
+    def test_large_results_not_cached(self):
+        cache = QueryResultCache(max_rows=2)
+        key = cache.key("SELECT 1", None)
+        cache.put(key, [{}, {}, {}])
+        assert len(cache) == 0
+
+    def test_dict_params_normalized(self):
+        cache = QueryResultCache()
+        assert cache.key("SELECT $a", {"a": 1, "b": [2]}) == cache.key(
+            "SELECT  $a", {"b": [2], "a": 1},
+        )
+
+
 # ── DuckDBDashboardService ──────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -282,6 +473,72 @@ class TestExportScanResults:
         assert len(rows_b) == 2
 
 
+@pytest.mark.asyncio
+class TestStreamScanResults:
+    async def _collect(self, chunks) -> bytes:
+        return b"".join([c async for c in chunks])
+
+    async def test_stream_empty_catalog(self, analytics: AnalyticsService):
+        encoder = create_encoder("json", SCAN_RESULTS_EXPORT_COLUMNS)
+        body = await self._collect(analytics.stream_scan_results(TENANT_A, encoder))
+        assert json.loads(body) == []
+
+    async def test_stream_empty_parquet_is_valid(self, analytics: AnalyticsService):
+        encoder = create_encoder(
+            "parquet", SCAN_RESULTS_EXPORT_COLUMNS, SCAN_RESULTS_EXPORT_SCHEMA,
+        )
+        body = await self._collect(analytics.stream_scan_results(TENANT_A, encoder))
+        table = pq.read_table(io.BytesIO(body))
+        assert table.num_rows == 0
+
+    async def test_stream_matches_export(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        encoder = create_encoder("json", SCAN_RESULTS_EXPORT_COLUMNS)
+        body = await self._collect(
+            analytics.stream_scan_results(TENANT_A, encoder, batch_size=1),
+        )
+        streamed = json.loads(body)
+        exported = await analytics.export_scan_results(TENANT_A)
+        assert [r["file_path"] for r in streamed] == [r["file_path"] for r in exported]
+        assert streamed[0]["recommended_label_name"] is None
+
+    async def test_stream_one_chunk_per_batch(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        encoder = create_encoder("parquet", SCAN_RESULTS_EXPORT_COLUMNS)
+        chunks = [
+            c async for c in analytics.stream_scan_results(
+                TENANT_A, encoder, risk_tier="CRITICAL", batch_size=1,
+            )
+        ]
+        table = pq.read_table(io.BytesIO(b"".join(chunks)))
+        assert table.column("risk_tier").to_pylist() == ["CRITICAL"]
+        assert len(chunks) >= 2  # row group bytes, then the footer
+
+    async def test_stream_closed_early(
+        self, storage: LocalStorage, analytics: AnalyticsService,
+    ):
+        """A consumer that stops mid-stream leaves the service usable."""
+        write_scan_results(storage)
+        analytics.refresh_views()
+
+        encoder = create_encoder("csv", SCAN_RESULTS_EXPORT_COLUMNS)
+        chunks = analytics.stream_scan_results(TENANT_A, encoder, batch_size=1)
+        assert await anext(chunks)  # header
+        assert await anext(chunks)  # first row
+        await chunks.aclose()
+
+        rows = await analytics.query("SELECT count(*) AS cnt FROM scan_results")
+        assert rows[0]["cnt"] == 2
+
+
 @pytest.mark.asyncio
 class TestRemediationStats:
     async def test_remediation_stats_empty(
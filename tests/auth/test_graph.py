@@ -386,6 +386,58 @@ class TestGraphClientUserLookups:
             assert params["$top"] == "5"
 
 
+    async def test_get_transitive_group_sids_follows_next_link(self, client):
+        """get_transitive_group_sids should page and skip cloud-only groups."""
+        pages = [
+            {
+                "value": [
+                    {"id": "g1", "onPremisesSecurityIdentifier": "S-1-5-21-1-2001"},
+                    {"id": "g2", "onPremisesSecurityIdentifier": None},
+                ],
+                "@odata.nextLink": f"{GRAPH_API_BASE}/users/u1/transitiveMemberOf?$skiptoken=x",
+            },
+            {"value": [{"id": "g3", "onPremisesSecurityIdentifier": "S-1-5-21-1-2003"}]},
+        ]
+
+        with patch.object(client, "_request", side_effect=pages) as mock_req:
+            sids = await client.get_transitive_group_sids("u1")
+
+        assert sids == ["S-1-5-21-1-2001", "S-1-5-21-1-2003"]
+        second = mock_req.call_args_list[1]
+        assert second[0][1] == "/users/u1/transitiveMemberOf?$skiptoken=x"
+        assert second[1]["params"] is None
+
+    async def test_get_users_by_on_prem_sids_batches(self, client):
+        """get_users_by_on_prem_sids should send one $batch request."""
+        mock_response = {
+            "responses": [
+                {"id": "1", "status": 200, "body": {"value": []}},
+                {"id": "0", "status": 200, "body": {"value": [
+                    {"id": "u1", "displayName": "Jane", "onPremisesSecurityIdentifier": "S-1-5-21-1"},
+                ]}},
+                {"id": "2", "status": 429, "body": {}},
+            ]
+        }
+
+        with patch.object(client, "_request", return_value=mock_response) as mock_req:
+            found = await client.get_users_by_on_prem_sids(
+                ["S-1-5-21-1", "S-1-5-21-2", "S-1-5-21-3"],
+            )
+
+        assert found["S-1-5-21-1"].display_name == "Jane"
+        assert found["S-1-5-21-2"] is None
+        assert "S-1-5-21-3" not in found  # throttled: retry, don't cache a miss
+        args, kwargs = mock_req.call_args
+        assert args == ("POST", "/$batch")
+        requests = kwargs["json"]["requests"]
+        assert [r["id"] for r in requests] == ["0", "1", "2"]
+        assert "S-1-5-21-2" in requests[1]["url"]
+        assert " " not in requests[1]["url"]
+
+    async def test_get_users_by_on_prem_sids_rejects_oversized_batch(self, client):
+        with pytest.raises(ValueError):
+            await client.get_users_by_on_prem_sids([f"S-1-5-21-{i}" for i in range(21)])
+
 class TestGraphClientRequest:
     """Tests for low-level request method."""
 
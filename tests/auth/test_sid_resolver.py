@@ -6,6 +6,9 @@ import os
 # Add src to path for direct import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+import asyncio
+
+import httpx
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -352,3 +355,253 @@ class TestAsyncResolution:
         assert len(results) == 3
         assert results["S-1-5-18"].display_name == "Local System"
         assert results["S-1-5-19"].display_name == "NT Authority\\Local Service"
+
+
+class TestExpandPrincipal:
+    """Tests for transitive group expansion."""
+
+    @staticmethod
+    def _resolver_with_groups(group_sids):
+        resolver = SIDResolver(enable_graph=True)
+        mock_graph_user = MagicMock()
+        mock_graph_user.id = "user-guid"
+        mock_graph_user.display_name = "Jane Doe"
+        mock_graph_user.user_principal_name = "jdoe@contoso.com"
+        mock_graph_user.on_premises_sam_account_name = "CONTOSO\\jdoe"
+        mock_graph_user.on_premises_security_identifier = "S-1-5-21-1-2-3-1013"
+        mock_graph_user.department = None
+        mock_graph_user.job_title = None
+
+        mock_client = MagicMock()
+        mock_client.get_user_by_on_prem_sid = AsyncMock(return_value=mock_graph_user)
+        mock_client.get_user_by_upn = AsyncMock(return_value=mock_graph_user)
+        mock_client.get_transitive_group_sids = AsyncMock(return_value=group_sids)
+        resolver._graph_client = mock_client
+        return resolver, mock_client
+
+    async def test_sid_includes_transitive_and_implicit_groups(self):
+        resolver, _ = self._resolver_with_groups(["s-1-5-21-1-2-3-2001", "S-1-5-21-1-2-3-2002"])
+
+        result = await resolver.expand_principal("s-1-5-21-1-2-3-1013")
+
+        assert result == {
+            "S-1-5-21-1-2-3-1013",
+            "S-1-5-21-1-2-3-2001",
+            "S-1-5-21-1-2-3-2002",
+            "S-1-1-0",
+            "S-1-5-11",
+        }
+
+    async def test_upn_adds_on_prem_sid(self):
+        resolver, _ = self._resolver_with_groups(["S-1-5-21-1-2-3-2001"])
+
+        result = await resolver.expand_principal("jdoe@contoso.com")
+
+        assert "jdoe@contoso.com" in result
+        assert "S-1-5-21-1-2-3-1013" in result
+        assert "S-1-5-21-1-2-3-2001" in result
+
+    async def test_expansion_is_cached(self):
+        resolver, client = self._resolver_with_groups(["S-1-5-21-1-2-3-2001"])
+
+        first = await resolver.expand_principal("S-1-5-21-1-2-3-1013")
+        second = await resolver.expand_principal("S-1-5-21-1-2-3-1013")
+
+        assert first == second
+        assert client.get_transitive_group_sids.await_count == 1
+        assert resolver.get_cache_stats()["group_entries"] == 1
+
+    async def test_graph_failure_not_cached(self):
+        resolver, client = self._resolver_with_groups([])
+        client.get_transitive_group_sids = AsyncMock(side_effect=RuntimeError("down"))
+
+        result = await resolver.expand_principal("S-1-5-21-1-2-3-1013")
+
+        assert result == {"S-1-5-21-1-2-3-1013", "S-1-1-0", "S-1-5-11"}
+        assert resolver.get_cache_stats()["group_entries"] == 0
+
+    @staticmethod
+    def _graph_forbidden():
+        request = httpx.Request("GET", "https://graph.microsoft.com/v1.0/users")
+        response = httpx.Response(403, request=request)
+        return httpx.HTTPStatusError("Forbidden", request=request, response=response)
+
+    async def test_graph_http_error_on_groups_falls_back_to_sid(self):
+        resolver, client = self._resolver_with_groups([])
+        client.get_transitive_group_sids = AsyncMock(side_effect=self._graph_forbidden())
+
+        result = await resolver.expand_principal("S-1-5-21-1-2-3-1013")
+
+        assert result == {"S-1-5-21-1-2-3-1013", "S-1-1-0", "S-1-5-11"}
+        assert resolver.get_cache_stats()["group_entries"] == 0
+
+    async def test_graph_http_error_on_upn_lookup_falls_back(self):
+        resolver, client = self._resolver_with_groups([])
+        client.get_user_by_upn = AsyncMock(side_effect=self._graph_forbidden())
+
+        result = await resolver.expand_principal("jdoe@contoso.com")
+
+        assert result == {"jdoe@contoso.com", "S-1-1-0", "S-1-5-11"}
+        assert resolver.get_cache_stats()["group_entries"] == 0
+
+    async def test_well_known_sid_not_expanded(self):
+        resolver = SIDResolver(enable_graph=False)
+        assert await resolver.expand_principal("S-1-1-0") == {"S-1-1-0"}
+
+    async def test_posix_name_uses_local_groups(self):
+        resolver = SIDResolver(enable_graph=False)
+
+        with patch(
+            "openlabels.auth.sid_resolver._posix_groups", return_value={"staff"},
+        ):
+            result = await resolver.expand_principal("alice")
+
+        assert result == {"alice", "staff", "S-1-1-0", "S-1-5-11"}
+
+
+class _FakeSharedCache:
+    """Stand-in for a Redis-backed CacheManager."""
+
+    is_redis_connected = True
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get_many(self, keys):
+        return {k: dict(self.data[k]) for k in keys if k in self.data}
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+
+def _graph_user(sid):
+    user = MagicMock()
+    user.id = f"guid-{sid}"
+    user.display_name = f"User {sid}"
+    user.user_principal_name = None
+    user.on_premises_sam_account_name = None
+    user.department = None
+    user.job_title = None
+    return user
+
+
+class TestBatchResolution:
+    """Tests for deduplicated, Graph $batch-backed resolve_batch."""
+
+    @staticmethod
+    def _graph(unknown=()):
+        async def lookup(chunk):
+            return {sid: None if sid in unknown else _graph_user(sid) for sid in chunk}
+
+        client = MagicMock()
+        client.get_users_by_on_prem_sids = AsyncMock(side_effect=lookup)
+        return client
+
+    async def test_deduplicates_and_chunks_by_twenty(self):
+        resolver = SIDResolver(enable_graph=True)
+        resolver._graph_client = self._graph()
+        sids = [f"S-1-5-21-9-{i}" for i in range(45)]
+
+        results = await resolver.resolve_batch(sids + [s.lower() for s in sids[:5]])
+
+        calls = resolver._graph_client.get_users_by_on_prem_sids.await_args_list
+        assert sorted(len(c.args[0]) for c in calls) == [5, 20, 20]
+        assert len(results) == 50
+        assert results["s-1-5-21-9-0"].display_name == "User S-1-5-21-9-0"
+        assert results["S-1-5-21-9-44"].resolution_source == "graph_api"
+
+    async def test_concurrency_is_bounded(self):
+        resolver = SIDResolver(enable_graph=True, max_concurrency=2)
+        in_flight = peak = 0
+
+        async def lookup(chunk):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {sid: _graph_user(sid) for sid in chunk}
+
+        resolver._graph_client = MagicMock()
+        resolver._graph_client.get_users_by_on_prem_sids = AsyncMock(side_effect=lookup)
+
+        await resolver.resolve_batch([f"S-1-5-21-9-{i}" for i in range(200)])
+        assert peak == 2
+
+    async def test_cache_hits_skip_graph(self):
+        resolver = SIDResolver(enable_graph=True)
+        resolver._graph_client = self._graph()
+
+        await resolver.resolve_batch(["S-1-5-21-9-1", "S-1-5-18"])
+        await resolver.resolve_batch(["S-1-5-21-9-1"])
+
+        calls = resolver._graph_client.get_users_by_on_prem_sids.await_args_list
+        assert [c.args[0] for c in calls] == [["S-1-5-21-9-1"]]
+
+    async def test_unknown_sid_negatively_cached(self):
+        resolver = SIDResolver(enable_graph=True)
+        resolver._graph_client = self._graph(unknown={"S-1-5-21-9-7"})
+
+        first = await resolver.resolve_batch(["S-1-5-21-9-7"])
+        second = await resolver.resolve_batch(["S-1-5-21-9-7"])
+
+        assert first["S-1-5-21-9-7"].resolution_source == "fallback"
+        assert second["S-1-5-21-9-7"].resolution_source == "fallback"
+        assert resolver._graph_client.get_users_by_on_prem_sids.await_count == 1
+
+    async def test_negative_entries_expire(self):
+        resolver = SIDResolver(enable_graph=True, negative_cache_ttl_minutes=5)
+        resolver._negative["S-1-5-21-9-7"] = datetime.now(timezone.utc) - timedelta(minutes=6)
+        resolver._graph_client = self._graph()
+
+        result = await resolver.resolve_batch(["S-1-5-21-9-7"])
+        assert result["S-1-5-21-9-7"].resolution_source == "graph_api"
+
+    async def test_failed_chunk_falls_back_without_failing_batch(self):
+        resolver = SIDResolver(enable_graph=True)
+        resolver._graph_client = MagicMock()
+        resolver._graph_client.get_users_by_on_prem_sids = AsyncMock(
+            side_effect=RuntimeError("throttled"),
+        )
+
+        results = await resolver.resolve_batch(["S-1-5-21-9-1", "S-1-5-18"])
+
+        assert results["S-1-5-21-9-1"].resolution_source == "fallback"
+        assert results["S-1-5-18"].display_name == "Local System"
+
+    async def test_shared_tier_round_trip(self):
+        shared = _FakeSharedCache()
+        writer = SIDResolver(
+            enable_graph=True, use_shared=True, cache_manager=shared,
+            negative_cache_ttl_minutes=10,
+        )
+        writer._graph_client = self._graph(unknown={"S-1-5-21-9-2"})
+        await writer.resolve_batch(["S-1-5-21-9-1", "S-1-5-21-9-2"])
+
+        assert shared.data["sid:S-1-5-21-9-2"] == {"not_found": True}
+        assert shared.ttls["sid:S-1-5-21-9-2"] == 600
+        assert shared.ttls["sid:S-1-5-21-9-1"] == 24 * 3600
+
+        # A fresh process sees both entries without calling Graph
+        reader = SIDResolver(enable_graph=True, use_shared=True, cache_manager=shared)
+        reader._graph_client = self._graph()
+        results = await reader.resolve_batch(["S-1-5-21-9-1", "S-1-5-21-9-2"])
+
+        assert results["S-1-5-21-9-1"].display_name == "User S-1-5-21-9-1"
+        assert results["S-1-5-21-9-1"].resolution_source == "cache"
+        assert results["S-1-5-21-9-2"].resolution_source == "fallback"
+        reader._graph_client.get_users_by_on_prem_sids.assert_not_called()
+
+    async def test_warm_up_resolves_stored_sids(self):
+        resolver = SIDResolver(enable_graph=True)
+        resolver._graph_client = self._graph()
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[
+            MagicMock(sid="S-1-5-21-9-1"), MagicMock(sid="S-1-5-21-9-2"),
+        ])
+
+        assert await resolver.warm_up(session) == 2
+        assert resolver.get_cache_stats()["valid_entries"] == 2
@@ -379,3 +379,52 @@ class TestClassifyEntityDisplay:
         assert result.exit_code == 0
         # High risk count should be shown in summary
         assert "High" in result.output or "risk" in result.output.lower()
+
+
+class TestClassifyProfile:
+    """Tests for the --profile stage breakdown."""
+
+    def test_profile_prints_stage_breakdown(self, runner, temp_dir):
+        """Profiling a real classification shows per-stage and per-detector rows."""
+        from openlabels.cli.commands.classify import classify
+
+        test_file = Path(temp_dir) / "test_document.txt"
+        result = runner.invoke(classify, [str(test_file), "--profile"])
+
+        assert result.exit_code == 0
+        assert "Stage profile" in result.output
+        assert "file" in result.output
+        assert "read" in result.output
+        assert "detector:" in result.output
+
+    def test_profile_output_writes_summary_and_traces(self, runner, temp_dir):
+        """--profile-output writes stage histograms and sampled traces."""
+        from openlabels.cli.commands.classify import classify
+
+        profile_file = Path(temp_dir) / "profile.json"
+        result = runner.invoke(classify, [
+            temp_dir, "-r", "--profile-output", str(profile_file), "--trace-sample-rate", "1",
+        ])
+
+        assert result.exit_code == 0
+        assert "Stage profile" not in result.output
+        data = json.loads(profile_file.read_text())
+        assert data["stages"]["file"]["count"] == 3
+        assert "file/detect" in data["stages"]
+        assert data["files_traced"] == 3
+        assert all(t["stages"] for t in data["traces"])
+
+    def test_no_profile_by_default(self, runner, temp_dir, mock_file_classification):
+        """Without profiling options no breakdown is printed."""
+        from openlabels.cli.commands.classify import classify
+
+        test_file = Path(temp_dir) / "test_document.txt"
+        with patch("openlabels.core.processor.FileProcessor") as mock_processor_cls:
+            mock_processor = MagicMock()
+            mock_processor.process_file = AsyncMock(return_value=mock_file_classification)
+            mock_processor_cls.return_value = mock_processor
+
+            result = runner.invoke(classify, [str(test_file)])
+
+        assert result.exit_code == 0
+        assert "Stage profile" not in result.output
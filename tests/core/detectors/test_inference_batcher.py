@@ -0,0 +1,160 @@
+"""
+Tests for InferenceBatcher (dynamic batching for ONNX NER inference).
+
+Uses a fake session whose logits are a deterministic function of the
+input ids, so padded/batched results can be compared to batch-size-1.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from openlabels.core.detectors.inference_batcher import InferenceBatcher
+from openlabels.core.detectors.ml_onnx import ONNXDetector
+
+NUM_LABELS = 3
+
+
+class FakeSession:
+    """Mimics InferenceSession.run for [batch, seq_len] inputs."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[tuple[int, int]] = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def run(self, output_names, feeds):
+        input_ids = feeds["input_ids"]
+        mask = feeds["attention_mask"]
+        with self._lock:
+            self.calls.append(input_ids.shape)
+        if self.fail:
+            raise RuntimeError("inference exploded")
+        # logits[b, t, k] = id * (k + 1), zeroed where masked
+        ks = np.arange(1, NUM_LABELS + 1, dtype=np.float32)
+        logits = input_ids[..., None].astype(np.float32) * ks * mask[..., None]
+        return [logits]
+
+
+def _expected(ids):
+    ks = np.arange(1, NUM_LABELS + 1, dtype=np.float32)
+    return np.asarray(ids, dtype=np.float32)[:, None] * ks
+
+
+class TestInferenceBatcher:
+
+    def test_single_request_trimmed_to_length(self):
+        session = FakeSession()
+        batcher = InferenceBatcher(session, max_batch_size=4, max_wait_ms=1.0)
+        try:
+            logits = batcher.infer(np.array([[5, 6, 7]]), np.array([[1, 1, 1]]))
+        finally:
+            batcher.close()
+
+        assert logits.shape == (3, NUM_LABELS)
+        np.testing.assert_allclose(logits, _expected([5, 6, 7]))
+
+    def test_concurrent_requests_share_a_batch(self):
+        session = FakeSession()
+        batcher = InferenceBatcher(session, max_batch_size=8, max_wait_ms=200.0)
+        sequences = [[i + 1] * (i + 2) for i in range(8)]
+        try:
+            futures = [
+                batcher.submit(np.array(seq), np.ones(len(seq), dtype=np.int64))
+                for seq in sequences
+            ]
+            results = [f.result(timeout=5) for f in futures]
+        finally:
+            batcher.close()
+
+        # All eight chunks padded into one [8, 9] tensor
+        assert session.calls == [(8, 9)]
+        for seq, logits in zip(sequences, results, strict=True):
+            assert logits.shape == (len(seq), NUM_LABELS)
+            np.testing.assert_allclose(logits, _expected(seq))
+        assert batcher.stats.batches_run == 1
+        assert batcher.stats.avg_batch_size == 8
+
+    def test_respects_max_batch_size(self):
+        session = FakeSession()
+        batcher = InferenceBatcher(session, max_batch_size=2, max_wait_ms=50.0)
+        try:
+            futures = [batcher.submit(np.array([1, 2]), np.array([1, 1])) for _ in range(5)]
+            for f in futures:
+                f.result(timeout=5)
+        finally:
+            batcher.close()
+
+        assert all(shape[0] <= 2 for shape in session.calls)
+        assert sum(shape[0] for shape in session.calls) == 5
+
+    def test_submit_from_many_threads(self):
+        session = FakeSession()
+        batcher = InferenceBatcher(session, max_batch_size=16, max_wait_ms=5.0)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(
+                    lambda n: batcher.infer(np.arange(1, n + 1), np.ones(n, dtype=np.int64)),
+                    range(1, 33),
+                ))
+        finally:
+            batcher.close()
+
+        for n, logits in zip(range(1, 33), results, strict=True):
+            np.testing.assert_allclose(logits, _expected(range(1, n + 1)))
+
+    def test_session_error_propagates_to_callers(self):
+        batcher = InferenceBatcher(FakeSession(fail=True), max_batch_size=4, max_wait_ms=1.0)
+        try:
+            future = batcher.submit(np.array([1]), np.array([1]))
+            with pytest.raises(RuntimeError, match="exploded"):
+                future.result(timeout=5)
+        finally:
+            batcher.close()
+
+    def test_submit_after_close_raises(self):
+        batcher = InferenceBatcher(FakeSession())
+        batcher.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            batcher.submit(np.array([1]), np.array([1]))
+
+
+class TestONNXDetectorBatching:
+    """ONNXDetector routes every chunk through the batcher."""
+
+    @pytest.fixture
+    def detector(self):
+        det = ONNXDetector()
+        det._loaded = True
+        det._session = FakeSession()
+        det._batcher = InferenceBatcher(det._session, max_batch_size=32, max_wait_ms=50.0)
+        det._id2label = {0: "O", 1: "O", 2: "O"}
+        det._tokenize = lambda text: (
+            np.array([[1] * min(len(text), 8)]),
+            np.array([[1] * min(len(text), 8)]),
+            [(i, i + 1) for i in range(min(len(text), 8))],
+        )
+        yield det
+        det.close()
+
+    def test_long_document_chunks_batched_together(self, detector):
+        text = ("word " * 2000).strip()
+        chunk_count = len(detector._chunk_text(text))
+
+        assert detector.detect(text) == []
+        assert chunk_count > 1
+        assert sum(shape[0] for shape in detector._session.calls) == chunk_count
+        assert len(detector._session.calls) < chunk_count
+
+    def test_close_stops_batcher(self, detector):
+        detector.close()
+        assert detector._batcher is None
+
+    def test_batching_disabled_runs_inline(self):
+        det = ONNXDetector(batch_size=1)
+        det._session = FakeSession()
+        future = det._submit_inference(np.array([[3, 4]]), np.array([[1, 1]]))
+        np.testing.assert_allclose(future.result(), _expected([3, 4]))
+        assert det._batcher is None
@@ -0,0 +1,131 @@
+"""
+Tests for PatternScanner (literal-prefiltered scanning of pattern tables).
+
+The scanner must produce exactly what the per-pattern finditer loop
+produced: same patterns, same matches, same order.
+"""
+
+import re
+
+import pytest
+
+from openlabels.core.detectors.additional_patterns import ADDITIONAL_PATTERNS
+from openlabels.core.detectors.financial import FINANCIAL_PATTERNS
+from openlabels.core.detectors.government import GOVERNMENT_PATTERNS
+from openlabels.core.detectors.pattern_registry import _p
+from openlabels.core.detectors.pattern_scanner import (
+    ANCHORED,
+    FULL,
+    GATED,
+    PatternScanner,
+    plan_pattern,
+)
+from openlabels.core.detectors.patterns import PATTERNS
+from openlabels.core.detectors.secrets import SECRETS_PATTERNS
+
+TABLES = {
+    "patterns": PATTERNS,
+    "secrets": SECRETS_PATTERNS,
+    "financial": FINANCIAL_PATTERNS,
+    "government": GOVERNMENT_PATTERNS,
+    "additional": ADDITIONAL_PATTERNS,
+}
+
+SAMPLE_TEXT = """
+Patient: John Smith  DOB: 01/15/1980  MRN: 123456789
+SSN: 123-45-6789, seen by Dr. Sarah Jones on March 3, 2024.
+Address: 1234 Main Street, Springfield, IL 62704. Phone (555) 123-4567.
+Contact: john.smith@example.com, IP 192.168.1.10
+AWS key AKIA""" + "IOSFODNN7EXAMPLE" + """ and token ghp_""" + "a" * 36 + """
+Card 4111 1111 1111 1111, IBAN GB82WEST12345698765432, CUSIP: 037833100
+TOP SECRET//NOFORN  CAGE code: 1ABC2  Passport: 123456789
+Routing number: 021000021  Employee ID: EMP-004512
+Ünïcödé İstanbul ſecret: 'abcdefghijklmnopqrstuvwx' K
+"""
+
+
+def _loop(table, text):
+    return [
+        (pdef.entity_type, match.span(), match.groups())
+        for pdef in table
+        for match in pdef.pattern.finditer(text)
+    ]
+
+
+def _scanned(scanner, text):
+    return [
+        (pdef.entity_type, match.span(), match.groups())
+        for pdef, match in scanner.scan(text)
+    ]
+
+
+class TestScanPlanning:
+
+    def test_literal_prefix_is_anchored(self):
+        plan = plan_pattern(0, _p(r'AKIA[0-9A-Z]{16}', 'AWS_ACCESS_KEY', 0.99))
+        assert plan.strategy == ANCHORED
+        assert plan.literals == frozenset({("AKIA", False)})
+
+    def test_factored_alternation_expands_to_full_literals(self):
+        # sre_parse factors the shared "A" out of the alternation
+        plan = plan_pattern(0, _p(r'(?:AKIA|ABIA)[0-9A-Z]{16}', 'AWS_ACCESS_KEY', 0.99))
+        assert plan.strategy == ANCHORED
+        assert {text for text, _ in plan.literals} == {"AKIA", "ABIA"}
+
+    def test_case_insensitive_literals_marked(self):
+        plan = plan_pattern(0, _p(r'SSN[:\s]+(\d{9})', 'SSN', 0.9, 1, flags=re.I))
+        assert plan.strategy == ANCHORED
+        assert plan.literals == frozenset({("SSN", True)})
+
+    def test_inner_literal_is_gated(self):
+        plan = plan_pattern(0, _p(r'\d+\s+Main\s+Street', 'ADDRESS', 0.8))
+        assert plan.strategy == GATED
+        assert ("Street", False) in plan.literals
+
+    def test_optional_prefix_is_not_an_anchor(self):
+        plan = plan_pattern(0, _p(r'(?:SSN\s*)?\d{3}-\d{2}-\d{4}', 'SSN', 0.8))
+        assert plan.strategy == GATED
+        assert plan.literals == frozenset({("-", False)})
+
+    def test_no_literals_is_full(self):
+        plan = plan_pattern(0, _p(r'\b\d{9}\b', 'SSN', 0.8))
+        assert plan.strategy == FULL
+
+
+class TestPatternScanner:
+
+    @pytest.mark.parametrize("name", sorted(TABLES))
+    def test_matches_per_pattern_loop(self, name):
+        table = TABLES[name]
+        scanner = PatternScanner(table)
+        assert _scanned(scanner, SAMPLE_TEXT) == _loop(table, SAMPLE_TEXT)
+
+    @pytest.mark.parametrize("name", sorted(TABLES))
+    def test_most_patterns_prefiltered(self, name):
+        counts = PatternScanner(TABLES[name]).strategy_counts
+        assert sum(counts.values()) == len(TABLES[name])
+        assert counts[FULL] < len(TABLES[name]) / 2
+
+    def test_overlapping_anchor_occurrences(self):
+        table = (_p(r'abab\d', 'X', 0.9),)
+        text = "ababab1 abab2"
+        assert _scanned(PatternScanner(table), text) == _loop(table, text)
+
+    def test_anchor_skips_inside_previous_match(self):
+        table = (_p(r'key(?:key)*\d', 'X', 0.9),)
+        text = "keykeykey1 key2"
+        assert _scanned(PatternScanner(table), text) == _loop(table, text)
+
+    def test_case_insensitive_non_ascii_text(self):
+        # U+017F folds to "s" and U+212A to "k" under re.IGNORECASE
+        table = (_p(r'secret[:\s]+(\w+)', 'SECRET', 0.8, 1, flags=re.I),
+                 _p(r'\d+\s+key\s+st', 'X', 0.8, flags=re.I))
+        text = "ſecret: one SECRET: two 12 Key ſt"
+        assert _scanned(PatternScanner(table), text) == _loop(table, text)
+
+    def test_absent_literals_skip_pattern(self):
+        table = (_p(r'AKIA[0-9A-Z]{16}', 'AWS_ACCESS_KEY', 0.99),)
+        assert list(PatternScanner(table).scan("nothing to see here")) == []
+
+    def test_empty_table(self):
+        assert list(PatternScanner(()).scan(SAMPLE_TEXT)) == []
@@ -0,0 +1,188 @@
+"""
+Tests for the process-pool detection backend.
+
+Covers compact span packing, the worker-side batch function, and
+end-to-end dispatch through DetectorOrchestrator in process mode.
+"""
+
+import pytest
+
+from openlabels.core.detectors import process_pool
+from openlabels.core.detectors.config import DetectionConfig
+from openlabels.core.detectors.orchestrator import DetectorOrchestrator
+from openlabels.core.detectors.process_pool import (
+    ProcessPoolDetectionBackend,
+    _detect_batch,
+    _init_worker,
+    pack_spans,
+    unpack_spans,
+)
+from openlabels.core.types import Span, SpanContext, Tier
+
+SSN_TEXT = "Patient SSN: 123-45-6789"
+
+
+class TestSpanPacking:
+    """Tests for compact span tuple conversion."""
+
+    def test_round_trip(self):
+        text = "Contact john@example.com today"
+        span = Span(
+            start=8, end=24, text="john@example.com", entity_type="EMAIL",
+            confidence=0.95, detector="pattern", tier=Tier.PATTERN,
+        )
+
+        packed = pack_spans([span])
+        assert packed == [(8, 24, "EMAIL", 0.95, "pattern", 2, False, None, None, None)]
+
+        restored = unpack_spans(text, packed)
+        assert restored[0].text == "john@example.com"
+        assert restored[0].tier == Tier.PATTERN
+        assert restored[0].entity_type == "EMAIL"
+
+    def test_round_trip_keeps_review_and_context_fields(self):
+        text = "Contact john@example.com today"
+        span = Span(
+            start=8, end=24, text="john@example.com", entity_type="EMAIL",
+            confidence=0.6, detector="pattern", tier=Tier.PATTERN,
+            context=SpanContext(source_page=3, extraction_method="ocr"),
+            needs_review=True,
+            review_reason="low confidence",
+            coref_anchor_value="john@example.com",
+        )
+
+        assert unpack_spans(text, pack_spans([span])) == [span]
+
+    def test_empty(self):
+        assert pack_spans([]) == []
+        assert unpack_spans("anything", []) == []
+
+
+class TestDetectBatch:
+    """Tests for the worker-side batch entry point (run in-process)."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_worker(self):
+        yield
+        process_pool._worker_orchestrator = None
+
+    def test_requires_initialized_worker(self):
+        process_pool._worker_orchestrator = None
+        with pytest.raises(RuntimeError):
+            _detect_batch(["text"])
+
+    def test_batch_matches_thread_mode(self):
+        config = DetectionConfig(execution_mode="process")
+        _init_worker(config)
+
+        packed = _detect_batch([SSN_TEXT, "nothing sensitive here"])
+
+        assert len(packed) == 2
+        spans, entity_counts, detectors_used, _, _, ml_chars = packed[0]
+        assert "SSN" in entity_counts
+        assert any(entity_type == "SSN" for _, _, entity_type, *_ in spans)
+        assert packed[1][0] == []
+        assert ml_chars == 0  # No ML detectors configured
+
+        expected = DetectorOrchestrator().detect_sync(SSN_TEXT)
+        assert entity_counts == expected.entity_counts
+        assert unpack_spans(SSN_TEXT, spans) == expected.spans
+
+    def test_worker_uses_thread_mode(self):
+        _init_worker(DetectionConfig(execution_mode="process"))
+        assert process_pool._worker_orchestrator.config.execution_mode == "thread"
+        assert process_pool._worker_orchestrator._process_backend is None
+
+
+class TestOrchestratorProcessMode:
+    """Tests for execution_mode wiring on the orchestrator."""
+
+    def test_thread_mode_has_no_backend(self):
+        orchestrator = DetectorOrchestrator()
+        assert orchestrator._process_backend is None
+
+    def test_process_mode_creates_backend(self):
+        orchestrator = DetectorOrchestrator(
+            DetectionConfig(execution_mode="process", process_workers=2, process_batch_size=4)
+        )
+        backend = orchestrator._process_backend
+        assert isinstance(backend, ProcessPoolDetectionBackend)
+        assert backend.num_workers == 2
+        assert backend.batch_size == 4
+        # Pool is started lazily
+        assert backend._executor is None
+        # Detectors are only built inside the workers
+        assert orchestrator.detectors == []
+        orchestrator.shutdown()
+
+    def test_process_mode_detect_sync_loads_detectors_on_demand(self):
+        orchestrator = DetectorOrchestrator(DetectionConfig(execution_mode="process"))
+        try:
+            result = orchestrator.detect_sync(SSN_TEXT)
+        finally:
+            orchestrator.shutdown()
+
+        assert "SSN" in result.entity_counts
+        assert orchestrator.detectors
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError, match="execution_mode"):
+            DetectorOrchestrator(DetectionConfig(execution_mode="gpu"))
+
+    def test_auto_worker_count(self):
+        backend = ProcessPoolDetectionBackend(DetectionConfig(), num_workers=0)
+        assert backend.num_workers >= 1
+
+    @pytest.mark.asyncio
+    async def test_pool_reset_keeps_in_flight_count(self):
+        import asyncio
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import MagicMock
+
+        backend = ProcessPoolDetectionBackend(DetectionConfig(), num_workers=2)
+        submitted: list[Future] = []
+
+        def submit(fn, texts):
+            future = Future()
+            submitted.append(future)
+            return future
+
+        executor = MagicMock(submit=submit)
+        backend._get_executor = lambda: executor
+        calls = [asyncio.ensure_future(backend.detect(SSN_TEXT)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert backend._in_flight == 2
+
+        # First batch breaks the pool; the second completes afterwards
+        submitted[0].set_exception(BrokenProcessPool("worker died"))
+        await asyncio.sleep(0)
+        assert backend._in_flight == 1
+        submitted[1].cancel()
+        await asyncio.sleep(0)
+
+        assert backend._in_flight == 0
+        for call in calls:
+            with pytest.raises((BrokenProcessPool, asyncio.CancelledError)):
+                await call
+
+    @pytest.mark.asyncio
+    async def test_detect_via_worker_processes(self):
+        import asyncio
+
+        orchestrator = DetectorOrchestrator(
+            DetectionConfig(execution_mode="process", process_workers=2)
+        )
+        try:
+            results = await asyncio.gather(
+                *(orchestrator.detect(SSN_TEXT) for _ in range(5)),
+                orchestrator.detect("   "),
+            )
+        finally:
+            orchestrator.shutdown()
+
+        for result in results[:5]:
+            assert "SSN" in result.entity_counts
+            ssn = next(s for s in result.spans if s.entity_type == "SSN")
+            assert ssn.text == SSN_TEXT[ssn.start:ssn.end]
+        assert results[5].spans == []
@@ -0,0 +1,97 @@
+"""Tests for tiered ML escalation region planning."""
+
+from openlabels.core.pipeline.escalation import (
+    EscalationPlan,
+    medical_hits,
+    merge_regions,
+    plan_escalation,
+)
+from openlabels.core.types import SpanBatch, Tier
+from openlabels.dictionaries import DictionaryLoader
+
+FILLER = "lorem ipsum dolor sit amet " * 40  # 1080 chars
+
+
+def _batch(text, *rows):
+    batch = SpanBatch(text)
+    for start, end, entity_type, confidence in rows:
+        batch.append(start, end, entity_type, confidence, "pattern", Tier.PATTERN)
+    return batch
+
+
+def _loader(tmp_path):
+    (tmp_path / "clinical_workflow.txt").write_text("discharge summary\nintubated\n")
+    (tmp_path / "professions.txt").write_text("physician\nrn\n")
+    (tmp_path / "clinical_stopwords.txt").write_text("patient\n")
+    return DictionaryLoader(dict_dir=tmp_path)
+
+
+class TestMergeRegions:
+    def test_widens_and_clamps(self):
+        text = "x" * 100
+        assert merge_regions(text, [(10, 20)], window=5) == [(5, 25)]
+        assert merge_regions(text, [(2, 4), (97, 99)], window=5) == [(0, 9), (92, 100)]
+
+    def test_snaps_to_whitespace(self):
+        text = "alpha bravo charlie delta echo"
+        # 12..19 = "charlie"; a 3-char window would cut "bravo" and "delta"
+        assert merge_regions(text, [(12, 19)], window=3) == [(6, 25)]
+
+    def test_merges_nearby_regions(self):
+        text = "x" * 1000
+        assert merge_regions(text, [(100, 110), (130, 140)], window=10) == [(90, 150)]
+        assert len(merge_regions(text, [(100, 110), (500, 510)], window=10)) == 2
+
+
+class TestPlanEscalation:
+    def test_confident_stage1_spans_skip_ml(self):
+        text = FILLER + "SSN 123-45-6789" + FILLER
+        batch = _batch(text, (len(FILLER) + 4, len(FILLER) + 15, "SSN", 0.99))
+
+        plan = plan_escalation(text, batch, window=50)
+
+        assert plan == EscalationPlan()
+        assert plan.ml_chars == 0
+
+    def test_low_confidence_span_escalates_its_window(self):
+        start = len(FILLER)
+        text = FILLER + "maybe 555-0100 " + FILLER
+        batch = _batch(text, (start + 6, start + 14, "PHONE", 0.5))
+
+        plan = plan_escalation(text, batch, window=50)
+
+        assert plan.reason == "low_confidence_spans: 1"
+        (region,) = plan.regions
+        assert region[0] <= start + 6 and region[1] >= start + 14
+        assert plan.ml_chars < 200 < len(text)
+
+    def test_ml_beneficial_type_below_cap(self):
+        text = FILLER + "Jane Doe " + FILLER
+        name = (len(FILLER), len(FILLER) + 8, "NAME", 0.8)
+
+        assert plan_escalation(text, _batch(text, name)).reason == "ml_beneficial_type: NAME"
+        sure = (*name[:3], 0.95)
+        assert plan_escalation(text, _batch(text, sure)).regions == []
+
+    def test_medical_terms_escalate(self, tmp_path):
+        loader = _loader(tmp_path)
+        text = FILLER + "Discharge summary by the physician. " + FILLER
+
+        plan = plan_escalation(text, SpanBatch(text), window=40, medical_dictionaries=loader)
+
+        assert plan.medical_context
+        assert plan.reason == "medical_context_detected"
+        (region,) = plan.regions
+        assert text.index("Discharge") >= region[0]
+        assert text.index("physician") < region[1]
+        assert plan.ml_chars < len(text) // 4
+
+
+class TestMedicalHits:
+    def test_filters_short_terms_and_stopwords(self, tmp_path):
+        loader = _loader(tmp_path)
+        text = "The RN saw the patient; intubated. Dx J45.20"
+
+        hits = [text[s:e] for s, e in medical_hits(text, loader)]
+
+        assert hits == ["intubated", "J45.20"]
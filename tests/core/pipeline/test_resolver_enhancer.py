@@ -9,9 +9,11 @@ tests/pipeline/test_context_enhancer.py with deeper coverage of:
 - Full enhance() pipeline orchestration
 """
 
+import random
+
 import pytest
 
-from openlabels.core.types import Span, Tier
+from openlabels.core.types import Span, SpanBatch, Tier
 from openlabels.core.pipeline.entity_resolver import (
     EntityResolver,
     Entity,
@@ -24,6 +26,7 @@ from openlabels.core.pipeline.entity_resolver import (
 from openlabels.core.pipeline.context_enhancer import (
     ContextEnhancer,
     EnhancementResult,
+    HotwordIndex,
     HotwordRule,
     NAME_DENY_LIST,
     USERNAME_DENY_LIST,
@@ -809,6 +812,49 @@ class TestHotwordDepression:
         assert confidence < 0.70
 
 
+class TestHotwordIndex:
+    """Document-wide hotword index used by enhance_batch."""
+
+    WORDS = (
+        "Mr. Dr Dear attn: patient: name: signed, Smith Jones Inc. LLC "
+        "street Ave from at in to via 's site the and of John Mary"
+    ).split()
+
+    def test_same_scores_as_window_search(self):
+        """Indexed scoring matches per-span window searches exactly."""
+        rng = random.Random(3)
+        enhancer = ContextEnhancer()
+        for _ in range(50):
+            tokens = [rng.choice(self.WORDS) for _ in range(100)]
+            text = " ".join(tokens)
+            index = HotwordIndex(text)
+            pos = 0
+            for token in tokens:
+                if token in ("Smith", "Jones", "John", "Mary"):
+                    span = make_span(token, start=pos, confidence=0.5, tier=Tier.ML)
+                    assert enhancer._apply_hotwords(text, span, 0.5, index) == (
+                        enhancer._apply_hotwords(text, span, 0.5)
+                    )
+                pos += len(token) + 1
+
+    def test_no_hit_skips_rule(self):
+        text = "Contact Mr. John Smith for details"
+        index = HotwordIndex(text)
+        title, salutation = NAME_POSITIVE_HOTWORDS[0], NAME_POSITIVE_HOTWORDS[1]
+        assert index.may_match(title, 12, 22)
+        assert not index.may_match(salutation, 12, 22)
+
+    def test_hit_outside_window_skips_rule(self):
+        text = "Mr." + " " * 40 + "John"
+        title = NAME_POSITIVE_HOTWORDS[0]
+        assert not HotwordIndex(text).may_match(title, 43, 47)
+
+    def test_unanchored_rule_always_checked(self):
+        import re as re_mod
+        rule = HotwordRule(re_mod.compile(r"dear"), 0.1, window_before=10, window_after=0)
+        assert HotwordIndex("nothing here").may_match(rule, 5, 9)
+
+
 class TestPatternExclusions:
     """_check_patterns rejects structural false positives."""
 
@@ -1063,6 +1109,45 @@ class TestEnhanceBatchOrchestration:
         assert len(kept) == 0
 
 
+class TestEnhanceBatchStats:
+    """enhance_batch() edits the batch in place and aggregates outcomes."""
+
+    def test_counts_and_reason_kinds(self):
+        enhancer = ContextEnhancer()
+        text = "MRN: 123456 Amount: 440060.24 John Smith"
+        batch = SpanBatch.from_spans(text, [
+            make_span("123456", start=5, entity_type="MRN", confidence=0.90, tier=Tier.STRUCTURED),
+            make_span("440060.24", start=20, entity_type="MRN", confidence=0.70, tier=Tier.ML),
+            make_span("John Smith", start=30, entity_type="NAME", confidence=0.70, tier=Tier.ML),
+        ])
+        stats = enhancer.enhance_batch(text, batch)
+        assert (stats.kept, stats.needs_llm, stats.rejected) == (2, 0, 1)
+        assert stats.reject_reasons == {"mrn_exclude_pattern": 1}
+        assert [batch.span_text(r) for r in range(len(batch))] == ["123456", "John Smith"]
+
+    def test_verify_marks_row(self):
+        enhancer = ContextEnhancer(enable_patterns=False)
+        text = "Record 789012 found"
+        batch = SpanBatch.from_spans(text, [
+            make_span("789012", start=7, entity_type="MRN", confidence=0.60, tier=Tier.ML),
+        ])
+        stats = enhancer.enhance_batch(text, batch)
+        assert stats.needs_llm == 1
+        (span,) = batch.to_spans()
+        assert span.needs_review is True
+        assert span.review_reason == "llm_verification"
+
+    def test_enhanced_names_use_hotwords(self):
+        enhancer = ContextEnhancer(enable_patterns=False)
+        enhancer.enhanced_types = {"NAME"}
+        text = "Name: John Smith"
+        batch = SpanBatch.from_spans(text, [
+            make_span("John Smith", start=6, confidence=0.60, tier=Tier.ML),
+        ])
+        enhancer.enhance_batch(text, batch)
+        assert batch.confidences[0] == pytest.approx(0.90)
+
+
 class TestContextEnhancerEdgeCases:
     """Edge cases for ContextEnhancer."""
 
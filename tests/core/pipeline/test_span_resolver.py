@@ -0,0 +1,242 @@
+"""Tests for the columnar span resolver shared by the orchestrator, the
+tiered pipeline and ONNX chunk merging."""
+
+import random
+
+import pytest
+
+from openlabels.core.pipeline.span_resolver import (
+    OverlapStrategy,
+    SpanTable,
+    drop_contained_spans,
+    merge_chunk_spans,
+    resolve_batch,
+    resolve_spans,
+)
+from openlabels.core.types import Span, SpanBatch, Tier
+
+TEXT = "abcdefghijklmnopqrstuvwxyz" * 4
+
+
+def make_span(start, end, entity_type="PHONE", confidence=0.9, tier=Tier.PATTERN, detector="test"):
+    return Span(
+        start=start,
+        end=end,
+        text=TEXT[start:end],
+        entity_type=entity_type,
+        confidence=confidence,
+        detector=detector,
+        tier=tier,
+    )
+
+
+def positions(spans):
+    return [(s.start, s.end) for s in spans]
+
+
+# =============================================================================
+# SpanTable
+# =============================================================================
+
+class TestSpanTable:
+
+    def test_overlap_runs_skip_singletons(self):
+        spans = [make_span(0, 3), make_span(5, 9), make_span(7, 12), make_span(20, 22)]
+        table = SpanTable(spans)
+        assert table.overlap_runs(table.sorted_indices()) == [(1, 3)]
+
+    def test_run_extends_through_contained_span(self):
+        # (0,10) reaches past (2,3), so (5,6) still belongs to the same run
+        spans = [make_span(0, 10), make_span(2, 3), make_span(5, 6), make_span(10, 12)]
+        table = SpanTable(spans)
+        assert table.overlap_runs(table.sorted_indices()) == [(0, 3)]
+
+    def test_sorted_by_start_then_tier_then_confidence(self):
+        spans = [
+            make_span(5, 8, confidence=0.9),
+            make_span(0, 4, tier=Tier.ML),
+            make_span(0, 4, tier=Tier.CHECKSUM, confidence=0.5),
+            make_span(0, 4, tier=Tier.CHECKSUM, confidence=0.7),
+        ]
+        table = SpanTable(spans)
+        assert table.sorted_indices().tolist() == [3, 2, 1, 0]
+
+    def test_type_ids_use_normalized_types(self):
+        table = SpanTable([make_span(0, 3, "PHONE"), make_span(4, 6, "phone"), make_span(7, 9, "EMAIL")])
+        ids = table.type_ids.tolist()
+        assert ids[0] == ids[1] != ids[2]
+
+
+# =============================================================================
+# resolve_spans
+# =============================================================================
+
+class TestResolveSpans:
+
+    def test_empty(self):
+        assert resolve_spans([]) == []
+
+    def test_exact_duplicate_higher_tier_wins(self):
+        low = make_span(0, 5, tier=Tier.PATTERN, confidence=0.99)
+        high = make_span(0, 5, tier=Tier.CHECKSUM, confidence=0.6)
+        assert resolve_spans([low, high]) == [high]
+
+    def test_contained_span_dropped(self):
+        outer = make_span(0, 10, confidence=0.5)
+        inner = make_span(2, 5, confidence=0.99)
+        assert resolve_spans([inner, outer]) == [outer]
+
+    def test_same_type_partial_overlap_merges_text(self):
+        spans = [make_span(0, 6), make_span(4, 10), make_span(8, 14, "phone")]
+        result = resolve_spans(spans)
+        assert positions(result) == [(0, 14)]
+        assert result[0].text == TEXT[0:14]
+
+    def test_merged_span_keeps_better_base(self):
+        spans = [
+            make_span(0, 6, tier=Tier.PATTERN, detector="regex", confidence=0.95),
+            make_span(4, 10, tier=Tier.CHECKSUM, detector="luhn", confidence=0.7),
+        ]
+        (merged,) = resolve_spans(spans)
+        assert merged.detector == "luhn"
+        assert merged.tier == Tier.CHECKSUM
+        assert merged.confidence == 0.95
+
+    @pytest.mark.parametrize("strategy,winner", [
+        (OverlapStrategy.HIGHER_CONFIDENCE, "EMAIL"),
+        (OverlapStrategy.HIGHER_TIER, "PHONE"),
+        (OverlapStrategy.LONGER_SPAN, "DATE"),
+    ])
+    def test_partial_overlap_strategies(self, strategy, winner):
+        spans = [
+            make_span(0, 6, "PHONE", confidence=0.6, tier=Tier.CHECKSUM),
+            make_span(3, 8, "EMAIL", confidence=0.9),
+        ]
+        if winner == "DATE":
+            spans = [make_span(0, 4, "PHONE", confidence=0.9), make_span(2, 12, "DATE", confidence=0.5)]
+        result = resolve_spans(spans, strategy=strategy)
+        assert [s.entity_type for s in result] == [winner]
+
+    def test_confidence_threshold(self):
+        spans = [make_span(0, 3, confidence=0.2), make_span(5, 8, confidence=0.8)]
+        assert positions(resolve_spans(spans, confidence_threshold=0.5)) == [(5, 8)]
+
+    def test_disjoint_spans_sorted(self):
+        spans = [make_span(20, 25), make_span(0, 3), make_span(10, 12)]
+        assert positions(resolve_spans(spans)) == [(0, 3), (10, 12), (20, 25)]
+
+    def test_randomized_output_never_overlaps(self):
+        rng = random.Random(7)
+        spans = []
+        for _ in range(500):
+            start = rng.randint(0, 90)
+            spans.append(make_span(
+                start, start + rng.randint(1, 12),
+                rng.choice(["PHONE", "EMAIL", "phone"]),
+                confidence=rng.choice([0.5, 0.7, 0.9]),
+                tier=rng.choice(list(Tier)),
+            ))
+        result = resolve_spans(spans)
+        for left, right in zip(result, result[1:], strict=False):
+            assert left.end <= right.start
+        for span in result:
+            assert span.text == TEXT[span.start:span.end]
+
+
+# =============================================================================
+# resolve_batch
+# =============================================================================
+
+class TestResolveBatch:
+
+    def test_matches_resolve_spans(self):
+        rng = random.Random(11)
+        spans = []
+        for _ in range(500):
+            start = rng.randint(0, 90)
+            spans.append(make_span(
+                start, start + rng.randint(1, 12),
+                rng.choice(["PHONE", "EMAIL", "phone"]),
+                confidence=rng.choice([0.5, 0.7, 0.9]),
+                tier=rng.choice(list(Tier)),
+            ))
+        batch = SpanBatch.from_spans(TEXT, spans)
+        resolve_batch(batch, confidence_threshold=0.6)
+        expected = resolve_spans(spans, confidence_threshold=0.6)
+        assert [s.to_dict() for s in batch.to_spans()] == [s.to_dict() for s in expected]
+
+    def test_merged_rows_read_source_text(self):
+        batch = SpanBatch.from_spans(TEXT, [make_span(0, 8), make_span(5, 12)])
+        resolve_batch(batch)
+        assert len(batch) == 1
+        assert (batch.starts[0], batch.ends[0]) == (0, 12)
+        assert not batch.has_text_override(0)
+        assert batch.span_text(0) == TEXT[0:12]
+
+    def test_table_from_batch_normalizes_types(self):
+        batch = SpanBatch.from_spans(TEXT, [make_span(0, 3, "PHONE"), make_span(4, 6, "phone")])
+        table = SpanTable.from_batch(batch)
+        assert table.type_ids[0] == table.type_ids[1]
+        assert len(table) == 2
+
+    def test_empty_after_threshold(self):
+        batch = SpanBatch.from_spans(TEXT, [make_span(0, 3, confidence=0.2)])
+        resolve_batch(batch, confidence_threshold=0.5)
+        assert len(batch) == 0
+
+
+# =============================================================================
+# drop_contained_spans
+# =============================================================================
+
+class TestDropContainedSpans:
+
+    def test_drops_duplicates_and_contained(self):
+        spans = [
+            make_span(0, 10, tier=Tier.PATTERN),
+            make_span(0, 10, tier=Tier.CHECKSUM),
+            make_span(3, 6),
+            make_span(8, 15),
+        ]
+        result = drop_contained_spans(spans)
+        assert positions(result) == [(0, 10), (8, 15)]
+        assert result[0].tier == Tier.CHECKSUM
+
+    def test_span_inside_dropped_span_still_dropped(self):
+        spans = [make_span(0, 20), make_span(2, 10), make_span(4, 6)]
+        assert positions(drop_contained_spans(spans)) == [(0, 20)]
+
+    def test_empty(self):
+        assert drop_contained_spans([]) == []
+
+
+# =============================================================================
+# merge_chunk_spans
+# =============================================================================
+
+class TestMergeChunkSpans:
+
+    def test_merges_same_type_across_boundary(self):
+        spans = [make_span(0, 8, "NAME", 0.8), make_span(5, 12, "NAME", 0.9)]
+        (merged,) = merge_chunk_spans(spans, TEXT)
+        assert positions([merged]) == [(0, 12)]
+        assert merged.text == TEXT[0:12]
+        assert merged.confidence == 0.9
+
+    def test_text_joined_without_full_text(self):
+        spans = [make_span(0, 8, "NAME", 0.8), make_span(5, 12, "NAME", 0.9), make_span(10, 16, "NAME")]
+        (merged,) = merge_chunk_spans(spans)
+        assert merged.text == TEXT[0:16]
+
+    def test_different_type_higher_confidence_replaces(self):
+        spans = [make_span(0, 8, "NAME", 0.6), make_span(5, 12, "ADDRESS", 0.9)]
+        assert [s.entity_type for s in merge_chunk_spans(spans, TEXT)] == ["ADDRESS"]
+
+    def test_labels_compared_as_emitted(self):
+        spans = [make_span(0, 8, "NAME", 0.9), make_span(5, 12, "name", 0.5)]
+        result = merge_chunk_spans(spans, TEXT)
+        assert positions(result) == [(0, 8)]
+
+    def test_non_overlapping_untouched(self):
+        spans = [make_span(10, 12, "NAME"), make_span(0, 4, "NAME")]
+        assert positions(merge_chunk_spans(spans, TEXT)) == [(0, 4), (10, 12)]
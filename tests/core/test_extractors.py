@@ -13,6 +13,7 @@ Tests cover:
 
 import io
 import email
+import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
@@ -33,8 +34,11 @@ from openlabels.core.extractors import (
     RTFExtractor,
     TextExtractor,
     XLSXExtractor,
+    detect_encoding,
     extract_text,
     get_extractor,
+    iter_decoded,
+    iter_text_segments,
 )
 from openlabels.core.constants import (
     MAX_DECOMPRESSED_SIZE,
@@ -1943,3 +1947,125 @@ class TestEdgeCases:
         assert result.text == ""
         assert len(result.warnings) == 1
         assert "No extractor available" in result.warnings[0]
+
+
+# =============================================================================
+# STREAMING EXTRACTION (iter_segments)
+# =============================================================================
+
+
+def _joined(segments):
+    """Concatenate segments, checking each offset against the running length."""
+    text = ""
+    for seg in segments:
+        assert seg.offset == len(text)
+        text += seg.text
+    return text
+
+
+class TestIterSegments:
+    """Segments must concatenate to exactly extract().text."""
+
+    def test_csv_segments_match_extract(self):
+        rows = [f"name{i},ssn{i},{i}" for i in range(25)]
+        content = ("\n".join(rows) + "\n,,\n").encode("utf-8")
+        ext = XLSXExtractor()
+
+        segments = list(ext.iter_segments(content, "data.csv"))
+        assert _joined(segments) == ext.extract(content, "data.csv").text
+
+    def test_csv_split_into_row_blocks(self):
+        from openlabels.core.extractors import _line_segments
+        lines = [f"row {i}" for i in range(10)]
+        segments = list(_line_segments(lines, rows_per_segment=3))
+
+        assert len(segments) == 4
+        assert segments[0].label == "lines 1-3"
+        assert segments[-1].label == "lines 10-10"
+        assert _joined(segments) == "\n".join(lines)
+
+    def test_latin1_csv_segments_match_extract(self):
+        content = b"Name,City\nJos\xe9,Montr\xe9al"
+        ext = XLSXExtractor()
+        assert _joined(ext.iter_segments(content, "latin.csv")) == ext.extract(content, "latin.csv").text
+
+    def test_xlsx_segments_match_extract(self):
+        mock_sheet = MagicMock()
+        mock_sheet.iter_rows.return_value = [("Name", "SSN"), (None, None), ("John", "123-45-6789")]
+        mock_wb = MagicMock()
+        mock_wb.sheetnames = ["People", "Empty"]
+        empty_sheet = MagicMock()
+        empty_sheet.iter_rows.return_value = []
+        mock_wb.__getitem__ = MagicMock(side_effect=lambda name: mock_sheet if name == "People" else empty_sheet)
+        mock_openpyxl = MagicMock()
+        mock_openpyxl.load_workbook.return_value = mock_wb
+
+        with patch.dict("sys.modules", {"openpyxl": mock_openpyxl}):
+            ext = XLSXExtractor()
+            streamed = _joined(ext.iter_segments(b"xlsx", "book.xlsx"))
+            mock_sheet.iter_rows.return_value = [("Name", "SSN"), (None, None), ("John", "123-45-6789")]
+            extracted = ext.extract(b"xlsx", "book.xlsx").text
+
+        assert streamed == extracted == "[Sheet: People]\nName | SSN\nJohn | 123-45-6789\n"
+        assert mock_wb.close.call_count == 2
+
+    def test_pdf_one_segment_per_page(self):
+        pages = []
+        for body in ("A" * (MIN_NATIVE_TEXT_LENGTH + 5), "", "B" * (MIN_NATIVE_TEXT_LENGTH + 5)):
+            page = MagicMock()
+            page.get_text.return_value = body
+            pages.append(page)
+
+        def make_doc():
+            doc = MagicMock()
+            doc.__iter__ = MagicMock(return_value=iter(pages))
+            doc.__len__ = MagicMock(return_value=len(pages))
+            return doc
+
+        with patch.dict("sys.modules", {"fitz": MagicMock()}):
+            import sys
+            sys.modules["fitz"].open.side_effect = lambda **kw: make_doc()
+            ext = PDFExtractor()
+            warnings = []
+            segments = list(ext.iter_segments(b"pdf", "doc.pdf", warnings))
+            extracted = ext.extract(b"pdf", "doc.pdf")
+
+        assert [seg.label for seg in segments] == ["page 1", "page 2", "page 3"]
+        assert _joined(segments) == extracted.text
+        assert warnings == ["Page 2 is scanned but OCR not available"]
+
+    def test_default_single_segment(self):
+        segments = list(TextExtractor().iter_segments(b"hello world", "a.txt"))
+        assert len(segments) == 1
+        assert segments[0].text == "hello world"
+
+    def test_iter_text_segments_unknown_type(self):
+        warnings = []
+        assert list(iter_text_segments(b"data", "file.zzz_unknown", warnings=warnings)) == []
+        assert "No extractor available" in warnings[0]
+
+
+class TestIncrementalDecoding:
+
+    @pytest.mark.parametrize("content, expected", [
+        (b"h\xc3\xa9llo w\xc3\xb6rld", "utf-8"),  # "héllo wörld"
+        ("hello".encode("utf-16"), "utf-16"),
+        (b"Jos\xe9 ", "latin-1"),  # Odd length, so not UTF-16 either
+        (b"", "utf-8"),
+    ])
+    def test_detect_encoding_matches_full_decode(self, content, expected):
+        assert detect_encoding(content, ["utf-8", "utf-16", "latin-1"], chunk_bytes=3) == expected
+
+    def test_detect_encoding_bomless_utf16_decodes_like_bytes_decode(self):
+        content = "hello".encode("utf-16-le" if sys.byteorder == "little" else "utf-16-be")
+        encoding = detect_encoding(content, ["utf-16"], chunk_bytes=3)
+        assert "".join(iter_decoded(content, encoding)) == content.decode("utf-16")
+
+    def test_detect_encoding_none_when_all_fail(self):
+        assert detect_encoding(b"\xff\xfe\xfd", ["utf-8", "ascii"]) is None
+
+    def test_iter_decoded_splits_multibyte_safely(self):
+        text = "日本語テキスト" * 50
+        chunks = list(iter_decoded(text.encode("utf-8"), "utf-8", chunk_bytes=5))
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
@@ -8,7 +8,9 @@ Adapted from openrisk/tests/test_detector_orchestrator.py
 
 import pytest
 from openlabels.core.detectors.config import DetectionConfig
+from openlabels.core.detectors.base import BaseDetector
 from openlabels.core.detectors.orchestrator import DetectorOrchestrator, detect
+from openlabels.core.types import Span, Tier
 
 
 # =============================================================================
@@ -311,6 +313,29 @@ class TestDetectorManagement:
         assert removed is False
 
 
+    def test_configured_names_same_in_process_mode(self):
+        """Configured detector names do not depend on detectors being loaded."""
+        thread = DetectorOrchestrator(DetectionConfig())
+        process = DetectorOrchestrator(DetectionConfig(execution_mode="process"))
+        try:
+            assert process.detector_names == []
+            assert process.configured_detector_names() == thread.configured_detector_names()
+            assert "secrets" in process.configured_detector_names()
+        finally:
+            process.shutdown()
+            thread.shutdown()
+
+    def test_configured_names_follow_config_and_changes(self):
+        """Detector flags and add/remove change the configured names."""
+        base = DetectorOrchestrator(DetectionConfig())
+        no_secrets = DetectorOrchestrator(DetectionConfig(enable_secrets=False))
+        assert "secrets" not in no_secrets.configured_detector_names()
+        assert base.configured_detector_names() != no_secrets.configured_detector_names()
+
+        base.remove_detector("secrets")
+        assert base.configured_detector_names() == no_secrets.configured_detector_names()
+
+
 # =============================================================================
 # Convenience Function Tests
 # =============================================================================
@@ -405,3 +430,92 @@ class TestIntegration:
         assert len(result.spans) >= 1, "Should detect government classification markings"
         classification_spans = [s for s in result.spans if "CLASSIFICATION" in s.entity_type.upper() or "SECRET" in s.text.upper()]
         assert len(classification_spans) >= 1, f"Should find classification marking, found types: {[s.entity_type for s in result.spans]}"
+
+
+# =============================================================================
+# Tiered ML Mode Tests
+# =============================================================================
+
+FILLER = "Nothing to see in this sentence at all. " * 50  # 2000 chars
+
+
+class _StubDetector(BaseDetector):
+    """Reports every occurrence of *needle* and records the texts it saw."""
+
+    def __init__(self, name, tier, needle, entity_type, confidence):
+        self.name = name
+        self.tier = tier
+        self.needle = needle
+        self.entity_type = entity_type
+        self.confidence = confidence
+        self.seen: list[str] = []
+
+    def detect(self, text):
+        self.seen.append(text)
+        spans = []
+        start = text.find(self.needle)
+        while start >= 0:
+            end = start + len(self.needle)
+            spans.append(Span(
+                start=start, end=end, text=text[start:end],
+                entity_type=self.entity_type, confidence=self.confidence,
+                detector=self.name, tier=self.tier,
+            ))
+            start = text.find(self.needle, end)
+        return spans
+
+
+def _tiered(window=64):
+    orchestrator = DetectorOrchestrator(DetectionConfig(
+        enable_checksum=False, enable_secrets=False, enable_financial=False,
+        enable_government=False, enable_patterns=False,
+        ml_mode="tiered", ml_window_chars=window,
+    ))
+    orchestrator.confidence_threshold = 0.0  # Keep calibrated ML spans
+    orchestrator._medical_dictionaries = None
+    stage1 = _StubDetector("stub_pattern", Tier.PATTERN, "Jane", "NAME", 0.8)
+    ml = _StubDetector("stub_ml", Tier.ML, "today", "DATE", 0.95)
+    orchestrator.add_detector(stage1)
+    orchestrator.add_detector(ml)
+    return orchestrator, ml
+
+
+class TestTieredMLMode:
+    """ml_mode="tiered" sends ML only the windows stage 1 flags."""
+
+    def test_invalid_ml_mode_rejected(self):
+        with pytest.raises(ValueError):
+            DetectorOrchestrator(DetectionConfig(ml_mode="sometimes"))
+
+    def test_unflagged_document_skips_ml(self):
+        orchestrator, ml = _tiered()
+
+        result = orchestrator.detect_sync(FILLER)
+
+        assert ml.seen == []
+        assert result.ml_chars == 0
+        assert result.text_length == len(FILLER)
+
+    def test_ml_runs_only_on_flagged_window(self):
+        orchestrator, ml = _tiered(window=64)
+        text = FILLER + "Signed by Jane Roe today. " + FILLER
+
+        result = orchestrator.detect_sync(text)
+
+        (window,) = ml.seen
+        assert "Jane Roe" in window
+        assert len(window) < 300
+        assert result.ml_chars == len(window)
+        ml_spans = [s for s in result.spans if s.detector == "stub_ml"]
+        assert [s.text for s in ml_spans] == ["today"]
+        assert text[ml_spans[0].start:ml_spans[0].end] == "today"
+
+    def test_full_mode_sends_whole_text(self):
+        orchestrator, ml = _tiered()
+        orchestrator.config = DetectionConfig(ml_mode="full")
+        text = FILLER + "Signed by Jane Roe today. " + FILLER
+
+        result = orchestrator.detect_sync(text)
+
+        assert ml.seen == [text]
+        assert result.ml_chars == len(text)
@@ -203,6 +203,130 @@ class TestFileProcessorInit:
         mock_ocr_init.assert_called_once()
 
 
+class TestFileProcessorFingerprint:
+    """Tests for the result-determining configuration fingerprint."""
+
+    @patch("openlabels.core.processor.DetectorOrchestrator")
+    def test_stable_for_same_config(self, mock_orch_cls):
+        a = FileProcessor(enable_ocr=False)
+        b = FileProcessor(enable_ocr=False)
+        assert a.fingerprint == b.fingerprint
+
+    @patch("openlabels.core.processor.DetectorOrchestrator")
+    def test_changes_with_detection_settings(self, mock_orch_cls):
+        from openlabels.core.detectors.config import DetectionConfig
+        base = FileProcessor(enable_ocr=False)
+        stricter = FileProcessor(
+            config=DetectionConfig(confidence_threshold=0.9), enable_ocr=False,
+        )
+        assert base.fingerprint != stricter.fingerprint
+
+    @patch("openlabels.core.processor.DetectorOrchestrator")
+    def test_ignores_throughput_settings(self, mock_orch_cls):
+        from openlabels.core.detectors.config import DetectionConfig
+        base = FileProcessor(enable_ocr=False)
+        tuned = FileProcessor(
+            config=DetectionConfig(max_workers=16, ml_batch_size=1), enable_ocr=False,
+        )
+        assert base.fingerprint == tuned.fingerprint
+
+    @patch("openlabels.core.processor.DetectorOrchestrator")
+    def test_changes_when_model_files_change(self, mock_orch_cls, tmp_path):
+        from openlabels.core.detectors.config import DetectionConfig
+        model = tmp_path / "phi_bert" / "model.onnx"
+        model.parent.mkdir()
+        model.write_bytes(b"v1")
+        config = DetectionConfig(enable_ml=True, ml_model_dir=tmp_path)
+
+        before = FileProcessor(config=config, enable_ocr=False).fingerprint
+        model.write_bytes(b"v2-larger")
+        after = FileProcessor(config=config, enable_ocr=False).fingerprint
+        assert before != after
+
+
+class TestStreamingDetection:
+    """Tests for windowed detection of large streamable files."""
+
+    @staticmethod
+    def _csv(rows: int) -> bytes:
+        lines = ["name,ssn,email"]
+        for i in range(rows):
+            lines.append(f"Person {i},123-45-{6000 + i % 3000:04d},person{i}@example.com")
+        return "\n".join(lines).encode("utf-8")
+
+    @staticmethod
+    def _key(spans):
+        return sorted((s.start, s.end, s.entity_type, s.text) for s in spans)
+
+    async def test_windows_match_whole_document(self):
+        content = self._csv(400)
+        whole = FileProcessor(enable_ocr=False)
+        streamed = FileProcessor(enable_ocr=False, streaming_threshold=1)
+
+        with patch("openlabels.core.processor.STREAM_WINDOW_CHARS", 1000), \
+                patch("openlabels.core.processor.STREAM_OVERLAP_CHARS", 64):
+            result = await streamed.process_file("big.csv", content)
+        expected = await whole.process_file("big.csv", content)
+
+        assert result.error is None
+        assert result.spans
+        assert self._key(result.spans) == self._key(expected.spans)
+        assert result.entity_counts == expected.entity_counts
+        assert result.risk_score == expected.risk_score
+
+    async def test_plain_text_streamed(self):
+        content = self._csv(200)
+        processor = FileProcessor(enable_ocr=False, streaming_threshold=1)
+
+        with patch.object(processor, "_detect_streaming",
+                          wraps=processor._detect_streaming) as streaming, \
+                patch("openlabels.core.processor.STREAM_WINDOW_CHARS", 500), \
+                patch("openlabels.core.processor.STREAM_OVERLAP_CHARS", 32):
+            result = await processor.process_file("big.txt", content)
+
+        streaming.assert_awaited_once()
+        text = content.decode("utf-8")
+        for span in result.spans:
+            assert text[span.start:span.end] == span.text
+
+    async def test_small_files_not_streamed(self):
+        processor = FileProcessor(enable_ocr=False)
+        with patch.object(processor, "_detect_streaming", AsyncMock()) as streaming:
+            await processor.process_file("small.csv", self._csv(5))
+        streaming.assert_not_awaited()
+
+    async def test_falls_back_when_streaming_unavailable(self):
+        content = self._csv(20)
+        processor = FileProcessor(enable_ocr=False, streaming_threshold=1)
+
+        with patch("openlabels.core.processor.iter_text_segments",
+                   side_effect=ImportError("openpyxl not installed")):
+            result = await processor.process_file("big.csv", content)
+
+        expected = await FileProcessor(enable_ocr=False).process_file("big.csv", content)
+        assert self._key(result.spans) == self._key(expected.spans)
+
+    async def test_keeps_spans_when_extraction_fails_partway(self):
+        from openlabels.core.extractors import TextSegment
+
+        head = "name,ssn\nAlice,123-45-6789\n" * 20
+
+        def segments(content, file_path, ocr_engine=None, warnings=None):
+            yield TextSegment(text=head, offset=0)
+            raise KeyError("xl/worksheets/sheet2.xml")
+
+        processor = FileProcessor(enable_ocr=False, streaming_threshold=1)
+        with patch("openlabels.core.processor.iter_text_segments", side_effect=segments), \
+                patch.object(processor, "_extract_text", AsyncMock()) as whole:
+            result = await processor.process_file("big.xlsx", b"x" * 64)
+
+        whole.assert_not_awaited()
+        assert result.spans
+        assert all(head[s.start:s.end] == s.text for s in result.spans)
+        assert result.entity_counts
+        assert "KeyError" in result.error
+
+
 # =============================================================================
 # OCR LAZY LOADING
 # =============================================================================
@@ -0,0 +1,198 @@
+"""
+Tests for per-stage latency profiling.
+
+Tests focus on:
+- Histogram statistics and percentile estimates
+- Stage nesting via context variables (including executor threads)
+- No-op behaviour when no profiler is active
+- Sampled per-file traces (slowest kept) and the text report
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from openlabels.core.profiling import (
+    LatencyHistogram,
+    StageProfiler,
+    get_profiler,
+    in_context,
+    profile_aiter,
+    profile_stage,
+    profile_trace,
+    use_profiler,
+)
+
+
+class TestLatencyHistogram:
+
+    def test_tracks_count_total_min_max(self):
+        histogram = LatencyHistogram()
+        for ms in (1.0, 3.0, 8.0):
+            histogram.observe(ms)
+
+        assert histogram.count == 3
+        assert histogram.total_ms == 12.0
+        assert histogram.min_ms == 1.0
+        assert histogram.max_ms == 8.0
+        assert histogram.mean_ms == 4.0
+
+    def test_percentile_is_bucket_bound_clamped_to_max(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.observe(0.8)
+        histogram.observe(40.0)
+
+        assert histogram.percentile(50) == 1  # Upper bound of the 0.5-1 ms bucket
+        assert histogram.percentile(99) == 1
+        assert histogram.percentile(100) == 40.0  # 50 ms bucket, clamped to max
+
+        single = LatencyHistogram()
+        single.observe(3.0)
+        assert single.percentile(50) == 3.0
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.observe(1.0)
+        b.observe(5.0)
+        a.merge(b)
+        assert a.count == 2
+        assert a.max_ms == 5.0
+
+    def test_empty_to_dict(self):
+        assert LatencyHistogram().to_dict()["min_ms"] == 0.0
+
+
+class TestStageNesting:
+
+    def test_no_profiler_is_noop(self):
+        assert get_profiler() is None
+        with profile_stage("file"):
+            pass
+        with profile_trace("/a.txt") as trace:
+            assert trace is None
+
+    def test_nested_stages_record_paths(self):
+        profiler = StageProfiler()
+        with use_profiler(profiler):
+            with profile_stage("file"):
+                with profile_stage("read"):
+                    pass
+                with profile_stage("detect"):
+                    pass
+
+        assert set(profiler.histograms()) == {"file", "file/read", "file/detect"}
+        assert get_profiler() is None
+
+    def test_executor_threads_nest_with_in_context(self):
+        profiler = StageProfiler()
+
+        def work():
+            with profile_stage("detector:x"):
+                pass
+
+        with use_profiler(profiler), ThreadPoolExecutor(2) as pool:
+            with profile_stage("detect"):
+                futures = [pool.submit(in_context(work)) for _ in range(4)]
+                for f in futures:
+                    f.result()
+
+        assert profiler.histograms()["detect/detector:x"].count == 4
+
+    def test_in_context_passthrough_when_disabled(self):
+        def fn():
+            return 1
+        assert in_context(fn) is fn
+
+    async def test_concurrent_tasks_use_their_own_profiler(self):
+        a, b = StageProfiler(), StageProfiler()
+
+        async def job(profiler, stage):
+            with use_profiler(profiler):
+                await asyncio.sleep(0)
+                with profile_stage(stage):
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(job(a, "a"), job(b, "b"))
+        assert set(a.histograms()) == {"a"}
+        assert set(b.histograms()) == {"b"}
+
+    async def test_profile_aiter_times_each_step(self):
+        profiler = StageProfiler()
+
+        async def listing():
+            for i in range(3):
+                yield i
+
+        with use_profiler(profiler):
+            items = [i async for i in profile_aiter(listing(), "list")]
+
+        assert items == [0, 1, 2]
+        assert profiler.histograms()["list"].count == 4  # 3 items + exhaustion
+
+
+class TestSummaryAndTraces:
+
+    def test_summary_self_time(self):
+        profiler = StageProfiler()
+        profiler.record("file", 10.0)
+        profiler.record("file/read", 4.0)
+        profiler.record("file/detect", 5.0)
+
+        stages = profiler.summary()["stages"]
+        assert stages["file"]["self_ms"] == 1.0
+        assert stages["file/read"]["self_ms"] == 4.0
+
+    def test_parallel_children_do_not_make_self_time_negative(self):
+        profiler = StageProfiler()
+        profiler.record("detect", 5.0)
+        profiler.record("detect/detector:a", 4.0)
+        profiler.record("detect/detector:b", 4.0)
+        assert profiler.summary()["stages"]["detect"]["self_ms"] == 0.0
+
+    def test_unsampled_files_not_traced(self):
+        profiler = StageProfiler(trace_sample_rate=0.0)
+        with profiler.trace("/a.txt") as trace:
+            assert trace is None
+        assert profiler.files_traced == 0
+
+    def test_keeps_slowest_traces(self, monkeypatch):
+        profiler = StageProfiler(trace_sample_rate=1.0, max_traces=2)
+        clock = iter([0.0, 0.001, 1.0, 1.005, 2.0, 2.003])
+        monkeypatch.setattr("openlabels.core.profiling.time.perf_counter", lambda: next(clock))
+
+        for path in ("/fast", "/slow", "/medium"):
+            with use_profiler(profiler), profiler.trace(path):
+                pass
+
+        assert [t.file_path for t in profiler.traces] == ["/slow", "/medium"]
+        assert profiler.files_traced == 3
+
+    def test_trace_collects_stages(self, tmp_path):
+        profiler = StageProfiler(trace_sample_rate=1.0)
+        with use_profiler(profiler):
+            with profile_trace("/a.txt"), profile_stage("file"):
+                with profile_stage("read"):
+                    pass
+
+        (trace,) = profiler.traces
+        assert [s for s, _ in trace.stages] == ["file/read", "file"]
+
+        out = tmp_path / "traces.jsonl"
+        assert profiler.dump_traces(out) == 1
+        assert json.loads(out.read_text())["file_path"] == "/a.txt"
+
+    def test_format_report_orders_tree(self):
+        profiler = StageProfiler()
+        profiler.record("file", 10.0)
+        profiler.record("file/read", 2.0)
+        profiler.record("file/detect", 7.0)
+        profiler.record("commit", 1.0)
+
+        lines = profiler.format_report().splitlines()
+        labels = [line.split()[0] for line in lines[1:]]
+        assert labels == ["file", "detect", "read", "commit"]
+        assert lines[2].startswith("  detect")
+
+    def test_format_report_empty(self):
+        assert StageProfiler().format_report() == "No stages recorded."
@@ -11,6 +11,8 @@ Tests cover:
 import pytest
 from openlabels.core.types import (
     Span,
+    SpanBatch,
+    SpanContext,
     Tier,
     DetectionResult,
     normalize_entity_type,
@@ -97,6 +99,102 @@ class TestSpan:
 # TIER TESTS
 # =============================================================================
 
+class TestSpanBatch:
+    """Tests for columnar SpanBatch storage."""
+
+    TEXT = "Call 555-123-4567 or mail jane@example.com"
+
+    def test_text_read_from_source(self):
+        batch = SpanBatch(self.TEXT)
+        row = batch.append(5, 17, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        assert batch.span_text(row) == "555-123-4567"
+        assert not batch.has_text_override(row)
+
+    def test_types_and_detectors_interned(self):
+        batch = SpanBatch(self.TEXT)
+        batch.append(5, 17, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        batch.append(26, 42, "EMAIL", 0.9, "pattern", Tier.PATTERN)
+        batch.append(5, 17, "PHONE", 0.8, "checksum", Tier.CHECKSUM)
+        assert batch.entity_types == ["PHONE", "EMAIL"]
+        assert batch.detectors == ["pattern", "checksum"]
+        assert list(batch.type_ids) == [0, 1, 0]
+
+    def test_append_validates(self):
+        batch = SpanBatch(self.TEXT)
+        with pytest.raises(ValueError):
+            batch.append(5, 5, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        with pytest.raises(ValueError):
+            batch.append(5, 17, "PHONE", 1.5, "pattern", Tier.PATTERN)
+
+    def test_round_trip_keeps_optional_fields(self):
+        context = SpanContext(source_page=3)
+        span = Span(
+            start=5, end=17, text="555-123-4567", entity_type="PHONE",
+            confidence=0.9, detector="pattern", tier=Tier.PATTERN,
+            context=context, needs_review=True, review_reason="check",
+        )
+        (restored,) = SpanBatch.from_spans(self.TEXT, [span]).to_spans()
+        assert restored == span
+
+    def test_text_override_when_not_source_slice(self):
+        span = Span(
+            start=0, end=4, text="XXXX", entity_type="PHONE",
+            confidence=0.9, detector="test", tier=Tier.ML,
+        )
+        batch = SpanBatch.from_spans(self.TEXT, [span])
+        assert batch.has_text_override(0)
+        assert batch.to_spans()[0].text == "XXXX"
+
+    def test_select_reorders_and_keeps_overrides(self):
+        batch = SpanBatch(self.TEXT)
+        batch.append(5, 17, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        batch.append(0, 4, "NAME", 0.9, "test", Tier.ML, text="XXXX")
+        batch.select([1])
+        assert len(batch) == 1
+        assert batch.entity_type(0) == "NAME"
+        assert batch.span_text(0) == "XXXX"
+
+    def test_extend_remaps_ids(self):
+        left = SpanBatch(self.TEXT)
+        left.append(5, 17, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        right = SpanBatch(self.TEXT)
+        right.append(26, 42, "EMAIL", 0.9, "secrets", Tier.PATTERN)
+        right.append(5, 17, "PHONE", 0.8, "secrets", Tier.PATTERN)
+        left.extend(right)
+        assert [left.entity_type(r) for r in range(3)] == ["PHONE", "EMAIL", "PHONE"]
+        assert [left.detector(r) for r in range(3)] == ["pattern", "secrets", "secrets"]
+
+    def test_extend_rejects_other_text(self):
+        with pytest.raises(ValueError):
+            SpanBatch(self.TEXT).extend(SpanBatch("other"))
+
+    def test_extend_with_offset_shifts_rows(self):
+        batch = SpanBatch(self.TEXT)
+        window = SpanBatch(self.TEXT[20:])
+        window.append(6, 22, "EMAIL", 0.9, "ml", Tier.ML)
+        batch.extend(window, offset=20)
+        assert (batch.starts[0], batch.ends[0]) == (26, 42)
+        assert batch.span_text(0) == self.TEXT[26:42]
+
+    def test_extend_with_offset_rejects_non_slice(self):
+        with pytest.raises(ValueError):
+            SpanBatch(self.TEXT).extend(SpanBatch("not a slice"), offset=3)
+
+    def test_entity_counts_normalized(self):
+        batch = SpanBatch(self.TEXT)
+        batch.append(5, 17, "PHONE", 0.9, "pattern", Tier.PATTERN)
+        batch.append(5, 17, "PHONE_NUMBER", 0.9, "ml", Tier.ML)
+        batch.append(26, 42, "EMAIL", 0.9, "pattern", Tier.PATTERN)
+        assert batch.entity_counts() == {"PHONE": 2, "EMAIL": 1}
+
+    def test_filter_confidence(self):
+        batch = SpanBatch(self.TEXT)
+        batch.append(5, 17, "PHONE", 0.4, "pattern", Tier.PATTERN)
+        batch.append(26, 42, "EMAIL", 0.9, "pattern", Tier.PATTERN)
+        batch.filter_confidence(0.5)
+        assert [batch.entity_type(r) for r in range(len(batch))] == ["EMAIL"]
+
+
 class TestTier:
     """Tests for Tier enum."""
 
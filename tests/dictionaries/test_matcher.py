@@ -0,0 +1,139 @@
+"""Tests for the multi-term dictionary matcher."""
+
+import json
+import re
+
+import pytest
+
+from openlabels.dictionaries import DictionaryLoader
+from openlabels.dictionaries.matcher import TermMatch, TermMatcher
+
+
+def _regex_matches(terms, text):
+    """Reference semantics: one ``\\bterm\\b`` search per term."""
+    text = text.lower()
+    return {t for t in terms if re.search(rf"\b{re.escape(t)}\b", text)}
+
+
+class TestTermMatcher:
+    def test_reports_offsets(self):
+        matcher = TermMatcher.build({"diabetes", "diabetes mellitus", "insulin"})
+        text = "Diabetes mellitus, on insulin."
+
+        assert list(matcher.finditer(text)) == [
+            TermMatch(0, 8, "diabetes"),
+            TermMatch(0, 17, "diabetes mellitus"),
+            TermMatch(22, 29, "insulin"),
+        ]
+
+    def test_word_boundaries(self):
+        matcher = TermMatcher.build({"diabetes", "type 2"})
+
+        assert matcher.find_all("prediabetes") == set()
+        assert matcher.find_all("diabetes_x") == set()
+        assert matcher.find_all("type 23") == set()
+        assert matcher.find_all("(type 2)") == {"type 2"}
+
+    def test_separators_must_match_exactly(self):
+        matcher = TermMatcher.build({"c. difficile", "h&p"})
+
+        assert matcher.find_all("has c. difficile and h&p") == {"c. difficile", "h&p"}
+        assert matcher.find_all("has c.difficile and h & p") == set()
+
+    @pytest.mark.parametrize("text", [
+        "-abc at start", "x-abc", " -abc", "abc- end", "abc-", "abc-x", "a_b-abc-",
+        "(c.diff) and c.diff.", "café au lait spots", "naïve 50mg/day",
+    ])
+    def test_same_results_as_regex(self, text):
+        terms = {"-abc", "abc-", "abc", "c.diff", "café au lait", "naïve", "50mg/day"}
+        assert TermMatcher.build(terms).find_all(text) == _regex_matches(terms, text)
+
+    def test_empty(self):
+        assert TermMatcher.build([]).find_all("anything") == set()
+        assert TermMatcher.build({"abc"}).find_all("") == set()
+
+    def test_save_and_load(self, tmp_path):
+        terms = frozenset({"diabetes", "diabetes mellitus"})
+        path = tmp_path / "diagnoses.json"
+        TermMatcher.build(terms).save(path, source="v1")
+
+        loaded = TermMatcher.load(path, terms, source="v1")
+        assert loaded is not None
+        assert loaded.find_all("diabetes mellitus") == {"diabetes", "diabetes mellitus"}
+
+        assert TermMatcher.load(path, terms, source="v2") is None
+        assert TermMatcher.load(tmp_path / "missing.json", terms, source="v1") is None
+
+    def test_corrupt_index_ignored(self, tmp_path):
+        path = tmp_path / "diagnoses.json"
+        path.write_text("{not json")
+        assert TermMatcher.load(path, frozenset({"x"}), source="v1") is None
+
+
+class TestLoaderMatcher:
+    @pytest.fixture(autouse=True)
+    def index_cache(self, tmp_path, monkeypatch):
+        cache = tmp_path / "cache"
+        monkeypatch.setattr("openlabels.dictionaries.INDEX_CACHE_DIR", cache)
+        return cache
+
+    def test_matcher_built_lazily_and_persisted(self, tmp_path):
+        (tmp_path / "diagnoses.txt").write_text("Diabetes\nAsthma\n")
+        loader = DictionaryLoader(dict_dir=tmp_path)
+        index_path = loader.index_dir / "diagnoses.json"
+
+        assert not index_path.exists()
+        assert loader.find_matches("diagnoses", "asthma") == {"asthma"}
+        assert json.loads(index_path.read_text())["index"] == {"diabetes": [1], "asthma": [1]}
+        assert loader.get_matcher("diagnoses") is loader.get_matcher("diagnoses")
+
+    def test_other_loader_reuses_persisted_index(self, tmp_path, monkeypatch):
+        (tmp_path / "diagnoses.txt").write_text("diabetes\n")
+        DictionaryLoader(dict_dir=tmp_path).get_matcher("diagnoses")
+
+        def fail_build(terms):
+            raise AssertionError("index should be loaded, not rebuilt")
+
+        monkeypatch.setattr(TermMatcher, "build", fail_build)
+        loader = DictionaryLoader(dict_dir=tmp_path)
+        assert loader.find_matches("diagnoses", "Has diabetes") == {"diabetes"}
+
+    def test_stale_index_rebuilt(self, tmp_path):
+        dict_file = tmp_path / "diagnoses.txt"
+        dict_file.write_text("diabetes\n")
+        DictionaryLoader(dict_dir=tmp_path).get_matcher("diagnoses")
+
+        dict_file.write_text("diabetes\nasthma\n")
+        loader = DictionaryLoader(dict_dir=tmp_path)
+        assert loader.find_matches("diagnoses", "asthma") == {"asthma"}
+
+    def test_default_index_dir_outside_dict_dir(self, tmp_path, index_cache):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        a = DictionaryLoader(dict_dir=tmp_path / "a")
+        b = DictionaryLoader(dict_dir=tmp_path / "b")
+
+        assert a.index_dir.parent == index_cache
+        assert a.index_dir != b.index_dir
+        assert DictionaryLoader(dict_dir=tmp_path / "a").index_dir == a.index_dir
+
+    def test_unwritable_index_dir(self, tmp_path):
+        (tmp_path / "diagnoses.txt").write_text("diabetes\n")
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        loader = DictionaryLoader(dict_dir=tmp_path, index_dir=blocker / "index")
+
+        assert loader.find_matches("diagnoses", "diabetes") == {"diabetes"}
+
+    def test_find_spans(self, tmp_path):
+        (tmp_path / "drugs.txt").write_text("Metformin\n")
+        loader = DictionaryLoader(dict_dir=tmp_path)
+
+        spans = loader.find_spans("drugs", "metformin then METFORMIN")
+        assert [(m.start, m.end) for m in spans] == [(0, 9), (15, 24)]
+
+    def test_multi_word_terms_need_word_boundaries(self, tmp_path):
+        (tmp_path / "diagnoses.txt").write_text("diabetes mellitus\n")
+        loader = DictionaryLoader(dict_dir=tmp_path)
+
+        assert loader.find_matches("diagnoses", "prediabetes mellitus") == set()
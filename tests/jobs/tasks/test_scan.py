@@ -50,6 +50,17 @@ from openlabels.jobs.tasks.scan import (
     CANCELLATION_CHECK_INTERVAL,
 )
 from openlabels.exceptions import AdapterError, JobError
+from openlabels.server.config import Settings
+
+
+def _scan_settings() -> Settings:
+    """Real settings with labeling, catalog and SIEM export turned off."""
+    settings = Settings()
+    settings.labeling.enabled = False
+    settings.catalog.enabled = False
+    settings.catalog.local_path = ""  # No catalog storage, so the post-scan flush is skipped
+    settings.siem_export.enabled = False
+    return settings
 
 
 class TestGetProcessor:
@@ -65,10 +76,7 @@ class TestGetProcessor:
 
         try:
             with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                mock_settings.return_value = MagicMock(
-                    ml_model_dir=None,
-                    confidence_threshold=0.70,
-                )
+                mock_settings.return_value = Settings()
                 with patch('openlabels.jobs.tasks.scan.FileProcessor') as MockProcessor:
                     mock_proc_instance = MagicMock()
                     MockProcessor.return_value = mock_proc_instance
@@ -102,10 +110,7 @@ class TestGetProcessor:
 
         try:
             with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                mock_settings.return_value = MagicMock(
-                    ml_model_dir="/models",
-                    confidence_threshold=0.80,
-                )
+                mock_settings.return_value = Settings()
                 with patch('openlabels.jobs.tasks.scan.FileProcessor') as MockProcessor:
                     MockProcessor.return_value = MagicMock()
                     get_processor(enable_ml=True)
@@ -271,6 +276,8 @@ class TestDetectAndScore:
         mock_result.entity_counts = {"ssn": 5}
         mock_result.spans = []
         mock_result.processing_time_ms = 100
+        mock_result.text_length = 1000
+        mock_result.ml_chars = 0
         mock_result.error = None
         mock_processor.process_file = AsyncMock(return_value=mock_result)
         scan_module._processor = mock_processor
@@ -282,6 +289,8 @@ class TestDetectAndScore:
             assert result["risk_tier"] == "HIGH"
             assert result["entity_counts"] == {"ssn": 5}
             assert result["total_entities"] == 5
+            assert result["text_length"] == 1000
+            assert result["ml_chars"] == 0
         finally:
             scan_module._processor = original
 
@@ -370,6 +379,8 @@ class TestDetectAndScore:
         mock_result.entity_counts = {"test": 100}
         mock_result.spans = mock_spans
         mock_result.processing_time_ms = 100
+        mock_result.text_length = 1000
+        mock_result.ml_chars = 0
         mock_result.error = None
         mock_processor.process_file = AsyncMock(return_value=mock_result)
         scan_module._processor = mock_processor
@@ -393,6 +404,8 @@ class TestDetectAndScore:
         mock_result.entity_counts = {"ssn": 3, "credit_card": 2, "phone": 5}
         mock_result.spans = []
         mock_result.processing_time_ms = 50
+        mock_result.text_length = 1000
+        mock_result.ml_chars = 0
         mock_result.error = None
         mock_processor.process_file = AsyncMock(return_value=mock_result)
         scan_module._processor = mock_processor
@@ -485,6 +498,9 @@ class TestExecuteScanTask:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -492,12 +508,7 @@ class TestExecuteScanTask:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     await execute_scan_task(mock_session, {"job_id": str(mock_job.id), "_skip_fanout": True})
 
@@ -521,6 +532,9 @@ class TestExecuteScanTask:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -528,12 +542,7 @@ class TestExecuteScanTask:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     result = await execute_scan_task(mock_session, {"job_id": str(mock_job.id), "_skip_fanout": True})
 
@@ -586,6 +595,9 @@ class TestScanTaskDeltaMode:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -593,12 +605,7 @@ class TestScanTaskDeltaMode:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     result = await execute_scan_task(
                         mock_session,
@@ -656,6 +663,9 @@ class TestScanTaskErrorHandling:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -663,12 +673,7 @@ class TestScanTaskErrorHandling:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     # PermissionError from list_files is caught inside _iter_all_files
                     # and the scan completes with 0 files processed
@@ -695,6 +700,9 @@ class TestScanTaskErrorHandling:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -702,12 +710,7 @@ class TestScanTaskErrorHandling:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     # OSError from list_files is caught inside _iter_all_files
                     # and the scan completes with 0 files processed
@@ -774,9 +777,14 @@ class TestTaskCancellationMidScan:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.should_scan_file = AsyncMock(return_value=(True, "new"))
+                mock_inv.check_file_metadata = AsyncMock(return_value=("verify", "metadata_ambiguous"))
+                mock_inv.file_seen_row = AsyncMock(return_value=None)
                 mock_inv.compute_content_hash = MagicMock(return_value="hash")
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
@@ -791,10 +799,7 @@ class TestTaskCancellationMidScan:
                     }
 
                     with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                        mock_settings.return_value = MagicMock(
-                            detection=MagicMock(max_file_size_mb=100),
-                            labeling=MagicMock(enabled=False),
-                        )
+                        mock_settings.return_value = _scan_settings()
 
                         # Mock cancellation check - return cancelled after some iterations
                         call_count = [0]
@@ -870,9 +875,14 @@ class TestProgressReportingAndUpdates:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.should_scan_file = AsyncMock(return_value=(True, "new"))
+                mock_inv.check_file_metadata = AsyncMock(return_value=("verify", "metadata_ambiguous"))
+                mock_inv.file_seen_row = AsyncMock(return_value=None)
                 mock_inv.compute_content_hash = MagicMock(return_value="hash")
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
@@ -889,12 +899,7 @@ class TestProgressReportingAndUpdates:
                     }
 
                     with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                        mock_settings.return_value = MagicMock(
-                            detection=MagicMock(max_file_size_mb=100),
-                            labeling=MagicMock(enabled=False),
-                            catalog=MagicMock(enabled=False),
-                            siem_export=MagicMock(enabled=False),
-                        )
+                        mock_settings.return_value = _scan_settings()
 
                         await execute_scan_task(mock_session, {"job_id": str(job_id), "_skip_fanout": True})
 
@@ -960,6 +965,9 @@ class TestLargeFilesHandling:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -967,12 +975,7 @@ class TestLargeFilesHandling:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),  # 100MB limit
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     result = await execute_scan_task(mock_session, {"job_id": str(job_id), "_skip_fanout": True})
 
@@ -1052,9 +1055,14 @@ class TestPermissionDeniedScenarios:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 mock_inv.should_scan_file = AsyncMock(return_value=(True, "new"))
+                mock_inv.check_file_metadata = AsyncMock(return_value=("verify", "metadata_ambiguous"))
+                mock_inv.file_seen_row = AsyncMock(return_value=None)
                 mock_inv.compute_content_hash = MagicMock(return_value="hash")
                 mock_inv.update_file_inventory = AsyncMock()
                 mock_inv.update_folder_inventory = AsyncMock()
@@ -1071,12 +1079,7 @@ class TestPermissionDeniedScenarios:
                     }
 
                     with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                        mock_settings.return_value = MagicMock(
-                            detection=MagicMock(max_file_size_mb=100),
-                            labeling=MagicMock(enabled=False),
-                            catalog=MagicMock(enabled=False),
-                            siem_export=MagicMock(enabled=False),
-                        )
+                        mock_settings.return_value = _scan_settings()
 
                         result = await execute_scan_task(mock_session, {"job_id": str(job_id), "_skip_fanout": True})
 
@@ -1250,10 +1253,15 @@ class TestInventoryDeltaScanning:
 
             with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
                 mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
                 mock_inv.load_file_inventory = AsyncMock(return_value={})
                 mock_inv.load_folder_inventory = AsyncMock(return_value={})
                 # Mark file as unchanged - should not scan
                 mock_inv.should_scan_file = AsyncMock(return_value=(False, "unchanged"))
+                mock_inv.check_file_metadata = AsyncMock(return_value=("verify", "metadata_ambiguous"))
+                mock_inv.file_seen_row = AsyncMock(return_value=None)
                 mock_inv.compute_content_hash = MagicMock(return_value="same-hash")
                 mock_inv.update_folder_inventory = AsyncMock()
                 mock_inv.mark_missing_files = AsyncMock(return_value=0)
@@ -1261,12 +1269,7 @@ class TestInventoryDeltaScanning:
                 MockInventory.return_value = mock_inv
 
                 with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
-                    mock_settings.return_value = MagicMock(
-                        detection=MagicMock(max_file_size_mb=100),
-                        labeling=MagicMock(enabled=False),
-                        catalog=MagicMock(enabled=False),
-                        siem_export=MagicMock(enabled=False),
-                    )
+                    mock_settings.return_value = _scan_settings()
 
                     result = await execute_scan_task(
                         mock_session,
@@ -1276,3 +1279,184 @@ class TestInventoryDeltaScanning:
                     # One file yielded, but delta says unchanged: exactly 1 skipped
                     assert result["files_skipped"] == 1
                     assert result["scan_mode"] == "delta"
+
+    async def test_metadata_unchanged_files_not_downloaded(self, mock_session):
+        """Files proven unchanged by listing metadata are skipped without a read."""
+        job_id = uuid4()
+        mock_job = MagicMock()
+        mock_job.id = job_id
+        mock_job.tenant_id = uuid4()
+        mock_job.target_id = uuid4()
+        mock_job.status = "pending"
+        mock_job.files_scanned = 0
+        mock_job.files_with_pii = 0
+        mock_job.progress = {}
+
+        mock_target = MagicMock()
+        mock_target.id = mock_job.target_id
+        mock_target.adapter = "s3"
+        mock_target.config = {"path": "bucket"}
+
+        mock_session.get = AsyncMock(side_effect=[mock_job, mock_target, mock_target])
+
+        unchanged_file = MagicMock()
+        unchanged_file.path = "s3://bucket/unchanged.txt"
+        unchanged_file.name = "unchanged.txt"
+        unchanged_file.size = 100
+        unchanged_file.modified = datetime.now(timezone.utc)
+        unchanged_file.change_token = "etag-1"
+        unchanged_file.exposure = MagicMock(value="PRIVATE")
+
+        with patch('openlabels.jobs.tasks.scan._get_adapter') as mock_adapter:
+            adapter = MagicMock()
+            adapter.__aenter__ = AsyncMock(return_value=adapter)
+            adapter.__aexit__ = AsyncMock(return_value=False)
+
+            async def file_list(*args):
+                yield unchanged_file
+
+            adapter.list_files = file_list
+            adapter.read_file = AsyncMock(return_value=b"content")
+            mock_adapter.return_value = adapter
+
+            with patch('openlabels.jobs.inventory.InventoryService') as MockInventory:
+                mock_inv = MagicMock()
+                mock_inv.iter_prefetched = lambda files: files
+                mock_inv.prefetch_folders = AsyncMock()
+                mock_inv.bulk_upsert_file_inventory = AsyncMock()
+                mock_inv.check_file_metadata = AsyncMock(return_value=("skip", "unchanged_token"))
+                seen_row = {"file_path": unchanged_file.path, "last_scan_job_id": job_id}
+                mock_inv.file_seen_row = AsyncMock(return_value=seen_row)
+                mock_inv.bulk_mark_files_seen = AsyncMock()
+                mock_inv.should_scan_file = AsyncMock(return_value=(True, "new"))
+                mock_inv.update_folder_inventory = AsyncMock()
+                mock_inv.mark_missing_files = AsyncMock(return_value=0)
+                mock_inv.get_inventory_stats = AsyncMock(return_value={})
+                MockInventory.return_value = mock_inv
+
+                with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings:
+                    mock_settings.return_value = _scan_settings()
+
+                    result = await execute_scan_task(
+                        mock_session,
+                        {"job_id": str(job_id), "force_full_scan": False, "_skip_fanout": True}
+                    )
+
+                    adapter.read_file.assert_not_awaited()
+                    mock_inv.should_scan_file.assert_not_awaited()
+                    # Seen by this job (in one batched update), so
+                    # mark_missing_files leaves it alone
+                    mock_inv.file_seen_row.assert_awaited_once_with(unchanged_file, job_id)
+                    mock_inv.bulk_mark_files_seen.assert_awaited_once_with([seen_row])
+                    assert result["files_skipped"] == 1
+                    assert result["files_skipped_unread"] == 1
+
+
+class TestStageProfiling:
+    """Tests for the optional per-stage profile attached to scan results."""
+
+    def test_profiler_disabled_by_default(self):
+        from openlabels.jobs.tasks.scan import _build_profiler
+        from openlabels.server.config import Settings
+
+        assert _build_profiler(Settings()) is None
+
+    def test_profiler_built_from_job_settings(self):
+        from openlabels.jobs.tasks.scan import _build_profiler
+
+        settings = Settings()
+        settings.jobs.profiling_enabled = True
+        settings.jobs.profiling_trace_sample_rate = 0.25
+        settings.jobs.profiling_max_traces = 5
+
+        profiler = _build_profiler(settings)
+        assert profiler.trace_sample_rate == 0.25
+        assert profiler.max_traces == 5
+
+    def test_attach_profile_adds_summary_and_dumps_traces(self, tmp_path):
+        from openlabels.core.profiling import StageProfiler, profile_stage, use_profiler
+        from openlabels.jobs.tasks.scan import _attach_profile
+
+        profiler = StageProfiler(trace_sample_rate=1.0)
+        with use_profiler(profiler), profiler.trace("/a.txt"), profile_stage("file"):
+            pass
+
+        settings = Settings()
+        settings.jobs.profiling_trace_dir = str(tmp_path)
+        stats = {}
+        _attach_profile(profiler, stats, settings, "scan-1")
+
+        assert stats["profile"]["stages"]["file"]["count"] == 1
+        assert stats["profile"]["trace_file"] == str(tmp_path / "scan-1-traces.jsonl")
+        assert (tmp_path / "scan-1-traces.jsonl").read_text().count("\n") == 1
+
+
+class TestAutoLabelResults:
+    """Tests for batched auto-labeling after a scan."""
+
+    @staticmethod
+    def _result(risk_tier):
+        result = MagicMock()
+        result.id = uuid4()
+        result.file_path = f"/data/{result.id}.docx"
+        result.file_name = f"{result.id}.docx"
+        result.file_size = 100
+        result.file_modified = datetime.now(timezone.utc)
+        result.risk_tier = risk_tier
+        result.entity_counts = {}
+        result.exposure_level = None
+        return result
+
+    @staticmethod
+    def _rows(items):
+        rows = MagicMock()
+        rows.all.return_value = items
+        rows.scalars.return_value.all.return_value = items
+        return rows
+
+    async def test_labels_and_commits_per_page(self):
+        from openlabels.jobs.tasks.scan import _auto_label_results
+        from openlabels.labeling.engine import LabelResult
+
+        label = MagicMock()
+        label.id = "label-high"
+        label.name = "Confidential"
+        results = [self._result("HIGH"), self._result("LOW"), self._result("HIGH")]
+
+        session = AsyncMock()
+        session.get = AsyncMock(return_value=MagicMock(adapter="filesystem"))
+        session.execute = AsyncMock(side_effect=[
+            self._rows([]),            # label rules
+            self._rows([label]),       # labels for risk_tier_mapping
+            self._rows(results[:2]),   # page 1
+            self._rows(results[2:]),   # page 2
+            self._rows([]),            # done
+        ])
+        job = MagicMock()
+        job.progress = {"files_scanned": 3}
+
+        engine = MagicMock()
+        engine.apply_label = AsyncMock(side_effect=[
+            LabelResult(success=True, label_id="label-high"),
+            LabelResult(success=False, label_id="label-high", error="locked"),
+        ])
+        engine.close = AsyncMock()
+
+        with patch('openlabels.jobs.tasks.scan.get_settings') as mock_settings, \
+                patch('openlabels.jobs.tasks.scan.create_labeling_engine', return_value=engine):
+            mock_settings.return_value.labeling.risk_tier_mapping = {"HIGH": "Confidential", "LOW": None}
+            mock_settings.return_value.labeling.auto_label_batch_size = 2
+            mock_settings.return_value.labeling.auto_label_local_concurrency = 4
+            mock_settings.return_value.labeling.auto_label_graph_concurrency = 2
+
+            stats = await _auto_label_results(session, job)
+
+        assert (stats["labeled"], stats["errors"], stats["skipped"]) == (1, 1, 1)
+        assert "labels_per_second" in stats
+        assert session.commit.await_count == 2
+        engine.close.assert_awaited_once()
+        assert results[0].label_applied is True
+        assert results[0].current_label_name == "Confidential"
+        assert results[2].label_error == "locked"
+        assert job.progress["files_scanned"] == 3
+        assert job.progress["auto_label"]["processed"] == 3
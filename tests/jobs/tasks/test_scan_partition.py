@@ -250,3 +250,41 @@ class TestPartitionTaskExecution:
                 "partition_id": str(uuid4()),
                 "job_id": str(uuid4()),
             })
+
+
+class TestIterPartitionFiles:
+    """Tests for enumerating the files of one partition."""
+
+    @pytest.mark.asyncio
+    async def test_object_store_receives_spec(self):
+        from openlabels.adapters.base import PartitionSpec
+        from openlabels.jobs.tasks.scan_partition import _iter_partition_files
+
+        spec = PartitionSpec(start_after="a", end_before="m")
+        calls = []
+
+        async def list_files(target, partition=None):
+            calls.append((target, partition))
+            yield "file"
+
+        adapter = MagicMock()
+        adapter.list_files = list_files
+        files = [f async for f in _iter_partition_files(adapter, "s3", "bucket", spec)]
+        assert files == ["file"]
+        assert calls == [("bucket", spec)]
+
+    @pytest.mark.asyncio
+    async def test_site_batch_lists_each_site_and_skips_failures(self):
+        from openlabels.adapters.base import PartitionSpec
+        from openlabels.jobs.tasks.scan_partition import _iter_partition_files
+
+        async def list_files(site):
+            if site == "bad":
+                raise ConnectionError("throttled")
+            yield f"{site}/doc.docx"
+
+        adapter = MagicMock()
+        adapter.list_files = list_files
+        spec = PartitionSpec(site_ids=["s1", "bad", "s2"])
+        files = [f async for f in _iter_partition_files(adapter, "sharepoint", "", spec)]
+        assert files == ["s1/doc.docx", "s2/doc.docx"]
@@ -26,6 +26,7 @@ from openlabels.jobs.coordinator import (
     MIN_PARTITION_SIZE,
     FanoutDecision,
     ScanCoordinator,
+    plan_subtree_partitions,
 )
 
 
@@ -64,6 +65,20 @@ class TestPartitionSpec:
         assert spec.end_before is None
         assert spec.prefix is None
 
+    def test_batch_fields_roundtrip(self):
+        original = PartitionSpec(
+            directories=["/share/a", "/share/b"],
+            exclude_directories=["/share/a/big"],
+        )
+        restored = PartitionSpec.from_dict(original.to_dict())
+        assert restored == original
+        assert PartitionSpec.from_dict({"site_ids": ["s1", "s2"]}).site_ids == ["s1", "s2"]
+
+    def test_listing_roots(self):
+        assert PartitionSpec(start_after="a").listing_roots() == []
+        assert PartitionSpec(directory="/d", directories=["/e"]).listing_roots() == ["/d", "/e"]
+        assert PartitionSpec(user_ids=["u1", "u2"]).listing_roots() == ["u1", "u2"]
+
     def test_to_dict_excludes_none(self):
         spec = PartitionSpec(start_after="a")
         d = spec.to_dict()
@@ -105,6 +120,14 @@ def _make_target(adapter_type="s3"):
     return target
 
 
+def _rows_result(one=None, rows=None, scalar=None):
+    result = MagicMock()
+    result.one.return_value = one
+    result.all.return_value = rows or []
+    result.scalar.return_value = scalar
+    return result
+
+
 def _make_job():
     job = MagicMock()
     job.id = uuid4()
@@ -133,10 +156,11 @@ class TestCoordinatorEvaluate:
 
     @pytest.mark.asyncio
     async def test_filesystem_not_partitionable(self):
-        """Filesystem adapter shouldn't trigger fan-out."""
+        """Filesystem without an indexed directory tree shouldn't fan out."""
         coordinator = _make_coordinator(MagicMock(
             fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=8
         ))
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(one=(0, 0)))
         decision = await coordinator.evaluate(
             _make_job(), _make_target("filesystem"), AsyncMock()
         )
@@ -322,3 +346,211 @@ class TestPartitionComputation:
 
         specs = await coordinator._compute_keyrange_partitions(adapter, "", 4)
         assert len(specs) == 1
+
+
+# ── Filesystem and SharePoint/OneDrive fan-out ───────────────────────
+
+def _tree(spec, root="/share"):
+    """Directory rows from {path: direct_file_count}; parents precede children."""
+    ids = {}
+    rows = []
+    for path, count in spec.items():
+        parent = path.rsplit("/", 1)[0] if path != root else None
+        ids[path] = uuid4()
+        rows.append((ids[path], ids.get(parent), path, count))
+    return rows
+
+
+def _graph_settings(sites=False, users=False):
+    settings = MagicMock()
+    settings.adapters.sharepoint.scan_all_sites = sites
+    settings.adapters.onedrive.scan_all_users = users
+    return patch("openlabels.server.config.get_settings", return_value=settings)
+
+
+class TestPlanSubtreePartitions:
+    """Tests for the directory-tree partition planner."""
+
+    def test_balances_large_subtrees(self):
+        rows = _tree({
+            "/share": 10,
+            "/share/a": 4000,
+            "/share/b": 3000,
+            "/share/c": 2000,
+            "/share/d": 1000,
+        })
+        specs = plan_subtree_partitions(rows, "/share", 2)
+
+        assert len(specs) == 2
+        loads = sorted(
+            sum({"/share": 10, "/share/a": 4000, "/share/b": 3000,
+                 "/share/c": 2000, "/share/d": 1000}[d] for d in s.directories)
+            for s in specs
+        )
+        assert loads == [5000, 5010]
+
+    def test_split_parent_excludes_children(self):
+        rows = _tree({"/share": 5, "/share/a": 100, "/share/b": 100})
+        specs = plan_subtree_partitions(rows, "/share", 3)
+
+        roots = sorted(d for s in specs for d in s.directories)
+        assert roots == ["/share", "/share/a", "/share/b"]
+        parent_spec = next(s for s in specs if "/share" in s.directories)
+        assert parent_spec.exclude_directories == ["/share/a", "/share/b"]
+
+    def test_splits_nested_heavy_subtree(self):
+        rows = _tree({
+            "/share": 0,
+            "/share/a": 0,
+            "/share/a/x": 500,
+            "/share/a/y": 500,
+            "/share/b": 500,
+        })
+        specs = plan_subtree_partitions(rows, "/share", 3)
+        roots = {d for s in specs for d in s.directories}
+        assert {"/share/a/x", "/share/a/y", "/share/b"} <= roots
+        assert len(specs) == 3
+
+    def test_every_directory_covered_once(self):
+        counts = {"/share": 1}
+        for i in range(20):
+            counts[f"/share/d{i}"] = (i + 1) * 10
+            counts[f"/share/d{i}/sub"] = 5
+        specs = plan_subtree_partitions(_tree(counts), "/share", 4)
+
+        roots = [d for s in specs for d in s.directories]
+        excluded = {d for s in specs for d in s.exclude_directories or []}
+        assert len(roots) == len(set(roots))
+        # A subtree is walked by its root's partition unless it is itself a root
+        assert excluded <= set(roots)
+        assert len(specs) == 4
+
+    def test_unit_cap_stops_splitting(self):
+        counts = {"/share": 0}
+        counts.update({f"/share/d{i}": 10 for i in range(50)})
+        specs = plan_subtree_partitions(_tree(counts), "/share", 4, max_units=10)
+        assert [s.directories for s in specs] == [["/share"]]
+
+    def test_root_not_indexed(self):
+        rows = _tree({"/other": 10, "/other/a": 10}, root="/other")
+        assert plan_subtree_partitions(rows, "/share", 4) == []
+
+    def test_trailing_separator_on_target(self):
+        rows = _tree({"/share": 0, "/share/a": 10, "/share/b": 10})
+        specs = plan_subtree_partitions(rows, "/share/", 2)
+        assert len(specs) == 2
+
+
+class TestFilesystemFanout:
+    """Tests for filesystem fan-out from the directory tree index."""
+
+    @pytest.mark.asyncio
+    async def test_indexed_tree_above_threshold(self):
+        coordinator = _make_coordinator(MagicMock(
+            fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=8
+        ))
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(one=(40, 20000)))
+
+        decision = await coordinator.evaluate(
+            _make_job(), _make_target("filesystem"), AsyncMock()
+        )
+        assert decision.should_fanout
+        assert decision.estimated_files == 20000
+        assert decision.num_partitions == 8
+
+    @pytest.mark.asyncio
+    async def test_partitions_capped_by_directory_count(self):
+        coordinator = _make_coordinator(MagicMock(
+            fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=8
+        ))
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(one=(3, 20000)))
+
+        decision = await coordinator.evaluate(
+            _make_job(), _make_target("filesystem"), AsyncMock()
+        )
+        assert decision.num_partitions == 3
+
+    @pytest.mark.asyncio
+    async def test_create_partitions_uses_subtrees(self):
+        coordinator = _make_coordinator()
+        rows = _tree({"/share": 0, "/share/a": 600, "/share/b": 600})
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(rows=rows))
+        coordinator.session.add = MagicMock()
+        target = _make_target("filesystem")
+        target.config = {"path": "/share"}
+
+        with patch("openlabels.jobs.queue.JobQueue") as queue_cls:
+            queue_cls.return_value.enqueue = AsyncMock()
+            partitions = await coordinator.create_partitions(
+                _make_job(), target, AsyncMock(), num_partitions=2, estimated_files=1200,
+            )
+
+        specs = [PartitionSpec.from_dict(p.partition_spec) for p in partitions]
+        assert sorted(d for s in specs for d in s.directories) == ["/share", "/share/a", "/share/b"]
+
+
+class TestGraphFanout:
+    """Tests for SharePoint/OneDrive fan-out by site or user."""
+
+    def _target(self, adapter_type, path=""):
+        target = _make_target(adapter_type)
+        target.config = {"path": path}
+        return target
+
+    @pytest.mark.asyncio
+    async def test_single_site_not_partitionable(self):
+        coordinator = _make_coordinator(MagicMock(
+            fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=4
+        ))
+        with _graph_settings(sites=True):
+            decision = await coordinator.evaluate(
+                _make_job(), self._target("sharepoint", "site-1"), AsyncMock()
+            )
+        assert not decision.should_fanout
+        assert "single_resource" in decision.reason
+
+    @pytest.mark.asyncio
+    async def test_all_sites_without_inventory_fans_out(self):
+        coordinator = _make_coordinator(MagicMock(
+            fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=4
+        ))
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(scalar=0))
+        adapter = AsyncMock()
+        adapter.list_sites = AsyncMock(return_value=[{"id": f"s{i}"} for i in range(10)])
+
+        with _graph_settings(sites=True):
+            decision = await coordinator.evaluate(
+                _make_job(), self._target("sharepoint"), adapter
+            )
+        assert decision.should_fanout
+        assert decision.num_partitions == 4
+
+    @pytest.mark.asyncio
+    async def test_small_inventory_stays_single_worker(self):
+        coordinator = _make_coordinator(MagicMock(
+            fanout_enabled=True, fanout_threshold=1000, fanout_max_partitions=4
+        ))
+        coordinator.session.execute = AsyncMock(return_value=_rows_result(scalar=200))
+        adapter = AsyncMock()
+        adapter.list_users = AsyncMock(return_value=[{"id": "u1"}, {"id": "u2"}])
+
+        with _graph_settings(users=True):
+            decision = await coordinator.evaluate(
+                _make_job(), self._target("onedrive"), adapter
+            )
+        assert not decision.should_fanout
+        assert "below_threshold" in decision.reason
+
+    @pytest.mark.asyncio
+    async def test_resource_batches_cover_all_users(self):
+        coordinator = _make_coordinator()
+        adapter = AsyncMock()
+        adapter.list_users = AsyncMock(return_value=[{"id": f"u{i}"} for i in range(7)])
+        target = self._target("onedrive")
+
+        with _graph_settings(users=True):
+            specs = await coordinator._compute_resource_partitions(target, adapter, 3)
+
+        assert len(specs) == 3
+        assert sorted(u for s in specs for u in s.user_ids) == sorted(f"u{i}" for i in range(7))
+        assert all(s.site_ids is None for s in specs)
@@ -0,0 +1,278 @@
+"""
+Tests for the content-addressed detection result cache.
+
+Tests focus on:
+- Key composition (tenant, fingerprint, extension, exposure, hash)
+- Local LRU tier and Redis shared tier
+- Coalescing of concurrent lookups for the same content
+- Hit/miss accounting in scan pipeline stats
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openlabels.jobs.detection_cache import (
+    DetectionCache,
+    detection_cache_key,
+    policy_fingerprint,
+)
+from openlabels.jobs.pipeline import PipelineStats
+
+
+def _result(**overrides):
+    result = {
+        "risk_score": 42,
+        "risk_tier": "MEDIUM",
+        "entity_counts": {"SSN": 1},
+        "total_entities": 1,
+        "findings": {"entities": [{"entity_type": "SSN", "start": 0, "end": 11}]},
+        "policy_violations": None,
+        "error": None,
+    }
+    result.update(overrides)
+    return result
+
+
+def _shared_manager(store=None):
+    """A CacheManager stand-in backed by a plain dict."""
+    store = {} if store is None else store
+    manager = MagicMock()
+    manager.is_redis_connected = True
+    manager.get = AsyncMock(side_effect=lambda key: store.get(key))
+
+    async def _set(key, value, ttl=None):
+        store[key] = value
+        return True
+
+    manager.set = AsyncMock(side_effect=_set)
+    return manager, store
+
+
+class TestDetectionCacheKey:
+
+    def test_key_includes_all_parts(self):
+        key = detection_cache_key("t1", "fp", "/share/Report.DOCX", "PUBLIC", "abc123")
+        assert key == "detect:t1:fp:.docx:PUBLIC:abc123"
+
+    def test_extension_changes_key(self):
+        a = detection_cache_key("t1", "fp", "a.txt", "PRIVATE", "h")
+        b = detection_cache_key("t1", "fp", "a.pdf", "PRIVATE", "h")
+        assert a != b
+
+    def test_tenants_do_not_share_keys(self):
+        a = detection_cache_key("t1", "fp", "a.txt", "PRIVATE", "h")
+        b = detection_cache_key("t2", "fp", "a.txt", "PRIVATE", "h")
+        assert a != b
+
+    def test_policy_fingerprint_tracks_versions(self):
+        v1 = SimpleNamespace(_policies=[SimpleNamespace(name="HIPAA", version="1.0")])
+        v2 = SimpleNamespace(_policies=[SimpleNamespace(name="HIPAA", version="1.1")])
+        assert policy_fingerprint(v1) != policy_fingerprint(v2)
+        assert policy_fingerprint(v1) == policy_fingerprint(v1)
+
+
+class TestLocalTier:
+
+    async def test_miss_then_hit(self):
+        cache = DetectionCache(use_shared=False)
+        assert await cache.get("k") is None
+        await cache.put("k", _result())
+        assert await cache.get("k") == _result()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_returns_copies(self):
+        cache = DetectionCache(use_shared=False)
+        await cache.put("k", _result())
+        first = await cache.get("k")
+        first["entity_counts"]["SSN"] = 99
+        assert (await cache.get("k"))["entity_counts"] == {"SSN": 1}
+
+    async def test_lru_eviction(self):
+        cache = DetectionCache(max_entries=2, use_shared=False)
+        await cache.put("a", _result())
+        await cache.put("b", _result())
+        await cache.get("a")  # a is now most recently used
+        await cache.put("c", _result())
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+    async def test_errors_not_cached(self):
+        cache = DetectionCache(use_shared=False)
+        assert await cache.put("k", _result(error="extraction failed")) is False
+        assert len(cache) == 0
+
+
+class TestSharedTier:
+
+    async def test_put_writes_through_with_ttl(self):
+        manager, store = _shared_manager()
+        cache = DetectionCache(shared_ttl=60, cache_manager=manager)
+        await cache.initialize()
+        await cache.put("k", _result())
+        assert store["k"] == _result()
+        manager.set.assert_awaited_once_with("k", _result(), ttl=60)
+
+    async def test_shared_hit_populates_local(self):
+        manager, _ = _shared_manager({"k": _result()})
+        cache = DetectionCache(cache_manager=manager)
+        await cache.initialize()
+
+        assert await cache.get("k") == _result()
+        assert await cache.get("k") == _result()
+        assert cache.stats.shared_hits == 1
+        assert cache.stats.local_hits == 1
+        assert manager.get.await_count == 1
+
+    async def test_disconnected_redis_is_skipped(self):
+        manager, _ = _shared_manager({"k": _result()})
+        manager.is_redis_connected = False
+        cache = DetectionCache(cache_manager=manager)
+        await cache.initialize()
+
+        assert not cache.shared_enabled
+        assert await cache.get("k") is None
+        manager.get.assert_not_awaited()
+
+    async def test_shared_errors_degrade_to_miss(self):
+        manager, _ = _shared_manager()
+        manager.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = DetectionCache(cache_manager=manager)
+        await cache.initialize()
+        assert await cache.get("k") is None
+        assert cache.stats.misses == 1
+
+
+class TestGetOrCompute:
+
+    async def test_computes_once_then_hits(self):
+        cache = DetectionCache(use_shared=False)
+        compute = AsyncMock(return_value=_result())
+
+        first, hit1 = await cache.get_or_compute("k", compute)
+        second, hit2 = await cache.get_or_compute("k", compute)
+
+        assert (hit1, hit2) == (False, True)
+        assert first == second == _result()
+        compute.assert_awaited_once()
+
+    async def test_concurrent_duplicates_coalesced(self):
+        cache = DetectionCache(use_shared=False)
+        calls = 0
+        release = asyncio.Event()
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _result()
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert [hit for _, hit in results].count(False) == 1
+        assert cache.stats.coalesced == 4
+
+    async def test_failed_compute_lets_waiters_retry(self):
+        cache = DetectionCache(use_shared=False)
+        release = asyncio.Event()
+        attempts = 0
+
+        async def compute():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await release.wait()
+                raise RuntimeError("detector crashed")
+            return _result()
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(RuntimeError):
+            await leader
+        result, hit = await waiter
+        assert result == _result()
+        assert hit is False
+        assert attempts == 2
+
+    async def test_leader_error_result_not_counted_as_hit(self):
+        cache = DetectionCache(use_shared=False)
+        release = asyncio.Event()
+        attempts = 0
+
+        async def compute():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await release.wait()
+                return _result(error="extraction failed")
+            return _result()
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert (await leader)[0]["error"] == "extraction failed"
+        result, hit = await waiter
+        assert result == _result()
+        assert hit is False
+        assert cache.stats.coalesced == 0
+        assert cache.stats.hits == 0
+        assert cache.stats.misses == 2
+
+
+class TestScanIntegration:
+
+    async def test_duplicate_content_counted_in_pipeline_stats(self):
+        from openlabels.jobs.tasks import scan
+
+        cache = DetectionCache(use_shared=False)
+        stats = PipelineStats()
+        file_info = SimpleNamespace(path="/a/report.txt", exposure=None, size=10)
+        processor = SimpleNamespace(fingerprint="fp")
+
+        with patch.object(scan, "get_detection_cache", AsyncMock(return_value=cache)), \
+                patch.object(scan, "get_processor", return_value=processor), \
+                patch.object(scan, "_detect_and_score", AsyncMock(return_value=_result())) as detect:
+            for path in ("/a/report.txt", "/b/copy.txt", "/c/other.txt"):
+                file_info.path = path
+                result = await scan._detect_and_score_cached(
+                    b"same bytes", "hash1", file_info, "filesystem", "tenant", stats,
+                )
+                assert result["total_entities"] == 1
+
+        detect.assert_awaited_once()
+        assert stats.detection_cache_misses == 1
+        assert stats.detection_cache_hits == 2
+        assert stats.to_dict()["detection_cache_hits"] == 2
+
+    async def test_disabled_cache_calls_detection_directly(self):
+        from openlabels.jobs.tasks import scan
+
+        stats = PipelineStats()
+        file_info = SimpleNamespace(path="/a/report.txt", exposure=None, size=10)
+
+        with patch.object(scan, "get_detection_cache", AsyncMock(return_value=None)), \
+                patch.object(scan, "_detect_and_score", AsyncMock(return_value=_result())) as detect:
+            await scan._detect_and_score_cached(
+                b"x", "hash1", file_info, "filesystem", "tenant", stats,
+            )
+            await scan._detect_and_score_cached(
+                b"x", "hash1", file_info, "filesystem", "tenant", stats,
+            )
+
+        assert detect.await_count == 2
+        assert stats.detection_cache_hits == 0
@@ -3,7 +3,7 @@ Comprehensive tests for the data inventory service.
 
 Tests focus on:
 - On-demand inventory lookups with bounded LRU cache
-- Delta scan logic (should_scan_folder, should_scan_file)
+- Delta scan logic (should_scan_folder, check_file_metadata, should_scan_file)
 - Content hash computation
 - Folder and file inventory updates
 - Missing file detection (DB UPDATE approach)
@@ -22,7 +22,13 @@ from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from sqlalchemy.dialects import postgresql
+
+from openlabels.adapters.base import FileInfo
 from openlabels.jobs.inventory import (
+    DELTA_SCAN,
+    DELTA_SKIP,
+    DELTA_VERIFY,
     InventoryService,
     get_folder_path,
     _FILE_CACHE_MAX,
@@ -370,6 +376,139 @@ class TestShouldScanFile:
         assert reason == "unchanged"
 
 
+class TestCheckFileMetadata:
+    """Tests for the metadata-only first stage of the delta check."""
+
+    @pytest.fixture
+    def service(self):
+        return _make_service()
+
+    @pytest.fixture
+    def modified(self):
+        return datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def _file(self, modified, size=1024, change_token=None):
+        return FileInfo(
+            path="/test/file.txt",
+            name="file.txt",
+            size=size,
+            modified=modified,
+            change_token=change_token,
+        )
+
+    def _inv(self, service, modified, size=1024, change_token=None, needs_rescan=False):
+        inv = MagicMock()
+        inv.needs_rescan = needs_rescan
+        inv.file_size = size
+        inv.file_modified = modified
+        inv.change_token = change_token
+        service._file_cache["/test/file.txt"] = inv
+        return inv
+
+    async def test_force_full_scan(self, service, modified):
+        decision, reason = await service.check_file_metadata(self._file(modified), True)
+        assert (decision, reason) == (DELTA_SCAN, "full_scan")
+
+    async def test_new_file(self, service, modified):
+        decision, reason = await service.check_file_metadata(self._file(modified))
+        assert (decision, reason) == (DELTA_SCAN, "new_file")
+
+    async def test_flagged_rescan(self, service, modified):
+        self._inv(service, modified, needs_rescan=True)
+        decision, _ = await service.check_file_metadata(self._file(modified))
+        assert decision == DELTA_SCAN
+
+    async def test_size_changed(self, service, modified):
+        self._inv(service, modified, size=2048, change_token="a")
+        decision, reason = await service.check_file_metadata(self._file(modified, change_token="a"))
+        assert (decision, reason) == (DELTA_SCAN, "size_changed")
+
+    async def test_matching_token_skips_even_if_mtime_differs(self, service, modified):
+        self._inv(service, modified - timedelta(days=1), change_token="etag-1")
+        decision, reason = await service.check_file_metadata(
+            self._file(modified, change_token="etag-1")
+        )
+        assert (decision, reason) == (DELTA_SKIP, "unchanged_token")
+
+    async def test_changed_token_scans(self, service, modified):
+        self._inv(service, modified, change_token="etag-1")
+        decision, reason = await service.check_file_metadata(
+            self._file(modified, change_token="etag-2")
+        )
+        assert (decision, reason) == (DELTA_SCAN, "token_changed")
+
+    async def test_same_size_and_mtime_skips(self, service, modified):
+        self._inv(service, modified)
+        decision, reason = await service.check_file_metadata(self._file(modified))
+        assert (decision, reason) == (DELTA_SKIP, "unchanged_metadata")
+
+    async def test_newer_mtime_scans(self, service, modified):
+        self._inv(service, modified - timedelta(hours=1))
+        decision, reason = await service.check_file_metadata(self._file(modified))
+        assert (decision, reason) == (DELTA_SCAN, "modified_time")
+
+    async def test_older_mtime_is_ambiguous(self, service, modified):
+        self._inv(service, modified + timedelta(hours=1))
+        decision, _ = await service.check_file_metadata(self._file(modified))
+        assert decision == DELTA_VERIFY
+
+    async def test_missing_inventory_metadata_is_ambiguous(self, service, modified):
+        self._inv(service, None)
+        decision, _ = await service.check_file_metadata(self._file(modified))
+        assert decision == DELTA_VERIFY
+
+    async def test_file_seen_row_records_listing_metadata(self, service, modified):
+        """A skipped file is stamped with the job, so mark_missing_files leaves it."""
+        inv = self._inv(service, modified - timedelta(days=1))
+        job_id = uuid4()
+        row = await service.file_seen_row(self._file(modified, change_token="etag-9"), job_id)
+        assert row == {
+            "id": inv.id,
+            "file_path": "/test/file.txt",
+            "file_modified": modified,
+            "change_token": "etag-9",
+            "last_scan_job_id": job_id,
+        }
+
+    async def test_file_seen_row_leaves_orm_row_clean(self, service, modified):
+        """The update is applied in bulk, not through the session's unit of work."""
+        inv = self._inv(service, modified - timedelta(days=1), change_token="etag-1")
+        await service.file_seen_row(self._file(modified, change_token="etag-9"), uuid4())
+        assert inv.file_modified == modified - timedelta(days=1)
+        assert inv.change_token == "etag-1"
+
+    async def test_file_seen_row_unknown_file(self, service, modified):
+        assert await service.file_seen_row(self._file(modified), uuid4()) is None
+
+    async def test_bulk_mark_files_seen_one_statement_per_chunk(self, service, modified):
+        job_id = uuid4()
+        rows = [
+            {
+                "id": uuid4(),
+                "file_path": f"/test/f{i}.txt",
+                "file_modified": modified,
+                "change_token": None,
+                "last_scan_job_id": job_id,
+            }
+            for i in range(3)
+        ]
+        service._file_cache["/test/f0.txt"] = MagicMock()
+        service.session.execute.reset_mock()
+
+        assert await service.bulk_mark_files_seen(rows + rows[:1]) == 3
+
+        service.session.execute.assert_awaited_once()
+        stmt, params = service.session.execute.await_args.args
+        assert "FROM (VALUES" in str(stmt)
+        assert params["job_2"] == job_id
+        assert "/test/f0.txt" not in service._file_cache
+
+    async def test_bulk_mark_files_seen_empty(self, service):
+        service.session.execute.reset_mock()
+        assert await service.bulk_mark_files_seen([]) == 0
+        service.session.execute.assert_not_awaited()
+
+
 class TestComputeContentHash:
     """Tests for content hash computation."""
 
@@ -772,3 +911,123 @@ class TestGetInventoryStats:
         # Unknown tier shouldn't be counted in known tiers
         assert stats["risk_tier_breakdown"]["CRITICAL"] == 0
         assert stats["risk_tier_breakdown"]["HIGH"] == 0
+
+
+def _scalars_result(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+class TestPrefetch:
+    """Tests for page-level inventory prefetch and the negative cache."""
+
+    async def test_prefetch_caches_found_and_absent_paths(self):
+        """One query loads a page; later lookups for it never hit the DB."""
+        service = _make_service()
+        known = MagicMock(file_path="/a/known.txt")
+        service.session.execute = AsyncMock(return_value=_scalars_result([known]))
+
+        found = await service.prefetch_files(["/a/known.txt", "/a/new.txt", "/a/new.txt"])
+
+        assert found == 1
+        assert service.session.execute.await_count == 1
+        assert await service._get_file_inv("/a/known.txt") is known
+        assert await service._get_file_inv("/a/new.txt") is None
+        assert service.session.execute.await_count == 1
+
+    async def test_prefetch_skips_already_cached_paths(self):
+        service = _make_service()
+        service._cache_file("/a/cached.txt", MagicMock())
+        await service.prefetch_files(["/a/cached.txt"])
+        service.session.execute.assert_not_called()
+
+    async def test_caching_a_file_clears_absent_marker(self):
+        service = _make_service()
+        service._cache_absent_file("/a/file.txt")
+        inv = MagicMock()
+        service._cache_file("/a/file.txt", inv)
+        assert await service._get_file_inv("/a/file.txt") is inv
+
+    async def test_absent_cache_is_bounded(self):
+        service = _make_service()
+        for i in range(_FILE_CACHE_MAX + 10):
+            service._cache_absent_file(f"/f{i}")
+        assert len(service._absent_files) == _FILE_CACHE_MAX
+
+    async def test_iter_prefetched_yields_all_files_in_order(self):
+        service = _make_service()
+        service.session.execute = AsyncMock(return_value=_scalars_result([]))
+        files = [MagicMock(path=f"/f{i}") for i in range(5)]
+
+        async def listing():
+            for f in files:
+                yield f
+
+        seen = [f async for f in service.iter_prefetched(listing(), page_size=2)]
+
+        assert seen == files
+        assert service.session.execute.await_count == 3  # pages of 2, 2, 1
+
+    async def test_prefetch_folders(self):
+        service = _make_service()
+        folder = MagicMock(folder_path="/a")
+        service.session.execute = AsyncMock(return_value=_scalars_result([folder]))
+
+        assert await service.prefetch_folders(["/a", "/b"]) == 1
+        assert await service._get_folder_inv("/a") is folder
+
+
+class TestBulkUpsertFileInventory:
+    """Tests for the multi-row file inventory upsert."""
+
+    @staticmethod
+    def _file_info(path):
+        return FileInfo(
+            path=path,
+            name=path.rsplit("/", 1)[-1],
+            size=10,
+            modified=datetime.now(timezone.utc),
+            adapter="filesystem",
+        )
+
+    def _row(self, service, path, content_hash="h"):
+        scan_row = {
+            "risk_score": 10, "risk_tier": "LOW", "entity_counts": {"SSN": 1},
+            "total_entities": 1, "exposure_level": "PRIVATE", "owner": None,
+        }
+        return service.file_inventory_row(self._file_info(path), scan_row, content_hash, uuid4())
+
+    async def test_empty_rows_do_nothing(self):
+        service = _make_service()
+        assert await service.bulk_upsert_file_inventory([]) == 0
+        service.session.execute.assert_not_called()
+
+    async def test_duplicate_paths_keep_last_row(self):
+        service = _make_service()
+        rows = [self._row(service, "/a.txt", "h1"), self._row(service, "/a.txt", "h2")]
+
+        assert await service.bulk_upsert_file_inventory(rows) == 1
+        stmt = service.session.execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (tenant_id, target_id, file_path) DO UPDATE" in str(compiled)
+        assert "h2" in compiled.params.values()
+        assert "h1" not in compiled.params.values()
+
+    async def test_evicts_cached_entries(self):
+        service = _make_service()
+        service._cache_file("/a.txt", MagicMock())
+        service._cache_absent_file("/b.txt")
+
+        await service.bulk_upsert_file_inventory(
+            [self._row(service, "/a.txt"), self._row(service, "/b.txt")]
+        )
+
+        assert "/a.txt" not in service._file_cache
+        assert "/b.txt" not in service._absent_files
+
+    async def test_large_batches_are_chunked(self):
+        service = _make_service()
+        rows = [self._row(service, f"/f{i}.txt") for i in range(1200)]
+        assert await service.bulk_upsert_file_inventory(rows) == 1200
+        assert service.session.execute.await_count == 3
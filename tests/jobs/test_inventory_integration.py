@@ -0,0 +1,89 @@
+"""Integration tests for delta-scan bookkeeping in the inventory service."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from openlabels.adapters.base import FileInfo
+from openlabels.jobs.inventory import DELTA_SKIP, InventoryService
+
+MODIFIED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def scanned_tree(test_db):
+    """A target whose three files were inventoried by a first full scan."""
+    from openlabels.server.models import FileInventory, ScanJob, ScanTarget, Tenant
+
+    tenant = Tenant(name="delta-test-tenant")
+    test_db.add(tenant)
+    await test_db.flush()
+
+    target = ScanTarget(
+        tenant_id=tenant.id,
+        name="delta-test-target",
+        adapter="filesystem",
+        config={"path": "/data"},
+    )
+    test_db.add(target)
+    await test_db.flush()
+
+    first_job = ScanJob(tenant_id=tenant.id, target_id=target.id, status="completed")
+    test_db.add(first_job)
+    await test_db.flush()
+
+    files = [
+        FileInfo(path=f"/data/file{i}.txt", name=f"file{i}.txt", size=100 + i, modified=MODIFIED)
+        for i in range(3)
+    ]
+    for f in files:
+        test_db.add(FileInventory(
+            tenant_id=tenant.id,
+            target_id=target.id,
+            file_path=f.path,
+            file_name=f.name,
+            adapter="filesystem",
+            content_hash="hash",
+            file_size=f.size,
+            file_modified=f.modified,
+            risk_score=50,
+            risk_tier="MEDIUM",
+            last_scan_job_id=first_job.id,
+        ))
+    await test_db.flush()
+
+    return tenant, target, files, test_db
+
+
+class TestDeltaScanMissingFiles:
+
+    async def test_repeated_delta_scans_do_not_flag_unchanged_files(self, scanned_tree):
+        """Files skipped on metadata alone are still seen, not missing."""
+        from sqlalchemy import select
+
+        from openlabels.server.models import FileInventory, ScanJob
+
+        tenant, target, files, session = scanned_tree
+
+        for _ in range(2):
+            job = ScanJob(tenant_id=tenant.id, target_id=target.id, status="running")
+            session.add(job)
+            await session.flush()
+
+            inventory = InventoryService(session, tenant.id, target.id)
+            seen_rows = []
+            for file_info in files:
+                decision, _ = await inventory.check_file_metadata(file_info)
+                assert decision == DELTA_SKIP
+                seen_rows.append(await inventory.file_seen_row(file_info, job.id))
+            assert await inventory.bulk_mark_files_seen(seen_rows) == 3
+
+            assert await inventory.mark_missing_files(job.id) == 0
+
+        flagged = await session.execute(
+            select(FileInventory.file_path).where(
+                FileInventory.target_id == target.id,
+                FileInventory.needs_rescan == True,  # noqa: E712
+            )
+        )
+        assert flagged.all() == []
@@ -0,0 +1,111 @@
+"""
+Tests for job dispatch wake-ups (LISTEN/NOTIFY and fallback poll backoff).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.exc import OperationalError
+
+from openlabels.jobs.notify import JobNotificationListener, PollBackoff
+from openlabels.jobs.queue import JOB_NOTIFY_CHANNEL
+
+
+def _engine(driver):
+    """An AsyncEngine stand-in whose raw connection is ``driver``."""
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+    connection.close = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=connection)
+    return engine, connection
+
+
+def _asyncpg_driver():
+    driver = MagicMock()
+    driver.add_listener = AsyncMock()
+    driver.remove_listener = AsyncMock()
+    driver.is_closed.return_value = False
+    return driver
+
+
+class TestPollBackoff:
+
+    def test_doubles_up_to_max(self):
+        backoff = PollBackoff(1.0, 5.0)
+        assert backoff.delay == 1.0
+        assert [backoff.increase() for _ in range(4)] == [2.0, 4.0, 5.0, 5.0]
+
+    def test_reset_returns_to_min(self):
+        backoff = PollBackoff(0.5, 30.0)
+        backoff.increase()
+        backoff.increase()
+        backoff.reset()
+        assert backoff.delay == 0.5
+
+    def test_max_never_below_min(self):
+        backoff = PollBackoff(10.0, 1.0)
+        assert backoff.increase() == 10.0
+
+
+class TestJobNotificationListener:
+
+    async def test_start_listens_on_channel(self):
+        driver = _asyncpg_driver()
+        engine, _ = _engine(driver)
+        listener = JobNotificationListener(engine)
+
+        assert await listener.start() is True
+        assert listener.connected
+        driver.add_listener.assert_awaited_once()
+        assert driver.add_listener.call_args.args[0] == JOB_NOTIFY_CHANNEL
+
+    async def test_notification_wakes_waiter(self):
+        driver = _asyncpg_driver()
+        engine, _ = _engine(driver)
+        listener = JobNotificationListener(engine)
+        await listener.start()
+        callback = driver.add_listener.call_args.args[1]
+
+        waiter = asyncio.create_task(listener.wait(10))
+        await asyncio.sleep(0)
+        callback(driver, 1234, JOB_NOTIFY_CHANNEL, "tenant")
+
+        assert await asyncio.wait_for(waiter, 1) is True
+
+    async def test_wait_times_out(self):
+        driver = _asyncpg_driver()
+        engine, _ = _engine(driver)
+        listener = JobNotificationListener(engine)
+        await listener.start()
+
+        assert await listener.wait(0.01) is False
+
+    async def test_driver_without_listen_support_polls(self):
+        engine, connection = _engine(object())
+        listener = JobNotificationListener(engine)
+
+        assert await listener.start() is False
+        assert not listener.connected
+        connection.close.assert_awaited_once()
+        assert await listener.wait(0.01) is False
+
+    async def test_connection_failure_degrades_to_sleep(self):
+        engine = MagicMock()
+        engine.connect = AsyncMock(side_effect=OperationalError("connect", {}, Exception("down")))
+        listener = JobNotificationListener(engine)
+
+        assert await listener.start() is False
+        assert await listener.wait(0.01) is False
+
+    async def test_close_removes_listener(self):
+        driver = _asyncpg_driver()
+        engine, connection = _engine(driver)
+        listener = JobNotificationListener(engine)
+        await listener.start()
+
+        await listener.close()
+
+        driver.remove_listener.assert_awaited_once()
+        connection.close.assert_awaited_once()
+        assert not listener.connected
@@ -0,0 +1,212 @@
+"""
+Tests for work stealing between key-range scan partitions.
+
+Tests focus on:
+- Splitting off the tail of a straggling partition at a lookahead key
+- Leaving small remaining ranges alone
+- Throughput-sized cuts and publish failures
+- Publishing the split (new partition row, shrunk spec, queued job)
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from openlabels.adapters.base import PartitionSpec
+from openlabels.jobs.coordinator import ScanCoordinator
+from openlabels.jobs.partition_split import MIN_KEEP_FILES, PartitionSplitter
+
+
+class _KeyAdapter:
+    """Object-store stand-in listing sorted keys within a partition range."""
+
+    def __init__(self, count, inclusive_start=False):
+        self.keys = [f"k{i:05d}" for i in range(count)]
+        self.inclusive_start = inclusive_start
+
+    async def list_files(self, target, partition=None):
+        for key in self.keys:
+            start = partition.start_after if partition else None
+            if start and (key < start if self.inclusive_start else key <= start):
+                continue
+            if partition and partition.end_before and key >= partition.end_before:
+                return
+            yield SimpleNamespace(item_id=key, path=f"s3://bucket/{key}")
+
+
+async def _drain(splitter, adapter, spec):
+    return [f.item_id async for f in splitter.iter_files(adapter.list_files("", partition=spec))]
+
+
+class TestPartitionSplitter:
+
+    async def test_splits_tail_of_long_running_partition(self):
+        adapter = _KeyAdapter(1000)
+        spec = PartitionSpec()
+        publish = AsyncMock()
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish,
+            split_after_seconds=0, target_seconds=0, check_interval_seconds=3600,
+            min_tail_files=100,
+        )
+
+        listed = await _drain(splitter, adapter, spec)
+
+        # First check happens after k00000; the worker keeps MIN_KEEP_FILES more
+        cut = adapter.keys[1 + MIN_KEEP_FILES]
+        assert listed == adapter.keys[:1 + MIN_KEEP_FILES]
+        remaining, tail = publish.await_args.args
+        assert remaining.end_before == cut
+        assert tail.start_after == adapter.keys[MIN_KEEP_FILES]
+        assert tail.end_before is None
+        assert spec.end_before == cut
+        assert splitter.splits == 1
+
+    @pytest.mark.parametrize("inclusive_start", [False, True])
+    async def test_every_key_listed_once_across_split(self, inclusive_start):
+        adapter = _KeyAdapter(1000, inclusive_start=inclusive_start)
+        spec = PartitionSpec()
+        publish = AsyncMock()
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish,
+            split_after_seconds=0, target_seconds=0, check_interval_seconds=3600,
+            min_tail_files=100, inclusive_start=inclusive_start,
+        )
+
+        listed = await _drain(splitter, adapter, spec)
+        _, tail = publish.await_args.args
+        listed += [f.item_id async for f in adapter.list_files("", partition=tail)]
+
+        assert listed == adapter.keys
+
+    async def test_tail_keeps_original_upper_bound_and_prefix(self):
+        adapter = _KeyAdapter(1000)
+        spec = PartitionSpec(end_before="k00900", prefix="data/")
+        publish = AsyncMock()
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish,
+            split_after_seconds=0, target_seconds=0, check_interval_seconds=3600,
+            min_tail_files=100,
+        )
+        await _drain(splitter, adapter, spec)
+
+        _, tail = publish.await_args.args
+        assert tail.end_before == "k00900"
+        assert tail.prefix == "data/"
+
+    async def test_small_remaining_range_not_split(self):
+        adapter = _KeyAdapter(100)
+        spec = PartitionSpec()
+        publish = AsyncMock()
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish,
+            split_after_seconds=0, check_interval_seconds=0, min_tail_files=100,
+        )
+
+        listed = await _drain(splitter, adapter, spec)
+
+        assert listed == adapter.keys
+        publish.assert_not_awaited()
+        assert splitter.splits == 0
+
+    async def test_no_split_before_threshold(self):
+        adapter = _KeyAdapter(1000)
+        spec = PartitionSpec()
+        publish = AsyncMock()
+        splitter = PartitionSplitter(adapter, "", spec, publish, split_after_seconds=3600)
+
+        assert len(await _drain(splitter, adapter, spec)) == 1000
+        publish.assert_not_awaited()
+
+    async def test_publish_failure_keeps_full_range(self):
+        adapter = _KeyAdapter(1000)
+        spec = PartitionSpec()
+        publish = AsyncMock(side_effect=ConnectionError("db down"))
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish,
+            split_after_seconds=0, target_seconds=0, check_interval_seconds=3600,
+            min_tail_files=100,
+        )
+
+        assert len(await _drain(splitter, adapter, spec)) == 1000
+        assert spec.end_before is None
+
+    async def test_throughput_sizes_the_cut(self):
+        adapter = _KeyAdapter(5000)
+        spec = PartitionSpec()
+        publish = AsyncMock()
+        splitter = PartitionSplitter(
+            adapter, "", spec, publish, target_seconds=10, min_tail_files=100,
+        )
+        splitter.files_listed = 200
+        with patch.object(PartitionSplitter, "files_per_second", 40.0):
+            tail = await splitter.maybe_split("k00199")
+
+        # 40 files/s * 10 s = 400 files kept after k00199
+        assert tail.start_after == "k00599"
+        assert spec.end_before == "k00600"
+
+
+class TestSplitPartition:
+
+    async def test_publishes_new_partition_and_shrinks_running_one(self):
+        session = AsyncMock()
+        session.add = MagicMock()
+        total = MagicMock()
+        total.scalar_one.return_value = 5
+        session.execute = AsyncMock(side_effect=[total, MagicMock()])
+        coordinator = ScanCoordinator(session, uuid4())
+        job_id, partition_id = uuid4(), uuid4()
+
+        with patch("openlabels.jobs.queue.JobQueue") as queue_cls:
+            queue_cls.return_value.enqueue = AsyncMock()
+            partition = await coordinator.split_partition(
+                job_id, partition_id,
+                PartitionSpec(end_before="m"),
+                PartitionSpec(start_after="l"),
+            )
+
+        assert partition.partition_index == 4
+        assert partition.total_partitions == 5
+        assert partition.partition_spec == {"start_after": "l"}
+        session.add.assert_called_once_with(partition)
+        payload = queue_cls.return_value.enqueue.await_args.kwargs["payload"]
+        assert payload == {"partition_id": str(partition.id), "job_id": str(job_id)}
+        session.commit.assert_awaited_once()
+
+
+class TestBuildSplitter:
+
+    def _settings(self, enabled=True):
+        return SimpleNamespace(jobs=SimpleNamespace(
+            partition_split_enabled=enabled,
+            partition_split_after_seconds=300.0,
+            partition_split_target_seconds=120.0,
+            partition_split_check_seconds=60.0,
+            partition_split_min_files=500,
+        ))
+
+    def _build(self, settings, adapter_type="s3", spec=None):
+        from openlabels.jobs.tasks.scan_partition import _build_splitter
+
+        target = SimpleNamespace(adapter=adapter_type)
+        return _build_splitter(
+            settings, MagicMock(), target, "", spec or PartitionSpec(),
+            MagicMock(), MagicMock(),
+        )
+
+    def test_enabled_for_object_store_key_ranges(self):
+        assert isinstance(self._build(self._settings()), PartitionSplitter)
+
+    def test_gcs_tails_start_at_the_cut(self):
+        assert self._build(self._settings(), "gcs").inclusive_start is True
+        assert self._build(self._settings(), "s3").inclusive_start is False
+
+    @pytest.mark.parametrize("adapter_type", ["filesystem", "sharepoint", "onedrive"])
+    def test_not_used_for_path_partitions(self, adapter_type):
+        assert self._build(self._settings(), adapter_type) is None
+
+    def test_disabled(self):
+        assert self._build(self._settings(enabled=False)) is None
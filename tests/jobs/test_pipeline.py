@@ -393,3 +393,30 @@ class TestFilePipeline:
 
         # Final commit should still be called
         assert commit_fn.called
+
+    @pytest.mark.asyncio
+    async def test_records_stage_profile_when_active(self):
+        """With a profiler active, per-file, wait and commit stages are recorded."""
+        from openlabels.core.profiling import StageProfiler, profile_stage, use_profiler
+
+        async def process_fn(file_info, ctx):
+            with profile_stage("read"):
+                await asyncio.sleep(0)
+            ctx.stats.record_result("MINIMAL", 0)
+
+        files = [FakeFileInfo(path=f"/f{i}", name=f"f{i}", size=100) for i in range(3)]
+        pipeline = FilePipeline(
+            config=PipelineConfig(max_concurrent_files=2, memory_budget_mb=1, commit_interval=2),
+            process_fn=process_fn,
+            commit_fn=AsyncMock(),
+        )
+        profiler = StageProfiler(trace_sample_rate=1.0)
+        with use_profiler(profiler):
+            await pipeline.run(_make_file_iterator(files))
+
+        histograms = profiler.histograms()
+        assert histograms["file"].count == 3
+        assert histograms["file/read"].count == 3
+        assert histograms["wait"].count == 3
+        assert histograms["commit"].count == 2  # One periodic + the final commit
+        assert {t.file_path for t in profiler.traces} == {"/f0", "/f1", "/f2"}
@@ -22,8 +22,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from openlabels.jobs.queue import (
     calculate_retry_delay,
+    dequeue_jobs,
+    dequeue_next_job,
+    release_jobs,
     JobQueue,
     BASE_RETRY_DELAY_SECONDS,
+    JOB_NOTIFY_CHANNEL,
     MAX_RETRY_DELAY_SECONDS,
 )
 
@@ -243,6 +247,96 @@ class TestJobQueueDequeue:
         queue.session.flush.assert_called()
 
 
+class TestJobNotifications:
+    """Tests for NOTIFY on enqueue."""
+
+    @pytest.fixture
+    def queue(self):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+        return JobQueue(mock_session, uuid4())
+
+    @staticmethod
+    def _notify_calls(session):
+        return [
+            call for call in session.execute.call_args_list
+            if "pg_notify" in str(call.args[0])
+        ]
+
+    async def test_enqueue_notifies_workers(self, queue):
+        await queue.enqueue("scan", {"path": "/data"})
+
+        calls = self._notify_calls(queue.session)
+        assert len(calls) == 1
+        assert calls[0].args[1] == {
+            "channel": JOB_NOTIFY_CHANNEL,
+            "payload": str(queue.tenant_id),
+        }
+
+    async def test_delayed_enqueue_does_not_notify(self, queue):
+        future_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        await queue.enqueue("scan", {}, scheduled_for=future_time)
+
+        assert self._notify_calls(queue.session) == []
+
+
+class TestDequeueJobs:
+    """Tests for claiming several jobs per round trip."""
+
+    @staticmethod
+    def _session_with(jobs):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = jobs
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    async def test_claims_all_returned_jobs(self):
+        jobs = [MagicMock(status="pending") for _ in range(3)]
+        session = self._session_with(jobs)
+
+        claimed = await dequeue_jobs(session, "worker-1", limit=3)
+
+        assert claimed == jobs
+        assert all(job.status == "running" for job in jobs)
+        assert all(job.worker_id == "worker-1" for job in jobs)
+        session.execute.assert_awaited_once()
+        session.flush.assert_awaited_once()
+
+    async def test_limit_applied_to_query(self):
+        session = self._session_with([])
+
+        await dequeue_jobs(session, "worker-1", limit=5)
+
+        query = session.execute.call_args.args[0]
+        assert query._limit_clause.value == 5
+        session.flush.assert_not_awaited()
+
+    async def test_zero_limit_skips_query(self):
+        session = self._session_with([])
+        assert await dequeue_jobs(session, "worker-1", limit=0) == []
+        session.execute.assert_not_awaited()
+
+    async def test_dequeue_next_job_returns_single(self):
+        job = MagicMock(status="pending")
+        session = self._session_with([job])
+        assert await dequeue_next_job(session, "worker-1") is job
+
+    async def test_release_jobs_notifies_when_released(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        released = await release_jobs(session, [uuid4(), uuid4()], "worker-1")
+
+        assert released == 2
+        assert session.execute.await_count == 2  # UPDATE + pg_notify
+
+    async def test_release_no_jobs_is_noop(self):
+        session = AsyncMock()
+        assert await release_jobs(session, [], "worker-1") == 0
+        session.execute.assert_not_awaited()
+
+
 class TestJobQueueComplete:
     """Tests for marking jobs complete."""
 
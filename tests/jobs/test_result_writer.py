@@ -0,0 +1,167 @@
+"""
+Tests for batched scan result persistence.
+
+Tests focus on:
+- Row construction from scan output
+- Buffering and automatic flush at batch size
+- Inventory rows written alongside results
+- Batched refresh of files the delta check skipped
+- Flushing before pipeline commits
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from openlabels.adapters.base import ExposureLevel, FileInfo
+from openlabels.jobs.result_writer import ScanResultWriter, scan_result_row
+
+
+def _file_info(path="/share/report.txt"):
+    return FileInfo(
+        path=path,
+        name=path.rsplit("/", 1)[-1],
+        size=100,
+        modified=datetime.now(timezone.utc),
+        adapter="filesystem",
+        exposure=ExposureLevel.INTERNAL,
+        item_id="item-1",
+    )
+
+
+def _result():
+    return {
+        "risk_score": 50,
+        "risk_tier": "MEDIUM",
+        "entity_counts": {"SSN": 2},
+        "total_entities": 2,
+        "findings": {"entities": []},
+    }
+
+
+def _writer(batch_size=10):
+    session = MagicMock()
+    session.execute = AsyncMock()
+    inventory = MagicMock()
+    inventory.file_inventory_row = MagicMock(side_effect=lambda fi, row, h, job, scanned_at=None: {
+        "file_path": fi.path, "content_hash": h,
+    })
+    inventory.bulk_upsert_file_inventory = AsyncMock()
+    inventory.file_seen_row = AsyncMock(side_effect=lambda fi, job: {"file_path": fi.path})
+    inventory.bulk_mark_files_seen = AsyncMock()
+    return ScanResultWriter(session, inventory, uuid4(), uuid4(), batch_size=batch_size)
+
+
+class TestScanResultRow:
+
+    def test_maps_file_and_result_columns(self):
+        tenant_id, job_id = uuid4(), uuid4()
+        row = scan_result_row(tenant_id, job_id, _file_info(), _result(), "abc")
+
+        assert row["tenant_id"] == tenant_id
+        assert row["job_id"] == job_id
+        assert row["file_name"] == "report.txt"
+        assert row["content_hash"] == "abc"
+        assert row["exposure_level"] == "INTERNAL"
+        assert row["risk_tier"] == "MEDIUM"
+        assert row["policy_violations"] is None
+        assert row["id"] is not None
+
+    def test_uses_given_id(self):
+        result_id = uuid4()
+        row = scan_result_row(uuid4(), uuid4(), _file_info(), _result(), "abc", result_id=result_id)
+        assert row["id"] == result_id
+
+
+class TestScanResultWriter:
+
+    async def test_add_buffers_without_writing(self):
+        writer = _writer()
+        result_id = await writer.add(_file_info(), _result(), "h")
+
+        assert writer.pending == 1
+        assert result_id is not None
+        writer.session.execute.assert_not_called()
+
+    async def test_flush_writes_results_then_inventory(self):
+        writer = _writer()
+        await writer.add(_file_info("/a.txt"), _result(), "h1")
+        await writer.add(_file_info("/b.txt"), _result(), "h2")
+
+        assert await writer.flush() == 2
+
+        rows = writer.session.execute.await_args.args[1]
+        assert [r["file_path"] for r in rows] == ["/a.txt", "/b.txt"]
+        writer.inventory.bulk_upsert_file_inventory.assert_awaited_once_with([
+            {"file_path": "/a.txt", "content_hash": "h1"},
+            {"file_path": "/b.txt", "content_hash": "h2"},
+        ])
+        assert writer.pending == 0
+        assert writer.stats.to_dict() == {
+            "results_written": 2, "inventory_rows_written": 2, "seen_rows_written": 0,
+            "flushes": 1,
+        }
+
+    async def test_auto_flush_at_batch_size(self):
+        writer = _writer(batch_size=2)
+        await writer.add(_file_info("/a.txt"), _result(), "h")
+        writer.session.execute.assert_not_called()
+        await writer.add(_file_info("/b.txt"), _result(), "h")
+
+        writer.session.execute.assert_awaited_once()
+        assert writer.pending == 0
+
+    async def test_skip_inventory_row(self):
+        writer = _writer()
+        await writer.add(_file_info(), _result(), "h", update_inventory=False)
+        await writer.flush()
+
+        writer.session.execute.assert_awaited_once()
+        writer.inventory.bulk_upsert_file_inventory.assert_not_called()
+
+    async def test_mark_seen_buffers_until_flush(self):
+        writer = _writer()
+        await writer.mark_seen(_file_info("/a.txt"))
+        await writer.mark_seen(_file_info("/b.txt"))
+        writer.inventory.bulk_mark_files_seen.assert_not_called()
+
+        assert await writer.flush() == 0
+
+        writer.inventory.bulk_mark_files_seen.assert_awaited_once_with([
+            {"file_path": "/a.txt"}, {"file_path": "/b.txt"},
+        ])
+        writer.session.execute.assert_not_called()
+        assert writer.stats.seen_rows_written == 2
+        assert writer.stats.flushes == 1
+
+    async def test_mark_seen_auto_flush_at_batch_size(self):
+        writer = _writer(batch_size=2)
+        await writer.mark_seen(_file_info("/a.txt"))
+        await writer.mark_seen(_file_info("/b.txt"))
+        writer.inventory.bulk_mark_files_seen.assert_awaited_once()
+
+    async def test_mark_seen_ignores_files_missing_from_inventory(self):
+        writer = _writer()
+        writer.inventory.file_seen_row = AsyncMock(return_value=None)
+        await writer.mark_seen(_file_info())
+        assert await writer.flush() == 0
+        assert writer.stats.flushes == 0
+
+    async def test_empty_flush_is_noop(self):
+        writer = _writer()
+        assert await writer.flush() == 0
+        writer.session.execute.assert_not_called()
+        assert writer.stats.flushes == 0
+
+    async def test_commit_with_flushes_first(self):
+        writer = _writer()
+        calls = []
+        writer.session.execute = AsyncMock(side_effect=lambda *a: calls.append("insert"))
+
+        async def commit():
+            calls.append("commit")
+
+        await writer.add(_file_info(), _result(), "h")
+        await writer.commit_with(commit)()
+
+        assert calls == ["insert", "commit"]
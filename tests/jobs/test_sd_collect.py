@@ -8,10 +8,14 @@ from pathlib import Path
 import pytest
 
 from openlabels.jobs.sd_collect import (
+    WORLD_PRINCIPAL,
     SDInfo,
     _collect_batch_sync,
     collect_posix_sd,
     collect_sd,
+    index_principal_grants,
+    normalize_principal,
+    principal_grants,
 )
 
 
@@ -251,3 +255,119 @@ class TestCollectSD:
     def test_returns_none_for_nonexistent(self):
         sd = collect_sd("/nonexistent/path/12345")
         assert sd is None
+
+
+class TestPrincipalGrants:
+
+    def test_windows_allow_aces_mapped_to_permissions(self):
+        grants = principal_grants("S-1-5-21-1-500", None, {"aces": [
+            {"sid": "s-1-5-21-1-1013", "mask": 0x1200A9, "type": 0},
+            {"sid": "S-1-5-21-1-2001", "mask": 0x1F01FF, "type": 0},
+        ]})
+        assert grants == {
+            "S-1-5-21-1-1013": ["execute", "read"],
+            "S-1-5-21-1-2001": ["full_control"],
+        }
+
+    def test_windows_deny_aces_skipped(self):
+        grants = principal_grants(None, None, {"aces": [
+            {"sid": "S-1-5-21-1-1013", "mask": 0x1F01FF, "type": 1},
+        ]})
+        assert grants == {}
+
+    def test_windows_aces_without_type_treated_as_allow(self):
+        grants = principal_grants(None, None, {"aces": [
+            {"sid": "S-1-1-0", "mask": 0x10000000},
+        ]})
+        assert grants == {"S-1-1-0": ["full_control"]}
+
+    def test_repeated_sid_permissions_merged(self):
+        grants = principal_grants(None, None, {"aces": [
+            {"sid": "S-1-5-21-1-1013", "mask": 0x1, "type": 0},
+            {"sid": "S-1-5-21-1-1013", "mask": 0x2, "type": 0},
+        ]})
+        assert grants == {"S-1-5-21-1-1013": ["read", "write"]}
+
+    def test_posix_mode_bits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chmod(tmpdir, 0o754)
+            sd = collect_posix_sd(tmpdir)
+
+        grants = principal_grants(sd.owner_sid, sd.group_sid, sd.permissions_json)
+        assert grants[sd.owner_sid] == ["execute", "read", "write"]
+        assert grants[WORLD_PRINCIPAL] == ["read"]
+        if sd.group_sid != sd.owner_sid:
+            assert grants[sd.group_sid] == ["execute", "read"]
+
+    def test_posix_private_dir_has_no_world_grant(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chmod(tmpdir, 0o700)
+            sd = collect_posix_sd(tmpdir)
+
+        grants = principal_grants(sd.owner_sid, sd.group_sid, sd.permissions_json)
+        assert WORLD_PRINCIPAL not in grants
+
+    def test_principal_keyed_json(self):
+        grants = principal_grants(None, None, {
+            "alice": ["write", "read"],
+            "bob": {"read": True},
+            "note": "ignored",
+        })
+        assert grants == {"alice": ["read", "write"], "bob": ["read"]}
+
+    def test_empty_permissions(self):
+        assert principal_grants("root", "root", None) == {}
+
+    def test_normalize_principal(self):
+        assert normalize_principal(" s-1-5-21-1 ") == "S-1-5-21-1"
+        assert normalize_principal("Alice") == "Alice"
+
+
+class TestIndexPrincipalGrants:
+
+    async def test_backfills_descriptor_stored_by_another_tenant(self, test_db):
+        """A shared descriptor is indexed for every tenant whose directories use it."""
+        from sqlalchemy import select
+
+        from openlabels.server.models import (
+            DirectoryTree,
+            PrincipalGrant,
+            ScanTarget,
+            SecurityDescriptor,
+            Tenant,
+        )
+
+        owner, sharer = Tenant(name="sd-owner"), Tenant(name="sd-sharer")
+        test_db.add_all([owner, sharer])
+        await test_db.flush()
+
+        sd_hash = bytes(32)
+        permissions = {"alice": ["read"]}
+        test_db.add(SecurityDescriptor(
+            sd_hash=sd_hash, tenant_id=owner.id,
+            permissions_json=permissions, principals_indexed=True,
+        ))
+        await test_db.flush()
+        test_db.add(PrincipalGrant(
+            tenant_id=owner.id, principal="alice", sd_hash=sd_hash, permissions=["read"],
+        ))
+        for tenant in (owner, sharer):
+            target = ScanTarget(
+                tenant_id=tenant.id, name="share", adapter="filesystem", config={},
+            )
+            test_db.add(target)
+            await test_db.flush()
+            test_db.add(DirectoryTree(
+                tenant_id=tenant.id, target_id=target.id,
+                dir_path="/share", dir_name="share", sd_hash=sd_hash,
+            ))
+        await test_db.flush()
+
+        assert await index_principal_grants(test_db, sharer.id) == 1
+        assert await index_principal_grants(test_db, sharer.id) == 0
+        assert await index_principal_grants(test_db, owner.id) == 0
+
+        tenants = (await test_db.execute(
+            select(PrincipalGrant.tenant_id).where(PrincipalGrant.sd_hash == sd_hash)
+        )).scalars().all()
+        assert sorted(tenants, key=str) == sorted([owner.id, sharer.id], key=str)
@@ -9,6 +9,7 @@ Tests focus on:
 - Graceful shutdown handling
 """
 
+import asyncio
 import sys
 import os
 import json
@@ -474,6 +475,193 @@ class TestWorkerLoop:
 
 
 
+class TestWorkerDispatch:
+    """Tests for the dispatcher that claims jobs for idle slots."""
+
+    @staticmethod
+    def _settings(batch_size=8):
+        settings = MagicMock()
+        settings.jobs.dispatch_batch_size = batch_size
+        settings.jobs.dispatch_poll_min_seconds = 1.0
+        settings.jobs.dispatch_poll_max_seconds = 30.0
+        settings.jobs.dispatch_listen_enabled = False
+        settings.database.pgbouncer_mode = False
+        return settings
+
+    @staticmethod
+    def _session_ctx():
+        ctx = MagicMock()
+        ctx.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+        return ctx
+
+    async def test_claims_up_to_idle_slots_in_one_round_trip(self):
+        worker = Worker(concurrency=4)
+        worker.running = True
+        worker._idle_slots = 3
+        jobs = [MagicMock(id=uuid4()) for _ in range(3)]
+
+        async def claim(session, worker_id, limit):
+            worker.running = False
+            return jobs[:limit]
+
+        with patch('openlabels.jobs.worker.get_settings', return_value=self._settings()), \
+                patch('openlabels.jobs.worker.get_session_context', self._session_ctx()), \
+                patch('openlabels.jobs.worker.dequeue_jobs', side_effect=claim) as mock_claim:
+            await worker._dispatch_loop()
+
+        assert mock_claim.call_count == 1
+        assert mock_claim.call_args.kwargs["limit"] == 3
+        assert [worker._ready.get_nowait() for _ in range(3)] == [j.id for j in jobs]
+
+    async def test_batch_size_caps_claim(self):
+        worker = Worker(concurrency=16)
+        worker.running = True
+        worker._idle_slots = 16
+
+        async def claim(session, worker_id, limit):
+            worker.running = False
+            return []
+
+        with patch('openlabels.jobs.worker.get_settings', return_value=self._settings(batch_size=4)), \
+                patch('openlabels.jobs.worker.get_session_context', self._session_ctx()), \
+                patch('openlabels.jobs.worker.dequeue_jobs', side_effect=claim) as mock_claim, \
+                patch('openlabels.jobs.worker.asyncio.sleep', new_callable=AsyncMock):
+            await worker._dispatch_loop()
+
+        assert mock_claim.call_args.kwargs["limit"] == 4
+
+    async def test_empty_polls_back_off(self):
+        worker = Worker(concurrency=1)
+        worker.running = True
+        worker._idle_slots = 1
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 4:
+                worker.running = False
+
+        with patch('openlabels.jobs.worker.get_settings', return_value=self._settings()), \
+                patch('openlabels.jobs.worker.get_session_context', self._session_ctx()), \
+                patch('openlabels.jobs.worker.dequeue_jobs', AsyncMock(return_value=[])), \
+                patch('openlabels.jobs.worker.asyncio.sleep', side_effect=fake_sleep):
+            await worker._dispatch_loop()
+
+        assert delays == [1.0, 2.0, 4.0, 8.0]
+
+    async def test_worker_loop_executes_dispatched_job(self):
+        worker = Worker(concurrency=1)
+        worker.running = True
+        worker._worker_tasks = [MagicMock(done=lambda: False)]
+
+        job = MagicMock(id=uuid4(), tenant_id=uuid4(), status="running")
+        session = AsyncMock()
+        session.get = AsyncMock(return_value=job)
+        ctx = MagicMock()
+        ctx.return_value.__aenter__ = AsyncMock(return_value=session)
+        ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+        worker._ready.put_nowait(job.id)
+
+        async def execute(session, queue, executed_job):
+            worker.running = False
+
+        with patch('openlabels.jobs.worker.get_session_context', ctx), \
+                patch.object(worker, '_execute_job', side_effect=execute) as mock_execute:
+            await worker._worker_loop(0)
+
+        mock_execute.assert_called_once()
+        assert job.worker_id == f"{worker.worker_id}:0"
+        assert worker._idle_slots == 0
+
+    async def test_worker_loop_skips_cancelled_job(self):
+        worker = Worker(concurrency=1)
+        worker.running = True
+        worker._worker_tasks = [MagicMock(done=lambda: False)]
+
+        job = MagicMock(id=uuid4(), status="cancelled")
+        session = AsyncMock()
+
+        async def get(model, job_id):
+            worker.running = False
+            return job
+
+        session.get = AsyncMock(side_effect=get)
+        ctx = MagicMock()
+        ctx.return_value.__aenter__ = AsyncMock(return_value=session)
+        ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+        worker._ready.put_nowait(job.id)
+
+        with patch('openlabels.jobs.worker.get_session_context', ctx), \
+                patch.object(worker, '_execute_job', new_callable=AsyncMock) as mock_execute:
+            await worker._worker_loop(0)
+
+        mock_execute.assert_not_called()
+
+    async def test_worker_loop_keeps_pending_get_across_timeouts(self):
+        worker = Worker(concurrency=1)
+        worker.running = True
+        worker._worker_tasks = [MagicMock(done=lambda: False)]
+        worker._concurrency_check_interval = 0.01
+
+        job = MagicMock(id=uuid4(), tenant_id=uuid4(), status="running")
+        session = AsyncMock()
+        session.get = AsyncMock(return_value=job)
+        ctx = MagicMock()
+        ctx.return_value.__aenter__ = AsyncMock(return_value=session)
+        ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        async def execute(session, queue, executed_job):
+            worker.running = False
+
+        async def dispatch_later():
+            await asyncio.sleep(0.05)  # Several timeouts first
+            worker._ready.put_nowait(job.id)
+
+        with patch('openlabels.jobs.worker.get_session_context', ctx), \
+                patch.object(worker, '_execute_job', side_effect=execute) as mock_execute:
+            await asyncio.gather(worker._worker_loop(0), dispatch_later())
+
+        mock_execute.assert_called_once()
+        assert worker._ready.empty()
+
+    async def test_worker_loop_exit_keeps_dispatched_job(self):
+        worker = Worker(concurrency=1)
+        worker.running = True
+        worker._worker_tasks = [MagicMock(done=lambda: False)]
+        job_id = uuid4()
+
+        async def timed_out(fs, timeout=None):
+            await asyncio.sleep(0.01)
+            return set(), set(fs)
+
+        async def dispatch_and_stop():
+            worker._ready.put_nowait(job_id)
+            worker.running = False
+
+        # The job arrives as the wait times out and the worker stops
+        with patch('openlabels.jobs.worker.asyncio.wait', side_effect=timed_out):
+            await asyncio.gather(worker._worker_loop(0), dispatch_and_stop())
+        await asyncio.sleep(0)
+
+        # Still queued, so _release_ready_jobs hands it back
+        assert worker._ready.get_nowait() == job_id
+
+    async def test_unstarted_jobs_released_on_shutdown(self):
+        worker = Worker(concurrency=2)
+        job_ids = [uuid4(), uuid4()]
+        for job_id in job_ids:
+            worker._ready.put_nowait(job_id)
+
+        with patch('openlabels.jobs.worker.get_session_context', self._session_ctx()), \
+                patch('openlabels.jobs.worker.release_jobs', AsyncMock(return_value=2)) as mock_release:
+            await worker._release_ready_jobs()
+
+        assert mock_release.call_args.args[1] == job_ids
+        assert mock_release.call_args.args[2] == worker.worker_id
+        assert worker._ready.empty()
+
+
 class TestWorkerEdgeCases:
     """Edge case tests for worker robustness."""
 
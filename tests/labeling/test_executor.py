@@ -0,0 +1,198 @@
+"""
+Tests for batched label application.
+
+Tests cover LabelingEngine.apply_graph_labels ($batch grouping and
+single-request fallback) and LabelingExecutor routing and concurrency.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openlabels.adapters.base import FileInfo
+from openlabels.core.circuit_breaker import CircuitOpenError
+from openlabels.labeling.engine import GRAPH_BATCH_LIMIT, LabelingEngine, LabelResult
+from openlabels.labeling.executor import LabelingExecutor, LabelTask
+
+
+def _file(adapter, n=0, **kwargs):
+    return FileInfo(
+        path=f"/data/file{n}.docx",
+        name=f"file{n}.docx",
+        size=100,
+        modified=datetime.now(),
+        adapter=adapter,
+        **kwargs,
+    )
+
+
+def _batch_response(*responses):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"responses": list(responses)}
+    return response
+
+
+@pytest.fixture
+def engine():
+    return LabelingEngine(tenant_id="t", client_id="c", client_secret="s")
+
+
+class TestApplyGraphLabels:
+    async def test_one_batch_call(self, engine):
+        items = [
+            (_file("sharepoint", 0, site_id="site", item_id="a"), "label-1", "Confidential"),
+            (_file("onedrive", 1, user_id="user", item_id="b"), "label-2", None),
+        ]
+        response = _batch_response(
+            {"id": "1", "status": 200},
+            {"id": "0", "status": 204},
+        )
+
+        with patch.object(engine, "_graph_request", return_value=response) as mock_request:
+            results = await engine.apply_graph_labels(items)
+
+        mock_request.assert_called_once()
+        method, path, body = mock_request.call_args.args
+        assert (method, path) == ("POST", "/$batch")
+        assert [r["url"] for r in body["requests"]] == [
+            "/sites/site/drive/items/a",
+            "/users/user/drive/items/b",
+        ]
+        assert body["requests"][0]["body"]["sensitivityLabel"]["labelId"] == "label-1"
+        assert [r.success for r in results] == [True, True]
+        assert results[0].label_name == "Confidential"
+
+    async def test_client_errors_reported_throttled_retried(self, engine):
+        items = [
+            (_file("sharepoint", i, site_id="site", item_id=str(i)), "label-1", None)
+            for i in range(3)
+        ]
+        response = _batch_response(
+            {"id": "0", "status": 404, "body": {"error": {"message": "itemNotFound"}}},
+            {"id": "1", "status": 429},
+            {"id": "2", "status": 200},
+        )
+        retried = LabelResult(success=True, label_id="label-1", method="graph_api")
+
+        with patch.object(engine, "_graph_request", return_value=response), \
+                patch.object(engine, "_apply_graph_label", return_value=retried) as mock_single:
+            results = await engine.apply_graph_labels(items)
+
+        assert results[0].success is False
+        assert "itemNotFound" in results[0].error
+        assert results[1] is retried
+        assert results[2].success is True
+        mock_single.assert_called_once_with(*items[1])
+
+    async def test_unresolved_items_use_single_path(self, engine):
+        items = [(_file("sharepoint", 0), "label-1", None)]
+        single = LabelResult(success=False, error="Could not resolve SharePoint file ID")
+
+        with patch.object(engine, "_graph_request") as mock_request, \
+                patch.object(engine, "_apply_graph_label", return_value=single):
+            results = await engine.apply_graph_labels(items)
+
+        mock_request.assert_not_called()
+        assert results == [single]
+
+    async def test_rejects_oversized_batch(self, engine):
+        items = [(_file("sharepoint", i), "label-1", None) for i in range(GRAPH_BATCH_LIMIT + 1)]
+        with pytest.raises(ValueError):
+            await engine.apply_graph_labels(items)
+
+
+class TestLabelingExecutor:
+    async def test_groups_graph_items_into_batches(self):
+        engine = MagicMock()
+        engine.apply_graph_labels = AsyncMock(
+            side_effect=lambda items: [LabelResult(success=True, label_id=i[1]) for i in items]
+        )
+        engine.apply_label = AsyncMock(return_value=LabelResult(success=True, method="sidecar"))
+        tasks = [
+            LabelTask(_file("sharepoint", i, site_id="s", item_id=str(i)), f"label-{i}")
+            for i in range(GRAPH_BATCH_LIMIT + 5)
+        ]
+        tasks.insert(3, LabelTask(_file("filesystem", 99), "label-local"))
+
+        results = await LabelingExecutor(engine).run(tasks)
+
+        assert [len(c.args[0]) for c in engine.apply_graph_labels.call_args_list] == [
+            GRAPH_BATCH_LIMIT, 5,
+        ]
+        engine.apply_label.assert_called_once()
+        assert results[3].method == "sidecar"
+        assert results[0].label_id == "label-0"
+        assert results[-1].label_id == f"label-{GRAPH_BATCH_LIMIT + 4}"
+
+    async def test_local_concurrency_is_bounded(self):
+        active = peak = 0
+
+        async def apply_label(file_info, label_id, label_name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return LabelResult(success=True, label_id=label_id)
+
+        engine = MagicMock()
+        engine.apply_label = apply_label
+        tasks = [LabelTask(_file("filesystem", i), "label-1") for i in range(12)]
+
+        results = await LabelingExecutor(engine, local_concurrency=3).run(tasks)
+
+        assert peak == 3
+        assert all(r.success for r in results)
+
+    async def test_errors_become_failed_results(self):
+        engine = MagicMock()
+        engine.apply_label = AsyncMock(side_effect=[
+            PermissionError("denied"),
+            LabelResult(success=True, label_id="label-1"),
+        ])
+        tasks = [LabelTask(_file("filesystem", i), "label-1") for i in range(2)]
+
+        results = await LabelingExecutor(engine, local_concurrency=1).run(tasks)
+
+        assert results[0].success is False
+        assert results[0].error == "denied"
+        assert results[1].success is True
+
+    async def test_unexpected_errors_fail_only_their_tasks(self):
+        engine = MagicMock()
+        engine.apply_graph_labels = AsyncMock(side_effect=CircuitOpenError("graph", 30.0))
+        engine.apply_label = AsyncMock(side_effect=[
+            ValueError("corrupt"),
+            LabelResult(success=True, label_id="label-local"),
+        ])
+        tasks = [
+            LabelTask(_file("sharepoint", 0, site_id="s", item_id="0"), "label-graph"),
+            LabelTask(_file("filesystem", 1), "label-local"),
+            LabelTask(_file("filesystem", 2), "label-local"),
+        ]
+
+        results = await LabelingExecutor(engine, local_concurrency=1).run(tasks)
+
+        assert len(results) == 3
+        assert results[0].success is False
+        assert "Circuit breaker 'graph' is open" in results[0].error
+        assert results[1].success is False
+        assert results[1].error == "corrupt"
+        assert results[2].success is True
+
+    async def test_missing_results_become_failed_results(self):
+        engine = MagicMock()
+        engine.apply_graph_labels = AsyncMock(return_value=[])
+        engine.apply_label = AsyncMock(return_value=None)
+        tasks = [
+            LabelTask(_file("sharepoint", 0, site_id="s", item_id="0"), "label-graph"),
+            LabelTask(_file("filesystem", 1), "label-local"),
+        ]
+
+        results = await LabelingExecutor(engine).run(tasks)
+
+        assert [r.success for r in results] == [False, False]
+        assert [r.label_id for r in results] == ["label-graph", "label-local"]
+        assert results[0].error == "No labeling result returned"
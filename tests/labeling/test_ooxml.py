@@ -0,0 +1,222 @@
+"""
+Tests for Office Open XML part replacement.
+
+Tests cover verbatim copying of unchanged members, part replacement and
+addition, and the LocalLabelWriter apply/remove round trip.
+"""
+
+import io
+import os
+import stat
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from openlabels.labeling.engine import LocalLabelWriter
+from openlabels.labeling.ooxml import read_part, replace_parts
+
+CONTENT_TYPES = (
+    '<?xml version="1.0"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"></Types>'
+)
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream; makes zipfile emit data descriptors."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.buffer += b
+        return len(b)
+
+
+def _make_package(path, *, custom=None, streamed=False):
+    target = _Unseekable() if streamed else path
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES)
+        zf.writestr("word/document.xml", "<document>" + "text " * 2000 + "</document>")
+        zf.writestr("word/media/image1.png", os.urandom(4096), zipfile.ZIP_STORED)
+        if custom is not None:
+            zf.writestr("docProps/custom.xml", custom)
+    if streamed:
+        path.write_bytes(bytes(target.buffer))
+
+
+def _raw_members(path):
+    """Compressed bytes of every member, keyed by name."""
+    with open(path, "rb") as f, zipfile.ZipFile(f) as zf:
+        raw = {}
+        for info in zf.infolist():
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = int.from_bytes(f.read(2), "little"), int.from_bytes(f.read(2), "little")
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            raw[info.filename] = f.read(info.compress_size)
+        return raw
+
+
+class TestReplaceParts:
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_unchanged_members_copied_verbatim(self, tmp_path, streamed):
+        path = tmp_path / "doc.docx"
+        _make_package(path, custom="<Properties/>", streamed=streamed)
+        before = _raw_members(path)
+
+        replace_parts(path, {"docProps/custom.xml": b"<Properties>new</Properties>"})
+
+        after = _raw_members(path)
+        for name in ("[Content_Types].xml", "word/document.xml", "word/media/image1.png"):
+            assert after[name] == before[name]
+        with zipfile.ZipFile(path) as zf:
+            assert zf.testzip() is None
+            assert zf.read("docProps/custom.xml") == b"<Properties>new</Properties>"
+            assert zf.getinfo("word/media/image1.png").compress_type == zipfile.ZIP_STORED
+
+    def test_keeps_member_order_and_appends_new_parts(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+
+        replace_parts(path, {"[Content_Types].xml": b"<Types/>", "docProps/custom.xml": b"<P/>"})
+
+        with zipfile.ZipFile(path) as zf:
+            assert zf.namelist() == [
+                "[Content_Types].xml",
+                "word/document.xml",
+                "word/media/image1.png",
+                "docProps/custom.xml",
+            ]
+            assert zf.read("[Content_Types].xml") == b"<Types/>"
+
+    def test_preserves_file_mode(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        path.chmod(0o640)
+
+        replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_swaps_in_new_file_atomically(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        original = path.read_bytes()
+        inode = path.stat().st_ino
+
+        with patch("openlabels.labeling.ooxml.os.replace", side_effect=OSError("crash")):
+            with pytest.raises(OSError):
+                replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+        assert path.read_bytes() == original
+        assert os.listdir(tmp_path) == ["doc.docx"]
+
+        replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+        assert path.stat().st_ino != inode
+        assert os.listdir(tmp_path) == ["doc.docx"]
+
+    @pytest.mark.skipif(not hasattr(os, "chown"), reason="no file ownership")
+    def test_rewrites_in_place_when_owner_cannot_be_kept(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        inode = path.stat().st_ino
+
+        with patch("openlabels.labeling.ooxml._owner", return_value=(-1, -1)), \
+                patch("openlabels.labeling.ooxml.os.chown", side_effect=PermissionError):
+            replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+
+        assert path.stat().st_ino == inode
+        with zipfile.ZipFile(path) as zf:
+            assert zf.read("docProps/custom.xml") == b"<P/>"
+
+    def test_rewrites_in_place_keeping_inode_and_hard_links(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path, custom="<Properties/>")
+        link = tmp_path / "link.docx"
+        os.link(path, link)
+        inode = path.stat().st_ino
+
+        replace_parts(path, {"docProps/custom.xml": b"<Properties>new</Properties>"})
+
+        assert path.stat().st_ino == inode
+        assert path.stat().st_nlink == 2
+        with zipfile.ZipFile(link) as zf:
+            assert zf.testzip() is None
+            assert zf.read("docProps/custom.xml") == b"<Properties>new</Properties>"
+        assert sorted(os.listdir(tmp_path)) == ["doc.docx", "link.docx"]
+
+    @pytest.mark.skipif(not hasattr(os, "setxattr"), reason="no extended attributes")
+    def test_preserves_extended_attributes(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        try:
+            os.setxattr(path, "user.openlabels.test", b"kept")
+        except OSError:
+            pytest.skip("filesystem does not support user xattrs")
+
+        replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+
+        assert os.getxattr(path, "user.openlabels.test") == b"kept"
+
+    def test_shrinking_package_is_truncated(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path, custom="<Properties>" + "x" * 20000 + "</Properties>")
+        size = path.stat().st_size
+
+        replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+
+        assert path.stat().st_size < size
+        with zipfile.ZipFile(path) as zf:
+            assert zf.testzip() is None
+            assert zf.read("docProps/custom.xml") == b"<P/>"
+
+    def test_bad_zip_leaves_file_and_no_temp(self, tmp_path):
+        path = tmp_path / "bad.docx"
+        path.write_text("not a zip")
+
+        with pytest.raises(zipfile.BadZipFile):
+            replace_parts(path, {"docProps/custom.xml": b"<P/>"})
+
+        assert path.read_text() == "not a zip"
+        assert os.listdir(tmp_path) == ["bad.docx"]
+
+    def test_read_part_limit(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+
+        with zipfile.ZipFile(path) as zf:
+            assert read_part(zf, "docProps/custom.xml", max_bytes=100) is None
+            with pytest.raises(zipfile.BadZipFile, match="too large"):
+                read_part(zf, "word/document.xml", max_bytes=100)
+
+
+class TestLocalLabelWriterOffice:
+    def test_apply_then_remove(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        document = _raw_members(path)["word/document.xml"]
+        writer = LocalLabelWriter()
+
+        result = writer.apply_office_metadata(str(path), "label-1", "Confidential")
+
+        assert result.success and result.method == "office_metadata"
+        assert writer.get_local_label(str(path)) == {"id": "label-1", "name": "Confidential"}
+        with zipfile.ZipFile(path) as zf:
+            assert "/docProps/custom.xml" in zf.read("[Content_Types].xml").decode()
+            assert zf.namelist().count("[Content_Types].xml") == 1
+
+        assert writer.remove_office_label(str(path)).method == "office_metadata_removed"
+        assert writer.get_local_label(str(path)) is None
+        assert _raw_members(path)["word/document.xml"] == document
+
+    def test_remove_without_custom_properties(self, tmp_path):
+        path = tmp_path / "doc.docx"
+        _make_package(path)
+        before = path.read_bytes()
+
+        result = LocalLabelWriter().remove_office_label(str(path))
+
+        assert result.method == "no_label_found"
+        assert path.read_bytes() == before
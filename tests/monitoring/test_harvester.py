@@ -8,7 +8,7 @@ These tests validate:
 - Provider → RawAccessEvent conversion
 - EventHarvester cycle with mock providers
 - Checkpoint tracking per provider
-- DB persistence (FileAccessEvent insertion)
+- DB persistence (FileAccessEvent COPY, aggregated file counters)
 - Back-pressure cap enforcement
 - Registry cache-to-DB sync wiring
 - MonitoringSettings config
@@ -17,6 +17,7 @@ These tests validate:
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
@@ -43,6 +44,29 @@ from openlabels.monitoring.harvester import EventHarvester
 # =====================================================================
 
 
+def _make_mock_session():
+    """Mock async session whose raw connection accepts COPY."""
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.flush = AsyncMock()
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+    session.connection = AsyncMock(return_value=conn)
+    session.copy_driver = driver
+    return session
+
+
+def _copied_rows(session) -> list[dict]:
+    """Rows written through COPY on a ``_make_mock_session`` session."""
+    rows = []
+    for call in session.copy_driver.copy_records_to_table.call_args_list:
+        columns = call.kwargs["columns"]
+        rows.extend(dict(zip(columns, record, strict=True)) for record in call.kwargs["records"])
+    return rows
+
+
 def _make_raw_event(
     file_path: str = "/data/secret.xlsx",
     action: str = "read",
@@ -349,10 +373,7 @@ class TestEventHarvester:
     @pytest.fixture
     def _mock_session(self):
         """Create a mock async session."""
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
-        return session
+        return _make_mock_session()
 
     @pytest.fixture
     def _mock_monitored_file(self):
@@ -383,8 +404,11 @@ class TestEventHarvester:
             count = await harvester.harvest_once(_mock_session)
 
         assert count == 2
-        assert _mock_session.add.call_count == 2
-        _mock_session.flush.assert_awaited_once()
+        rows = _copied_rows(_mock_session)
+        assert [r["action"] for r in rows] == ["read", "write"]
+        assert all(r["monitored_file_id"] == _mock_monitored_file.id for r in rows)
+        assert all(r["tenant_id"] == _mock_monitored_file.tenant_id for r in rows)
+        _mock_session.add.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_harvest_skips_unmonitored_files(self, _mock_session):
@@ -401,7 +425,7 @@ class TestEventHarvester:
             count = await harvester.harvest_once(_mock_session)
 
         assert count == 0
-        assert _mock_session.add.call_count == 0
+        assert _copied_rows(_mock_session) == []
 
     @pytest.mark.asyncio
     async def test_checkpoint_tracking(self, _mock_session, _mock_monitored_file):
@@ -535,9 +559,13 @@ class TestEventHarvester:
 
     @pytest.mark.asyncio
     async def test_monitored_file_stats_updated(self, _mock_session, _mock_monitored_file):
-        """Harvester updates access_count and last_event_at on MonitoredFile."""
+        """Per-file access_count/last_event_at go out as one aggregated UPDATE."""
         t = datetime(2026, 2, 5, 14, 0, 0, tzinfo=timezone.utc)
-        events = [_make_raw_event(event_time=t)]
+        events = [
+            _make_raw_event(event_time=t - timedelta(minutes=5)),
+            _make_raw_event(event_time=t),
+            _make_raw_event(event_time=t - timedelta(minutes=1)),
+        ]
         provider = FakeProvider(name="test", events=events)
         harvester = EventHarvester([provider])
 
@@ -548,8 +576,13 @@ class TestEventHarvester:
         ):
             await harvester.harvest_once(_mock_session)
 
-        assert _mock_monitored_file.access_count == 1
-        assert _mock_monitored_file.last_event_at == t
+        updates = [
+            c for c in _mock_session.execute.await_args_list
+            if "UPDATE monitored_files" in str(c.args[0])
+        ]
+        assert len(updates) == 1
+        params = updates[0].args[1]
+        assert params == {"id_0": _mock_monitored_file.id, "n_0": 3, "t_0": t}
 
     @pytest.mark.asyncio
     async def test_store_raw_events_flag(self, _mock_session, _mock_monitored_file):
@@ -565,9 +598,9 @@ class TestEventHarvester:
         ):
             await harvester.harvest_once(_mock_session)
 
-        # Check the FileAccessEvent was created with raw_event
-        call_args = _mock_session.add.call_args[0][0]
-        assert call_args.raw_event == {"test": True}
+        # raw_event is copied as JSON text into the jsonb column
+        (row,) = _copied_rows(_mock_session)
+        assert json.loads(row["raw_event"]) == {"test": True}
 
     @pytest.mark.asyncio
     async def test_store_raw_events_off(self, _mock_session, _mock_monitored_file):
@@ -583,8 +616,8 @@ class TestEventHarvester:
         ):
             await harvester.harvest_once(_mock_session)
 
-        call_args = _mock_session.add.call_args[0][0]
-        assert call_args.raw_event is None
+        (row,) = _copied_rows(_mock_session)
+        assert row["raw_event"] is None
 
 
 # =====================================================================
@@ -597,10 +630,7 @@ class TestUnknownActionFiltering:
 
     @pytest.fixture
     def _mock_session(self):
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
-        return session
+        return _make_mock_session()
 
     @pytest.fixture
     def _mock_monitored_file(self):
@@ -630,8 +660,8 @@ class TestUnknownActionFiltering:
             count = await harvester.harvest_once(_mock_session)
 
         assert count == 1  # only the "read" event
-        call_args = _mock_session.add.call_args[0][0]
-        assert call_args.action == "read"
+        (row,) = _copied_rows(_mock_session)
+        assert row["action"] == "read"
 
     @pytest.mark.asyncio
     async def test_all_unknown_yields_zero(self, _mock_session, _mock_monitored_file):
@@ -674,10 +704,7 @@ class TestDeferredCheckpoints:
 
     @pytest.fixture
     def _mock_session(self):
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
-        return session
+        return _make_mock_session()
 
     @pytest.fixture
     def _mock_monitored_file(self):
@@ -729,10 +756,7 @@ class TestBackPressureSorting:
 
     @pytest.fixture
     def _mock_session(self):
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
-        return session
+        return _make_mock_session()
 
     @pytest.fixture
     def _mock_monitored_file(self):
@@ -0,0 +1,227 @@
+"""Tests for the bulk access-event ingestion path."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from openlabels.monitoring import ingest
+from openlabels.monitoring.ingest import (
+    EVENT_COLUMNS,
+    AdaptiveFlushSizer,
+    apply_file_stats,
+    build_event_rows,
+    copy_access_events,
+    persist_access_events,
+)
+from openlabels.monitoring.providers.base import RawAccessEvent
+
+T0 = datetime(2026, 3, 1, 9, 0, 0, tzinfo=timezone.utc)
+
+
+def _event(path="/data/a.xlsx", action="read", minutes=0, raw=None):
+    return RawAccessEvent(
+        file_path=path,
+        event_time=T0 + timedelta(minutes=minutes),
+        action=action,
+        event_source="test",
+        user_name="alice",
+        raw=raw,
+    )
+
+
+def _monitored(path):
+    return SimpleNamespace(id=uuid4(), tenant_id=uuid4(), file_path=path)
+
+
+def _session(driver):
+    session = AsyncMock()
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver))
+    session.connection = AsyncMock(return_value=conn)
+    return session
+
+
+class TestBuildEventRows:
+    def test_records_follow_column_order(self):
+        mf = _monitored("/data/a.xlsx")
+        records, _ = build_event_rows([_event()], {mf.file_path: mf})
+
+        (record,) = records
+        assert len(record) == len(EVENT_COLUMNS)
+        row = dict(zip(EVENT_COLUMNS, record, strict=True))
+        assert row["tenant_id"] == mf.tenant_id
+        assert row["monitored_file_id"] == mf.id
+        assert row["action"] == "read"
+        assert row["user_name"] == "alice"
+        assert row["event_time"] == T0
+        assert row["id"] is not None
+
+    def test_aggregates_per_file(self):
+        a, b = _monitored("/data/a.xlsx"), _monitored("/data/b.docx")
+        events = [
+            _event(a.file_path, minutes=3),
+            _event(a.file_path, minutes=7),
+            _event(a.file_path, minutes=1),
+            _event(b.file_path, minutes=2),
+        ]
+        records, stats = build_event_rows(events, {a.file_path: a, b.file_path: b})
+
+        assert len(records) == 4
+        assert stats[a.id].count == 3
+        assert stats[a.id].last_event_at == T0 + timedelta(minutes=7)
+        assert stats[b.id].count == 1
+
+    def test_skips_unmonitored_and_invalid_actions(self):
+        mf = _monitored("/data/a.xlsx")
+        events = [
+            _event("/elsewhere.txt"),
+            _event(mf.file_path, action="unknown"),
+            _event(mf.file_path, action="write"),
+        ]
+        records, stats = build_event_rows(events, {mf.file_path: mf})
+
+        assert len(records) == 1
+        assert list(stats) == [mf.id]
+
+    def test_raw_event_serialized_only_when_requested(self):
+        mf = _monitored("/data/a.xlsx")
+        events = [_event(raw={"pid": 4, "when": T0})]
+        mapping = {mf.file_path: mf}
+
+        (off,), _ = build_event_rows(events, mapping)
+        (on,), _ = build_event_rows(events, mapping, store_raw=True)
+
+        raw_idx = EVENT_COLUMNS.index("raw_event")
+        assert off[raw_idx] is None
+        assert json.loads(on[raw_idx]) == {"pid": 4, "when": str(T0)}
+
+
+class TestCopyAccessEvents:
+    @pytest.mark.asyncio
+    async def test_uses_copy_on_asyncpg(self):
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = _session(driver)
+        records = [tuple(range(len(EVENT_COLUMNS)))]
+
+        await copy_access_events(session, records)
+
+        driver.copy_records_to_table.assert_awaited_once_with(
+            "file_access_events", records=records, columns=EVENT_COLUMNS,
+        )
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_executemany_insert(self):
+        driver = object()  # no copy_records_to_table
+        session = _session(driver)
+        mf = _monitored("/data/a.xlsx")
+        records, _ = build_event_rows(
+            [_event(raw={"k": 1}), _event(minutes=1)], {mf.file_path: mf}, store_raw=True,
+        )
+
+        await copy_access_events(session, records)
+
+        session.execute.assert_awaited_once()
+        rows = session.execute.await_args.args[1]
+        assert len(rows) == 2
+        assert rows[0]["raw_event"] == {"k": 1}
+        assert rows[1]["raw_event"] is None
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self):
+        session = _session(MagicMock())
+        await copy_access_events(session, [])
+        session.connection.assert_not_awaited()
+
+
+class TestApplyFileStats:
+    @pytest.mark.asyncio
+    async def test_single_update_per_flush(self):
+        session = AsyncMock()
+        a, b = _monitored("/a"), _monitored("/b")
+        _, stats = build_event_rows(
+            [_event("/a"), _event("/a", minutes=5), _event("/b", minutes=2)],
+            {"/a": a, "/b": b},
+        )
+
+        await apply_file_stats(session, stats)
+
+        session.execute.assert_awaited_once()
+        stmt, params = session.execute.await_args.args
+        assert "UPDATE monitored_files" in str(stmt)
+        assert "GREATEST" in str(stmt)
+        assert params == {
+            "id_0": a.id, "n_0": 2, "t_0": T0 + timedelta(minutes=5),
+            "id_1": b.id, "n_1": 1, "t_1": T0 + timedelta(minutes=2),
+        }
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_flushes(self, monkeypatch):
+        monkeypatch.setattr(ingest, "_STATS_CHUNK", 2)
+        session = AsyncMock()
+        files = [_monitored(f"/f{i}") for i in range(5)]
+        _, stats = build_event_rows(
+            [_event(f.file_path) for f in files], {f.file_path: f for f in files},
+        )
+
+        await apply_file_stats(session, stats)
+
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_persist_returns_copied_count(self):
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = _session(driver)
+        mf = _monitored("/data/a.xlsx")
+
+        count = await persist_access_events(
+            session, [_event(), _event("/other"), _event(minutes=1)], {mf.file_path: mf},
+        )
+
+        assert count == 2
+        assert len(driver.copy_records_to_table.await_args.kwargs["records"]) == 2
+        session.execute.assert_awaited_once()  # the file-stats UPDATE
+
+
+class TestAdaptiveFlushSizer:
+    def test_starts_at_min_size(self):
+        sizer = AdaptiveFlushSizer(min_size=100, max_size=1000)
+        assert sizer.target_size == 100
+        assert not sizer.should_flush(99)
+        assert sizer.should_flush(100)
+
+    def test_target_tracks_measured_rate(self):
+        sizer = AdaptiveFlushSizer(min_size=100, max_size=100_000, target_seconds=0.5)
+        sizer.rate = 10_000.0
+        assert sizer.target_size == 5000
+
+    def test_target_is_clamped(self):
+        sizer = AdaptiveFlushSizer(min_size=100, max_size=1000, target_seconds=1.0)
+        sizer.rate = 1e6
+        assert sizer.target_size == 1000
+        sizer.rate = 1.0
+        assert sizer.target_size == 100
+
+    def test_backlog_grows_flush_up_to_max(self):
+        sizer = AdaptiveFlushSizer(min_size=100, max_size=1000)
+        assert sizer.next_size(40) == 40
+        assert sizer.next_size(600) == 600
+        assert sizer.next_size(5000) == 1000
+        assert sizer.next_size(0) == 0
+
+    def test_record_smooths_rate(self):
+        sizer = AdaptiveFlushSizer(smoothing=0.5)
+        sizer.record(1000, sizer.start())
+        first = sizer.rate
+        assert first > 0
+        assert sizer.last_flush_size == 1000
+
+        sizer.rate = 1000.0
+        sizer.record(0, sizer.start())  # empty flushes don't move the estimate
+        assert sizer.rate == 1000.0
@@ -144,10 +144,10 @@ class TestM365OperationMap:
 
     def test_all_actions_are_valid_db_actions(self):
         """All mapped actions are in the valid DB enum set."""
-        from openlabels.monitoring.harvester import _VALID_DB_ACTIONS
+        from openlabels.monitoring.ingest import VALID_DB_ACTIONS
 
         for op, action in M365_OPERATION_MAP.items():
-            assert action in _VALID_DB_ACTIONS, (
+            assert action in VALID_DB_ACTIONS, (
                 f"{op} maps to '{action}' which is not a valid DB action"
             )
 
@@ -157,6 +157,8 @@ class TestEventStreamManagerStats:
         assert stats["total_events_flushed"] == 0
         assert stats["total_events_dropped"] == 0
         assert stats["buffer_size"] == 0
+        assert stats["flush_size"] == 500
+        assert stats["ingest_rate"] == 0.0
         assert stats["providers"] == ["mock_stream"]
 
     @pytest.mark.asyncio
@@ -191,6 +193,105 @@ class TestEventStreamManagerStats:
         assert manager.total_flush_cycles == 0
 
 
+class TestEventStreamManagerAdaptiveFlush:
+    """Tests for backlog-driven flush sizing."""
+
+    @pytest.mark.asyncio
+    async def test_backlog_drained_in_max_size_chunks(self):
+        manager = EventStreamManager(providers=[], batch_size=10, max_batch_size=40)
+        manager._buffer = [_make_event(f"/f{i}") for i in range(100)]
+        manager._persist_events = AsyncMock(side_effect=lambda batch: len(batch))
+
+        await manager._flush_buffer()
+
+        sizes = [len(c.args[0]) for c in manager._persist_events.await_args_list]
+        assert sizes == [40, 40, 20]
+        assert manager.total_events_flushed == 100
+        assert manager.total_flush_cycles == 3
+        assert manager._buffer == []
+        assert manager.get_stats()["ingest_rate"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_rebuffered_in_order(self):
+        manager = EventStreamManager(providers=[], batch_size=10, max_batch_size=40)
+        events = [_make_event(f"/f{i}") for i in range(100)]
+        manager._buffer = list(events)
+        manager._persist_events = AsyncMock(side_effect=[40, RuntimeError("db down")])
+
+        await manager._flush_buffer()
+
+        assert manager._buffer == events[40:]
+        assert manager.total_events_flushed == 40
+        assert manager.total_events_dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_reader_wakes_flush_task(self):
+        """Crossing the flush size triggers a flush before the interval."""
+        events = [_make_event(f"/test/{i}.txt") for i in range(20)]
+        provider = _MockStreamProvider(batches=[events])
+        manager = EventStreamManager(
+            providers=[provider], batch_size=10, flush_interval=60.0,
+        )
+        persisted = asyncio.Event()
+
+        async def persist(batch):
+            persisted.set()
+            return len(batch)
+
+        manager._persist_events = AsyncMock(side_effect=persist)
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(manager.run(shutdown))
+        try:
+            await asyncio.wait_for(persisted.wait(), timeout=2.0)
+        finally:
+            shutdown.set()
+            await task
+
+        assert manager.total_events_flushed == 20
+
+
+    @pytest.mark.asyncio
+    async def test_shutdown_during_flush_keeps_chunk(self):
+        """A chunk being persisted at shutdown is finished, not dropped."""
+        events = [_make_event(f"/test/{i}.txt") for i in range(20)]
+        provider = _MockStreamProvider(batches=[events])
+        manager = EventStreamManager(
+            providers=[provider], batch_size=10, flush_interval=60.0,
+        )
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def persist(batch):
+            started.set()
+            await release.wait()
+            return len(batch)
+
+        manager._persist_events = AsyncMock(side_effect=persist)
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(manager.run(shutdown))
+        await asyncio.wait_for(started.wait(), timeout=2.0)
+        shutdown.set()
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.wait_for(task, timeout=2.0)
+
+        assert manager.total_events_flushed == 20
+        assert manager.total_events_dropped == 0
+        assert manager._buffer == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_rebuffers_chunk(self):
+        manager = EventStreamManager(providers=[], batch_size=10, max_batch_size=40)
+        events = [_make_event(f"/f{i}") for i in range(20)]
+        manager._buffer = list(events)
+        manager._persist_events = AsyncMock(side_effect=asyncio.CancelledError)
+
+        with pytest.raises(asyncio.CancelledError):
+            await manager._flush_buffer()
+
+        assert manager._buffer == events
+
+
 class TestEventStreamManagerScanTrigger:
     """Tests for scan trigger integration."""
 
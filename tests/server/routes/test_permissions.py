@@ -0,0 +1,103 @@
+"""Tests for permissions API endpoints (/permissions)."""
+
+import pytest
+from sqlalchemy import text
+
+GRANTED = b"\x01" * 32
+NOT_GRANTED = b"\x02" * 32
+
+
+@pytest.fixture
+async def granted_tree(test_client, test_db):
+    """Five directories readable by alice and one she cannot reach."""
+    from openlabels.server.models import (
+        DirectoryTree,
+        PrincipalGrant,
+        ScanTarget,
+        SecurityDescriptor,
+    )
+
+    row = (await test_db.execute(text(
+        "SELECT id FROM tenants WHERE name LIKE 'Test Tenant%' ORDER BY id DESC LIMIT 1"
+    ))).one()
+    tenant_id = row.id
+
+    target = ScanTarget(
+        tenant_id=tenant_id,
+        name="permissions-test-target",
+        adapter="filesystem",
+        config={"path": "/data"},
+    )
+    test_db.add(target)
+    for sd_hash in (GRANTED, NOT_GRANTED):
+        test_db.add(SecurityDescriptor(
+            sd_hash=sd_hash, tenant_id=tenant_id, principals_indexed=True,
+        ))
+    await test_db.flush()
+
+    test_db.add(PrincipalGrant(
+        tenant_id=tenant_id, principal="alice", sd_hash=GRANTED, permissions=["read"],
+    ))
+    for n in range(5):
+        test_db.add(DirectoryTree(
+            tenant_id=tenant_id, target_id=target.id,
+            dir_path=f"/data/dir{n}", dir_name=f"dir{n}", sd_hash=GRANTED,
+        ))
+    test_db.add(DirectoryTree(
+        tenant_id=tenant_id, target_id=target.id,
+        dir_path="/data/private", dir_name="private", sd_hash=NOT_GRANTED,
+    ))
+    await test_db.commit()
+
+    return tenant_id, target
+
+
+class TestLookupPrincipalAccess:
+
+    URL = "/api/v1/permissions/principal/alice"
+
+    async def test_cursor_walks_every_directory_once(self, test_client, granted_tree):
+        """Forward cursors page through the granted directories in path order."""
+        _, target = granted_tree
+        params = {"target_id": str(target.id), "expand_groups": "false", "page_size": 2}
+
+        paths: list[str] = []
+        cursor = None
+        for _ in range(5):
+            resp = await test_client.get(
+                self.URL, params={**params, **({"cursor": cursor} if cursor else {})},
+            )
+            assert resp.status_code == 200
+            body = resp.json()
+            paths += [item["dir_path"] for item in body["items"]]
+            assert all(item["permissions"] == ["read"] for item in body["items"])
+            assert all(item["granted_via"] == ["alice"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if not body["has_next"]:
+                break
+
+        assert paths == [f"/data/dir{n}" for n in range(5)]
+        assert cursor is None
+
+    async def test_backward_cursor_returns_previous_page(self, test_client, granted_tree):
+        _, target = granted_tree
+        params = {"target_id": str(target.id), "expand_groups": "false", "page_size": 2}
+
+        first = (await test_client.get(self.URL, params=params)).json()
+        second = (await test_client.get(
+            self.URL, params={**params, "cursor": first["next_cursor"]},
+        )).json()
+        assert second["has_previous"] is True
+
+        back = (await test_client.get(self.URL, params={
+            **params, "cursor": second["previous_cursor"], "direction": "backward",
+        })).json()
+
+        assert [i["dir_path"] for i in back["items"]] == ["/data/dir0", "/data/dir1"]
+
+    async def test_invalid_cursor_rejected(self, test_client, granted_tree):
+        resp = await test_client.get(
+            self.URL, params={"expand_groups": "false", "cursor": "not-a-cursor"},
+        )
+
+        assert resp.status_code == 400
@@ -64,6 +64,13 @@ class TestInMemoryCacheBasic:
         assert await cache.get("b") is None
 
 
+    @pytest.mark.asyncio
+    async def test_get_many_omits_missing(self):
+        cache = InMemoryCache()
+        await cache.set("a", 1)
+        await cache.set("b", {"x": 2})
+        assert await cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": 2}}
+
 class TestInMemoryCacheTTL:
     @pytest.mark.asyncio
     async def test_ttl_expiration(self):
@@ -201,6 +208,19 @@ class TestCacheManagerMemoryBackend:
         assert "backend" in stats
 
 
+    @pytest.mark.asyncio
+    async def test_get_many(self):
+        mgr = CacheManager(redis_url=None, enabled=True)
+        await mgr.initialize()
+
+        await mgr.set("a", "1", ttl=60)
+        assert await mgr.get_many(["a", "b"]) == {"a": "1"}
+
+    @pytest.mark.asyncio
+    async def test_get_many_disabled(self):
+        mgr = CacheManager(enabled=False)
+        assert await mgr.get_many(["a"]) == {}
+
 class TestCacheManagerGetOrSet:
     @pytest.mark.asyncio
     async def test_get_or_set_miss(self):